@@ -0,0 +1,53 @@
+"""add calendar_feed_revision + calendar_feed_cache
+
+Revision ID: a7b8c9d0e1f2
+Revises: cd34ef56ab78
+Create Date: 2026-10-19 10:00:00.000000
+
+Serverseitiger Cache fuer die FullCalendar-Feeds (`web_api.calendar_cache`):
+
+1.  `calendar_feed_revision` — Singleton-Zaehler (id=1). Wird nach jedem
+    Commit, der Plaene/Appointments/Events beruehrt, erhoeht; die Revision
+    ist Teil des Cache-Keys. Die Zeile wird hier direkt geseedet.
+2.  `calendar_feed_cache` — optionale, worker-uebergreifende Cache-Stufe
+    (nur aktiv mit CALENDAR_FEED_CACHE_SHARED=true).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "cd34ef56ab78"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    revision_table = op.create_table(
+        "calendar_feed_revision",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("revision", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(revision_table, [{"id": 1, "revision": 0}])
+
+    op.create_table(
+        "calendar_feed_cache",
+        sa.Column("cache_key", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column("revision", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_calendar_feed_cache_revision", "calendar_feed_cache", ["revision"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_calendar_feed_cache_revision", table_name="calendar_feed_cache")
+    op.drop_table("calendar_feed_cache")
+    op.drop_table("calendar_feed_revision")
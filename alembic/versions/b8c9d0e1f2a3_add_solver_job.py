@@ -0,0 +1,66 @@
+"""add solver_job
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-19 14:00:00.000000
+
+Warteschlange fuer serverseitige Planberechnungen (`web_api.solver_jobs`):
+neue Tabelle `solver_job` + Enums `solverjobkind` / `solverjobstatus`.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "solver_job",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum("single_period", "multi_period", name="solverjobkind"),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "queued", "running", "succeeded", "failed", "cancelled",
+                name="solverjobstatus",
+            ),
+            nullable=False,
+        ),
+        sa.Column("team_id", sa.Uuid(), nullable=False),
+        sa.Column("plan_period_ids", sa.JSON(), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("created_by_id", sa.Uuid(), nullable=True),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False),
+        sa.Column("progress_step", sa.Integer(), nullable=False),
+        sa.Column("progress_message", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["team_id"], ["team.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["created_by_id"], ["web_user.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_solver_job_status", "solver_job", ["status"])
+    op.create_index("ix_solver_job_team_id", "solver_job", ["team_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_solver_job_team_id", table_name="solver_job")
+    op.drop_index("ix_solver_job_status", table_name="solver_job")
+    op.drop_table("solver_job")
+    op.execute("DROP TYPE IF EXISTS solverjobstatus")
+    op.execute("DROP TYPE IF EXISTS solverjobkind")
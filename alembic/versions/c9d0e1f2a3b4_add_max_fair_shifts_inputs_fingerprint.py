@@ -0,0 +1,38 @@
+"""add max_fair_shifts_of_app.inputs_fingerprint
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-19 16:00:00.000000
+
+Fingerprint der Solver-Eingaben, aus denen max./faire Einsätze berechnet
+wurden (`sat_solver.max_fair_shifts_cache`). Zeilen mit Fingerprint sind
+Cache-Einträge des Solvers; beim Speichern von Plänen angelegte Zeilen
+bleiben ohne (NULL).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "max_fair_shifts_of_app",
+        sa.Column("inputs_fingerprint", sa.String(length=64), nullable=True),
+    )
+    op.create_index(
+        "ix_max_fair_shifts_of_app_inputs_fingerprint",
+        "max_fair_shifts_of_app",
+        ["inputs_fingerprint"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_max_fair_shifts_of_app_inputs_fingerprint", table_name="max_fair_shifts_of_app")
+    op.drop_column("max_fair_shifts_of_app", "inputs_fingerprint")
@@ -0,0 +1,49 @@
+"""add availability_summary
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-19 18:00:00.000000
+
+Vorberechnete Zeile pro (Person, Planperiode) fuer die Verfuegbarkeitsmaske
+(`web_api.availability.summary`). Wird lazy beim ersten Seitenaufruf einer
+Person befuellt und nach Aenderungen pro Person geloescht — kein Backfill.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, Sequence[str], None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "availability_summary",
+        sa.Column("person_id", sa.Uuid(), nullable=False),
+        sa.Column("plan_period_id", sa.Uuid(), nullable=False),
+        sa.Column("actor_plan_period_id", sa.Uuid(), nullable=False),
+        sa.Column("team_id", sa.Uuid(), nullable=False),
+        sa.Column("team_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("start", sa.Date(), nullable=False),
+        sa.Column("end", sa.Date(), nullable=False),
+        sa.Column("deadline", sa.Date(), nullable=True),
+        sa.Column("notes_for_employees", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("notes", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("requested_assignments", sa.Integer(), nullable=False),
+        sa.Column("closed", sa.Boolean(), nullable=False),
+        sa.Column("total_entered", sa.Integer(), nullable=False),
+        sa.Column("total_appointed", sa.Integer(), nullable=False),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["person_id"], ["person.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["plan_period_id"], ["plan_period.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("person_id", "plan_period_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("availability_summary")
@@ -0,0 +1,35 @@
+"""add solver_tree_revision
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-19 20:00:00.000000
+
+Singleton-Zaehler (id=1) fuer den Snapshot-Cache der Solver-Gruppen-Baeume
+(`database.tree_revision`). Bisher prozess-lokal — Aenderungen, die ein
+Desktop-Client ueber die Web-API schreibt, sah der Solver im Desktop-Prozess
+nicht. Die Zeile wird hier direkt geseedet.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    revision_table = op.create_table(
+        "solver_tree_revision",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("revision", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(revision_table, [{"id": 1, "revision": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("solver_tree_revision")
@@ -34,7 +34,7 @@ class Create(Command):
 class CreateBulk(Command):
     """Erstellt alle Appointments einer Plan-Version in einer einzigen DB-Session."""
 
-    def __init__(self, appointments: list[schemas.AppointmentCreate], plan_id: UUID):
+    def __init__(self, appointments: list[schemas.AppointmentCreate | schemas.AppointmentIdsCreate], plan_id: UUID):
         super().__init__()
         self.appointments = appointments
         self.plan_id = plan_id
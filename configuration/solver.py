@@ -94,9 +94,39 @@ class ConstraintsMultipliers(BaseModel):
     # TODO: Bei mehr als 2 Mitarbeitern werden die Weight-Vars angepasst
 
 
+class StoppingPolicy(BaseModel):
+    """
+    Abbruch- und Such-Einstellungen für eine Solver-Phase (`solve_model_to_optimum`).
+
+    Das Zeitlimit der Phase gilt immer zusätzlich. `None` bzw. 0/leer bedeutet
+    CP-SAT-Default bzw. Regel nicht aktiv. Empfehlungen für typische Plangrößen
+    liefert `scripts/tune_solver_stopping.py`.
+    """
+    # Stopp, sobald |Lösung - Schranke| / |Lösung| <= Wert (z. B. 0.01 = 1 %)
+    relative_gap_limit: float | None = None
+    # Stopp, wenn nach der ersten Lösung so lange keine bessere mehr kommt
+    no_improvement_seconds: float | None = None
+    # Stopp, sobald die Zielfunktion diesen Wert erreicht (Minimierung: <=, Maximierung: >=)
+    objective_target: int | None = None
+    # Anzahl CP-SAT-Worker (0 = alle Kerne) und Portfolio (Namen der Subsolver)
+    num_workers: int = 0
+    subsolvers: list[str] = []
+
+
+class StoppingPolicies(BaseModel):
+    """Eine StoppingPolicy pro Solver-Phase (Attributname = Phasen-Name)."""
+    unadjusted: StoppingPolicy = StoppingPolicy()
+    max_shifts: StoppingPolicy = StoppingPolicy()
+    adjusted: StoppingPolicy = StoppingPolicy()
+    test_plan: StoppingPolicy = StoppingPolicy()
+
+
 class SolverConfig(BaseModel):
     minimization_weights: MinimizationWeights = MinimizationWeights()
     constraints_multipliers: ConstraintsMultipliers = ConstraintsMultipliers()
+    stopping_policies: StoppingPolicies = StoppingPolicies()
+    # Sprechende Namen für alle Solver-Variablen, auch ohne log_search_process
+    debug_var_names: bool = False
 
 
 class ConfigHandlerJson:
@@ -26,6 +26,8 @@ from sqlmodel import Session, SQLModel, create_engine
 
 from configuration.db_config import get_database_url
 from database.event_listeners import register_listeners
+from database.tree_revision import register_tree_revision_listeners
+from database.pool import create_pooled_engine, resolve_profile
 
 # Alle Modelle importieren, damit SQLModel.metadata vollständig ist
 from database.models import *  # noqa: F401, F403
@@ -36,18 +38,11 @@ from database.models import *  # noqa: F401, F403
 load_dotenv()
 _database_url = get_database_url()
 if _database_url:
-    # PostgreSQL: render.com setzt DATABASE_URL automatisch
-    # pool_pre_ping: Erkennt serverseitig geschlossene Verbindungen (render.com Idle-Timeout)
-    # pool_recycle: Verbindungen nach 30 min zwingend erneuern
-    engine = create_engine(
-        _database_url,
-        echo=False,
-        pool_size=5,
-        max_overflow=10,
-        pool_pre_ping=True,
-        pool_timeout=30,
-        pool_recycle=1800,
-    )
+    # PostgreSQL: render.com setzt DATABASE_URL automatisch (Server → Profil
+    # "web"), der Desktop-Client holt die URL aus dem Keyring (→ "desktop").
+    # Pool-Größen, Recycle und Idle-Ping statt pool_pre_ping: database.pool
+    _profile_name, _profile = resolve_profile("web" if os.environ.get("DATABASE_URL") else "desktop")
+    engine = create_pooled_engine(_database_url, "sync", _profile_name, _profile, echo=False)
 else:
     # SQLite-Fallback für lokale Entwicklung (kein DATABASE_URL gesetzt)
     from configuration.project_paths import curr_user_path_handler
@@ -77,6 +72,9 @@ else:
 # ── Listeners registrieren ───────────────────────────────────────────────────
 
 register_listeners()
+# Revision der Solver-Gruppen-Bäume (sat_solver.tree_snapshot) — in jedem
+# Prozess, damit auch Schreibvorgänge von Web-API und Desktop sie bumpen.
+register_tree_revision_listeners()
 
 
 # ── Session-Factory ──────────────────────────────────────────────────────────
@@ -0,0 +1,194 @@
+"""Schnelle ORM → Schema-Konvertierung für vertrauenswürdige DB-Lesewege.
+
+`schemas.PlanShow.model_validate(plan)` validiert den kompletten ORM-Graphen:
+jedes Feld jedes verschachtelten Objekts wird geprüft, und dieselbe Person,
+derselbe Arbeitsort, dieselbe Tageszeit wird pro Vorkommen neu gebaut. Für
+Daten, die gerade aus der eigenen DB kommen, ist die Prüfung überflüssig —
+nach SQL ist sie der größte Posten in den Profilen.
+
+`to_schema` / `to_schemas` bauen die Schemas stattdessen über vorkompilierte
+Builder (einmal pro Schema-Klasse):
+- Felder werden per Attribut gelesen und ohne Prüfung per `model_construct`
+  übernommen; nur `float` wird konvertiert (DB liefert ggf. `int`).
+- Verschachtelte Schemas (direkt, Optional, Liste) laufen rekursiv über ihre
+  eigenen Builder; alle anderen Typen über gecachte TypeAdapter.
+- `field_validator`s (mode 'before'/'after', ohne `info`-Parameter) laufen wie
+  bei Pydantic — `set_to_list`, `parse_guests`, `_drop_taas_with_softdeleted_team`.
+  Schemas mit anderen Validatoren (model_validator, wrap/plain, `info`)
+  werden weiter per `model_validate` gebaut.
+- Innerhalb eines Aufrufs wird jedes ORM-Objekt pro Schema-Klasse nur einmal
+  gebaut; alle Vorkommen teilen sich die Instanz.
+
+Nur für Lesefunktionen verwenden, deren ORM-Objekte direkt aus der Session
+kommen — nicht für Eingaben von außen.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import inspect
+import sys
+import types
+import typing
+from collections.abc import Callable, Iterable
+from functools import cache
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+M = TypeVar('M', bound=BaseModel)
+
+_Memo = dict[tuple[type, int], tuple[BaseModel, Any]]
+_Convert = Callable[[Any, _Memo], Any]
+
+_MISSING = object()
+_PASSTHROUGH = (str, int, bool, UUID, datetime.date, datetime.datetime, datetime.time, datetime.timedelta,
+                bytes, EmailStr, Any)
+_SEQUENCES = (list, typing.List)
+
+
+def _resolve(annotation: Any, namespace: dict[str, Any]) -> Any:
+    """Löst ForwardRefs auf, die Pydantic in `FieldInfo.annotation` stehen lässt (z. B. `Optional['Project']`)."""
+    if isinstance(annotation, typing.ForwardRef):
+        return namespace.get(annotation.__forward_arg__, annotation)
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return typing.Union[tuple(_resolve(arg, namespace) for arg in args)]
+    if origin in _SEQUENCES and len(args) == 1:
+        return list[_resolve(args[0], namespace)]
+    return annotation
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _is_passthrough(annotation: Any) -> bool:
+    return annotation in _PASSTHROUGH or (isinstance(annotation, type) and issubclass(annotation, enum.Enum))
+
+
+def _nested(model: type[BaseModel]) -> _Convert:
+    return lambda value, memo: _builder(model)(value, memo)
+
+
+def _nested_list(model: type[BaseModel]) -> _Convert:
+    return lambda values, memo: [_builder(model)(value, memo) for value in values]
+
+
+def _adapter(annotation: Any) -> _Convert:
+    adapter = TypeAdapter(annotation)
+    return lambda value, memo: adapter.validate_python(value, from_attributes=True)
+
+
+def _converter(annotation: Any) -> _Convert | None:
+    """Konverter für einen Feldwert ≠ None; `None` heißt: Wert unverändert übernehmen."""
+    inner = _unwrap_optional(annotation)
+    if _is_passthrough(inner):
+        return None
+    if inner is float:
+        return lambda value, memo: float(value)
+    if _is_model(inner):
+        return _nested(inner)
+    if typing.get_origin(inner) in _SEQUENCES:
+        (item,) = typing.get_args(inner) or (Any,)
+        if _is_model(item):
+            return _nested_list(item)
+        if _is_passthrough(item):
+            return lambda values, memo: list(values)
+    return _adapter(annotation)
+
+
+def _simple_validators(model: type[BaseModel]) -> dict[str, tuple[list, list]] | None:
+    """Field-Validatoren pro Feld als (before, after); None, wenn das Schema andere Validatoren nutzt."""
+    decorators = model.__pydantic_decorators__
+    if decorators.model_validators or decorators.validators or decorators.root_validators:
+        return None
+    by_field: dict[str, tuple[list, list]] = {}
+    for decorator in decorators.field_validators.values():
+        mode = decorator.info.mode
+        if mode not in ('before', 'after') or len(inspect.signature(decorator.func).parameters) != 1:
+            return None
+        names = model.model_fields if '*' in decorator.info.fields else decorator.info.fields
+        for name in names:
+            before, after = by_field.setdefault(name, ([], []))
+            # Pydantic: before-Validatoren in umgekehrter, after-Validatoren in Definitionsreihenfolge
+            if mode == 'before':
+                before.insert(0, decorator.func)
+            else:
+                after.append(decorator.func)
+    return by_field
+
+
+class _Builder:
+    """Vorkompilierter Builder: ORM-Objekt → Schema-Instanz ohne Validierung."""
+
+    def __init__(self, model: type[BaseModel], validators: dict[str, tuple[list, list]]):
+        self.model = model
+        self.fields_set = frozenset(model.model_fields)
+        self.fields = []
+        namespace = vars(sys.modules[model.__module__])
+        for name, field in model.model_fields.items():
+            attrs = tuple(dict.fromkeys(
+                a for a in (field.validation_alias, field.alias, name) if isinstance(a, str)))
+            default = (_MISSING if field.default is PydanticUndefined and field.default_factory is None
+                       else field)
+            before, after = validators.get(name, ((), ()))
+            convert = _converter(_resolve(field.annotation, namespace))
+            self.fields.append((name, attrs, default, tuple(before), convert, tuple(after)))
+
+    def __call__(self, source: Any, memo: _Memo) -> BaseModel:
+        key = (self.model, id(source))
+        if (hit := memo.get(key)) is not None:
+            return hit[0]
+        values = {}
+        for name, attrs, default, before, convert, after in self.fields:
+            value = _MISSING
+            for attr in attrs:
+                if (value := getattr(source, attr, _MISSING)) is not _MISSING:
+                    break
+            if value is _MISSING:
+                if default is _MISSING:
+                    continue
+                value = default.get_default(call_default_factory=True)
+            for validator in before:
+                value = validator(value)
+            if value is not None and convert is not None:
+                value = convert(value, memo)
+            for validator in after:
+                value = validator(value)
+            values[name] = value
+        obj = self.model.model_construct(_fields_set=set(self.fields_set), **values)
+        # Quelle mitspeichern: hält das ORM-Objekt am Leben, damit id(source) eindeutig bleibt
+        memo[key] = (obj, source)
+        return obj
+
+
+@cache
+def _builder(model: type[BaseModel]) -> Callable[[Any, _Memo], BaseModel]:
+    validators = _simple_validators(model)
+    if validators is None:
+        return lambda source, memo: model.model_validate(source)
+    return _Builder(model, validators)
+
+
+def to_schema(model: type[M], source: Any) -> M:
+    """`model.model_validate(source)` ohne Validierung, mit geteilten Unterobjekten."""
+    return _builder(model)(source, {})
+
+
+def to_schemas(model: type[M], sources: Iterable[Any]) -> list[M]:
+    """Wie `to_schema` für mehrere Objekte; Unterobjekte werden über alle geteilt."""
+    memo: _Memo = {}
+    build = _builder(model)
+    return [build(source, memo) for source in sources]
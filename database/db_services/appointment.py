@@ -96,34 +96,44 @@ def undelete(appointment_id: UUID) -> None:
         session.flush()
 
 
-def create_bulk(appointments: list[schemas.AppointmentCreate], plan_id: UUID) -> list[UUID]:
+def _appointment_ids(appointment: schemas.AppointmentCreate | schemas.AppointmentIdsCreate) -> tuple[UUID, list[UUID]]:
+    if isinstance(appointment, schemas.AppointmentIdsCreate):
+        return appointment.event_id, appointment.avail_day_ids
+    return appointment.event.id, [ad.id for ad in appointment.avail_days]
+
+
+def create_bulk(appointments: list[schemas.AppointmentCreate | schemas.AppointmentIdsCreate],
+                plan_id: UUID) -> list[UUID]:
     """Erstellt alle Appointments in einer einzigen Session/Transaktion.
 
     Gibt nur die UUIDs zurück (kein model_validate-Overhead).
     Da Appointment.id per uuid4() Python-seitig generiert wird, ist kein
     Zwischens-flush() für die M2M-Beziehungen nötig.
+    Solver-Ergebnisse kommen als AppointmentIdsCreate (nur IDs) und werden
+    nicht vorher hydriert.
     """
     log_function_info()
     with get_session() as session:
         plan = session.get(models.Plan, plan_id)
 
-        event_ids = [a.event.id for a in appointments]
-        avail_day_ids = [ad.id for a in appointments for ad in a.avail_days]
+        ids = [_appointment_ids(a) for a in appointments]
+        event_ids = [event_id for event_id, _ in ids]
+        avail_day_ids = [ad_id for _, ad_ids in ids for ad_id in ad_ids]
         events_by_id = {e.id: e for e in session.exec(select(models.Event).where(models.Event.id.in_(event_ids))).all()}
         avail_days_by_id = {
             ad.id: ad for ad in session.exec(select(models.AvailDay).where(models.AvailDay.id.in_(avail_day_ids))).all()
         }
 
         created_ids: list[UUID] = []
-        for appointment in appointments:
+        for appointment, (event_id, ad_ids) in zip(appointments, ids):
             app = models.Appointment(
-                event=events_by_id[appointment.event.id],
+                event=events_by_id[event_id],
                 plan=plan,
                 notes=appointment.notes,
             )
             session.add(app)
-            for ad in appointment.avail_days:
-                app.avail_days.append(avail_days_by_id[ad.id])
+            for ad_id in ad_ids:
+                app.avail_days.append(avail_days_by_id[ad_id])
             created_ids.append(app.id)
         session.flush()
         return created_ids
@@ -17,6 +17,7 @@ from ..database import get_session
 from ..models import _utcnow
 from ._common import log_function_info
 from ._eager_loading import avail_day_show_options
+from ._trusted_read import to_schemas
 from .combination_locations_possible import is_comb_loc_orphaned
 
 
@@ -33,7 +34,7 @@ def get_batch(avail_day_ids: list[UUID]) -> dict[UUID, schemas.AvailDayShow]:
                 .where(models.AvailDay.id.in_(avail_day_ids))
                 .options(*avail_day_show_options()))
         ads = session.exec(stmt).unique().all()
-        return {ad.id: schemas.AvailDayShow.model_validate(ad) for ad in ads}
+        return {ad.id: schema for ad, schema in zip(ads, to_schemas(schemas.AvailDayShow, ads))}
 
 
 def get_batch_minimal(avail_day_ids: list[UUID]) -> dict[UUID, schemas.AvailDaySolverMinimal]:
@@ -69,7 +70,7 @@ def get_batch_minimal(avail_day_ids: list[UUID]) -> dict[UUID, schemas.AvailDayS
                     .selectinload(models.CombinationLocationsPossible.locations_of_work),
                 ))
         ads = session.exec(stmt).unique().all()
-        return {ad.id: schemas.AvailDaySolverMinimal.model_validate(ad) for ad in ads}
+        return {ad.id: schema for ad, schema in zip(ads, to_schemas(schemas.AvailDaySolverMinimal, ads))}
 
 
 def get_from__actor_pp_date_tod(actor_plan_period_id: UUID, date: datetime.date,
@@ -94,7 +95,7 @@ def get_all_from__plan_period(plan_period_id: UUID) -> list[schemas.AvailDayShow
     with get_session() as session:
         ads = session.exec(select(models.AvailDay).join(models.ActorPlanPeriod)
                            .where(models.ActorPlanPeriod.plan_period_id == plan_period_id)).all()
-        return [schemas.AvailDayShow.model_validate(ad) for ad in ads]
+        return to_schemas(schemas.AvailDayShow, ads)
 
 
 def get_all_from__actor_plan_period(actor_plan_period_id: UUID) -> list[schemas.AvailDayShow]:
@@ -103,7 +104,7 @@ def get_all_from__actor_plan_period(actor_plan_period_id: UUID) -> list[schemas.
                 .where(models.AvailDay.actor_plan_period_id == actor_plan_period_id)
                 .options(*avail_day_show_options()))
         ads = session.exec(stmt).unique().all()
-        return [schemas.AvailDayShow.model_validate(ad) for ad in ads]
+        return to_schemas(schemas.AvailDayShow, ads)
 
 
 def get_with_skills__actor_pp_date(actor_plan_period_id: UUID, date: datetime.date) -> list[schemas.AvailDayWithSkills]:
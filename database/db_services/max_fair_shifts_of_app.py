@@ -4,10 +4,18 @@ Speichert für jede ActorPlanPeriod die Obergrenzen für maximale (`max_shifts`)
 und faire (`fair_shifts`) Schichtzuteilungen, die der Solver zur Fairness-
 Optimierung verwendet. Die minimale Abfrage (`get_all_from__plan_period_minimal`)
 liefert ein kompaktes Dict für den Solver-Zugriff ohne Schema-Overhead.
+
+Einträge mit `inputs_fingerprint` sind Cache-Einträge des Solvers
+(`sat_solver.max_fair_shifts_cache`): pro ActorPlanPeriod höchstens einer,
+`replace_fingerprinted` ersetzt sie. Beim Speichern von Plänen angelegte
+Einträge bleiben ohne Fingerprint und werden davon nicht berührt. Alle
+übrigen Leser filtern auf `inputs_fingerprint IS NULL` (`_stored_only`) —
+Cache-Einträge sind keine gespeicherten Ergebnisse.
 """
 import datetime
 from uuid import UUID
 
+from sqlalchemy import delete as sql_delete
 from sqlmodel import select
 
 from .. import schemas, models
@@ -16,17 +24,22 @@ from ..models import _utcnow
 from ._common import log_function_info
 
 
+def _stored_only():
+    """Filter: nur beim Plan-Speichern angelegte Einträge, keine Solver-Cache-Zeilen."""
+    return models.MaxFairShiftsOfApp.inputs_fingerprint.is_(None)
+
+
 def get_all_from__plan_period(plan_period_id: UUID) -> list[schemas.MaxFairShiftsOfAppShow]:
     with get_session() as session:
         mfs_list = session.exec(select(models.MaxFairShiftsOfApp).join(models.ActorPlanPeriod)
-                                .where(models.ActorPlanPeriod.plan_period_id == plan_period_id)).all()
+                                .where(models.ActorPlanPeriod.plan_period_id == plan_period_id, _stored_only())).all()
         return [schemas.MaxFairShiftsOfAppShow.model_validate(m) for m in mfs_list]
 
 
 def get_all_from__plan_period_minimal(plan_period_id: UUID) -> dict[UUID, tuple[int, int]]:
     with get_session() as session:
         mfs_list = session.exec(select(models.MaxFairShiftsOfApp).join(models.ActorPlanPeriod)
-                                .where(models.ActorPlanPeriod.plan_period_id == plan_period_id)).all()
+                                .where(models.ActorPlanPeriod.plan_period_id == plan_period_id, _stored_only())).all()
         return {m.actor_plan_period_id: (m.max_shifts, m.fair_shifts) for m in mfs_list}
 
 
@@ -41,11 +54,45 @@ def get_by_actor_plan_period_ids(actor_plan_period_ids: list[UUID]) -> dict[UUID
     with get_session() as session:
         mfs_list = session.exec(
             select(models.MaxFairShiftsOfApp)
-            .where(models.MaxFairShiftsOfApp.actor_plan_period_id.in_(actor_plan_period_ids))
+            .where(models.MaxFairShiftsOfApp.actor_plan_period_id.in_(actor_plan_period_ids), _stored_only())
         ).all()
         return {m.actor_plan_period_id: (m.max_shifts, m.fair_shifts) for m in mfs_list}
 
 
+def get_by_fingerprint(actor_plan_period_ids: list[UUID], inputs_fingerprint: str) -> dict[UUID, tuple[int, float]]:
+    """Cache-Einträge mit passendem Fingerprint — Dict ActorPlanPeriod-ID → (max_shifts, fair_shifts)."""
+    if not actor_plan_period_ids:
+        return {}
+    with get_session() as session:
+        rows = session.exec(
+            select(models.MaxFairShiftsOfApp.actor_plan_period_id, models.MaxFairShiftsOfApp.max_shifts,
+                   models.MaxFairShiftsOfApp.fair_shifts)
+            .where(models.MaxFairShiftsOfApp.actor_plan_period_id.in_(actor_plan_period_ids),
+                   models.MaxFairShiftsOfApp.inputs_fingerprint == inputs_fingerprint)
+        ).all()
+        return {app_id: (max_shifts, fair_shifts) for app_id, max_shifts, fair_shifts in rows}
+
+
+def replace_fingerprinted(entries: list[schemas.MaxFairShiftsOfAppCreate]) -> None:
+    """Ersetzt die Cache-Einträge der betroffenen ActorPlanPeriods durch `entries`.
+
+    Alte Cache-Einträge (beliebiger Fingerprint) werden per Bulk-DELETE entfernt,
+    Einträge ohne Fingerprint bleiben unverändert.
+    """
+    log_function_info()
+    with get_session() as session:
+        session.execute(
+            sql_delete(models.MaxFairShiftsOfApp)
+            .where(models.MaxFairShiftsOfApp.actor_plan_period_id.in_([e.actor_plan_period_id for e in entries]),
+                   models.MaxFairShiftsOfApp.inputs_fingerprint.is_not(None))
+        )
+        session.add_all(models.MaxFairShiftsOfApp(max_shifts=entry.max_shifts, fair_shifts=entry.fair_shifts,
+                                                  actor_plan_period_id=entry.actor_plan_period_id,
+                                                  inputs_fingerprint=entry.inputs_fingerprint)
+                        for entry in entries)
+        session.flush()
+
+
 def create(max_fair_shifts_per_app: schemas.MaxFairShiftsOfAppCreate) -> schemas.MaxFairShiftsOfAppShow:
     log_function_info()
     with get_session() as session:
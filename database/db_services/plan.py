@@ -18,6 +18,7 @@ from ..database import get_session
 from ..models import _utcnow
 from ._common import log_function_info
 from ._eager_loading import plan_show_options
+from ._trusted_read import to_schema, to_schemas
 
 
 def create(plan_period_id: UUID, name: str, notes: str = '') -> schemas.PlanShow:
@@ -88,7 +89,7 @@ def get(plan_id: UUID, small: bool = False) -> schemas.PlanShow | schemas.Plan:
             return schemas.Plan.model_validate(session.get(models.Plan, plan_id))
         stmt = select(models.Plan).where(models.Plan.id == plan_id).options(*plan_show_options())
         plan = session.exec(stmt).unique().one()
-        return schemas.PlanShow.model_validate(plan)
+        return to_schema(schemas.PlanShow, plan)
 
 
 def get_from__name(plan_name: str, minimal: bool = False) -> schemas.PlanShow | schemas.Plan | None:
@@ -103,7 +104,7 @@ def get_from__name(plan_name: str, minimal: bool = False) -> schemas.PlanShow |
         if not minimal:
             stmt = stmt.options(*plan_show_options())
             plan = session.exec(stmt).unique().first()
-            return schemas.PlanShow.model_validate(plan) if plan else None
+            return to_schema(schemas.PlanShow, plan) if plan else None
         plan = session.exec(stmt).first()
         return schemas.Plan.model_validate(plan) if plan else None
 
@@ -116,7 +117,7 @@ def get_all_from__team(team_id: UUID,
                     .where(models.PlanPeriod.team_id == team_id)
                     .options(*plan_show_options()))
             plans = session.exec(stmt).unique().all()
-            return [schemas.PlanShow.model_validate(p) for p in plans]
+            return to_schemas(schemas.PlanShow, plans)
         stmt = select(models.Plan).join(models.PlanPeriod).where(models.PlanPeriod.team_id == team_id)
         if not inclusive_prep_deleted:
             stmt = stmt.where(models.Plan.prep_delete.is_(None))
@@ -138,7 +139,7 @@ def get_all_from__plan_period(plan_period_id: UUID) -> list[schemas.PlanShow]:
         stmt = (select(models.Plan).where(models.Plan.plan_period_id == plan_period_id)
                 .options(*plan_show_options()))
         plans = session.exec(stmt).unique().all()
-        return [schemas.PlanShow.model_validate(p) for p in plans]
+        return to_schemas(schemas.PlanShow, plans)
 
 
 def get_all_from__plan_period_minimal(plan_period_id: UUID) -> dict[str, UUID]:
@@ -26,6 +26,7 @@ from ..models import _utcnow
 from ._common import log_function_info
 from ._eager_loading import plan_period_show_options, plan_period_actor_tab_options
 from ._soft_delete import active_team_pp_criteria
+from ._trusted_read import to_schema
 
 
 def _register_reminder_jobs(group: "models.NotificationGroup") -> None:
@@ -137,14 +138,14 @@ def get(plan_period_id: UUID, minimal: bool = False, *,
             if not include_deleted:
                 stmt = stmt.options(*active_team_pp_criteria())
             pp = session.exec(stmt).unique().one()
-            return schemas.PlanPeriod.model_validate(pp)
+            return to_schema(schemas.PlanPeriod, pp)
         stmt = (select(models.PlanPeriod)
                 .where(models.PlanPeriod.id == plan_period_id)
                 .options(*plan_period_show_options()))
         if not include_deleted:
             stmt = stmt.options(*active_team_pp_criteria())
         pp = session.exec(stmt).unique().one()
-        return schemas.PlanPeriodShow.model_validate(pp)
+        return to_schema(schemas.PlanPeriodShow, pp)
 
 
 def get_notification_group_info(plan_period_id: UUID) -> "schemas.NotificationGroupInfo | None":
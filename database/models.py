@@ -1378,6 +1378,8 @@ class MaxFairShiftsOfApp(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     max_shifts: int = Field(default=0, ge=0, le=65535)
     fair_shifts: float = Field(default=0.0)
+    # Nur bei Cache-Einträgen des Solvers gesetzt (sat_solver.max_fair_shifts_cache)
+    inputs_fingerprint: str | None = Field(default=None, max_length=64, index=True)
     created_at: datetime = Field(default_factory=_utcnow, sa_column=_created_at_col())
     last_modified: datetime = Field(default_factory=_utcnow, sa_column=_last_modified_col())
 
@@ -1564,3 +1566,17 @@ class EmployeeEvent(SQLModel, table=True):
     employee_event_categories: list[EmployeeEventCategory] = Relationship(
         back_populates="employee_events", link_model=EmployeeEventCategoryLink
     )
+
+
+class SolverTreeRevision(SQLModel, table=True):
+    """Singleton-Zähler (id=1) für den Snapshot-Cache der Solver-Gruppen-Bäume.
+
+    Wird nach jedem Commit, der baumrelevante Tabellen berührt, um 1 erhöht
+    (siehe `database.tree_revision`) — auch von Web-API und anderen
+    Desktop-Clients, daher sieht jeder Solver-Prozess fremde Änderungen.
+    """
+
+    __tablename__ = "solver_tree_revision"
+
+    id: int = Field(default=1, primary_key=True)
+    revision: int = Field(default=0)
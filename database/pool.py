@@ -0,0 +1,254 @@
+"""Connection-Pool-Profile und Pool-Telemetrie.
+
+Drei Prozess-Rollen greifen mit eigenen Pools auf dieselbe Postgres-DB zu:
+
+- ``web``       — Uvicorn-Worker (Browser-UI und Desktop-API): sync Engine aus
+                  `database.database` plus Async-Engine (`web_api.async_database`)
+- ``scheduler`` — Job-Store des APScheduler im Worker mit dem Scheduler-Lock
+- ``desktop``   — Desktop-Client mit direkter DB-Verbindung (URL aus dem Keyring)
+
+Die Profile (`POOL_PROFILES`) legen Größe, Overflow, Timeout und Recycle fest.
+Für die Haupt-Engines eines Prozesses (sync + async) wählt ``DB_POOL_PROFILE``
+ein anderes Profil, ``DB_POOL_SIZE``, ``DB_MAX_OVERFLOW``, ``DB_POOL_TIMEOUT``,
+``DB_POOL_RECYCLE`` und ``DB_POOL_PING_AFTER_IDLE`` überschreiben einzelne
+Werte; der Scheduler-Pool nutzt immer sein Profil.
+
+Liveness: statt ``pool_pre_ping`` (ein Round-Trip bei JEDEM Checkout) wird nur
+eine Verbindung gepingt, die länger als ``ping_after_idle`` Sekunden im Pool
+lag — nur die kann der Server (render.com Idle-Timeout) inzwischen geschlossen
+haben. Schlägt der Ping fehl, verwirft der Pool die Verbindung und versucht
+eine neue (`DisconnectionError`). Heiße Verbindungen gehen ohne Ping raus.
+
+Telemetrie: `PoolMetrics` zählt pro Engine Checkouts, Timeouts, Pings und
+Invalidierungen und führt ein Histogramm der Checkout-Wartezeit (inkl.
+Verbindungsaufbau bei Overflow und Idle-Ping). Abrufbar über
+`pool_metrics_snapshot()` bzw. ``GET /admin/metrics/db-pool``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+
+from sqlalchemy import create_engine, event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float               # Sekunden Warten auf eine freie Verbindung
+    pool_recycle: int                 # Verbindungen nach n Sekunden zwingend erneuern
+    ping_after_idle: float | None     # Ping nur nach so langer Idle-Zeit; None = nie
+
+
+POOL_PROFILES: dict[str, PoolProfile] = {
+    # Threadpool mit 40 Threads, aber die meisten Requests halten die
+    # Verbindung nur Millisekunden — 5 feste + 10 Overflow wie bisher.
+    "web": PoolProfile(pool_size=5, max_overflow=10, pool_timeout=30, pool_recycle=1800, ping_after_idle=60),
+    # Wenige, dafür lange Jobs (Reminder, Solver-Ergebnisse); Warten ist
+    # unkritisch, Verbindungen pro Worker sollen knapp bleiben.
+    "scheduler": PoolProfile(pool_size=1, max_overflow=2, pool_timeout=60, pool_recycle=1800, ping_after_idle=30),
+    # Viele Clients gleichzeitig gegen dieselbe DB, lange Idle-Phasen
+    # zwischen Dialogen: kleiner Pool, früh recyceln.
+    "desktop": PoolProfile(pool_size=2, max_overflow=3, pool_timeout=30, pool_recycle=600, ping_after_idle=30),
+}
+
+# SQLAlchemy-Cache kompilierter Statements (Default 500 Einträge) — hält auch
+# die heißen Abfragen großer Services ohne Neu-Kompilierung.
+QUERY_CACHE_SIZE = int(os.environ.get("DB_QUERY_CACHE_SIZE", "1200"))
+
+_ENV_OVERRIDES: dict[str, tuple[str, type]] = {
+    "pool_size": ("DB_POOL_SIZE", int),
+    "max_overflow": ("DB_MAX_OVERFLOW", int),
+    "pool_timeout": ("DB_POOL_TIMEOUT", float),
+    "pool_recycle": ("DB_POOL_RECYCLE", int),
+    "ping_after_idle": ("DB_POOL_PING_AFTER_IDLE", float),
+}
+
+
+def resolve_profile(default: str) -> tuple[str, PoolProfile]:
+    """Profilname (``DB_POOL_PROFILE`` oder `default`) und Profil inkl. Env-Overrides.
+
+    ``DB_POOL_PING_AFTER_IDLE=-1`` schaltet den Idle-Ping ab.
+    """
+    name = os.environ.get("DB_POOL_PROFILE") or default
+    if name not in POOL_PROFILES:
+        raise ValueError(f"Unbekanntes Pool-Profil {name!r} (erlaubt: {', '.join(POOL_PROFILES)})")
+    overrides = {}
+    for field_name, (env_name, cast) in _ENV_OVERRIDES.items():
+        if raw := os.environ.get(env_name):
+            overrides[field_name] = cast(raw)
+    if overrides.get("ping_after_idle", 0) < 0:
+        overrides["ping_after_idle"] = None
+    return name, replace(POOL_PROFILES[name], **overrides)
+
+
+# ── Telemetrie ───────────────────────────────────────────────────────────────
+
+# Obergrenzen der Wartezeit-Buckets in Sekunden (Prometheus-Konvention `le`).
+WAIT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class PoolMetrics:
+    """Zähler und Wartezeit-Histogramm eines Pools (thread-sicher)."""
+
+    def __init__(self, name: str, profile_name: str, profile: PoolProfile):
+        self.name = name
+        self.profile_name = profile_name
+        self.profile = profile
+        self.engine: Engine | None = None
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_sum = 0.0
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self.invalidations = 0
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._bucket_counts[bisect_left(WAIT_BUCKETS, seconds)] += 1
+            self._wait_sum += seconds
+            self.checkouts += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            cumulative, buckets = 0, []
+            for upper, count in zip((*WAIT_BUCKETS, float("inf")), self._bucket_counts):
+                cumulative += count
+                buckets.append({"le": "+Inf" if upper == float("inf") else upper, "count": cumulative})
+            return {
+                "profile": self.profile_name,
+                "pool_size": self.profile.pool_size,
+                "max_overflow": self.profile.max_overflow,
+                "checked_out": pool.checkedout() if pool is not None else 0,
+                "checked_in": pool.checkedin() if pool is not None else 0,
+                "overflow": max(pool.overflow(), 0) if pool is not None else 0,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "pings": self.pings,
+                "ping_failures": self.ping_failures,
+                "invalidations": self.invalidations,
+                "wait_seconds_sum": round(self._wait_sum, 6),
+                "wait_seconds_buckets": buckets,
+            }
+
+
+_registry: dict[str, PoolMetrics] = {}
+_registry_lock = threading.Lock()
+
+
+def pool_metrics_snapshot() -> dict[str, dict]:
+    """Momentaufnahme aller instrumentierten Pools dieses Prozesses."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {m.name: m.snapshot() for m in metrics}
+
+
+class _WaitTimingMixin:
+    """Misst `Pool.connect()` — Warten auf eine freie Verbindung, ggf.
+    Verbindungsaufbau und Idle-Ping. (`_do_get` ruft sich rekursiv auf und
+    eignet sich daher nicht.)"""
+
+    metrics: PoolMetrics
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def _pool_class(base: type, metrics: PoolMetrics) -> type:
+    # Eigene Unterklasse pro Engine: `Pool.recreate()` (z. B. nach `dispose()`)
+    # baut über `self.__class__` nach und behält so die Metriken.
+    return type(f"Instrumented{base.__name__}", (_WaitTimingMixin, base), {"metrics": metrics})
+
+
+def _install_liveness(engine: Engine, metrics: PoolMetrics, ping_after_idle: float | None) -> None:
+    @event.listens_for(engine, "connect")
+    def _on_connect(_dbapi_connection, connection_record):
+        metrics.increment("connects")
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(_dbapi_connection, connection_record):
+        connection_record.info["idle_since"] = time.monotonic()
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(_dbapi_connection, _connection_record, _exception):
+        metrics.increment("invalidations")
+
+    if ping_after_idle is None:
+        return
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, _connection_proxy):
+        idle_since = connection_record.info.get("idle_since")
+        if idle_since is None or time.monotonic() - idle_since < ping_after_idle:
+            return
+        metrics.increment("pings")
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as exc:
+            metrics.increment("ping_failures")
+            # Pool verwirft die Verbindung und versucht es mit einer neuen.
+            raise sa_exc.DisconnectionError(f"Idle-Ping fehlgeschlagen: {exc}") from exc
+
+
+def create_pooled_engine(url, name: str, profile_name: str, profile: PoolProfile, *, is_async: bool = False, **kwargs):
+    """Engine mit Profil, Idle-Ping und Telemetrie; registriert sie unter `name`.
+
+    `is_async=True` liefert eine `AsyncEngine` (asyncpg); Instrumentierung
+    hängt dann an deren `sync_engine`.
+    """
+    metrics = PoolMetrics(name, profile_name, profile)
+    options = dict(
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_timeout=profile.pool_timeout,
+        pool_recycle=profile.pool_recycle,
+        poolclass=_pool_class(AsyncAdaptedQueuePool if is_async else QueuePool, metrics),
+        query_cache_size=QUERY_CACHE_SIZE,
+        **kwargs,
+    )
+    if is_async:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine(url, **options)
+        sync_engine = engine.sync_engine
+    else:
+        engine = sync_engine = create_engine(url, **options)
+
+    _install_liveness(sync_engine, metrics, profile.ping_after_idle)
+    metrics.engine = sync_engine
+    with _registry_lock:
+        _registry[name] = metrics
+    logger.info("DB-Pool %s: Profil %s (%s)", name, profile_name, profile)
+    return engine
@@ -1358,6 +1358,13 @@ class AppointmentCreate(BaseModel):
     event: Event
 
 
+class AppointmentIdsCreate(BaseModel):
+    """Appointment nur mit IDs — Solver-Ergebnis, das ohne Hydrierung gespeichert werden kann."""
+    notes: Optional[str] = ''
+    event_id: UUID
+    avail_day_ids: List[UUID]
+
+
 class Appointment(AppointmentCreate):
     model_config = ConfigDict(from_attributes=True)
     guests: list[str] = []
@@ -1594,6 +1601,7 @@ class MaxFairShiftsOfAppCreate(BaseModel):
     max_shifts: int
     fair_shifts: float
     actor_plan_period_id: UUID
+    inputs_fingerprint: Optional[str] = None
 
 
 class MaxFairShiftsOfApp(BaseModel):
@@ -1602,6 +1610,7 @@ class MaxFairShiftsOfApp(BaseModel):
     id: UUID
     max_shifts: int
     fair_shifts: float
+    inputs_fingerprint: Optional[str] = None
     created_at: datetime.datetime
     last_modified: datetime.datetime
 
@@ -0,0 +1,123 @@
+"""Daten-Revision der Solver-Gruppen-Bäume (`solver_tree_revision`, eine Zeile).
+
+Der Snapshot-Cache in `sat_solver.tree_snapshot` bindet jeden Eintrag an die
+Revision, unter der sein Bau begonnen hat. Session-Listener bumpen sie nach
+jedem Commit, der EventGroup-/AvailDayGroup-/CastGroup-Bäume oder deren
+Payloads berührt — in jedem Prozess, der `database.database` importiert
+(Web-API, Solver-Worker, Desktop-Client mit direkter DB-Verbindung). Die
+Revision liegt in der DB, ein Solver sieht also auch Änderungen, die ein
+anderer Prozess (z. B. die Web-API für einen Desktop-Client) geschrieben hat.
+
+Wie bei `web_api.calendar_cache` läuft der Bump NACH dem Commit in einer
+eigenen Mini-Transaktion: Wer die neue Revision liest, sieht auch die neuen
+Daten, und im fachlichen Transaktionspfad entsteht kein Row-Lock.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as SASession
+
+from database.models import (
+    ActorPlanPeriod,
+    AvailDay,
+    AvailDayGroup,
+    CastGroup,
+    CastGroupLink,
+    CastRule,
+    Event,
+    EventGroup,
+    LocationPlanPeriod,
+    SolverTreeRevision,
+)
+
+logger = logging.getLogger(__name__)
+
+# Alles, was in Struktur oder Payload der Bäume einfließt.
+_TRACKED_MODELS: tuple[type, ...] = (
+    ActorPlanPeriod,
+    AvailDay,
+    AvailDayGroup,
+    CastGroup,
+    CastGroupLink,
+    CastRule,
+    Event,
+    EventGroup,
+    LocationPlanPeriod,
+)
+_TRACKED_TABLES: frozenset[str] = frozenset(m.__tablename__ for m in _TRACKED_MODELS)
+
+_SESSION_FLAG = "solver_tree_dirty"
+_REVISION_ROW_ID = 1
+
+
+def current_revision() -> int:
+    """Aktuelle Revision aus der DB (0, solange noch nie gebumpt wurde)."""
+    from database import database as db_module
+
+    with db_module.engine.connect() as connection:
+        revision = connection.execute(
+            select(SolverTreeRevision.revision).where(SolverTreeRevision.id == _REVISION_ROW_ID)
+        ).scalar_one_or_none()
+    return revision or 0
+
+
+def bump_revision(connection) -> None:
+    """Erhöht die Revision atomar, legt die Zeile beim allerersten Bump an."""
+    increment = (update(SolverTreeRevision)
+                 .where(SolverTreeRevision.id == _REVISION_ROW_ID)
+                 .values(revision=SolverTreeRevision.revision + 1))
+    if connection.execute(increment).rowcount:
+        return
+    try:
+        with connection.begin_nested():
+            connection.execute(SolverTreeRevision.__table__.insert().values(id=_REVISION_ROW_ID, revision=1))
+    except IntegrityError:
+        # Paralleler Erst-Bump hat die Zeile angelegt — dann nur erhöhen.
+        connection.execute(increment)
+
+
+def _touches_trees(objects) -> bool:
+    return any(isinstance(obj, _TRACKED_MODELS) for obj in objects)
+
+
+def _after_flush(session: SASession, _flush_context) -> None:
+    if _touches_trees(session.new) or _touches_trees(session.dirty) or _touches_trees(session.deleted):
+        session.info[_SESSION_FLAG] = True
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    """Bulk-UPDATE/DELETE laufen am Flush vorbei — hier separat erkennen."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        orm_execute_state.session.info[_SESSION_FLAG] = True
+
+
+def _after_commit(session: SASession) -> None:
+    if not session.info.pop(_SESSION_FLAG, False):
+        return
+    try:
+        with session.get_bind().begin() as connection:
+            bump_revision(connection)
+    except Exception:
+        # Der Commit ist bereits durch; schlimmstenfalls greift `max_age`.
+        logger.exception("Solver-Baum-Revision konnte nicht erhöht werden")
+
+
+def _after_soft_rollback(session: SASession, _previous_transaction) -> None:
+    session.info.pop(_SESSION_FLAG, None)
+
+
+def register_tree_revision_listeners() -> None:
+    """Registriert die Invalidierungs-Listener global auf `Session`. Idempotent."""
+    if event.contains(SASession, "after_flush", _after_flush):
+        return
+    event.listen(SASession, "after_flush", _after_flush)
+    event.listen(SASession, "do_orm_execute", _do_orm_execute)
+    event.listen(SASession, "after_commit", _after_commit)
+    event.listen(SASession, "after_soft_rollback", _after_soft_rollback)
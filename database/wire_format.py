@@ -0,0 +1,110 @@
+"""
+Normalisiertes JSON-Format für tiefe Lese-Schemas (PlanShow, PlanPeriodShow, …).
+
+Ein `PlanShow` schachtelt Appointment → AvailDay → ActorPlanPeriod → Person …;
+dieselbe Person, derselbe Arbeitsort, dieselbe Tageszeit und dieselbe
+Planperiode stehen im normalen JSON hundertfach. Das Normalisieren legt jedes
+Objekt mit `id` genau einmal in einer Entity-Tabelle ab (Schlüssel:
+Schema-Klasse + id) und ersetzt jedes Vorkommen durch eine Referenz:
+
+    {
+      "$normalized": 1,
+      "root": {"$ref": ["PlanShow", "<id>"]},
+      "entities": {
+        "PlanShow": {"<id>": {"name": "...", "appointments": [{"$ref": ["Appointment", "<id>"]}, ...]}},
+        "Person": {"<id>": {...}},
+        ...
+      }
+    }
+
+Objekte ohne `id` bleiben eingebettet. `decode` baut daraus Schema-Objekte,
+die zwischen allen Referenzen geteilt sind (Pydantic übernimmt Instanzen der
+passenden Klasse ohne Kopie) — weniger Validierung und weniger Speicher im
+Client. Ausnahme sind Klassen mit `revalidate_instances='always'` (z. B.
+TimeOfDay), die Pydantic pro Vorkommen kopiert.
+
+Ausgehandelt wird das Format per `Accept: application/vnd.hcc-plan.normalized+json`;
+ohne den Header antwortet der Server wie bisher. `decode` akzeptiert beide
+Formen.
+"""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from database import schemas
+
+NORMALIZED_MEDIA_TYPE = 'application/vnd.hcc-plan.normalized+json'
+
+_MARKER = '$normalized'
+_REF = '$ref'
+_VERSION = 1
+
+M = TypeVar('M', bound=BaseModel)
+
+
+def _encode(value: Any, entities: dict[str, dict[str, Any]]) -> Any:
+    if isinstance(value, BaseModel):
+        entity_id = getattr(value, 'id', None)
+        if not isinstance(entity_id, UUID):
+            return {name: _encode(getattr(value, name), entities) for name in type(value).model_fields}
+        type_name, key = type(value).__name__, str(entity_id)
+        table = entities.setdefault(type_name, {})
+        if key not in table:
+            table[key] = {name: _encode(getattr(value, name), entities) for name in type(value).model_fields}
+        return {_REF: [type_name, key]}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_encode(item, entities) for item in value]
+    if isinstance(value, dict):
+        return {to_jsonable_python(key): _encode(item, entities) for key, item in value.items()}
+    return to_jsonable_python(value)
+
+
+def encode(model: BaseModel) -> dict[str, Any]:
+    """Normalisierte, JSON-fähige Darstellung von `model`."""
+    entities: dict[str, dict[str, Any]] = {}
+    root = _encode(model, entities)
+    return {_MARKER: _VERSION, 'root': root, 'entities': entities}
+
+
+def is_normalized(data: Any) -> bool:
+    return isinstance(data, dict) and data.get(_MARKER) == _VERSION
+
+
+def _schema_class(type_name: str) -> type[BaseModel]:
+    cls = getattr(schemas, type_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise ValueError(f'Unbekannter Schema-Typ im normalisierten JSON: {type_name!r}')
+    return cls
+
+
+def decode(data: Any, model: type[M]) -> M:
+    """Baut `model` aus normalisiertem oder normalem JSON.
+
+    Jede Entity wird genau einmal validiert; alle Referenzen zeigen auf dasselbe Objekt.
+    """
+    if not is_normalized(data):
+        return model.model_validate(data)
+    tables: dict[str, dict[str, Any]] = data['entities']
+    built: dict[tuple[str, str], BaseModel] = {}
+
+    def entity(type_name: str, key: str) -> BaseModel:
+        if (obj := built.get((type_name, key))) is None:
+            obj = _schema_class(type_name).model_validate(resolve(tables[type_name][key]))
+            built[(type_name, key)] = obj
+        return obj
+
+    def resolve(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and _REF in value:
+                return entity(*value[_REF])
+            return {key: resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [resolve(item) for item in value]
+        return value
+
+    return model.model_validate(resolve(data['root']))
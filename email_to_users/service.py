@@ -8,24 +8,35 @@ DB lädt. Damit gibt es nur noch eine SMTP-Konfigurationsquelle im System.
 """
 
 import logging
+import time
 import uuid
+from collections import defaultdict
 from datetime import date
 from typing import Any, Dict, List, Optional
 
 from jinja2.sandbox import SandboxedEnvironment
-from sqlalchemy import select as sa_select
+from sqlalchemy import func, or_, select as sa_select
 
 from database import schemas
 from database.database import get_session
 from database.models import (
+    ActorPlanPeriod,
+    Appointment,
+    AvailDay,
+    AvailDayAppointmentLink,
+    Event,
+    LocationOfWork,
+    LocationPlanPeriod,
     NotificationGroup,
     NotificationLog,
     Person,
     Plan,
     PlanPeriod,
+    TeamActorAssign,
+    TimeOfDay,
 )
 from web_api.email.config_loader import SmtpConfig
-from web_api.email.service import EmailPayload, _send_one_smtp
+from web_api.email.service import EmailPayload, _send_many_smtp, _send_one_smtp
 from web_api.templating import templates as jinja_templates
 
 logger = logging.getLogger(__name__)
@@ -51,6 +62,12 @@ _REMINDER_SUBJECT = {
 }
 _REMINDER_DAYS_LEFT = {"t7": 7, "t3": 3, "t1": 1, "catchup": 0}
 
+# Reminder werden in Bloecken versendet: Mails eines Blocks ueber eine
+# SMTP-Verbindung, danach NotificationLog + Inbox-Messages des Blocks in einem
+# INSERT und ein Commit. Nach Crash mitten im Block wird hoechstens dieser
+# Block erneut versendet.
+_REMINDER_BATCH_SIZE = 50
+
 # Mapping Reminder-Kind → InboxMessageType. Lazy-Lookup ueber Strings, damit
 # das Modul ohne InboxMessageType-Import ladbar bleibt; die Aufloesung
 # passiert erst beim Versand (siehe `_create_reminder_inbox_message`).
@@ -107,6 +124,10 @@ class EmailService:
             logger.exception("E-Mail-Versand fehlgeschlagen (to=%s)", payload.to)
             return False, f"{type(exc).__name__}: {exc}"
 
+    def _send_many(self, payloads: List[EmailPayload]) -> List[Optional[str]]:
+        """Sendet mehrere Mails über eine SMTP-Verbindung; pro Payload `None` oder Fehlertext."""
+        return _send_many_smtp(payloads, self.smtp_config)
+
     def _render(self, template_name: str, ctx: Dict[str, Any]) -> str:
         """Rendert ein Jinja2-Template aus web_api/templates/emails/."""
         return jinja_templates.get_template(f"emails/{template_name}").render(**ctx)
@@ -116,9 +137,18 @@ class EmailService:
         plan_id: str,
         recipient_ids: Optional[List[str]] = None,
         include_attachments: bool = False,
+        dry_run: bool = False,
     ) -> Dict[str, Any]:
         """Versendet eine Plan-Benachrichtigung pro Empfänger mit individueller Einsatzliste.
 
+        Drei Stufen, getrennt gemessen (`timings_ms`):
+        - query: Einsatzlisten aller Empfänger in einer Abfrage (`_assignments_by_person`)
+        - render: alle Mails rendern, bevor die erste versendet wird
+        - deliver: Versand über eine SMTP-Verbindung (`_send_many`)
+
+        `dry_run=True` lässt den Versand weg und liefert nur Anzahl (`rendered`)
+        und Zeiten — zum Prüfen vor einer Planfreigabe an viele Empfänger.
+
         Anhänge werden in dieser Pipeline nicht unterstützt — wenn der Aufrufer
         include_attachments=True setzt, loggen wir eine Warnung und ignorieren.
         """
@@ -128,47 +158,62 @@ class EmailService:
                 "läuft in dieser Web-API-Pipeline nicht (xlsxwriter ist Desktop-only)."
             )
 
+        started = time.perf_counter()
         with get_session() as session:
-            plan = session.get(Plan, plan_id)
+            plan = session.get(Plan, uuid.UUID(str(plan_id)))
             if plan is None:
                 return {"success": 0, "failed": 0, "error": "Plan nicht gefunden"}
             plan_period = plan.plan_period
-            team = plan_period.team
+            team_name = plan_period.team.name
 
-            recipients = self._resolve_plan_recipients(session, plan, recipient_ids)
+            assignments_by_person = self._assignments_by_person(session, plan.id)
+            recipients = self._resolve_plan_recipients(session, assignments_by_person, recipient_ids)
             if not recipients:
                 return {"success": 0, "failed": 0}
+            query_done = time.perf_counter()
 
             period_str = (
                 f"{plan_period.start.strftime('%d.%m.%Y')} - "
                 f"{plan_period.end.strftime('%d.%m.%Y')}"
             )
-            stats = {"success": 0, "failed": 0}
-
-            for person in recipients:
-                assignments = self._extract_assignments_for_person(plan, person.id)
-                if not assignments:
-                    continue
-                ctx = {
-                    "recipient_name": person.full_name,
-                    "recipient_first_name": person.f_name or "",
-                    "plan_name": plan.name,
-                    "plan_period": period_str,
-                    "team_name": team.name,
-                    "assignments": assignments,
-                    "notes": plan.notes,
-                }
-                payload = EmailPayload(
+            template = jinja_templates.get_template("emails/plan_notification.html")
+            subject = f"Neuer Einsatzplan verfügbar: {plan.name}"
+            payloads = [
+                EmailPayload(
                     to=[str(person.email)],
-                    subject=f"Neuer Einsatzplan verfügbar: {plan.name}",
-                    html_body=self._render("plan_notification.html", ctx),
+                    subject=subject,
+                    html_body=template.render(
+                        recipient_name=person.full_name,
+                        recipient_first_name=person.f_name or "",
+                        plan_name=plan.name,
+                        plan_period=period_str,
+                        team_name=team_name,
+                        assignments=assignments_by_person[person.id],
+                        notes=plan.notes,
+                    ),
                 )
-                if self._send_one(payload)[0]:
-                    stats["success"] += 1
-                else:
-                    stats["failed"] += 1
-
-            return stats
+                for person in recipients
+                if assignments_by_person.get(person.id)
+            ]
+        render_done = time.perf_counter()
+
+        stats: Dict[str, Any] = {"success": 0, "failed": 0, "rendered": len(payloads)}
+        if not dry_run:
+            for error in self._send_many(payloads):
+                stats["failed" if error else "success"] += 1
+        deliver_done = time.perf_counter()
+
+        stats["timings_ms"] = {
+            "query": round((query_done - started) * 1000, 1),
+            "render": round((render_done - query_done) * 1000, 1),
+            "deliver": round((deliver_done - render_done) * 1000, 1),
+        }
+        logger.info(
+            "Plan-Benachrichtigung %s%s: %d Mails, %d ok, %d fehlgeschlagen, Zeiten %s",
+            plan_id, " (dry run)" if dry_run else "", len(payloads),
+            stats["success"], stats["failed"], stats["timings_ms"],
+        )
+        return stats
 
     def send_availability_request(
         self,
@@ -252,8 +297,13 @@ class EmailService:
 
         Idempotenz: pro `(group_id, person_id, kind)` wird hoechstens einmal
         erfolgreich versendet — schreibt `notification_log`-Zeile pro Versuch
-        (success/failure), liest vor jedem Versand den Log und skipped
-        Empfaenger mit erfolgreichem vorherigem Eintrag.
+        (success/failure) und skipped Empfaenger mit erfolgreichem vorherigem
+        Eintrag.
+
+        Mengenbasiert: Kandidaten, Zeitraum-Status, bereits versendete
+        Reminder und WebUser-Accounts kommen aus je einer Abfrage; Versand,
+        Log- und Inbox-Inserts laufen blockweise (`_REMINDER_BATCH_SIZE`).
+        `rows_read` / `rows_written` in den Stats zaehlen die beruehrten Zeilen.
         """
         if kind not in _REMINDER_TEMPLATE:
             return {"success": 0, "failed": 0, "skipped": 0,
@@ -269,73 +319,98 @@ class EmailService:
                 return {"success": 0, "failed": 0, "skipped": 0,
                         "error": "Team nicht aktiv"}
 
+            plan_periods = sorted(group.plan_periods, key=lambda p: p.start)
+            candidates = self._reminder_candidates(session, group.id)
+            period_status = self._reminder_period_status(session, group.id)
             if kind in ("t3", "t1"):
-                recipients = self._resolve_group_recipients_saumig(session, group)
+                # saumig: mind. eine Gruppen-PP mit ActorPlanPeriod, aber ohne aktiven AvailDay
+                recipients = [
+                    p for p in candidates
+                    if any(count == 0 for count in period_status.get(p.id, {}).values())
+                ]
             else:
-                recipients = self._resolve_group_recipients_t7(session, group)
+                recipients = candidates
+            already_sent = self._reminders_already_sent(
+                session, group.id, kind, [p.id for p in recipients]
+            )
+            # Personen ohne Account sind im Mapping nicht enthalten und bekommen
+            # entsprechend keinen Inbox-Eintrag (Best-Effort).
+            person_to_web_user_id = self._resolve_web_user_ids(
+                session, [p.id for p in recipients]
+            )
 
-            stats = {"success": 0, "failed": 0, "skipped": 0}
-            template_name = _REMINDER_TEMPLATE[kind]
+            stats: Dict[str, Any] = {
+                "success": 0, "failed": 0, "skipped": 0,
+                "rows_read": (1 + len(plan_periods) + len(candidates)
+                              + sum(len(v) for v in period_status.values())
+                              + len(already_sent) + len(person_to_web_user_id)),
+                "rows_written": 0,
+            }
+            template = jinja_templates.get_template(f"emails/{_REMINDER_TEMPLATE[kind]}")
             days_left = _REMINDER_DAYS_LEFT[kind]
             deadline_str = group.deadline.strftime("%d.%m.%Y")
             subject = _REMINDER_SUBJECT[kind].format(
                 team_name=team.name, deadline=deadline_str,
             )
 
-            # Batch-Lookup Person → WebUser, damit der Inbox-Hook unten ohne
-            # N+1 auskommt. Personen ohne Account sind im Mapping nicht enthalten
-            # und bekommen entsprechend keinen Inbox-Eintrag (Best-Effort).
-            person_to_web_user_id = self._resolve_web_user_ids(
-                session, [p.id for p in recipients]
-            )
-
+            pending: list[tuple[Person, List[Dict[str, Any]], EmailPayload]] = []
             for person in recipients:
                 if not person.email:
                     stats["failed"] += 1
                     continue
-
-                if self._reminder_already_sent(session, group.id, person.id, kind):
+                if person.id in already_sent:
                     stats["skipped"] += 1
                     continue
-
-                periods_ctx = self._build_group_periods_ctx(group, person, url_base)
+                periods_ctx = self._build_group_periods_ctx(
+                    plan_periods, period_status.get(person.id, {}), url_base
+                )
                 if not periods_ctx:
                     # Kein einziger relevanter Zeitraum fuer diese Person —
                     # vermutlich wurde sie nach Group-Anlage aus dem Team genommen.
                     stats["skipped"] += 1
                     continue
-
-                ctx = {
-                    "recipient_name": person.full_name,
-                    "recipient_first_name": person.f_name or "",
-                    "team_name": team.name,
-                    "deadline": deadline_str,
-                    "days_left": days_left,
-                    "periods": periods_ctx,
-                }
                 payload = EmailPayload(
                     to=[str(person.email)],
                     subject=subject,
-                    html_body=self._render(template_name, ctx),
-                )
-                success, error_detail = self._send_one(payload)
-                self._log_reminder(
-                    session, group.id, person.id, kind, success,
-                    error_detail=error_detail,
+                    html_body=template.render(
+                        recipient_name=person.full_name,
+                        recipient_first_name=person.f_name or "",
+                        team_name=team.name,
+                        deadline=deadline_str,
+                        days_left=days_left,
+                        periods=periods_ctx,
+                    ),
                 )
-                if success:
-                    self._create_reminder_inbox_message(
-                        session, person, group, team, kind,
-                        periods_ctx, deadline_str,
-                        person_to_web_user_id,
+                pending.append((person, periods_ctx, payload))
+
+            for start in range(0, len(pending), _REMINDER_BATCH_SIZE):
+                batch = pending[start:start + _REMINDER_BATCH_SIZE]
+                errors = self._send_many([payload for _, _, payload in batch])
+                logs = [
+                    NotificationLog(
+                        notification_group_id=group.id,
+                        person_id=person.id,
+                        kind=kind,
+                        success=error is None,
+                        error_detail=error,
                     )
-                # Pro Mail commit, damit der Idempotenz-Schutz auch bei
-                # Crash/Restart mitten im Loop greift.
+                    for (person, _, _), error in zip(batch, errors)
+                ]
+                session.add_all(logs)
+                inbox_count = self._create_reminder_inbox_messages(
+                    session, group, team, kind, deadline_str,
+                    {
+                        person_to_web_user_id[person.id]: periods_ctx
+                        for (person, periods_ctx, _), error in zip(batch, errors)
+                        if error is None and person.id in person_to_web_user_id
+                    },
+                )
+                # Pro Block commit, damit der Idempotenz-Schutz auch bei
+                # Crash/Restart mitten im Versand greift.
                 session.commit()
-                if success:
-                    stats["success"] += 1
-                else:
-                    stats["failed"] += 1
+                stats["rows_written"] += len(logs) + inbox_count
+                for error in errors:
+                    stats["failed" if error else "success"] += 1
 
             return stats
 
@@ -414,19 +489,25 @@ class EmailService:
 
     # ── Hilfsfunktionen ────────────────────────────────────────────────────────
 
-    def _resolve_plan_recipients(self, session, plan: Plan, recipient_ids):
-        if recipient_ids:
-            return [
-                p for p in (session.get(Person, pid) for pid in recipient_ids)
-                if p is not None
-            ]
-        recipients = []
-        for appointment in plan.appointments:
-            for avail_day in appointment.avail_days:
-                person = avail_day.actor_plan_period.person
-                if person not in recipients:
-                    recipients.append(person)
-        return recipients
+    @staticmethod
+    def _resolve_plan_recipients(
+        session,
+        assignments_by_person: Dict[uuid.UUID, List[Dict[str, str]]],
+        recipient_ids: Optional[List[str]],
+    ) -> List[Person]:
+        """Empfänger in einer Abfrage: `recipient_ids` in deren Reihenfolge, sonst alle Eingesetzten."""
+        person_ids = (
+            [uuid.UUID(str(pid)) for pid in recipient_ids] if recipient_ids
+            else list(assignments_by_person)
+        )
+        if not person_ids:
+            return []
+        persons = {
+            p.id: p for p in session.execute(
+                sa_select(Person).where(Person.id.in_(person_ids))
+            ).scalars()
+        }
+        return [persons[pid] for pid in person_ids if pid in persons]
 
     def _resolve_period_recipients(self, session, plan_period: PlanPeriod, recipient_ids):
         if recipient_ids:
@@ -442,93 +523,104 @@ class EmailService:
                 recipients.append(taa.person)
         return recipients
 
-    def _extract_assignments_for_person(self, plan: Plan, person_id) -> List[Dict[str, str]]:
-        assignments = []
-        for appointment in plan.appointments:
-            for avail_day in appointment.avail_days:
-                if avail_day.actor_plan_period.person.id != person_id:
-                    continue
-                event = appointment.event
-                location = event.location_plan_period.location_of_work
-                assignments.append({
-                    "date": event.date.strftime("%d.%m.%Y"),
-                    "time": event.time_of_day.name,
-                    "location": location.name,
-                })
-        return assignments
+    @staticmethod
+    def _assignments_by_person(session, plan_id: uuid.UUID) -> Dict[uuid.UUID, List[Dict[str, str]]]:
+        """Einsatzlisten aller Personen eines Plans in einer Abfrage, nach Datum und Tageszeit sortiert.
+
+        Ersetzt den Lauf über `plan.appointments` pro Empfänger (Lazy-Loads für
+        Event, Tageszeit, Arbeitsort und Person bei jedem Durchlauf). Die
+        Reihenfolge der Schlüssel ist die des ersten Einsatzes.
+        """
+        rows = session.execute(
+            sa_select(ActorPlanPeriod.person_id, Event.date, TimeOfDay.name, LocationOfWork.name)
+            .select_from(Appointment)
+            .join(AvailDayAppointmentLink, AvailDayAppointmentLink.appointment_id == Appointment.id)
+            .join(AvailDay, AvailDay.id == AvailDayAppointmentLink.avail_day_id)
+            .join(ActorPlanPeriod, ActorPlanPeriod.id == AvailDay.actor_plan_period_id)
+            .join(Event, Event.id == Appointment.event_id)
+            .join(TimeOfDay, TimeOfDay.id == Event.time_of_day_id)
+            .join(LocationPlanPeriod, LocationPlanPeriod.id == Event.location_plan_period_id)
+            .join(LocationOfWork, LocationOfWork.id == LocationPlanPeriod.location_of_work_id)
+            .where(Appointment.plan_id == plan_id)
+            .order_by(Event.date, TimeOfDay.start, LocationOfWork.name)
+        ).all()
+        by_person: Dict[uuid.UUID, List[Dict[str, str]]] = defaultdict(list)
+        for person_id, event_date, time_of_day_name, location_name in rows:
+            by_person[person_id].append({
+                "date": event_date.strftime("%d.%m.%Y"),
+                "time": time_of_day_name,
+                "location": location_name,
+            })
+        return dict(by_person)
 
     # ── Reminder-Helfer ────────────────────────────────────────────────────────
 
-    def _resolve_group_recipients_t7(
-        self, session, group: NotificationGroup
-    ) -> List[Person]:
-        """Union der Team-Members aller Gruppen-PPs (mit TeamActorAssign-Overlap)."""
-        seen: dict[uuid.UUID, Person] = {}
-        for pp in group.plan_periods:
-            for person in self._resolve_period_recipients(session, pp, None):
-                if person.prep_delete is not None:
-                    continue
-                if person.id not in seen:
-                    seen[person.id] = person
-        return list(seen.values())
+    @staticmethod
+    def _reminder_candidates(session, group_id: uuid.UUID) -> List[Person]:
+        """Team-Members aller Gruppen-PPs (TeamActorAssign-Overlap), ohne geloeschte Personen."""
+        stmt = (
+            sa_select(Person)
+            .join(TeamActorAssign, TeamActorAssign.person_id == Person.id)
+            .join(PlanPeriod, PlanPeriod.team_id == TeamActorAssign.team_id)
+            .where(
+                PlanPeriod.notification_group_id == group_id,
+                TeamActorAssign.start <= PlanPeriod.end,
+                or_(TeamActorAssign.end.is_(None), TeamActorAssign.end >= PlanPeriod.start),
+                Person.prep_delete.is_(None),
+            )
+            .distinct()
+            .order_by(Person.f_name, Person.l_name, Person.id)
+        )
+        return list(session.execute(stmt).scalars())
 
-    def _resolve_group_recipients_saumig(
-        self, session, group: NotificationGroup
-    ) -> List[Person]:
-        """Personen mit mind. einer Gruppen-PP ohne AvailDay.
+    @staticmethod
+    def _reminder_period_status(
+        session, group_id: uuid.UUID
+    ) -> Dict[uuid.UUID, Dict[uuid.UUID, int]]:
+        """`person_id → {plan_period_id → Anzahl aktiver AvailDays}` fuer alle Gruppen-PPs.
 
-        Pro Person wird gefragt: gibt es eine ActorPlanPeriod in einer der
-        Gruppen-PPs, in der die Person noch keinen aktiven AvailDay hat? Wenn
-        ja → saumig, Reminder geht raus. Wer ueberall (alle relevanten APPs)
-        bereits ≥1 AvailDay hat, ist fuer diese Stufe fertig.
+        Enthalten sind nur PPs, in denen die Person eine ActorPlanPeriod hat
+        (beim PP-Insert angelegt, wenn ihr TeamActorAssign mit der PP ueberlappt).
         """
-        candidates = self._resolve_group_recipients_t7(session, group)
-        saumig: list[Person] = []
-        for person in candidates:
-            if self._person_has_open_period(group, person):
-                saumig.append(person)
-        return saumig
-
-    @staticmethod
-    def _person_has_open_period(group: NotificationGroup, person: Person) -> bool:
-        for pp in group.plan_periods:
-            person_app = next(
-                (app for app in pp.actor_plan_periods if app.person_id == person.id),
-                None,
+        rows = session.execute(
+            sa_select(
+                ActorPlanPeriod.person_id,
+                ActorPlanPeriod.plan_period_id,
+                func.count(AvailDay.id),
             )
-            if person_app is None:
-                continue
-            active_avail_days = [ad for ad in person_app.avail_days if ad.prep_delete is None]
-            if not active_avail_days:
-                return True
-        return False
+            .join(PlanPeriod, PlanPeriod.id == ActorPlanPeriod.plan_period_id)
+            .outerjoin(
+                AvailDay,
+                (AvailDay.actor_plan_period_id == ActorPlanPeriod.id) & AvailDay.prep_delete.is_(None),
+            )
+            .where(PlanPeriod.notification_group_id == group_id)
+            .group_by(ActorPlanPeriod.person_id, ActorPlanPeriod.plan_period_id)
+        ).all()
+        status: Dict[uuid.UUID, Dict[uuid.UUID, int]] = defaultdict(dict)
+        for person_id, plan_period_id, count in rows:
+            status[person_id][plan_period_id] = count
+        return dict(status)
 
     @staticmethod
     def _build_group_periods_ctx(
-        group: NotificationGroup,
-        person: Person,
+        plan_periods: List[PlanPeriod],
+        person_status: Dict[uuid.UUID, int],
         url_base: Optional[str],
     ) -> List[Dict[str, Any]]:
-        """Liste der fuer `person` relevanten Gruppen-PPs mit Status + Link.
+        """Liste der fuer eine Person relevanten Gruppen-PPs mit Status + Link.
 
-        Eine PP ist relevant, wenn die Person dort eine ActorPlanPeriod hat
-        (was beim PP-Insert nur passiert, wenn ihr TeamActorAssign mit der PP
-        ueberlappt). Status `submitted` ↔ ≥1 aktiver AvailDay; sonst `open`.
+        `person_status` ist der Eintrag der Person aus `_reminder_period_status`.
+        Status `submitted` ↔ ≥1 aktiver AvailDay; sonst `open`.
 
         URL-Format: `<url_base>/availability?plan_period_id=<pp_id>` — die
         Web-Verfuegbarkeitsmaske ist Login-gated und identifiziert die Person
         ueber das Auth-Token, nicht ueber URL-Parameter.
         """
         items: list[dict] = []
-        for pp in sorted(group.plan_periods, key=lambda p: p.start):
-            person_app = next(
-                (app for app in pp.actor_plan_periods if app.person_id == person.id),
-                None,
-            )
-            if person_app is None:
+        for pp in plan_periods:
+            submitted_count = person_status.get(pp.id)
+            if submitted_count is None:
                 continue
-            active_avail_days = [ad for ad in person_app.avail_days if ad.prep_delete is None]
-            status = "submitted" if active_avail_days else "open"
             url = (
                 f"{url_base.rstrip('/')}/availability?plan_period_id={pp.id}"
                 if url_base
@@ -540,46 +632,29 @@ class EmailService:
                     f"{pp.end.strftime('%d.%m.%Y')}"
                 ),
                 "url": url,
-                "status": status,
-                "submitted_count": len(active_avail_days),
+                "status": "submitted" if submitted_count else "open",
+                "submitted_count": submitted_count,
                 "notes_for_employees": pp.notes_for_employees,
             })
         return items
 
     @staticmethod
-    def _reminder_already_sent(
+    def _reminders_already_sent(
         session,
         group_id: uuid.UUID,
-        person_id: uuid.UUID,
         kind: str,
-    ) -> bool:
-        """True, wenn fuer (group, person, kind) bereits ein erfolgreicher Log existiert."""
-        stmt = sa_select(NotificationLog.id).where(
+        person_ids: List[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        """Personen, fuer die (group, kind) bereits ein erfolgreicher Log existiert."""
+        if not person_ids:
+            return set()
+        stmt = sa_select(NotificationLog.person_id).where(
             NotificationLog.notification_group_id == group_id,
-            NotificationLog.person_id == person_id,
             NotificationLog.kind == kind,
             NotificationLog.success.is_(True),
-        )
-        return session.execute(stmt).first() is not None
-
-    @staticmethod
-    def _log_reminder(
-        session,
-        group_id: uuid.UUID,
-        person_id: uuid.UUID,
-        kind: str,
-        success: bool,
-        error_detail: Optional[str] = None,
-    ) -> None:
-        log = NotificationLog(
-            notification_group_id=group_id,
-            person_id=person_id,
-            kind=kind,
-            success=success,
-            error_detail=error_detail,
-        )
-        session.add(log)
-        session.flush()
+            NotificationLog.person_id.in_(person_ids),
+        ).distinct()
+        return set(session.execute(stmt).scalars())
 
     @staticmethod
     def _resolve_web_user_ids(
@@ -607,29 +682,27 @@ class EmailService:
         return {row[0]: row[1] for row in rows}
 
     @staticmethod
-    def _create_reminder_inbox_message(
+    def _create_reminder_inbox_messages(
         session,
-        person: Person,
         group: NotificationGroup,
         team,
         kind: str,
-        periods_ctx: List[Dict[str, Any]],
         deadline_str: str,
-        person_to_web_user_id: Dict[uuid.UUID, uuid.UUID],
-    ) -> None:
-        """Schreibt eine InboxMessage fuer den Reminder, falls die Person einen
-        aktiven WebUser-Account hat. Best-Effort: Failures werden geloggt,
-        aber nicht gepropagiert — der Mail-Versand bleibt die Wahrheit.
+        periods_by_web_user_id: Dict[uuid.UUID, List[Dict[str, Any]]],
+    ) -> int:
+        """Schreibt die InboxMessages eines Versand-Blocks (ein INSERT beim Commit).
+
+        Best-Effort: Failures werden geloggt, aber nicht gepropagiert — der
+        Mail-Versand bleibt die Wahrheit. Gibt die Anzahl angelegter Messages
+        zurueck.
         """
-        web_user_id = person_to_web_user_id.get(person.id)
-        if web_user_id is None:
-            return
+        if not periods_by_web_user_id:
+            return 0
         try:
             # Lazy-Import: vermeidet Zirkular bei Modul-Laden.
-            from web_api.inbox.service import create_inbox_message
+            from web_api.inbox.service import create_inbox_messages
             from web_api.models.web_models import InboxMessageType
 
-            msg_type = InboxMessageType(_REMINDER_INBOX_TYPE[kind])
             snapshot = {
                 "team_name": team.name,
                 "location_name": f"Team {team.name}",
@@ -637,21 +710,24 @@ class EmailService:
                 "deadline": deadline_str,
                 "kind": kind,
                 "days_left": _REMINDER_DAYS_LEFT[kind],
-                "periods": periods_ctx,
             }
-            create_inbox_message(
+            messages = create_inbox_messages(
                 session,
-                recipient_id=web_user_id,
-                msg_type=msg_type,
+                msg_type=InboxMessageType(_REMINDER_INBOX_TYPE[kind]),
                 reference_id=group.id,
                 reference_type="notification_group",
-                snapshot_data=snapshot,
+                snapshots={
+                    web_user_id: {**snapshot, "periods": periods_ctx}
+                    for web_user_id, periods_ctx in periods_by_web_user_id.items()
+                },
             )
+            return len(messages)
         except Exception:
             logger.exception(
-                "Inbox-Insert fuer Reminder fehlgeschlagen (group=%s person=%s kind=%s) — Mail-Versand unberuehrt",
-                group.id, person.id, kind,
+                "Inbox-Insert fuer Reminder fehlgeschlagen (group=%s kind=%s) — Mail-Versand unberuehrt",
+                group.id, kind,
             )
+            return 0
 
 
 def _text_to_html(text: str) -> str:
@@ -28,8 +28,8 @@ def update(actor_plan_period: schemas.ActorPlanPeriodShow) -> schemas.ActorPlanP
 
 def update_notes(app_id: uuid.UUID, notes: str | None) -> None:
     """204 No Content — Widget mutiert sein Notes-Feld lokal."""
-    get_api_client().patch(f"/api/v1/actor-plan-periods/{app_id}/notes",
-                           json={"notes": notes})
+    get_api_client().write("PATCH", f"/api/v1/actor-plan-periods/{app_id}/notes",
+                           json={"notes": notes}, coalesce=True)
 
 
 def update_requested_assignments(app_id: uuid.UUID, requested_assignments: int,
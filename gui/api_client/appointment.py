@@ -14,7 +14,8 @@ def create(appointment: schemas.AppointmentCreate, plan_id: uuid.UUID) -> schema
     return schemas.AppointmentShow.model_validate(data)
 
 
-def create_bulk(appointments: list[schemas.AppointmentCreate], plan_id: uuid.UUID) -> list[uuid.UUID]:
+def create_bulk(appointments: list[schemas.AppointmentCreate | schemas.AppointmentIdsCreate],
+                plan_id: uuid.UUID) -> list[uuid.UUID]:
     data = get_api_client().post("/api/v1/appointments/bulk", json={
         "plan_id": str(plan_id),
         "appointments": [a.model_dump(mode="json") for a in appointments],
@@ -23,23 +24,23 @@ def create_bulk(appointments: list[schemas.AppointmentCreate], plan_id: uuid.UUI
 
 
 def update_avail_days(appointment_id: uuid.UUID, avail_day_ids: list[uuid.UUID]) -> None:
-    get_api_client().patch(f"/api/v1/appointments/{appointment_id}/avail-days",
-                           json={"avail_day_ids": [str(i) for i in avail_day_ids]})
+    get_api_client().write("PATCH", f"/api/v1/appointments/{appointment_id}/avail-days",
+                           json={"avail_day_ids": [str(i) for i in avail_day_ids]}, coalesce=True)
 
 
 def update_notes(appointment_id: uuid.UUID, notes: str) -> None:
-    get_api_client().patch(f"/api/v1/appointments/{appointment_id}/notes",
-                           json={"notes": notes})
+    get_api_client().write("PATCH", f"/api/v1/appointments/{appointment_id}/notes",
+                           json={"notes": notes}, coalesce=True)
 
 
 def update_guests(appointment_id: uuid.UUID, guests: list[str]) -> None:
-    get_api_client().patch(f"/api/v1/appointments/{appointment_id}/guests",
-                           json={"guests": guests})
+    get_api_client().write("PATCH", f"/api/v1/appointments/{appointment_id}/guests",
+                           json={"guests": guests}, coalesce=True)
 
 
 def update_event(appointment_id: uuid.UUID, event_id: uuid.UUID) -> None:
-    get_api_client().patch(f"/api/v1/appointments/{appointment_id}/event",
-                           json={"event_id": str(event_id)})
+    get_api_client().write("PATCH", f"/api/v1/appointments/{appointment_id}/event",
+                           json={"event_id": str(event_id)}, coalesce=True)
 
 
 def delete(appointment_id: uuid.UUID) -> None:
@@ -19,18 +19,37 @@ Refresh-Interceptor: Bei HTTP 401 wird einmalig /auth/refresh versucht;
 klappt das, wird der urspruengliche Request wiederholt. Scheitert der
 Refresh, wird die Authentifizierung (einschl. Keyring-Token) geloescht
 und die Auth-Exception normal geworfen.
+
+Offline-Queue: Schreibvorgaenge ohne Antwort-Body laufen ueber ``write()``.
+Ohne Verbindung landen sie in der Offline-Queue (gui/api_client/offline_queue.py)
+und werden spaeter gesammelt ueber /api/v1/batch nachgereicht — im
+Hintergrund-Thread (``schedule_offline_replay``), nie im GUI-Thread. Solange
+die Queue nicht leer ist, muss jeder andere Schreibvorgang (POST/PUT/PATCH/
+DELETE) hinter ihr anstehen: ``_request`` reicht sie vorher nach und lehnt
+sofort mit 503 ab, wenn das nicht gelingt oder gerade ein Hintergrund-Lauf
+nachreicht. Das Journal gehoert zu Server + User (eigene Datei je Paar) —
+Vorgaenge einer frueheren Sitzung werden nie unter einem anderen Login oder
+gegen einen anderen Server nachgereicht. Beiseitegelegte Vorgaenge meldet das
+Signal ``offline_writes_set_aside``.
 """
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import json as jsonlib
 import logging
 import os
-from typing import Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 import requests
 from PySide6.QtCore import QObject, Signal
 from requests import Response
 
+if TYPE_CHECKING:
+    from gui.api_client.offline_queue import OfflineWriteQueue
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +66,16 @@ class _AuthEventEmitter(QObject):
 
     auth_required = Signal()
 
+
+class _OfflineQueueEventEmitter(QObject):
+    """Traegt ``writes_set_aside`` (Anzahl beiseitegelegter Vorgaenge).
+
+    Wird aus dem Replay-Thread emittiert; Empfaenger im Main-Thread bekommen
+    das Signal per Auto-Connection queued geliefert.
+    """
+
+    writes_set_aside = Signal(int)
+
 from gui.auth.token_store import (
     TokenStoreError,
     clear_refresh_token,
@@ -87,6 +116,14 @@ class ApiServerError(ApiError):
 _LOGIN_PATH = "/auth/login"
 _REFRESH_PATH = "/auth/refresh"
 _REFRESH_COOKIE = "refresh_token"
+BATCH_PATH = "/api/v1/batch"
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+# Schreibpfade, die nicht hinter der Offline-Queue warten (Auth, Nachreichen selbst).
+_QUEUE_EXEMPT_PATHS = frozenset({_LOGIN_PATH, _REFRESH_PATH, BATCH_PATH})
+# Wie lange ein direkter Schreibvorgang auf einen laufenden Replay wartet,
+# bevor er mit 503 abgelehnt wird (GUI-Thread darf nicht haengen).
+_DRAIN_LOCK_TIMEOUT = 0.5
 
 
 class DesktopApiClient:
@@ -101,10 +138,21 @@ class DesktopApiClient:
         # Refresh-Tokens aus /auth/refresh in den Keyring geschrieben werden.
         self._persist_refresh: bool = False
         self._auth_emitter = _AuthEventEmitter()
+        self._queue_emitter = _OfflineQueueEventEmitter()
         # Re-Login-De-Duplizierung: bei parallelen API-Calls darf das Signal
         # nur einmal feuern, sonst wuerden mehrere Login-Dialoge stapeln.
         # Wird auf False zurueckgesetzt durch login() und reset_relogin_pending().
         self._relogin_pending: bool = False
+        # Lazy: die SQLite-Datei entsteht erst beim ersten write(); je
+        # Server + User eine eigene Datei (`_offline_queue_path`).
+        self._offline_queue: OfflineWriteQueue | None = None
+        # Nachreichen: hoechstens ein Lauf gleichzeitig (`_replay_lock`);
+        # Hintergrund-Laeufe in einem eigenen Thread, `_replay_scheduled`
+        # verhindert, dass sich mehrere noch nicht gestartete Laeufe stapeln.
+        self._replay_lock = threading.Lock()
+        self._replay_state_lock = threading.Lock()
+        self._replay_scheduled = False
+        self._replay_executor: ThreadPoolExecutor | None = None
 
     # ── Singleton ─────────────────────────────────────────────────────────────
 
@@ -304,6 +352,13 @@ class DesktopApiClient:
         """
         return self._auth_emitter.auth_required
 
+    @property
+    def offline_writes_set_aside(self) -> Signal:
+        """Qt-Signal (int): Vorgaenge der Offline-Queue wurden nach wiederholten
+        Fehlversuchen beiseitegelegt; Wert = Anzahl aller beiseitegelegten.
+        """
+        return self._queue_emitter.writes_set_aside
+
     def reset_relogin_pending(self) -> None:
         """Hebt das De-Dup-Flag auf, ohne dass ein neuer Login passiert sein
         muss. Wird vom Empfaenger des ``auth_required``-Signals aufgerufen,
@@ -314,8 +369,8 @@ class DesktopApiClient:
 
     # ── HTTP-Basis ────────────────────────────────────────────────────────────
 
-    def _headers(self, *, json_body: bool = False) -> dict[str, str]:
-        headers: dict[str, str] = {"Accept": "application/json"}
+    def _headers(self, *, json_body: bool = False, accept: str | None = None) -> dict[str, str]:
+        headers: dict[str, str] = {"Accept": accept or "application/json"}
         if json_body:
             headers["Content-Type"] = "application/json"
         if self._access_token:
@@ -337,12 +392,15 @@ class DesktopApiClient:
     def delete(self, path: str, json: Any = None, **kwargs: Any) -> Any:
         return self._request("DELETE", path, json=json, **kwargs)
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+    def _request(self, method: str, path: str, *, accept: str | None = None, **kwargs: Any) -> Any:
+        """``accept`` ersetzt den Accept-Header (z. B. normalisiertes JSON, siehe database.wire_format)."""
+        if method in _WRITE_METHODS and path not in _QUEUE_EXEMPT_PATHS and self._has_queued_writes():
+            self._drain_offline_queue()
         has_body = "json" in kwargs and kwargs["json"] is not None
         url = f"{self._base_url}{path}"
         had_token_before = self._access_token is not None
         response = self._session.request(
-            method, url, headers=self._headers(json_body=has_body), **kwargs,
+            method, url, headers=self._headers(json_body=has_body, accept=accept), **kwargs,
         )
         # 401-Interceptor: einmaliger Refresh-Versuch + Retry. Schluss, wenn
         # es erneut 401 wird oder kein Refresh-Token im Zugriff ist. Auf dem
@@ -354,7 +412,7 @@ class DesktopApiClient:
             and self._try_refresh_on_401()
         ):
             response = self._session.request(
-                method, url, headers=self._headers(json_body=has_body), **kwargs,
+                method, url, headers=self._headers(json_body=has_body, accept=accept), **kwargs,
             )
         # Wenn der Refresh-Versuch fehlschlug (oder gar keiner moeglich war)
         # und wir _nicht_ im Auth-Pfad selbst sind: Re-Login-Signal feuern.
@@ -372,6 +430,110 @@ class DesktopApiClient:
             return None
         return response.json()
 
+    # ── Offline-Queue ─────────────────────────────────────────────────────────
+
+    @property
+    def offline_queue(self) -> OfflineWriteQueue:
+        """Journal des eingeloggten Users auf dem aktuellen Server."""
+        path = self._offline_queue_path()
+        if path is None:
+            raise ApiAuthError(401, "Nicht angemeldet")
+        if self._offline_queue is None or self._offline_queue.path != path:
+            # Die Queue des vorigen Logins nicht schliessen: ein laufender
+            # Hintergrund-Replay kann sie noch halten.
+            from gui.api_client.offline_queue import OfflineWriteQueue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._offline_queue = OfflineWriteQueue(path)
+        return self._offline_queue
+
+    def _offline_queue_path(self) -> str | None:
+        """``write_queue-<hash(Server, User-ID)>.sqlite3``; None ohne Login."""
+        user_id = _token_subject(self._access_token) if self._access_token else None
+        if user_id is None:
+            return None
+        from configuration.project_paths import curr_user_path_handler
+        identity = hashlib.sha256(f"{self._base_url}\n{user_id}".encode()).hexdigest()[:16]
+        return os.path.join(curr_user_path_handler.get_config().config_file_path, 'desktop_api',
+                            f'write_queue-{identity}.sqlite3')
+
+    def write(self, method: str, path: str, json: Any = None, *, coalesce: bool = False) -> None:
+        """Schreibvorgang, dessen Antwort der Aufrufer nicht braucht.
+
+        Ist der Server nicht erreichbar, wird der Vorgang in die Offline-Queue
+        gelegt statt zu scheitern. Liegen dort noch Vorgaenge, wird hinten
+        angehaengt und im Hintergrund nachgereicht — die Reihenfolge bleibt
+        erhalten, der Aufrufer (GUI-Thread) wartet nicht auf das Netz.
+        ``coalesce=True``: ein ausstehender Vorgang auf denselben Pfad wird
+        ersetzt (nur fuer Setzer wie PATCH .../notes).
+        """
+        queue = self.offline_queue
+        coalesce_key = f"{method} {path}" if coalesce else None
+        if queue.depth:
+            queue.enqueue(method, path, json, coalesce_key=coalesce_key)
+            self.schedule_offline_replay()
+            return
+        try:
+            self._request(method, path, json=json)
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            logger.info("Server nicht erreichbar (%s) — %s %s in die Offline-Queue.", exc, method, path)
+            queue.enqueue(method, path, json, coalesce_key=coalesce_key)
+
+    def replay_offline_queue(self, *, lock_timeout: float = -1) -> int:
+        """Reicht ausstehende Schreibvorgaenge nach; blockiert bis zum Ende.
+
+        Nur aus Hintergrund-Threads aufrufen — im GUI-Thread
+        ``schedule_offline_replay()``. ``lock_timeout``: laeuft bereits ein
+        Replay, nach so vielen Sekunden aufgeben (0 zurueck).
+        """
+        if not self._replay_lock.acquire(timeout=lock_timeout):
+            return 0
+        try:
+            queue = self.offline_queue
+            replayed = queue.replay(self) if queue.depth else 0
+            if queue.stats().set_aside:
+                self._queue_emitter.writes_set_aside.emit(len(queue.set_aside_writes()))
+            return replayed
+        finally:
+            self._replay_lock.release()
+
+    def _has_queued_writes(self) -> bool:
+        path = self._offline_queue_path()
+        if path is None or not os.path.exists(path):
+            return False
+        return self.offline_queue.depth > 0
+
+    def _drain_offline_queue(self) -> None:
+        """Vor einem direkten Schreibvorgang: Queue nachreichen, sonst ablehnen.
+
+        Ein Create/Delete mit Antwort kann nicht in die Queue — er darf aber
+        auch nicht an den ausstehenden Vorgaengen vorbei beim Server ankommen.
+        Laeuft schon ein Hintergrund-Replay, wird nicht auf ihn gewartet.
+        """
+        self.replay_offline_queue(lock_timeout=_DRAIN_LOCK_TIMEOUT)
+        if self._has_queued_writes():
+            raise ApiServerError(503, "Ausstehende Offline-Aenderungen konnten noch nicht uebertragen werden. "
+                                      "Bitte spaeter erneut versuchen.")
+
+    def schedule_offline_replay(self) -> None:
+        """Stoesst das Nachreichen im Hintergrund-Thread an (kehrt sofort zurueck)."""
+        with self._replay_state_lock:
+            if self._replay_scheduled:
+                return
+            self._replay_scheduled = True
+            if self._replay_executor is None:
+                self._replay_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="offline-replay")
+        self._replay_executor.submit(self._background_replay)
+
+    def _background_replay(self) -> None:
+        # Vor dem Lesen der Queue zuruecksetzen: was danach eingereiht wird,
+        # plant einen neuen Lauf ein oder wird von diesem noch erfasst.
+        with self._replay_state_lock:
+            self._replay_scheduled = False
+        try:
+            self.replay_offline_queue()
+        except Exception:
+            logger.exception("Offline-Queue: Nachreichen im Hintergrund fehlgeschlagen")
+
     def _signal_auth_required(self) -> None:
         """Emittiert das ``auth_required``-Signal genau einmal pro Re-Login-Zyklus."""
         if self._relogin_pending:
@@ -384,6 +546,18 @@ class DesktopApiClient:
 # ── Hilfsfunktion ─────────────────────────────────────────────────────────────
 
 
+def _token_subject(token: str) -> str | None:
+    """``sub`` aus dem JWT-Payload — ohne Signaturpruefung, nur zur Zuordnung
+    des lokalen Journals (geprueft wird das Token vom Server)."""
+    try:
+        payload = token.split(".")[1]
+        claims = jsonlib.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError):
+        return None
+    subject = claims.get("sub") if isinstance(claims, dict) else None
+    return str(subject) if subject else None
+
+
 def _raise_for_status(response: Response) -> None:
     if response.ok:
         return
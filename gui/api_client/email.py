@@ -12,11 +12,13 @@ from gui.api_client.client import get_api_client
 
 def send_plan_notification(plan_id: uuid.UUID,
                            recipient_ids: list[uuid.UUID] | None = None,
-                           include_attachments: bool = True) -> dict[str, Any]:
+                           include_attachments: bool = True,
+                           dry_run: bool = False) -> dict[str, Any]:
     return get_api_client().post("/api/v1/email/plan-notification", json={
         "plan_id": str(plan_id),
         "recipient_ids": [str(i) for i in recipient_ids] if recipient_ids else None,
         "include_attachments": include_attachments,
+        "dry_run": dry_run,
     })
 
 
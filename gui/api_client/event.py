@@ -56,7 +56,7 @@ def update_time_of_day_and_date(event_id: uuid.UUID, time_of_day_id: uuid.UUID,
 
 
 def update_notes(event_id: uuid.UUID, notes: str) -> None:
-    get_api_client().patch(f"/api/v1/events/{event_id}/notes", json={"notes": notes})
+    get_api_client().write("PATCH", f"/api/v1/events/{event_id}/notes", json={"notes": notes}, coalesce=True)
 
 
 def update_time_of_days(event_id: uuid.UUID,
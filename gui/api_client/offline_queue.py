@@ -0,0 +1,244 @@
+"""Offline-Queue für Schreibvorgänge des Desktop-Clients.
+
+Ersetzt `configuration/pending_api_requests.PendingApiHandlerToml` (TOML-Datei,
+bei jedem Eintrag und jeder Löschung komplett neu geschrieben, lineare Suche
+beim Abarbeiten, Verlust bei Absturz mitten im Schreiben).
+
+Journal: eine SQLite-Datei im WAL-Modus. Jeder Schreibvorgang ist ein
+INSERT am Ende (`seq` = Reihenfolge), bestätigte Vorgänge werden als Präfix
+gelöscht. Ein Absturz verliert höchstens den gerade laufenden INSERT.
+
+Zusammenfassen: Vorgänge mit `coalesce_key` (z. B. "PATCH …/notes") ersetzen
+einen noch ausstehenden Vorgang mit demselben Schlüssel — nur der letzte
+Wert zählt, er rückt ans Ende der Queue. Nur für Setzer verwenden, deren
+Ergebnis nicht von dazwischenliegenden Vorgängen abhängt.
+
+Nachreichen (`replay`): in Blöcken über `POST /api/v1/batch`, in
+Reihenfolge. Der Server meldet, wie viele Vorgänge durchliefen; genau diese
+werden bestätigt. Nur endgültig abgelehnte Vorgänge (`PERMANENT_STATUSES`,
+z. B. 404/422) werden verworfen und geloggt, damit sie die Queue nicht
+blockieren. Bei Login-, Last- und Erreichbarkeitsfehlern (`_UNCOUNTED_STATUSES`:
+401/403, 408, 429, 502–504) oder fehlender Verbindung bleibt der Rest für den
+nächsten Versuch liegen. Alle übrigen Fehler (z. B. 409 nach einem
+Constraint-Verstoß, 500) zählen als Fehlversuch des Vorgangs; nach
+`MAX_ATTEMPTS` wird er beiseitegelegt (`set_aside_writes()`) und das
+Nachreichen läuft weiter — ein einzelner kaputter Vorgang blockiert sonst
+alle Schreibvorgänge des Clients. Beiseitegelegte Vorgänge zeigt die GUI an;
+der User verwirft sie (`discard`).
+
+`stats()` liefert Queue-Tiefe und Durchsatz des letzten Nachreichens.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from gui.api_client.client import BATCH_PATH, ApiError
+
+if TYPE_CHECKING:
+    from gui.api_client.client import DesktopApiClient
+
+logger = logging.getLogger(__name__)
+
+# Statuscodes, bei denen eine Wiederholung nie zum Erfolg führt.
+PERMANENT_STATUSES: frozenset[int] = frozenset({400, 404, 405, 410, 413, 422})
+# Statuscodes, die nichts über den Vorgang selbst sagen (Login, Last, Server
+# nicht erreichbar) — kein Fehlversuch, der Vorgang wartet einfach.
+_UNCOUNTED_STATUSES: frozenset[int] = frozenset({401, 403, 408, 429, 502, 503, 504})
+# Fehlversuche, nach denen ein Vorgang beiseitegelegt wird.
+MAX_ATTEMPTS = 5
+# (Verbindungsaufbau, Antwort) in Sekunden für einen Batch-Request.
+BATCH_TIMEOUT: tuple[float, float] = (5, 30)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS journal (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    method       TEXT NOT NULL,
+    path         TEXT NOT NULL,
+    body         TEXT,
+    coalesce_key TEXT,
+    created_at   REAL NOT NULL,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    -- gesetzt = beiseitegelegt: Status und Antwort des letzten Fehlversuchs
+    set_aside_status INTEGER,
+    set_aside_detail TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_journal_coalesce_key ON journal (coalesce_key) WHERE coalesce_key IS NOT NULL;
+"""
+
+
+@dataclass(frozen=True)
+class QueuedWrite:
+    seq: int
+    method: str
+    path: str
+    body: Any
+
+
+@dataclass(frozen=True)
+class SetAsideWrite:
+    seq: int
+    method: str
+    path: str
+    body: Any
+    created_at: float
+    status: int
+    detail: str | None
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    depth: int
+    replayed: int
+    dropped: int
+    set_aside: int
+    replay_seconds: float
+
+    @property
+    def throughput(self) -> float:
+        """Nachgereichte Vorgänge pro Sekunde beim letzten `replay`."""
+        return self.replayed / self.replay_seconds if self.replay_seconds else 0.0
+
+
+class OfflineWriteQueue:
+    def __init__(self, path: str, batch_size: int = 100) -> None:
+        self._path = path
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL: Commit ohne fsync pro Eintrag, nach Absturz trotzdem konsistent
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._last_replay = (0, 0, 0, 0.0)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, method: str, path: str, body: Any = None, *, coalesce_key: str | None = None) -> int:
+        """Hängt einen Schreibvorgang an; gibt dessen `seq` zurück."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if coalesce_key is not None:
+                    self._conn.execute("DELETE FROM journal WHERE coalesce_key = ?", (coalesce_key,))
+                cursor = self._conn.execute(
+                    "INSERT INTO journal (method, path, body, coalesce_key, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (method, path, None if body is None else json.dumps(body), coalesce_key, time.time()))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return cursor.lastrowid
+
+    def pending(self, limit: int | None = None) -> list[QueuedWrite]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, method, path, body FROM journal WHERE set_aside_status IS NULL ORDER BY seq LIMIT ?",
+                (-1 if limit is None else limit,)).fetchall()
+        return [QueuedWrite(seq, method, path, None if body is None else json.loads(body))
+                for seq, method, path, body in rows]
+
+    def acknowledge(self, up_to_seq: int) -> None:
+        """Entfernt alle ausstehenden Vorgänge bis einschließlich `up_to_seq`."""
+        with self._lock:
+            self._conn.execute("DELETE FROM journal WHERE seq <= ? AND set_aside_status IS NULL", (up_to_seq,))
+
+    def record_failure(self, seq: int, status: int, detail: Any) -> bool:
+        """Zählt einen Fehlversuch; legt den Vorgang nach `MAX_ATTEMPTS` beiseite.
+
+        Gibt True zurück, wenn der Vorgang jetzt beiseiteliegt.
+        """
+        with self._lock:
+            self._conn.execute("UPDATE journal SET attempts = attempts + 1 WHERE seq = ?", (seq,))
+            attempts = self._conn.execute("SELECT attempts FROM journal WHERE seq = ?", (seq,)).fetchone()[0]
+            if attempts < MAX_ATTEMPTS:
+                return False
+            self._conn.execute("UPDATE journal SET set_aside_status = ?, set_aside_detail = ? WHERE seq = ?",
+                               (status, None if detail is None else json.dumps(detail), seq))
+            return True
+
+    def set_aside_writes(self) -> list[SetAsideWrite]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, method, path, body, created_at, set_aside_status, set_aside_detail FROM journal "
+                "WHERE set_aside_status IS NOT NULL ORDER BY seq").fetchall()
+        return [SetAsideWrite(seq, method, path, None if body is None else json.loads(body), created_at, status,
+                              None if detail is None else json.loads(detail))
+                for seq, method, path, body, created_at, status, detail in rows]
+
+    def discard(self, seqs: list[int]) -> None:
+        """Verwirft beiseitegelegte Vorgänge endgültig."""
+        with self._lock:
+            self._conn.executemany("DELETE FROM journal WHERE seq = ? AND set_aside_status IS NOT NULL",
+                                   [(seq,) for seq in seqs])
+
+    @property
+    def depth(self) -> int:
+        """Anzahl ausstehender (nicht beiseitegelegter) Vorgänge."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM journal WHERE set_aside_status IS NULL").fetchone()[0]
+
+    def stats(self) -> QueueStats:
+        replayed, dropped, set_aside, seconds = self._last_replay
+        return QueueStats(depth=self.depth, replayed=replayed, dropped=dropped, set_aside=set_aside,
+                          replay_seconds=seconds)
+
+    def replay(self, client: DesktopApiClient) -> int:
+        """Reicht ausstehende Vorgänge in Reihenfolge nach; gibt die Zahl der übernommenen zurück."""
+        replayed = dropped = set_aside = 0
+        started = time.perf_counter()
+        try:
+            while batch := self.pending(self._batch_size):
+                try:
+                    result = client.post(BATCH_PATH, json={"operations": [
+                        {"method": op.method, "path": op.path, "body": op.body} for op in batch]},
+                        timeout=BATCH_TIMEOUT)
+                except (requests.RequestException, ApiError) as exc:
+                    logger.info("Offline-Queue: Nachreichen nicht möglich (%s), %d Vorgänge bleiben liegen.",
+                                exc, self.depth)
+                    break
+                completed = result["completed"]
+                replayed += completed
+                if completed < len(batch):
+                    failed = batch[completed]
+                    status, detail = result["results"][completed]["status"], result["results"][completed]["body"]
+                    if completed:
+                        self.acknowledge(batch[completed - 1].seq)
+                    if status in PERMANENT_STATUSES:
+                        logger.warning("Offline-Queue: %s %s vom Server abgelehnt (%d) — verworfen: %s",
+                                       failed.method, failed.path, status, detail)
+                        dropped += 1
+                        self.acknowledge(failed.seq)
+                    elif status not in _UNCOUNTED_STATUSES and self.record_failure(failed.seq, status, detail):
+                        logger.warning("Offline-Queue: %s %s nach %d Fehlversuchen beiseitegelegt (%d): %s",
+                                       failed.method, failed.path, MAX_ATTEMPTS, status, detail)
+                        set_aside += 1
+                    else:
+                        logger.warning("Offline-Queue: Status %d bei %s %s, Nachreichen unterbrochen.",
+                                       status, failed.method, failed.path)
+                        break
+                else:
+                    self.acknowledge(batch[-1].seq)
+        finally:
+            self._last_replay = (replayed, dropped, set_aside, time.perf_counter() - started)
+        if replayed or dropped or set_aside:
+            stats = self.stats()
+            logger.info("Offline-Queue: %d Vorgänge nachgereicht (%.0f/s), %d verworfen, %d beiseitegelegt, "
+                        "%d ausstehend.", stats.replayed, stats.throughput, stats.dropped, stats.set_aside,
+                        stats.depth)
+        return replayed
@@ -32,8 +32,8 @@ def undelete(person_id: uuid.UUID) -> None:
 
 def update_notes(person_id: uuid.UUID, notes: str) -> None:
     """204 No Content — Widget mutiert sein notes-Feld lokal."""
-    get_api_client().patch(f"/api/v1/persons/{person_id}/notes",
-                           json={"notes": notes})
+    get_api_client().write("PATCH", f"/api/v1/persons/{person_id}/notes",
+                           json={"notes": notes}, coalesce=True)
 
 
 def update_admin_of_project(person_id: uuid.UUID, project_id: uuid.UUID) -> schemas.PersonShow:
@@ -2,32 +2,40 @@
 
 import uuid
 
-from database import schemas
+from database import schemas, wire_format
 from gui.api_client.client import get_api_client
 
+# PlanShow-Antworten normalisiert anfordern: geteilte Objekte statt hundertfacher Kopien
+_NORMALIZED = wire_format.NORMALIZED_MEDIA_TYPE
+
 
 def create(plan_period_id: uuid.UUID, name: str, notes: str = "") -> schemas.PlanShow:
     data = get_api_client().post("/api/v1/plans", json={
         "plan_period_id": str(plan_period_id),
         "name": name,
         "notes": notes,
-    })
-    return schemas.PlanShow.model_validate(data)
+    }, accept=_NORMALIZED)
+    return wire_format.decode(data, schemas.PlanShow)
+
+
+def get(plan_id: uuid.UUID) -> schemas.PlanShow:
+    data = get_api_client().get(f"/api/v1/plans/{plan_id}", accept=_NORMALIZED)
+    return wire_format.decode(data, schemas.PlanShow)
 
 
 def update_name(plan_id: uuid.UUID, new_name: str) -> schemas.PlanShow:
-    data = get_api_client().patch(f"/api/v1/plans/{plan_id}/name", json={"name": new_name})
-    return schemas.PlanShow.model_validate(data)
+    data = get_api_client().patch(f"/api/v1/plans/{plan_id}/name", json={"name": new_name}, accept=_NORMALIZED)
+    return wire_format.decode(data, schemas.PlanShow)
 
 
 def update_notes(plan_id: uuid.UUID, notes: str) -> schemas.PlanShow:
-    data = get_api_client().patch(f"/api/v1/plans/{plan_id}/notes", json={"notes": notes})
-    return schemas.PlanShow.model_validate(data)
+    data = get_api_client().patch(f"/api/v1/plans/{plan_id}/notes", json={"notes": notes}, accept=_NORMALIZED)
+    return wire_format.decode(data, schemas.PlanShow)
 
 
 def update_location_columns(plan_id: uuid.UUID, location_columns: str) -> None:
-    get_api_client().patch(f"/api/v1/plans/{plan_id}/location-columns",
-                           json={"location_columns": location_columns})
+    get_api_client().write("PATCH", f"/api/v1/plans/{plan_id}/location-columns",
+                           json={"location_columns": location_columns}, coalesce=True)
 
 
 def set_is_binding(plan_id: uuid.UUID, is_binding: bool) -> uuid.UUID | None:
@@ -62,5 +70,5 @@ def delete_prep_deletes_from__team(team_id: uuid.UUID) -> None:
 
 def put_in_excel_settings(plan_id: uuid.UUID, excel_settings_id: uuid.UUID) -> schemas.PlanShow:
     data = get_api_client().put(f"/api/v1/plans/{plan_id}/excel-settings",
-                                json={"excel_settings_id": str(excel_settings_id)})
-    return schemas.PlanShow.model_validate(data)
+                                json={"excel_settings_id": str(excel_settings_id)}, accept=_NORMALIZED)
+    return wire_format.decode(data, schemas.PlanShow)
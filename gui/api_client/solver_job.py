@@ -0,0 +1,28 @@
+"""Desktop-API-Client: Solver-Jobs (serverseitige Planberechnung)."""
+
+import uuid
+
+from gui.api_client.client import get_api_client
+
+
+def submit(plan_period_ids: list[uuid.UUID], num_plans: int, time_calc_max_shifts: int,
+           time_calc_fair_distribution: int, time_calc_plan: int) -> dict:
+    return get_api_client().post("/api/v1/solver-jobs", json={
+        "plan_period_ids": [str(pp_id) for pp_id in plan_period_ids],
+        "num_plans": num_plans,
+        "time_calc_max_shifts": time_calc_max_shifts,
+        "time_calc_fair_distribution": time_calc_fair_distribution,
+        "time_calc_plan": time_calc_plan,
+    })
+
+
+def get(job_id: uuid.UUID | str) -> dict:
+    return get_api_client().get(f"/api/v1/solver-jobs/{job_id}")
+
+
+def get_all_from__team(team_id: uuid.UUID) -> list[dict]:
+    return get_api_client().get("/api/v1/solver-jobs", params={"team_id": str(team_id)})
+
+
+def cancel(job_id: uuid.UUID | str) -> dict:
+    return get_api_client().post(f"/api/v1/solver-jobs/{job_id}/cancel")
@@ -8,6 +8,7 @@ def main():
 
     from PySide6.QtWidgets import QApplication, QMessageBox
 
+    from gui import startup_profile
     from gui.custom_widgets.splash_screen import SplashScreen, InitializationProgressCallback
     from gui.app_initialization import initialize_application_with_progress
 
@@ -24,6 +25,7 @@ def main():
     logging.info("Application starting...")
 
     app = QApplication(sys.argv)
+    startup_profile.mark('QApplication')
 
     # === Auth vor allem anderen ===
     # Silent-Login via Keyring-Refresh-Token; sonst LoginDialog. Abbruch → Exit.
@@ -31,6 +33,7 @@ def main():
     if not ensure_authenticated():
         logging.info("Login abgebrochen — App wird beendet.")
         sys.exit(0)
+    startup_profile.mark('Login')
 
     # === Splash Screen Setup ===
     try:
@@ -58,6 +61,7 @@ def main():
         # Splash-Screen mit Minimum-Display-Time beenden
         if splash:
             splash.finish_when_ready(window)  # NEU: Respektiert 2s Minimum-Display-Time
+        startup_profile.finish(app)
 
     except Exception as e:
         logging.critical(f"Failed to initialize application: {e}")
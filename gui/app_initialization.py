@@ -266,8 +266,10 @@ def initialize_main_application(app: QApplication,
     _update_progress(progress_callback, "MainWindow creation")
     try:
         from gui.main_window import MainWindow
+        from gui import startup_profile
         from tools.screen import Screen
-        
+        startup_profile.mark('Import MainWindow')
+
         # === Screen size calculation ===
         _update_progress(progress_callback, "Screen size calculation")
         Screen.set_screen_size()
@@ -276,6 +278,7 @@ def initialize_main_application(app: QApplication,
         _update_progress(progress_callback, "Window display")
         window = safe_execute(MainWindow, "Creating main window", app, Screen.screen_width, Screen.screen_height)
         safe_execute(window.show, "Showing main window")
+        startup_profile.mark('Erstes Fenster')
         window.setEnabled(False)  # Window deaktivieren während Tab-Restoration
         window.tab_restoration_in_progress = True  # Schließen verhindern während Tab-Restoration
 
@@ -287,6 +290,7 @@ def initialize_main_application(app: QApplication,
             )
         
         safe_execute(window.restore_tabs, "Restoring tabs")
+        startup_profile.mark('Tabs wiederhergestellt')
 
         # === Finalisierung ===
         _update_progress(progress_callback, "Finalisierung")
@@ -298,6 +302,11 @@ def initialize_main_application(app: QApplication,
 
         # Signal-Verbindung trennen
         window.tab_manager.tab_restoration_progress.disconnect()
+
+        # Solver, Excel-Export, Google Calendar usw. im Leerlauf vorladen (Haupt-Thread, siehe lazy_loading)
+        if not startup_profile.enabled():
+            from gui.lazy_loading import warm_up
+            warm_up()
         
         # === Windows Defender Optimierung (nur Windows) ===
         import platform
@@ -5,6 +5,9 @@ Abfolge beim App-Start:
 2. Faellt der weg oder schlaegt fehl: LoginDialog anzeigen.
 3. Bricht der User den Dialog ab, signalisiert `ensure_authenticated`
    False — der Aufrufer beendet die App.
+4. Nach erfolgreichem Login: Schreibvorgaenge aus der Offline-Queue der
+   letzten Sitzung (desselben Users auf demselben Server) im Hintergrund
+   nachreichen — der GUI-Thread wartet nicht auf das Netz.
 """
 
 from __future__ import annotations
@@ -27,7 +30,11 @@ def ensure_authenticated(parent: QWidget | None = None) -> bool:
     # Falls ein Refresh-Token im Keyring liegt: stillen Login probieren.
     # Bei Erfolg sind wir sofort durch — kein Dialog noetig.
     if client.try_silent_login():
+        client.schedule_offline_replay()
         return True
 
     dialog = LoginDialog(client, parent=parent)
-    return dialog.exec() == QDialog.DialogCode.Accepted
\ No newline at end of file
+    if dialog.exec() != QDialog.DialogCode.Accepted:
+        return False
+    client.schedule_offline_replay()
+    return True
\ No newline at end of file
@@ -1,12 +1,16 @@
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 from uuid import UUID
 
-from PySide6.QtCore import Slot, QObject, Signal
-from PySide6.QtGui import Qt
-from PySide6.QtWidgets import QProgressDialog, QWidget, QApplication
+from PySide6.QtCore import Slot, QObject, Signal, QPointF
+from PySide6.QtGui import Qt, QPainter, QPen, QColor, QPolygonF
+from PySide6.QtWidgets import (QProgressDialog, QWidget, QApplication, QDialog, QVBoxLayout, QLabel, QProgressBar,
+                               QDialogButtonBox, QPushButton)
 
 from gui.observer import signal_handling
 
+if TYPE_CHECKING:
+    from sat_solver.progress import SolveProgress
+
 
 class DlgProgressInfinite(QProgressDialog):
     def __init__(self, parent: QWidget, window_title: str, label_text: str, cancel_button_text: str,
@@ -60,6 +64,141 @@ class DlgProgressSteps(QProgressDialog):
             super().cancel()
 
 
+class ConvergenceChart(QWidget):
+    """
+    Verlauf von Zielfunktion (beste Lösung) und Schranke der laufenden Suche über der Zeit.
+
+    Zeigt immer nur die aktuelle Suche: wechselt die Phase oder beginnt die Zeit
+    von vorn, wird der Verlauf geleert.
+    """
+    MARGIN = 8
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+        self.setMinimumSize(360, 140)
+        self._phase: str | None = None
+        self._objectives: list[tuple[float, float]] = []
+        self._bounds: list[tuple[float, float]] = []
+
+    def add(self, solve_progress: 'SolveProgress'):
+        last_elapsed = max((t for t, _ in self._objectives[-1:] + self._bounds[-1:]), default=0.0)
+        if solve_progress.phase != self._phase or solve_progress.elapsed < last_elapsed:
+            self._phase = solve_progress.phase
+            self._objectives.clear()
+            self._bounds.clear()
+        if solve_progress.objective is not None:
+            self._objectives.append((solve_progress.elapsed, solve_progress.objective))
+        if solve_progress.bound is not None:
+            self._bounds.append((solve_progress.elapsed, solve_progress.bound))
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor('#fafafa'))
+        points = self._objectives + self._bounds
+        if not points:
+            return
+        t_max = max(t for t, _ in points) or 1.0
+        v_min, v_max = min(v for _, v in points), max(v for _, v in points)
+        v_span = (v_max - v_min) or 1.0
+        width, height = self.width() - 2 * self.MARGIN, self.height() - 2 * self.MARGIN
+
+        def polygon(series: list[tuple[float, float]]) -> QPolygonF:
+            # Treppenkurve: ein Wert gilt bis zum nächsten Punkt bzw. bis jetzt
+            result = QPolygonF()
+            for i, (t, v) in enumerate(series):
+                y = self.MARGIN + height * (1 - (v - v_min) / v_span)
+                result.append(QPointF(self.MARGIN + width * t / t_max, y))
+                t_next = series[i + 1][0] if i + 1 < len(series) else t_max
+                result.append(QPointF(self.MARGIN + width * t_next / t_max, y))
+            return result
+
+        for series, color in ((self._bounds, '#9e9e9e'), (self._objectives, '#1e88e5')):
+            pen = QPen(QColor(color))
+            pen.setWidth(2)
+            painter.setPen(pen)
+            painter.drawPolyline(polygon(series))
+
+
+class DlgProgressSolver(QDialog):
+    def __init__(self, parent: QWidget, window_title: str, label_text: str,
+                 minimum: int, maximum: int, cancel_button_text: str, cancel_func: Callable[[], None] | None = None,
+                 accept_current_func: Callable[[], None] | None = None):
+        """
+        Wie DlgProgressSteps, zusätzlich mit Konvergenz-Verlauf der laufenden Suche
+        (signal_solution_progress) und der Aktion "Aktuell beste Lösung übernehmen".
+        """
+        super().__init__(parent)
+        signal_handling.handler_solver.signal_progress.connect(
+            self.update_progress, Qt.ConnectionType.QueuedConnection)
+        signal_handling.handler_solver.signal_solution_progress.connect(
+            self.update_solution_progress, Qt.ConnectionType.QueuedConnection)
+        self.setWindowTitle(window_title)
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+        self.label_text = label_text
+        self.cancel_func = cancel_func
+        self.accept_current_func = accept_current_func
+
+        self.curr_progress = -1
+
+        layout = QVBoxLayout(self)
+        self.lb_text = QLabel(label_text)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(minimum, maximum)
+        self.chart = ConvergenceChart()
+        self.lb_solution = QLabel()
+        self.button_box = QDialogButtonBox()
+        self.bt_accept_current = QPushButton(self.tr('Accept current best'))
+        self.bt_accept_current.setEnabled(False)
+        self.bt_accept_current.clicked.connect(self.accept_current)
+        self.button_box.addButton(self.bt_accept_current, QDialogButtonBox.ButtonRole.ActionRole)
+        self.button_box.addButton(cancel_button_text, QDialogButtonBox.ButtonRole.RejectRole)
+        self.button_box.rejected.connect(self.cancel)
+        for widget in (self.lb_text, self.progress_bar, self.chart, self.lb_solution, self.button_box):
+            layout.addWidget(widget)
+
+    @Slot(str)
+    def update_progress(self, comment: str):
+        self.curr_progress += 1
+        self.progress_bar.setValue(self.curr_progress)
+        self.lb_text.setText(f'{self.label_text}\n{comment}')
+
+    @Slot(object)
+    def update_solution_progress(self, solve_progress: 'SolveProgress'):
+        self.chart.add(solve_progress)
+        if solve_progress.objective is None:
+            return
+        text = self.tr('Best: {objective:g}   Bound: {bound}   after {elapsed:.1f} s').format(
+            objective=solve_progress.objective,
+            bound='–' if solve_progress.bound is None else f'{solve_progress.bound:g}',
+            elapsed=solve_progress.elapsed)
+        if solve_progress.unassigned_shifts is not None:
+            text += self.tr('   Unassigned shifts: {num}').format(num=solve_progress.unassigned_shifts)
+        self.lb_solution.setText(text)
+        # Übernehmen nur während der Plan-Suche: vorher gibt es noch keine Pläne
+        self.bt_accept_current.setEnabled(self.accept_current_func is not None
+                                          and solve_progress.phase == 'adjusted')
+
+    def accept_current(self):
+        if self.accept_current_func:
+            self.accept_current_func()
+        self.bt_accept_current.setEnabled(False)
+
+    def cancel(self):
+        if self.cancel_func:
+            self.cancel_func()
+        self.hide()
+
+    def reject(self):
+        # Esc wie Abbrechen
+        self.cancel()
+
+    def closeEvent(self, event):
+        # close() nach Ende der Berechnung: nur schließen, nicht abbrechen
+        event.accept()
+
+
 class GlobalUpdatePlanTabsProgressManager(QObject):
     def __init__(self, progress_bar: DlgProgressInfinite):
         super().__init__()
@@ -384,7 +384,7 @@ class LocationPlanPeriodData:
             self.controller.execute(command)
 
 
-def save_schedule_versions_to_db(plan_period_id: UUID, team_id: UUID, schedule_versions: list[list[schemas.AppointmentCreate]],
+def save_schedule_versions_to_db(plan_period_id: UUID, team_id: UUID, schedule_versions: list[list[schemas.AppointmentIdsCreate]],
                                 max_shifts_per_app: dict[UUID, int], fair_shifts_per_app: dict[UUID, float],
                                 nr_versions_to_use: int, controller: command_base_classes.ContrExecUndoRedo) -> list[UUID]:
     plan_period = db_services.PlanPeriod.get(plan_period_id, minimal=True)
@@ -395,7 +395,7 @@ def save_schedule_versions_to_db(plan_period_id: UUID, team_id: UUID, schedule_v
     for version in schedule_versions[:nr_versions_to_use]:
         while f'{plan_base_name} ({new_first_plan_index:0>2})' in saved_plan_names:
             new_first_plan_index += 1
-        version: list[schemas.AppointmentCreate]
+        version: list[schemas.AppointmentIdsCreate]
         name_plan = f'{plan_base_name} ({new_first_plan_index:0>2})'
         new_first_plan_index += 1
 
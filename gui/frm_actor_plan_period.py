@@ -19,7 +19,6 @@ from database import schemas, db_services
 from database.special_schema_requests import get_locations_of_team_at_date, get_curr_team_of_person_at_date, \
     get_curr_assignment_of_person, get_location_ids_at_date_from_team, \
     get_person_ids_at_date_from_team, get_next_assignment_of_person
-from export_to_file import avail_days_to_xlsx
 from gui import (frm_comb_loc_possible, frm_actor_loc_prefs, frm_partner_location_prefs, frm_group_mode,
                  frm_time_of_day, widget_styles, frm_requested_assignments, frm_skills)
 from gui.custom_widgets import side_menu, BaseConfigButton
@@ -2,7 +2,8 @@ import datetime
 import datetime
 from uuid import UUID
 
-from PySide6.QtCore import QThread, Signal, QObject, Slot, Qt, QThreadPool
+import requests
+from PySide6.QtCore import QThread, Signal, QObject, Slot, Qt, QThreadPool, QTimer
 from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QLabel, QComboBox, QDialogButtonBox, QMessageBox, \
     QFormLayout, QSpinBox, QHBoxLayout, QGroupBox, QCheckBox, QListWidget, QListWidgetItem, QAbstractItemView, \
     QApplication, QSpacerItem, QSizePolicy
@@ -12,8 +13,10 @@ from commands import command_base_classes
 from commands.database_commands import plan_commands, appointment_commands, max_fair_shifts_per_app
 from database import db_services, schemas
 from gui import data_processing
+from gui.api_client import solver_job as api_solver_job
+from gui.api_client.client import ApiError
 from gui.concurrency import general_worker
-from gui.custom_widgets.progress_bars import DlgProgressInfinite, DlgProgressSteps
+from gui.custom_widgets.progress_bars import DlgProgressInfinite, DlgProgressSolver, DlgProgressSteps
 from gui.observer import signal_handling
 from tools.helper_functions import generate_fixed_cast_clear_text, time_to_string, date_to_string, setup_form_help
 
@@ -89,6 +92,15 @@ class DlgCalculate(QDialog):
         )
         self.cb_multi_period.stateChanged.connect(self._toggle_multi_period_mode)
         self.layout_head.addWidget(self.cb_multi_period)
+
+        # Serverseitige Berechnung: Job wird an die Web-API übergeben und gepollt
+        self.cb_server_side = QCheckBox(self.tr('Calculate on server'))
+        self.layout_head.addWidget(self.cb_server_side)
+        self._server_job_id: str | None = None
+        self._server_job_steps = 0
+        self._server_job_timer = QTimer(self)
+        self._server_job_timer.setInterval(2000)
+        self._server_job_timer.timeout.connect(self._poll_server_job)
         
         # Single-Period: ComboBox (Standard)
         self.combo_plan_periods = QComboBox()
@@ -193,21 +205,32 @@ class DlgCalculate(QDialog):
                                .format(period=self.combo_plan_periods.currentText()))
             return
 
+        if self.cb_server_side.isChecked():
+            self._submit_server_job(
+                [self.curr_plan_period_id],
+                self.spin_time_calculate_fair_distribution.value() // self.num_actor_plan_periods,
+                self.spin_num_plans.value() + self.num_actor_plan_periods + 4,
+            )
+            return
+
         # Lazy Import: OR-Tools nur laden wenn Spielplanerstellung benötigt (Performance-Optimierung)
         from sat_solver import solver_main
         
         # Signal für Solver-Cancel lazy verbinden
         signal_handling.handler_solver.signal_cancel_solving.connect(solver_main.solver_quit,
                                                                      Qt.ConnectionType.QueuedConnection)
+        signal_handling.handler_solver.signal_accept_current_best.connect(solver_main.solver_accept_current,
+                                                                          Qt.ConnectionType.QueuedConnection)
 
-        self.progress_dialog_solver = DlgProgressSteps(
+        self.progress_dialog_solver = DlgProgressSolver(
             self, 
             self.tr('Calculating Plan'), 
             self.tr('Calculating plans.'),
             0, 
             self.spin_num_plans.value() + self.num_actor_plan_periods + 3,
             self.tr('Cancel'), 
-            signal_handling.handler_solver.cancel_solving
+            signal_handling.handler_solver.cancel_solving,
+            signal_handling.handler_solver.accept_current_best
         )
         self.progress_dialog_solver.show()
 
@@ -261,7 +284,17 @@ class DlgCalculate(QDialog):
                 )
                 return
         
-        # 4. Lazy Import
+        if self.cb_server_side.isChecked():
+            total_actor_plan_periods = sum(
+                len(db_services.ActorPlanPeriod.get_all_from__plan_period(pp_id)) for pp_id in selected_pp_ids
+            )
+            self._submit_server_job(
+                selected_pp_ids,
+                self.spin_time_calculate_fair_distribution.value() // total_actor_plan_periods,
+                (1 + total_actor_plan_periods + 1 + len(selected_pp_ids)
+                 + self.spin_num_plans.value() * len(selected_pp_ids) + 2),
+            )
+            return
 
         # 4. Lazy Import
         from sat_solver import solver_main
@@ -320,7 +353,7 @@ class DlgCalculate(QDialog):
     def _save_multi_period_plans(
         self,
         selected_pp_ids: list[UUID],
-        schedule_versions: list[list[list[schemas.AppointmentCreate]]] | None,
+        schedule_versions: list[list[list[schemas.AppointmentIdsCreate]]] | None,
         fixed_cast_conflicts: dict[tuple[datetime.date, str, UUID], int] | None,
         skill_conflicts: dict[str, int] | None,
         max_shifts_per_app: dict[UUID, int] | None,
@@ -502,7 +535,7 @@ class DlgCalculate(QDialog):
         self.spin_time_calculate_fair_distribution.setValue(self.num_actor_plan_periods * 50)
 
     @Slot(object, object, object, object, object)
-    def _save_plan_to_db(self, schedule_versions: list[list[schemas.AppointmentCreate]] | None,
+    def _save_plan_to_db(self, schedule_versions: list[list[schemas.AppointmentIdsCreate]] | None,
                         fixed_cast_conflicts: dict[tuple[datetime.date, str, UUID], int] | None,
                         skill_conflicts: dict[str, int] | None,
                         max_shifts_per_app: dict[UUID, int] | None,
@@ -589,6 +622,80 @@ class DlgCalculate(QDialog):
         self.worker.signals.finished.connect(self._collect_plan_ids, Qt.ConnectionType.QueuedConnection)
         QThreadPool.globalInstance().start(self.worker)
 
+    def _submit_server_job(self, plan_period_ids: list[UUID], time_calc_fair_distribution: int,
+                           total_steps: int):
+        """Übergibt die Berechnung als Solver-Job an den Server und startet das Polling.
+
+        Der Server speichert selbst bis zu `spin_num_plans` Versionen; Fortschritts-
+        Schritte werden über `handler_solver.progress` in den gewohnten
+        Fortschritts-Dialog gespiegelt.
+        """
+        try:
+            job = api_solver_job.submit(
+                plan_period_ids, self.spin_num_plans.value(),
+                self.spin_time_calculate_max_shifts.value(), time_calc_fair_distribution,
+                self.spin_time_calculate_plan.value(),
+            )
+        except ApiError as e:
+            QMessageBox.critical(self, self.tr('Server Calculation'), e.detail)
+            return
+        self._server_job_id = job['id']
+        self._server_job_steps = 0
+        self.progress_dialog_solver = DlgProgressSteps(
+            self,
+            self.tr('Calculating Plan'),
+            self.tr('Calculating plans on the server.'),
+            0,
+            total_steps,
+            self.tr('Cancel'),
+            self._cancel_server_job
+        )
+        self.progress_dialog_solver.show()
+        self._server_job_timer.start()
+
+    def _cancel_server_job(self):
+        # Läuft im Qt-Slot des Abbrechen-Buttons: Fehler dürfen nicht entweichen,
+        # sonst schließt der Fortschritts-Dialog nicht. Das Polling läuft weiter
+        # und liefert das Ergebnis, falls der Abbruch nicht ankam.
+        try:
+            api_solver_job.cancel(self._server_job_id)
+        except (ApiError, requests.RequestException) as e:
+            QMessageBox.warning(self, self.tr('Server Calculation'),
+                                self.tr('The calculation could not be cancelled:\n{error}').format(error=e))
+
+    def _poll_server_job(self):
+        try:
+            job = api_solver_job.get(self._server_job_id)
+        except (ApiError, requests.RequestException):
+            return  # nächster Takt versucht es erneut
+        while self._server_job_steps < job['progress_step']:
+            self._server_job_steps += 1
+            signal_handling.handler_solver.progress(job['progress_message'] or '')
+
+        if job['status'] in ('queued', 'running'):
+            return
+        self._server_job_timer.stop()
+        result = job['result'] or {}
+
+        if job['status'] == 'succeeded':
+            if self.progress_dialog_solver:
+                self.progress_dialog_solver.close()
+            self._created_plan_ids = [UUID(plan_id) for plan_id in result.get('plan_ids', [])]
+            self.accept()
+        elif job['status'] == 'cancelled':
+            self.reject()
+        elif result.get('no_solution'):
+            self._save_plan_to_db(None, None, None, None, None)
+        elif 'fixed_cast_conflicts' in result:
+            fixed_cast_conflicts = {
+                (datetime.date.fromisoformat(c['date']), c['time_of_day'], UUID(c['event_id'])): c['count']
+                for c in result['fixed_cast_conflicts']
+            }
+            self._save_plan_to_db([], fixed_cast_conflicts, result['skill_conflicts'], None, None)
+        else:
+            QMessageBox.critical(self, self.tr('Server Calculation'), job['error'] or '')
+            self.reject()
+
     @Slot(list)
     def _collect_plan_ids(self, plan_ids: list[UUID]):
         self._created_plan_ids = plan_ids
@@ -4,16 +4,14 @@ import os
 import re
 from abc import ABC, abstractmethod
 from functools import partial
-from typing import Literal, Callable, TypeAlias
+from typing import Literal, Callable, TypeAlias, TYPE_CHECKING
 from uuid import UUID
 
-import sympy
 from PySide6.QtCore import Qt, QTimer, QCoreApplication
 from PySide6.QtGui import QIcon, QPalette
 from PySide6.QtWidgets import (QDialog, QWidget, QHBoxLayout, QPushButton, QGridLayout, QComboBox, QLabel, QVBoxLayout,
                                QDialogButtonBox, QDateEdit, QMenu, QMessageBox, QCheckBox)
 
-from sympy.logic.boolalg import BooleanFunction, simplify_logic
 
 from database import db_services, schemas
 from database.special_schema_requests import get_curr_team_of_location_at_date
@@ -25,6 +23,13 @@ from commands import command_base_classes
 from commands.database_commands import cast_group_commands, location_plan_period_commands, location_of_work_commands
 from gui.custom_widgets.qcombobox_find_data import QComboBoxToFindData
 from tools.helper_functions import backtranslate_eval_str, date_to_string, setup_form_help
+from gui.lazy_loading import lazy_import
+
+if TYPE_CHECKING:
+    from sympy.logic.boolalg import BooleanFunction
+
+# sympy kostet ~350 ms Importzeit und wird erst beim Vereinfachen einer Besetzung gebraucht
+sympy = lazy_import('sympy')
 
 object_with_fixed_cast_type: TypeAlias = (schemas.LocationOfWorkShow |
                                           schemas.LocationPlanPeriodShow |
@@ -226,11 +231,11 @@ class SimplifyFixedCastAndInfo:
 
         return new_string
 
-    def simplify_to_boolean_function(self, sentence: str) -> BooleanFunction:
+    def simplify_to_boolean_function(self, sentence: str) -> 'BooleanFunction':
         # form='cnf' oder form=None produziert bei der Constraint-Erstellung falsche Ergebnisse.
-        return simplify_logic(eval(sentence, {'symbols': self.symbols}), form='dnf', force=True)
+        return sympy.simplify_logic(eval(sentence, {'symbols': self.symbols}), form='dnf', force=True)
 
-    def back_translate_to_fixed_cast(self, expr: BooleanFunction) -> str:
+    def back_translate_to_fixed_cast(self, expr: 'BooleanFunction') -> str:
         expr_str = str(expr).replace('(', '( ').replace(')', ' )')
         exclude = {'~': ' not ', '&': ' and ', '|': ' or ', '(': '(', ')': ')'}
         expr_str_list = expr_str.split(' ')
@@ -0,0 +1,86 @@
+"""Beiseitegelegte Schreibvorgänge der Offline-Queue anzeigen und verwerfen.
+
+Die Offline-Queue (gui/api_client/offline_queue.py) legt einen Vorgang
+beiseite, wenn der Server ihn wiederholt ablehnt (z. B. 409, weil der
+Datensatz inzwischen von jemand anderem gelöscht wurde). Der Dialog zeigt
+diese Vorgänge mit Serverantwort; der User verwirft die ausgewählten.
+"""
+
+import datetime
+import json
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QWidget, QVBoxLayout, QLabel, QDialogButtonBox, QTableWidget, \
+    QTableWidgetItem, QHeaderView
+
+from gui.api_client.offline_queue import OfflineWriteQueue
+
+
+class DlgSetAsideOfflineWrites(QDialog):
+    def __init__(self, parent: QWidget, queue: OfflineWriteQueue):
+        super().__init__(parent=parent)
+
+        self.queue = queue
+
+        self._setup_ui()
+        self._fill_in_table()
+
+    def _setup_ui(self):
+        self.setWindowTitle(self.tr("Set-Aside Offline Changes"))
+        self.resize(900, 400)
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setSpacing(20)
+
+        self.lb_description = QLabel(self.tr(
+            "The server repeatedly rejected the following changes made while offline. "
+            "They are no longer retried. Select the changes you want to discard:"))
+        self.lb_description.setWordWrap(True)
+        self.layout.addWidget(self.lb_description)
+
+        self.table_writes = QTableWidget()
+        table_columns = [self.tr("Created"), self.tr("Operation"), self.tr("Status"), self.tr("Server Response")]
+        self.table_writes.setColumnCount(len(table_columns))
+        self.table_writes.setHorizontalHeaderLabels(table_columns)
+        self.table_writes.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table_writes.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
+        self.table_writes.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table_writes.setAlternatingRowColors(True)
+        self.table_writes.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        self.table_writes.horizontalHeader().setStretchLastSection(True)
+        self.table_writes.itemSelectionChanged.connect(self._on_selection_changed)
+        self.layout.addWidget(self.table_writes)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Discard
+                                           | QDialogButtonBox.StandardButton.Close)
+        self.bt_discard = self.button_box.button(QDialogButtonBox.StandardButton.Discard)
+        self.bt_discard.setText(self.tr("Discard Selected"))
+        self.bt_discard.setEnabled(False)
+        self.bt_discard.clicked.connect(self._discard_selected)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+    def _fill_in_table(self):
+        writes = self.queue.set_aside_writes()
+        self.table_writes.setRowCount(len(writes))
+        for row, write in enumerate(writes):
+            created = datetime.datetime.fromtimestamp(write.created_at).strftime('%d.%m.%Y %H:%M')
+            item_created = QTableWidgetItem(created)
+            item_created.setData(Qt.ItemDataRole.UserRole, write.seq)
+            self.table_writes.setItem(row, 0, item_created)
+            self.table_writes.setItem(row, 1, QTableWidgetItem(f'{write.method} {write.path}'))
+            self.table_writes.setItem(row, 2, QTableWidgetItem(str(write.status)))
+            detail = write.detail if isinstance(write.detail, str) else json.dumps(write.detail, ensure_ascii=False)
+            self.table_writes.setItem(row, 3, QTableWidgetItem(detail))
+
+    def _on_selection_changed(self):
+        self.bt_discard.setEnabled(bool(self.table_writes.selectionModel().selectedRows()))
+
+    def _discard_selected(self):
+        seqs = [self.table_writes.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
+                for index in self.table_writes.selectionModel().selectedRows()]
+        self.queue.discard(seqs)
+        self.table_writes.clearSelection()
+        self._fill_in_table()
+        if not self.table_writes.rowCount():
+            self.accept()
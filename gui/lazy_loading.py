@@ -0,0 +1,86 @@
+"""
+Lazy geladene Subsysteme des Desktop-Clients.
+
+Solver (OR-Tools, pandas), Google-Calendar-Stack (httplib2, googleapiclient),
+Excel-Export (xlsxwriter), Statistik und Mitarbeiter-Termine werden beim
+Start nicht gebraucht, kosteten aber über `gui.main_window` zusammen gut eine
+halbe Sekunde Importzeit vor dem ersten Fenster (`scripts/profile_startup.py`).
+
+- `lazy_import(name)`: Modul-Platzhalter (importlib.util.LazyLoader), der das
+  Modul erst beim ersten Attributzugriff lädt — auch für `except
+  httplib2.ServerNotFoundError:` geeignet, der Ausdruck wird erst im
+  Fehlerfall ausgewertet.
+- `warm_up()`: lädt die Subsysteme nach dem Anzeigen des Hauptfensters im
+  Leerlauf vor, je eines pro Event-Loop-Durchlauf, damit die GUI bedienbar
+  bleibt und der erste Klick auf z. B. "Plan berechnen" nicht wartet.
+
+WICHTIG: Das Vorladen läuft im Haupt-Thread, nicht in einem Worker. OR-Tools
+muss im Haupt-Thread initialisiert werden, bevor Worker-Threads den Solver
+benutzen (Threading-Crash 0xC0000005, siehe
+HANDOVER_ortools_threading_crash_fix_december_2025). Alle anderen Importe von
+`sat_solver.solver_main` in der GUI liegen ebenfalls in Slots des
+Haupt-Threads.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import sys
+import time
+from types import ModuleType
+
+from PySide6.QtCore import QTimer
+
+logger = logging.getLogger(__name__)
+
+# Reihenfolge = Reihenfolge beim Vorladen (häufigste Nutzung zuerst)
+SUBSYSTEMS: dict[str, tuple[str, ...]] = {
+    'Solver': ('sat_solver.solver_main', 'gui.frm_calculate_plan'),
+    'Excel-Export': ('export_to_file.plan_to_xlsx', 'gui.frm_excel_export'),
+    'Google Calendar': ('httplib2', 'google_calendar_api.transfer_appointments',
+                        'google_calendar_api.create_calendar', 'google_calendar_api.get_calendars'),
+    'Statistik': ('gui.employment_statistics',),
+    'Mitarbeiter-Termine': ('gui.employee_events_window',),
+}
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Modul, das erst beim ersten Attributzugriff geladen wird."""
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def _load(subsystem: str, module_names: tuple[str, ...]) -> None:
+    started = time.perf_counter()
+    try:
+        for name in module_names:
+            # dir() erzwingt das Laden auch bei LazyLoader-Platzhaltern aus lazy_import
+            dir(importlib.import_module(name))
+    except Exception:
+        logger.exception("Vorladen von %s fehlgeschlagen — wird beim ersten Gebrauch erneut versucht.", subsystem)
+        return
+    logger.info("Subsystem %s vorgeladen (%.0f ms).", subsystem, (time.perf_counter() - started) * 1000)
+
+
+def warm_up(subsystems: dict[str, tuple[str, ...]] = SUBSYSTEMS, start_delay_ms: int = 1000) -> None:
+    """Lädt `subsystems` im Leerlauf des Haupt-Threads vor, eines pro Timer-Tick."""
+    pending = list(subsystems.items())
+
+    def next_subsystem() -> None:
+        if not pending:
+            return
+        _load(*pending.pop(0))
+        QTimer.singleShot(0, next_subsystem)
+
+    QTimer.singleShot(start_delay_ms, next_subsystem)
@@ -11,7 +11,6 @@ from PySide6.QtCore import QRect, QPoint, Slot, QCoreApplication, QThreadPool, Q
 from PySide6.QtGui import QAction, QActionGroup, QCloseEvent
 from PySide6.QtWidgets import (QMainWindow, QMenuBar, QMenu, QWidget, QMessageBox, QInputDialog, QFileDialog,
                                QApplication, QLabel)
-from httplib2 import ServerNotFoundError
 # xlsxwriter Imports werden lazy geladen für bessere Startup-Performance
 
 from commands import command_base_classes
@@ -20,22 +19,17 @@ from configuration import team_start_config, project_paths
 from configuration.google_calenders import curr_calendars_handler
 from configuration.main_geometry import geometry_manager, MainGeometry
 from database import db_services, schemas
-# WICHTIG: Früher Top-Level-Import von solver_main initialisiert OR-Tools im Haupt-Thread
-# BEVOR Worker-Threads starten. Dies verhindert den Threading-Crash (0xC0000005).
+# Solver, Excel-Export und Google Calendar werden lazy geladen und nach dem Anzeigen des Fensters
+# im Haupt-Thread vorgeladen (gui.lazy_loading.warm_up). OR-Tools muss im Haupt-Thread initialisiert
+# werden, BEVOR Worker-Threads den Solver nutzen (Threading-Crash 0xC0000005).
 # Siehe HANDOVER_ortools_threading_crash_fix_december_2025
-from sat_solver import solver_main
-# Excel Export Imports werden lazy geladen für bessere Startup-Performance
-# Google Calendar API Imports werden lazy geladen für bessere Startup-Performance
 
 from tools import open_file_or_folder
 from tools.helper_functions import date_to_string
 from .api_client.client import get_api_client
 from . import frm_comb_loc_possible, frm_settings_solver_params, frm_excel_settings
 from .concurrency.general_worker import WorkerGeneral
-from .frm_appointments_to_google_calendar import DlgSendAppointmentsToGoogleCal
-from .frm_create_google_calendar import CreateGoogleCalendar
 from .frm_create_project import DlgCreateProject
-from .frm_excel_export import DlgPlanToXLSX
 from .frm_general_settings import DlgGeneralSettings
 from .frm_notes import DlgPlanPeriodNotes
 from .custom_widgets.progress_bars import GlobalUpdatePlanTabsProgressManager, DlgProgressInfinite
@@ -47,6 +41,7 @@ from .frm_plan_period import DlgPlanPeriodCreate, DlgPlanPeriodEdit
 from .frm_project_select import DlgProjectSelect
 from .frm_project_settings import DlgSettingsProject
 from .frm_undelete_plans import DlgUndeletePlans
+from .lazy_loading import lazy_import
 from .observer import signal_handling
 from .tab_manager import TabManager
 from .cache.main_window_integration import TabCacheIntegration
@@ -55,6 +50,9 @@ from gui.custom_widgets.toolbars import MainToolBar
 
 logger = logging.getLogger(__name__)
 
+# Lädt erst beim Auswerten von `except httplib2.ServerNotFoundError` (oder beim Vorladen)
+httplib2 = lazy_import('httplib2')
+
 
 class MainWindow(QMainWindow, TabCacheIntegration):
     """
@@ -158,6 +156,10 @@ class MainWindow(QMainWindow, TabCacheIntegration):
                               self.tr('Open Account in Browser...'),
                               self.tr('Open the account self-service page in the default web browser.'),
                               self.open_account_in_browser),
+            MenuToolbarAction(self, None,
+                              self.tr('Set-Aside Offline Changes...'),
+                              self.tr('Shows offline changes the server rejected repeatedly and lets you discard them.'),
+                              self.show_set_aside_offline_writes),
             MenuToolbarAction(self, os.path.join(path_to_toolbar_icons, 'address-book-blue.png'),
                               self.tr('Basis-Konfiguration...'),
                               self.tr('Edit basic configuration: employees, facilities and teams.'),
@@ -290,7 +292,8 @@ class MainWindow(QMainWindow, TabCacheIntegration):
                                                        self.actions['export_avail_days_to_excel']]
                                },
                                self.actions['lookup_for_excel_plan_folder'],
-                               None, self.actions['open_account_in_browser'],
+                               None, self.actions['show_set_aside_offline_writes'],
+                               self.actions['open_account_in_browser'],
                                self.actions['logout'], self.actions['exit']],
             self.tr('&Team'): [self._put_clients_to_menu],
             self.tr('&Konfiguration'): [self.actions['basic_config']],
@@ -396,6 +399,7 @@ class MainWindow(QMainWindow, TabCacheIntegration):
         # Connection ueber Threadgrenzen liefert das Signal queued in den
         # Main-Thread — wichtig, weil API-Calls aus Worker-Threads kommen.
         get_api_client().auth_required.connect(self._on_auth_required)
+        get_api_client().offline_writes_set_aside.connect(self._on_offline_writes_set_aside)
         self._refresh_user_indicator()
 
         # Cache-Monitoring Flag
@@ -858,6 +862,8 @@ class MainWindow(QMainWindow, TabCacheIntegration):
             QMessageBox.critical(self, self.tr('Plan Excel-Export'), self.tr('You must first open a plan.'))
             return
 
+        from .frm_excel_export import DlgPlanToXLSX
+
         dlg = DlgPlanToXLSX(self, widget.plan)
         if dlg.exec():
             widget.reload_plan()
@@ -1203,6 +1209,8 @@ class MainWindow(QMainWindow, TabCacheIntegration):
         else:
             QMessageBox.critical(self, 'Termine übertragen', 'Es muss ein Plan geöffnet sein.')
             return
+        from .frm_appointments_to_google_calendar import DlgSendAppointmentsToGoogleCal
+
         if DlgSendAppointmentsToGoogleCal(self, plan).exec():
             self.worker_general = WorkerGeneral(transfer, True, plan)
             self.worker_general.signals.finished.connect(finished, Qt.ConnectionType.QueuedConnection)
@@ -1324,7 +1332,7 @@ class MainWindow(QMainWindow, TabCacheIntegration):
                     print(f"Kalender-Daten:\n{pprint.pformat(calendar)}")
                     curr_calendars_handler.save_calendar_json_to_file(calendar)
                 return {'success': True}
-            except ServerNotFoundError as e:
+            except httplib2.ServerNotFoundError as e:
                 return {'error': 'ServerNotFoundError', 'message': e}
             except Exception as e:
                 return {'error': 'Exception', 'message': e}
@@ -1383,6 +1391,8 @@ class MainWindow(QMainWindow, TabCacheIntegration):
                     f'ist folgender Fehler aufgetreten:\n'
                     f'{error_text}')
 
+        from .frm_create_google_calendar import CreateGoogleCalendar
+
         dlg = CreateGoogleCalendar(self, self.project_id)
         if dlg.exec():
             self.worker_general = WorkerGeneral(create, True)
@@ -1415,7 +1425,7 @@ class MainWindow(QMainWindow, TabCacheIntegration):
                 
                 synchronize_local_calendars()
                 return True
-            except ServerNotFoundError as e:
+            except httplib2.ServerNotFoundError as e:
                 return {'error': 'ServerNotFoundError', 'message': e}
             except Exception as e:
                 return {'error': 'Exception', 'message': e}
@@ -1563,6 +1573,24 @@ class MainWindow(QMainWindow, TabCacheIntegration):
     def exit(self):
         self.close()
 
+    def show_set_aside_offline_writes(self):
+        from .frm_offline_writes import DlgSetAsideOfflineWrites
+        DlgSetAsideOfflineWrites(self, get_api_client().offline_queue).exec()
+
+    @Slot(int)
+    def _on_offline_writes_set_aside(self, count: int):
+        """Offline-Queue hat Vorgaenge nach wiederholter Ablehnung beiseitegelegt
+        (Signal kommt queued aus dem Replay-Thread)."""
+        reply = QMessageBox.warning(
+            self,
+            self.tr('Offline changes not transferred'),
+            self.tr('{count} change(s) made while offline were repeatedly rejected by the server '
+                    'and have been set aside. Show them now?').format(count=count),
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.show_set_aside_offline_writes()
+
     def open_account_in_browser(self):
         webbrowser.open(f"{get_api_client().base_url}/account/profile")
 
@@ -283,14 +283,23 @@ class HandlerExcelExport(QObject):
 
 class HandlerSolver(QObject):
     signal_progress = Signal(str)
+    signal_solution_progress = Signal(object)
     signal_cancel_solving = Signal()
+    signal_accept_current_best = Signal()
 
     def progress(self, comment: str):
         self.signal_progress.emit(comment)
 
+    def solution_progress(self, solve_progress: object):
+        """solve_progress: sat_solver.progress.SolveProgress (ohne Import, Qt-Seite bleibt solver-frei)."""
+        self.signal_solution_progress.emit(solve_progress)
+
     def cancel_solving(self):
         self.signal_cancel_solving.emit()
 
+    def accept_current_best(self):
+        self.signal_accept_current_best.emit()
+
 
 class HandlerGoogleCalAPI(QObject):
     signal_transfer_appointments_progress = Signal(str)
@@ -0,0 +1,43 @@
+"""
+Startzeit-Messpunkte des Desktop-Clients.
+
+`mark(label)` hält die Zeit seit Prozessstart fest (Referenz: Umgebungsvariable
+HCC_STARTUP_T0 als `time.time()` des startenden Prozesses, sonst der Import
+dieses Moduls). Mit HCC_STARTUP_PROFILE=1 gibt `finish(app)` nach dem ersten
+Fenster eine Zeile `STARTUP-PROFILE {json}` auf stdout aus und beendet die App
+— so misst `scripts/profile_startup.py` die Zeit bis zum ersten Fenster.
+Ohne die Variable werden die Messpunkte nur ins Log geschrieben.
+"""
+
+import json
+import logging
+import os
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+logger = logging.getLogger(__name__)
+
+_T0 = float(os.environ.get('HCC_STARTUP_T0', time.time()))
+_marks: list[tuple[str, float]] = []
+
+
+def enabled() -> bool:
+    return os.environ.get('HCC_STARTUP_PROFILE') == '1'
+
+
+def mark(label: str) -> None:
+    _marks.append((label, (time.time() - _T0) * 1000))
+
+
+def marks() -> dict[str, float]:
+    """Messpunkte in ms seit Prozessstart, in Aufzeichnungsreihenfolge."""
+    return {label: round(ms, 1) for label, ms in _marks}
+
+
+def finish(app: QApplication) -> None:
+    logger.info("Startzeiten (ms seit Prozessstart): %s", marks())
+    if enabled():
+        print(f"STARTUP-PROFILE {json.dumps(marks())}", flush=True)
+        QTimer.singleShot(0, app.quit)
@@ -4,6 +4,7 @@ from uuid import UUID
 from anytree import NodeMixin, RenderTree, ContRoundStyle
 
 from database import schemas, db_services
+from sat_solver.tree_snapshot import TreeSnapshot, current_revision, tree_snapshot_cache
 
 # Sentinel für "RequiredAvailDayGroups noch nicht geladen" — unterscheidet sich von None
 # (= "kein Eintrag vorhanden"). Wird von _preload_required_avail_day_groups() überschrieben
@@ -111,6 +112,22 @@ class AvailDayGroupTree:
         nodes.update({node.avail_day_group_id: node for node in root.descendants})
         return nodes
 
+    @classmethod
+    def from_snapshot(cls, snapshot: TreeSnapshot, actor_plan_period_ids: list[UUID]) -> 'AvailDayGroupTree':
+        """Frische anytree-Sicht aus einem Snapshot — ohne DB-Zugriff."""
+        nodes = snapshot.materialize(lambda payload, parent: AvailDayGroup(payload, None, parent))
+        tree = cls.__new__(cls)
+        tree.actor_plan_period_ids = list(actor_plan_period_ids)
+        tree.root = nodes[0]
+        tree.root.group_is_actor_plan_period_master_group = snapshot.root_is_master_group
+        tree.nodes = {node.avail_day_group_id: node for node in nodes}
+        tree.nodes[0] = tree.root
+        return tree
+
+    def to_snapshot(self) -> TreeSnapshot:
+        return TreeSnapshot.from_root(self.root, 'avail_day_group_id', 'avail_day_group_db',
+                                      'group_is_actor_plan_period_master_group')
+
     def _construct_with_batch_loading(self):
         """
         Konstruiert den Tree mit Batch-Loading für optimale Performance.
@@ -169,7 +186,14 @@ def get_avail_day_group_tree(plan_period_id: UUID, app_ids: list[UUID] | None =
     if app_ids is None:
         from database.db_services import plan_period as pp_svc
         _, app_ids = pp_svc.get_lpp_and_app_ids(plan_period_id)
-    return AvailDayGroupTree(app_ids)
+    key = ('avail_day_group', tuple(app_ids))
+    snapshot = tree_snapshot_cache.get(key)
+    if snapshot is not None:
+        return AvailDayGroupTree.from_snapshot(snapshot, app_ids)
+    revision = current_revision()
+    tree = AvailDayGroupTree(app_ids)
+    tree_snapshot_cache.put(key, tree.to_snapshot(), revision)
+    return tree
 
 
 def get_combined_avail_day_group_tree(plan_period_ids: list[UUID]) -> AvailDayGroupTree:
@@ -4,6 +4,7 @@ from uuid import UUID
 from anytree import NodeMixin, RenderTree, ContRoundStyle
 
 from database import schemas, db_services
+from sat_solver.tree_snapshot import TreeSnapshot, current_revision, tree_snapshot_cache
 
 
 class CastGroup(NodeMixin):
@@ -77,6 +78,19 @@ class CastGroupTree:
         nodes.update({node.cast_group_id: node for node in root.descendants})
         return nodes
 
+    @classmethod
+    def from_snapshot(cls, snapshot: TreeSnapshot, plan_period_id: UUID) -> 'CastGroupTree':
+        """Frische anytree-Sicht aus einem Snapshot — ohne DB-Zugriff."""
+        nodes = snapshot.materialize(lambda payload, parent: CastGroup(payload, None, parent))
+        tree = cls.__new__(cls)
+        tree.plan_period_id = plan_period_id
+        tree.root = nodes[0]
+        tree.nodes = {}
+        return tree
+
+    def to_snapshot(self) -> TreeSnapshot:
+        return TreeSnapshot.from_root(self.root, 'cast_group_id', 'cast_group_db')
+
     def construct_cast_group_tree(self):
         self.root = CastGroup(None)
         all_cast_groups_db = db_services.CastGroup.get_all_from__plan_period(self.plan_period_id)
@@ -103,7 +117,14 @@ class CastGroupTree:
 
 
 def get_cast_group_tree(plan_period_id: UUID) -> CastGroupTree:
-    return CastGroupTree(plan_period_id)
+    key = ('cast_group', plan_period_id)
+    snapshot = tree_snapshot_cache.get(key)
+    if snapshot is not None:
+        return CastGroupTree.from_snapshot(snapshot, plan_period_id)
+    revision = current_revision()
+    tree = CastGroupTree(plan_period_id)
+    tree_snapshot_cache.put(key, tree.to_snapshot(), revision)
+    return tree
 
 
 def get_combined_cast_group_tree(plan_period_ids: list[UUID]) -> CastGroupTree:
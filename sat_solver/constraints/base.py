@@ -4,6 +4,7 @@ Abstrakte Basisklasse für alle Solver-Constraints.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from uuid import UUID
 
@@ -14,6 +15,7 @@ from ortools.sat.python.cp_model import IntVar
 
 if TYPE_CHECKING:
     from sat_solver.constraints.registry import ConstraintRegistry
+    from sat_solver.solve_context import SolveContext
     from database import schemas
 
 
@@ -161,6 +163,15 @@ class ConstraintBase(ABC):
     def config(self):
         """Shortcut für Zugriff auf die Solver-Konfiguration."""
         return self.registry.config
+
+    @property
+    def context(self) -> 'SolveContext':
+        """Shortcut für Zugriff auf den Per-Solve-Zustand."""
+        return self.registry.context
+
+    def var_name(self, factory: Callable[[], str]) -> str:
+        """Variablen-Name, nur im Debug-Modus formatiert (siehe SolveContext.var_name)."""
+        return self.registry.context.var_name(factory)
     
     @abstractmethod
     def apply(self) -> None:
@@ -7,14 +7,15 @@ Implementiert Regeln für Event-Besetzungen:
 - No Rule ("*"): Keine Besetzungsregel
 """
 import collections
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 from ortools.sat.python.cp_model import IntVar
 
 from database import schemas
-from sat_solver import solver_variables
 from sat_solver.cast_group_tree import CastGroup
+from sat_solver.event_group_tree import EventGroup
 from sat_solver.constraints.base import ConstraintBase, Validatable
 
 if TYPE_CHECKING:
@@ -50,17 +51,17 @@ class CastRulesConstraint(ConstraintBase):
         Sammelt Cast Groups, sortiert sie chronologisch und wendet
         die entsprechenden Regeln an.
         """
-        # Sammle alle Cast Groups auf Level 1, gruppiert nach Parent
-        cast_groups_level_1 = collections.defaultdict(list)
-        for cast_group in self.entities.cast_groups_with_event.values():
-            cast_groups_level_1[cast_group.parent.cast_group_id].append(cast_group)
-        
-        # Sortiere Cast Groups chronologisch für konsistente Reihenfolge
-        for cast_groups in cast_groups_level_1.values():
-            cast_groups.sort(
-                key=lambda x: (x.event.date, x.event.time_of_day.time_of_day_enum.time_index)
-            )
-        
+        cast_groups_level_1 = self._cast_groups_level_1()
+
+        # Index nur für Event Groups, die tatsächlich in einer aktiven Regel vorkommen
+        ruled_event_group_ids = {
+            cast_group.event.event_group_id
+            for cg_id, cast_groups in cast_groups_level_1.items()
+            if self.entities.cast_groups[cg_id].cast_rule and self.entities.cast_groups[cg_id].strict_rule_pref
+            for cast_group in cast_groups
+        }
+        self._shift_vars_index = self._build_shift_vars_index(ruled_event_group_ids)
+
         # Verarbeite jede Cast Group Hierarchie
         for cg_id, cast_groups in cast_groups_level_1.items():
             cast_groups: list[CastGroup]
@@ -98,16 +99,47 @@ class CastRulesConstraint(ConstraintBase):
                 else:
                     raise ValueError(f'unknown rule symbol: {rule}')
     
+    def _cast_groups_level_1(self) -> dict[UUID | int, list[CastGroup]]:
+        """Cast Groups mit Event auf Level 1, gruppiert nach Parent und chronologisch sortiert."""
+        cast_groups_level_1 = collections.defaultdict(list)
+        for cast_group in self.entities.cast_groups_with_event.values():
+            cast_groups_level_1[cast_group.parent.cast_group_id].append(cast_group)
+
+        for cast_groups in cast_groups_level_1.values():
+            cast_groups.sort(
+                key=lambda x: (x.event.date, x.event.time_of_day.time_of_day_enum.time_index)
+            )
+        return cast_groups_level_1
+
+    def _build_shift_vars_index(self, event_group_ids: set[UUID]) -> dict[UUID, dict[UUID, list[IntVar]]]:
+        """
+        Index event_group_id → actor_plan_period_id → mögliche Schicht-Variablen.
+
+        Ein Durchlauf über entities.shift_vars pro apply() statt einer Vollsuche
+        je Regel-Paar und Mitarbeiter. Nur Schichten mit shifts_exclusive == 1
+        (das schließt Datum und Tageszeit des Events bereits ein).
+        """
+        index: dict[UUID, dict[UUID, list[IntVar]]] = collections.defaultdict(
+            lambda: collections.defaultdict(list))
+        for (adg_id, eg_id), var in self.entities.shift_vars.items():
+            if eg_id not in event_group_ids or not self.entities.shifts_exclusive[(adg_id, eg_id)]:
+                continue
+            app_id = self.entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id
+            index[eg_id][app_id].append(var)
+        return index
+
     def _different_cast(
         self, 
-        event_group_1: schemas.EventGroup, 
-        event_group_2: schemas.EventGroup,
+        event_group_1: EventGroup,
+        event_group_2: EventGroup,
         strict_rule_pref: int
     ) -> list[IntVar]:
         """
         Implementiert "Different Cast" Regel - Events müssen verschiedene Besetzung haben.
         
         Für jeden Mitarbeiter: Maximal eine Schicht in einer der beiden Event Groups.
+        Mitarbeiter mit weniger als zwei möglichen Schichten können die Regel nicht
+        verletzen und bekommen keine Constraints.
         
         Args:
             event_group_1: Erste Event Group für Vergleich
@@ -118,34 +150,47 @@ class CastRulesConstraint(ConstraintBase):
             Liste der Broken-Rule-Variablen (nur bei strict_rule_pref == 1)
         """
         broken_rules_vars: list[IntVar] = []
+        shift_vars_1 = self._shift_vars_index.get(event_group_1.event_group_id, {})
+        shift_vars_2 = self._shift_vars_index.get(event_group_2.event_group_id, {})
         
         for app_id, actor_plan_period in self.entities.actor_plan_periods.items():
-            # Sammle alle relevanten Schicht-Variablen für beide Event Groups
-            shift_vars = {
-                (adg_id, eg_id): var 
-                for (adg_id, eg_id), var in self.entities.shift_vars.items()
-                if eg_id in {event_group_1.id, event_group_2.id}
-                and self.entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id == app_id
-                and self.entities.avail_day_groups_with_avail_day[adg_id].avail_day.date
-                    in {event_group_1.event.date, event_group_2.event.date}
-                and self.entities.shifts_exclusive[(adg_id, eg_id)]
-            }
+            shift_vars = shift_vars_1.get(app_id, []) + shift_vars_2.get(app_id, [])
+            if len(shift_vars) < 2:
+                continue
             
             if strict_rule_pref == 2:
                 # Harte Regel: Mitarbeiter kann maximal in einer Event Group arbeiten
-                self.model.Add(sum(shift_vars.values()) <= 1)
+                self.model.AddAtMostOne(shift_vars)
             elif strict_rule_pref == 1:
-                # Weiche Regel: Erstelle Variable für Regelverstoß
-                name_var = (
+                # Weiche Regel: Verstoß-Variable <=> mindestens zwei Schichten
+                broken = self.model.NewBoolVar(self.var_name(lambda: (
                     f'{event_group_1.event.date:%d.%m.} + {event_group_2.event.date:%d.%m.}, '
                     f'{event_group_1.event.location_plan_period.location_of_work.name}, '
                     f'{actor_plan_period.person.f_name}'
-                )
-                equal_to_two = self.model.NewBoolVar(name_var)
-                self.model.AddMaxEquality(equal_to_two, [sum(shift_vars.values()) - 1, 0])
-                broken_rules_vars.append(equal_to_two)
+                )))
+                if len(shift_vars) == 2:
+                    # Regelfall (eine Schicht pro Event): broken == shift_1 AND shift_2
+                    self.model.AddBoolOr([shift_vars[0].Not(), shift_vars[1].Not(), broken])
+                    self.model.AddImplication(broken, shift_vars[0])
+                    self.model.AddImplication(broken, shift_vars[1])
+                else:
+                    self.model.Add(sum(shift_vars) <= 1).OnlyEnforceIf(broken.Not())
+                    self.model.Add(sum(shift_vars) >= 2).OnlyEnforceIf(broken)
+                broken_rules_vars.append(broken)
         
         return broken_rules_vars
+
+    def _applied_shift(self, shift_vars: list[IntVar], name: Callable[[], str]) -> IntVar | None:
+        """Literal "Mitarbeiter ist im Event eingesetzt" (None = keine mögliche Schicht)."""
+        if not shift_vars:
+            return None
+        if len(shift_vars) == 1:
+            return shift_vars[0]
+        applied = self.model.NewBoolVar(self.var_name(name))
+        self.model.AddBoolOr(shift_vars).OnlyEnforceIf(applied)
+        for var in shift_vars:
+            self.model.AddImplication(var, applied)
+        return applied
     
     def _same_cast(
         self, 
@@ -172,61 +217,49 @@ class CastRulesConstraint(ConstraintBase):
         
         event_group_1_id = cast_group_1.event.event_group_id
         event_group_2_id = cast_group_2.event.event_group_id
+        shift_vars_1 = self._shift_vars_index.get(event_group_1_id, {})
+        shift_vars_2 = self._shift_vars_index.get(event_group_2_id, {})
         
-        # Erstelle Boolean-Arrays für tatsächliche Schicht-Zuweisungen
-        applied_shifts_1: list[IntVar] = [
-            self.model.NewBoolVar(f'{cast_group_1.event.date:%d.%m.}: {app.person.f_name}')
-            for app in self.entities.actor_plan_periods.values()
-        ]
-        applied_shifts_2: list[IntVar] = [
-            self.model.NewBoolVar(f'{cast_group_2.event.date:%d.%m.}: {app.person.f_name}')
-            for app in self.entities.actor_plan_periods.values()
-        ]
-        
-        # Speichere für Debug-Zwecke in solver_variables
-        solver_variables.cast_rules.applied_shifts_1.append(applied_shifts_1)
-        solver_variables.cast_rules.applied_shifts_2.append(applied_shifts_2)
-        
-        # Verknüpfe Boolean-Arrays mit tatsächlichen Schicht-Variablen
-        for i, (app_id, app) in enumerate(self.entities.actor_plan_periods.items()):
-            # Finde Schicht-Variable für Event 1
-            shift_var_1 = next(
-                (v for (adg_id, eg_id), v in self.entities.shift_vars.items()
-                 if eg_id == event_group_1_id
-                 and self.entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id == app_id
-                 and self.entities.shifts_exclusive[(adg_id, eg_id)]),
-                0
-            )
-            # Finde Schicht-Variable für Event 2
-            shift_var_2 = next(
-                (v for (adg_id, eg_id), v in self.entities.shift_vars.items()
-                 if eg_id == event_group_2_id
-                 and self.entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id == app_id
-                 and self.entities.shifts_exclusive[(adg_id, eg_id)]),
-                0
-            )
-            
-            self.model.Add(applied_shifts_1[i] == shift_var_1)
-            self.model.Add(applied_shifts_2[i] == shift_var_2)
-        
-        # Berechne Unterschiede zwischen den Besetzungen (XOR-Logic)
+        applied_shifts_1: list[IntVar] = []
+        applied_shifts_2: list[IntVar] = []
         curr_is_unequal: list[IntVar] = []
         
-        for i, app in enumerate(self.entities.actor_plan_periods.values()):
-            curr_is_unequal.append(
-                self.model.NewBoolVar(f'{cast_group_1.event.date:%d.%m.}: {app.person.f_name}')
-            )
-            # Hilfsvariable für XOR-Implementierung
-            factor = self.model.NewIntVar(0, 1, '')
-            # XOR-Bedingung: unterschiedlich wenn genau einer der beiden true ist
-            self.model.Add(
-                applied_shifts_1[i] + applied_shifts_2[i] == curr_is_unequal[-1] + 2 * factor
-            )
+        # Mitarbeiter ohne mögliche Schicht in beiden Events sind immer "gleich" → übersprungen
+        for app_id, app in self.entities.actor_plan_periods.items():
+            applied_1 = self._applied_shift(shift_vars_1.get(app_id, []),
+                                            lambda: f'{cast_group_1.event.date:%d.%m.}: {app.person.f_name}')
+            applied_2 = self._applied_shift(shift_vars_2.get(app_id, []),
+                                            lambda: f'{cast_group_2.event.date:%d.%m.}: {app.person.f_name}')
+            if applied_1 is None and applied_2 is None:
+                continue
+            if applied_1 is not None:
+                applied_shifts_1.append(applied_1)
+            if applied_2 is not None:
+                applied_shifts_2.append(applied_2)
+            
+            if applied_1 is None or applied_2 is None:
+                # Nur in einem Event möglich: ungleich genau dann, wenn dort eingesetzt
+                curr_is_unequal.append(applied_1 if applied_1 is not None else applied_2)
+                continue
+            
+            # XOR als Klauseln: is_unequal == applied_1 XOR applied_2
+            is_unequal = self.model.NewBoolVar(
+                self.var_name(lambda: f'{cast_group_1.event.date:%d.%m.}: {app.person.f_name}'))
+            self.model.AddBoolOr([applied_1.Not(), applied_2, is_unequal])
+            self.model.AddBoolOr([applied_1, applied_2.Not(), is_unequal])
+            self.model.AddBoolOr([applied_1, applied_2, is_unequal.Not()])
+            self.model.AddBoolOr([applied_1.Not(), applied_2.Not(), is_unequal.Not()])
+            curr_is_unequal.append(is_unequal)
         
-        solver_variables.cast_rules.is_unequal.extend(curr_is_unequal)
+        # Speichere für Debug-Zwecke im Solve-Kontext
+        self.context.cast_rules.applied_shifts_1.append(applied_shifts_1)
+        self.context.cast_rules.applied_shifts_2.append(applied_shifts_2)
+        self.context.cast_rules.is_unequal.extend(curr_is_unequal)
         
         if strict_rule_pref == 2:
             # Harte Regel: Anzahl Unterschiede <= erlaubte Differenz
+            if not curr_is_unequal:
+                return broken_rules_vars
             (self.model.Add(sum(curr_is_unequal) <= abs(cast_group_1.nr_actors - cast_group_2.nr_actors))
              .OnlyEnforceIf([self.entities.event_group_vars[event_group_1_id],
                              self.entities.event_group_vars[event_group_2_id]]))
@@ -236,9 +269,9 @@ class CastRulesConstraint(ConstraintBase):
             max_diff = cast_group_1.nr_actors + cast_group_2.nr_actors
             broken_rules_var = self.model.NewIntVar(
                 0, max_diff,
-                f'{cast_group_1.event.date:%d.%m.} + '
-                f'{cast_group_2.event.date:%d.%m.}, '
-                f'{cast_group_1.event.location_plan_period.location_of_work.name}'
+                self.var_name(lambda: f'{cast_group_1.event.date:%d.%m.} + '
+                                      f'{cast_group_2.event.date:%d.%m.}, '
+                                      f'{cast_group_1.event.location_plan_period.location_of_work.name}')
             )
             # Zwischenvariable für Berechnung
             intermediate = self.model.NewIntVar(0, max_diff, '')
@@ -277,16 +310,8 @@ class CastRulesConstraint(ConstraintBase):
                 for avd in appointment.avail_days
             }
         
-        # Sammle Cast Groups auf Level 1, gruppiert nach Parent (wie in apply())
-        cast_groups_level_1 = collections.defaultdict(list)
-        for cast_group in self.entities.cast_groups_with_event.values():
-            cast_groups_level_1[cast_group.parent.cast_group_id].append(cast_group)
-        
-        # Sortiere chronologisch
-        for cast_groups in cast_groups_level_1.values():
-            cast_groups.sort(
-                key=lambda x: (x.event.date, x.event.time_of_day.time_of_day_enum.time_index)
-            )
+        # Cast Groups auf Level 1, gruppiert nach Parent (wie in apply())
+        cast_groups_level_1 = self._cast_groups_level_1()
         
         # Prüfe jede Cast Group Hierarchie
         for cg_id, cast_groups in cast_groups_level_1.items():
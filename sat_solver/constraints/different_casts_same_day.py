@@ -83,27 +83,90 @@ class DifferentCastsSameDayConstraint(ConstraintBase):
     def _create_constraints(self, dict_date_shift_var: defaultdict) -> None:
         """
         Erstellt die eigentlichen Constraints für das Model.
-        
+
+        Pro (Tag, Mitarbeiter) wird ein Konflikt-Graph aufgebaut (Kante = Kombination
+        laut CombinationLocationsPossible nicht erlaubt) und durch maximale Cliquen
+        abgedeckt — je Clique ein ``AddAtMostOne`` statt je Var-Paar ein ``sum <= 1``.
+
         Args:
             dict_date_shift_var: Das vorbereitete Dictionary mit Shift-Variablen
         """
-        for date, dict_actor_plan_period_id in dict_date_shift_var.items():
-            for actor_plan_period_id, dict_location_id in dict_actor_plan_period_id.items():
+        for dict_actor_plan_period_id in dict_date_shift_var.values():
+            for dict_location_id in dict_actor_plan_period_id.values():
                 # Nur wenn mehr als eine Location am Tag
                 if len(dict_location_id) <= 1:
                     continue
-                
-                # Alle Location-Paare prüfen
-                for loc_pair in itertools.combinations(list(dict_location_id.values()), 2):
-                    # Alle Shift-Var-Kombinationen zwischen den Locations
-                    for var_pair in itertools.product(*loc_pair):
-                        if not self._comb_locations_possible(
-                            var_pair[0][0][0], var_pair[0][0][1],
-                            var_pair[1][0][0], var_pair[1][0][1]
-                        ):
-                            # Hard Constraint: Summe der beiden Shifts <= 1
-                            self.model.Add(sum(v[1] for v in var_pair) <= 1)
-    
+                self._add_day_constraints(dict_location_id)
+
+    def _add_day_constraints(
+        self, dict_location_id: dict[UUID, list[tuple[tuple[UUID, UUID], IntVar]]]
+    ) -> None:
+        """
+        Constraints für einen Mitarbeiter an einem Tag.
+
+        1. Shift-Vars mit gleicher Signatur (Location, AvailDay, Zeitfenster) sind
+           für ``_comb_locations_possible`` ununterscheidbar → die Prüfung läuft
+           einmal pro Signatur-Paar statt pro Var-Paar.
+        2. Signaturen mit identischer Konflikt-Nachbarschaft (z. B. Vormittag und
+           Abend an derselben Location) werden zu einem Literal zusammengefasst:
+           ``x → z`` für jede Var der Klasse. Ohne diesen Schritt wäre der Graph
+           bei mehreren Shifts pro Location vollständig multipartit und jede
+           maximale Clique nur ein Var-Paar.
+        3. Der Quotienten-Graph wird greedy durch maximale Cliquen abgedeckt.
+        """
+        # 1. Signatur-Klassen: Signatur -> [(key, shift_var), ...]
+        signature_classes: dict[tuple, list[tuple[tuple[UUID, UUID], IntVar]]] = defaultdict(list)
+        for location_id, key_vars in dict_location_id.items():
+            for key, shift_var in key_vars:
+                adg_id, eg_id = key
+                avail_day = self.entities.avail_day_groups_with_avail_day[adg_id].avail_day
+                time_of_day = self.entities.event_groups_with_event[eg_id].event.time_of_day
+                signature = (location_id, avail_day.id, time_of_day.start, time_of_day.end)
+                signature_classes[signature].append((key, shift_var))
+
+        signatures = list(signature_classes)
+        representatives = [signature_classes[signature][0][0] for signature in signatures]
+        adjacency: list[set[int]] = [set() for _ in signatures]
+        for i, j in itertools.combinations(range(len(signatures)), 2):
+            # Gleiche Location → kein Konflikt
+            if signatures[i][0] == signatures[j][0]:
+                continue
+            if not self._comb_locations_possible(*representatives[i], *representatives[j]):
+                adjacency[i].add(j)
+                adjacency[j].add(i)
+
+        # 2. Nachbarschafts-Klassen (nicht adjazent, da N(u) == N(v) ⇒ v ∉ N(u))
+        neighbourhood_classes: dict[frozenset[int], list[int]] = defaultdict(list)
+        for i, neighbours in enumerate(adjacency):
+            if neighbours:
+                neighbourhood_classes[frozenset(neighbours)].append(i)
+        if not neighbourhood_classes:
+            return
+
+        class_members = list(neighbourhood_classes.values())
+        class_of = {i: c for c, members in enumerate(class_members) for i in members}
+        class_adjacency = [
+            {class_of[j] for j in adjacency[members[0]]}
+            for members in class_members
+        ]
+        literals = [
+            self._class_literal([shift_var for i in members for _, shift_var in signature_classes[signatures[i]]])
+            for members in class_members
+        ]
+
+        # 3. Clique-Cover
+        for clique in _greedy_clique_cover(class_adjacency):
+            self.model.AddAtMostOne(literals[c] for c in clique)
+
+    def _class_literal(self, shift_vars: list[IntVar]) -> IntVar:
+        """Einzelne Var direkt, sonst ein Literal z mit x → z für alle Vars der Klasse."""
+        if len(shift_vars) == 1:
+            return shift_vars[0]
+        literal = self.model.NewBoolVar('')
+        for shift_var in shift_vars:
+            self.model.AddImplication(shift_var, literal)
+        return literal
+
     def _comb_locations_possible(
         self, 
         adg_id_1: UUID, 
@@ -300,3 +363,37 @@ class DifferentCastsSameDayConstraint(ConstraintBase):
         # Kombination ist möglich wenn Zeitabstand ausreicht
         required_time = max(clp_1.time_span_between, clp_2.time_span_between)
         return time_diff >= required_time
+
+
+def _greedy_clique_cover(adjacency: list[set[int]]) -> list[list[int]]:
+    """
+    Deckt alle Kanten des Graphen durch maximale Cliquen ab.
+
+    Startet bei der ersten noch nicht abgedeckten Kante und erweitert greedy um den
+    gemeinsamen Nachbarn mit den meisten noch offenen Kanten zur Clique, bis keiner
+    mehr übrig ist. Deterministisch (Tie-Break über den Index).
+
+    Args:
+        adjacency: adjacency[i] = Nachbarn von Knoten i (symmetrisch)
+
+    Returns:
+        Liste von Cliquen (Knoten-Indizes), zusammen alle Kanten abdeckend
+    """
+    uncovered = {(i, j) for i, neighbours in enumerate(adjacency) for j in neighbours if i < j}
+    cliques: list[list[int]] = []
+    for edge in sorted(uncovered):
+        if edge not in uncovered:
+            continue
+        clique = list(edge)
+        candidates = adjacency[edge[0]] & adjacency[edge[1]]
+        while candidates:
+            best = max(
+                sorted(candidates),
+                key=lambda w: sum((min(w, c), max(w, c)) in uncovered for c in clique),
+            )
+            clique.append(best)
+            candidates &= adjacency[best]
+        for pair in itertools.combinations(sorted(clique), 2):
+            uncovered.discard(pair)
+        cliques.append(clique)
+    return cliques
@@ -157,12 +157,12 @@ class LocationPrefsConstraint(ConstraintBase):
         min_value = multiplier_slider[2]      # z.B. -20 (Bonus)
         max_value = multiplier_slider[0.5]    # z.B. 10 (Penalty)
         
-        # Erstelle Variable mit aussagekräftigem Namen
-        var_name = (
+        # Erstelle Variable mit aussagekräftigem Namen (nur im Debug-Modus)
+        var_name = self.var_name(lambda: (
             f'{event.date:%d.%m.%Y} ({event.time_of_day.name}), '
             f'{event.location_plan_period.location_of_work.name}: '
             f'{avail_day.actor_plan_period.person.f_name}'
-        )
+        ))
         
         return self.model.NewIntVar(min_value, max_value, var_name)
     
@@ -9,8 +9,6 @@ import itertools
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from ortools.sat.python.cp_model import IntVar
-
 from sat_solver.constraints.base import ConstraintBase, Validatable
 
 if TYPE_CHECKING:
@@ -25,8 +23,8 @@ class PartnerLocationPrefsConstraint(ConstraintBase):
     basierend auf ihren gegenseitigen Partner-Location-Präferenzen.
     
     Logik:
-    - Für jedes Event mit mindestens 2 Mitarbeitern werden alle Duo-Kombinationen geprüft
-    - Jede Kombination erhält eine Penalty-Variable basierend auf den Präferenz-Scores
+    - Für jedes Event mit mindestens 2 Mitarbeitern werden die Duo-Kombinationen geprüft
+    - Jede Kombination mit Gewicht ≠ 0 erhält eine Penalty-Variable basierend auf den Präferenz-Scores
     - Score 0 bedeutet: Diese Kombination sollte vermieden werden
     - Score 1-2 sind neutrale/positive Bewertungen
     
@@ -36,145 +34,154 @@ class PartnerLocationPrefsConstraint(ConstraintBase):
     
     name = "partner_location_prefs"
     weight_attribute = "constraints_partner_loc_prefs"
-    
+
+    def __init__(self):
+        super().__init__()
+        # id(avail_day) -> {(partner_id, location_id): score}
+        self._score_lookup: dict[int, dict[tuple[UUID, UUID], float]] = {}
+
     def apply(self) -> None:
         """
         Wendet das Partner-Location-Prefs Constraint an.
+
+        Variablen entstehen nur für Duos, deren Gewicht ≠ 0 ist. Bei den
+        Standard-Multiplikatoren (Score 1 → 0) sind das genau die Duos mit
+        einer expliziten Präferenz in mindestens einer Richtung; alle übrigen
+        tragen konstant 0 bei und werden gar nicht erst aufgezählt.
         """
         plp_multipliers = self.config.constraints_multipliers.sliders_partner_loc_prefs
-        
+        adgs_by_event = self._build_adgs_by_event()
+
         for eg_id, event_group in self.entities.event_groups_with_event.items():
+            nr_actors = event_group.event.cast_group.nr_actors
             # Nur Events mit mindestens 2 Mitarbeitern
-            if event_group.event.cast_group.nr_actors < 2:
+            if nr_actors < 2 or len(adgs_by_event.get(eg_id, ())) < 2:
                 continue
-            
-            # Hole alle verfügbaren AvailDayGroups für dieses Event
-            avail_day_groups = [
-                adg for adg_id, adg in self.entities.avail_day_groups_with_avail_day.items()
-                if self.entities.shifts_exclusive[adg_id, eg_id]
-            ]
-            
-            # Alle Duo-Kombinationen prüfen
-            for combo in itertools.combinations(avail_day_groups, 2):
-                self._process_duo_combination(combo, eg_id, event_group, plp_multipliers)
-    
-    def _process_duo_combination(self, combo, eg_id, event_group, plp_multipliers) -> None:
+            location_id = event_group.event.location_plan_period.location_of_work.id
+            default_weight = round((plp_multipliers[1] + plp_multipliers[1]) / (nr_actors - 1))
+
+            for adg_0, adg_1 in self._candidate_duos(adgs_by_event[eg_id], location_id, default_weight != 0):
+                score_0 = self._get_partner_score(adg_0, adg_1, location_id)
+                score_1 = self._get_partner_score(adg_1, adg_0, location_id)
+                weight = round((plp_multipliers[score_0] + plp_multipliers[score_1]) / (nr_actors - 1))
+                if weight:
+                    self._add_duo_penalty(adg_0, adg_1, eg_id, event_group, weight)
+                # Hard Constraint für Exclusion bei Score 0
+                self._add_exclusion_constraint(adg_0, adg_1, eg_id, nr_actors, score_0, score_1)
+
+    def _build_adgs_by_event(self) -> dict[UUID, list]:
+        """event_group_id -> AvailDayGroups, die für das Event möglich sind (ein Durchlauf über shift_vars)."""
+        adgs_by_event: dict[UUID, list] = {}
+        for (adg_id, eg_id) in self.entities.shift_vars:
+            if self.entities.shifts_exclusive[adg_id, eg_id]:
+                adgs_by_event.setdefault(eg_id, []).append(self.entities.avail_day_groups_with_avail_day[adg_id])
+        return adgs_by_event
+
+    def _candidate_duos(self, avail_day_groups: list, location_id: UUID, include_default: bool):
         """
-        Verarbeitet eine Duo-Kombination von Mitarbeitern.
-        
-        Args:
-            combo: Tuple von zwei AvailDayGroup-Objekten
-            eg_id: Event-Group-ID
-            event_group: Event-Group-Objekt
-            plp_multipliers: Multiplikatoren für die Penalty-Berechnung
+        Liefert die Duos eines Events, die eine Variable brauchen könnten.
+
+        Ausgelassen werden wie bisher Duos derselben Person und Duos, bei denen
+        keiner Präferenzen hat. Ist das Standard-Gewicht 0 (``include_default``
+        False), werden nur Partner aufgezählt, die in einer Präferenz für diese
+        Location vorkommen — der Aufwand skaliert dann mit den Präferenzen.
         """
-        # Überspringe wenn keine Partner-Location-Präferenzen vorhanden
-        if not any(len(adg.avail_day.actor_partner_location_prefs_defaults) for adg in combo):
-            return
-        
-        # Überspringe wenn es sich um dieselbe Person handelt
-        if combo[0].avail_day.actor_plan_period.id == combo[1].avail_day.actor_plan_period.id:
+        if include_default:
+            for adg_0, adg_1 in itertools.combinations(avail_day_groups, 2):
+                if (adg_0.avail_day.actor_partner_location_prefs_defaults
+                        or adg_1.avail_day.actor_partner_location_prefs_defaults):
+                    if adg_0.avail_day.actor_plan_period.id != adg_1.avail_day.actor_plan_period.id:
+                        yield adg_0, adg_1
             return
-        
-        # Erstelle Penalty-Variable
-        penalty_var = self._create_penalty_var(combo, event_group, plp_multipliers)
-        self.penalty_vars.append(penalty_var)
-        
-        # Berechne Scores
-        score_0 = self._get_partner_score(combo[0], combo[1], event_group)
-        score_1 = self._get_partner_score(combo[1], combo[0], event_group)
-        
-        # Erstelle Constraint-Logik
-        self._add_penalty_constraints(combo, eg_id, event_group, penalty_var, score_0, score_1, plp_multipliers)
-        
-        # Hard Constraint für Exclusion bei Score 0
-        self._add_exclusion_constraint(combo, eg_id, event_group, score_0, score_1)
-    
-    def _create_penalty_var(self, combo, event_group, plp_multipliers) -> IntVar:
-        """Erstellt eine Penalty-Variable für die Duo-Kombination."""
-        name = (
-            f'{event_group.event.date:%d.%m.%y} ({event_group.event.time_of_day.name}), '
-            f'{event_group.event.location_plan_period.location_of_work.name} '
-            f'{combo[0].avail_day.actor_plan_period.person.f_name} + '
-            f'{combo[1].avail_day.actor_plan_period.person.f_name}'
-        )
-        return self.model.NewIntVar(
-            plp_multipliers[2] * 2, 
-            plp_multipliers[0] * 2,
-            name
-        )
-    
-    def _get_partner_score(self, adg_from, adg_to, event_group) -> int:
+
+        position = {adg.avail_day_group_id: i for i, adg in enumerate(avail_day_groups)}
+        adgs_by_person: dict[UUID, list] = {}
+        for adg in avail_day_groups:
+            adgs_by_person.setdefault(adg.avail_day.actor_plan_period.person.id, []).append(adg)
+
+        seen: set[tuple[UUID, UUID]] = set()
+        for adg in avail_day_groups:
+            for partner_id, pref_location_id in self._scores(adg.avail_day):
+                if pref_location_id != location_id:
+                    continue
+                for partner_adg in adgs_by_person.get(partner_id, ()):
+                    if partner_adg.avail_day.actor_plan_period.id == adg.avail_day.actor_plan_period.id:
+                        continue
+                    # Reihenfolge wie bei itertools.combinations
+                    duo = sorted((adg, partner_adg), key=lambda a: position[a.avail_day_group_id])
+                    key = (duo[0].avail_day_group_id, duo[1].avail_day_group_id)
+                    if key not in seen:
+                        seen.add(key)
+                        yield duo[0], duo[1]
+
+    def _scores(self, avail_day) -> dict[tuple[UUID, UUID], float]:
+        """(partner_id, location_id) -> score, einmal pro AvailDay aufgebaut."""
+        lookup = self._score_lookup.get(id(avail_day))
+        if lookup is None:
+            lookup = {
+                (plp.partner.id, plp.location_of_work.id): plp.score
+                for plp in avail_day.actor_partner_location_prefs_defaults
+            }
+            self._score_lookup[id(avail_day)] = lookup
+        return lookup
+
+    def _get_partner_score(self, adg_from, adg_to, location_id: UUID) -> float:
         """
         Ermittelt den Partner-Präferenz-Score.
-        
+
         Args:
             adg_from: AvailDayGroup der Person, deren Präferenz geprüft wird
             adg_to: AvailDayGroup des Partners
-            event_group: Event-Group für den Standort
-        
+            location_id: Location des Events
+
         Returns:
             Score (0-2), Standard ist 1 wenn keine Präferenz definiert
         """
         partner_id = adg_to.avail_day.actor_plan_period.person.id
-        location_id = event_group.event.location_plan_period.location_of_work.id
-        
-        for plp in adg_from.avail_day.actor_partner_location_prefs_defaults:
-            if plp.partner.id == partner_id and plp.location_of_work.id == location_id:
-                return plp.score
-        return 1  # Standard-Score
-    
-    def _add_penalty_constraints(self, combo, eg_id, event_group, penalty_var, score_0, score_1, plp_multipliers) -> None:
+        return self._scores(adg_from.avail_day).get((partner_id, location_id), 1)
+
+    def _add_duo_penalty(self, adg_0, adg_1, eg_id: UUID, event_group, weight: int) -> None:
         """
-        Fügt die Penalty-Berechnungs-Constraints hinzu.
+        penalty == weight · (shift_0 ∧ shift_1 ∧ Event findet statt).
+
+        Die Konjunktion ist über Klauseln voll reifiziert (exakter Wert auch für
+        die Phasen, in denen Penalty-Summen fixiert werden).
         """
-        nr_actors = event_group.event.cast_group.nr_actors
-        
-        # Weight basierend auf den Scores
-        plp_weight_var = self.model.NewIntVar(plp_multipliers[2] * 2, plp_multipliers[0] * 2, '')
-        self.model.Add(
-            plp_weight_var == round(
-                (plp_multipliers[score_0] + plp_multipliers[score_1]) / (nr_actors - 1)
-            )
-        )
-        
-        # shift_active_var: 1 wenn beide Personen besetzt, sonst 0
-        shift_active_var = self.model.NewBoolVar('')
-        self.model.AddMultiplicationEquality(
-            shift_active_var,
-            [
-                self.entities.shift_vars[(combo[0].avail_day_group_id, eg_id)],
-                self.entities.shift_vars[(combo[1].avail_day_group_id, eg_id)]
-            ]
-        )
-        
-        # all_active_var: 1 wenn zudem das Event stattfindet
+        literals = [
+            self.entities.shift_vars[(adg_0.avail_day_group_id, eg_id)],
+            self.entities.shift_vars[(adg_1.avail_day_group_id, eg_id)],
+            self.entities.event_group_vars[eg_id],
+        ]
         all_active_var = self.model.NewBoolVar('')
-        self.model.AddMultiplicationEquality(
-            all_active_var, 
-            [shift_active_var, self.entities.event_group_vars[eg_id]]
-        )
-        
-        # Finale Penalty-Berechnung
-        self.model.AddMultiplicationEquality(penalty_var, [plp_weight_var, all_active_var])
-    
-    def _add_exclusion_constraint(self, combo, eg_id, event_group, score_0, score_1) -> None:
+        for literal in literals:
+            self.model.AddImplication(all_active_var, literal)
+        self.model.AddBoolOr([literal.Not() for literal in literals] + [all_active_var])
+
+        name = self.var_name(lambda: (
+            f'{event_group.event.date:%d.%m.%y} ({event_group.event.time_of_day.name}), '
+            f'{event_group.event.location_plan_period.location_of_work.name} '
+            f'{adg_0.avail_day.actor_plan_period.person.f_name} + '
+            f'{adg_1.avail_day.actor_plan_period.person.f_name}'
+        ))
+        penalty_var = self.model.NewIntVar(min(0, weight), max(0, weight), name)
+        self.model.Add(penalty_var == weight * all_active_var)
+        self.penalty_vars.append(penalty_var)
+
+    def _add_exclusion_constraint(self, adg_0, adg_1, eg_id: UUID, nr_actors: int,
+                                  score_0: float, score_1: float) -> None:
         """
         Fügt bei Score 0 und Besetzungsstärke 2 einen Hard Constraint hinzu.
         
         Wenn eine Person absolut nicht mit der anderen arbeiten soll und nur
         2 Personen benötigt werden, wird nur eine der beiden besetzt.
         """
-        nr_actors = event_group.event.cast_group.nr_actors
-        
         # Exclusion nur wenn mindestens ein Score 0 ist UND Besetzungsstärke < 3
-        exclusive = 0 if (score_0 and score_1) or nr_actors >= 3 else 1
-        
-        if exclusive:
-            self.model.Add(
-                self.entities.shift_vars[(combo[0].avail_day_group_id, eg_id)]
-                + self.entities.shift_vars[(combo[1].avail_day_group_id, eg_id)] < 2
-            ).OnlyEnforceIf(exclusive)
+        if (score_0 and score_1) or nr_actors >= 3:
+            return
+        self.model.AddBoolOr([
+            self.entities.shift_vars[(adg_0.avail_day_group_id, eg_id)].Not(),
+            self.entities.shift_vars[(adg_1.avail_day_group_id, eg_id)].Not(),
+        ])
 
 
     def validate_plan(self, plan: 'schemas.PlanShow') -> list['ValidationError']:
@@ -129,20 +129,12 @@ class PreferFixedCastConstraint(ConstraintBase):
                 self.model, self.entities, person_uuid, cast_group
             )
             
-            # Finde Person-Namen für bessere Variablen-Benennung
-            person = next(
-                (app.person for app in self.entities.actor_plan_periods.values() 
-                 if app.person.id == person_uuid),
-                None
-            )
-            person_name = person.f_name if person else str(person_uuid)[:8]
-            
-            penalty_var = self.model.NewIntVar(0, 1, 
-                f'Prefer: {cast_group.event.date:%d.%m.%y} '
-                f'({cast_group.event.time_of_day.name}), '
-                f'{cast_group.event.location_plan_period.location_of_work.name_an_city}, '
-                f'{person_name}'
-            )
+            penalty_var = self.model.NewIntVar(0, 1, self.var_name(
+                lambda: f'Prefer: {cast_group.event.date:%d.%m.%y} '
+                        f'({cast_group.event.time_of_day.name}), '
+                        f'{cast_group.event.location_plan_period.location_of_work.name_an_city}, '
+                        f'{self._person_name(person_uuid)}'
+            ))
             
             # penalty_var = 1 wenn Mitarbeiter NICHT zugewiesen
             # penalty_var = 0 wenn Mitarbeiter zugewiesen
@@ -150,6 +142,15 @@ class PreferFixedCastConstraint(ConstraintBase):
             
             self.penalty_vars.append(penalty_var)
     
+    def _person_name(self, person_uuid) -> str:
+        """Vorname für Variablen-Namen (Debug-Modus)."""
+        person = next(
+            (app.person for app in self.entities.actor_plan_periods.values()
+             if app.person.id == person_uuid),
+            None
+        )
+        return person.f_name if person else str(person_uuid)[:8]
+
     def _create_event_based_penalty(self, cast_group) -> None:
         """
         Strategie B: Event-basierte Penalty (bei OR-Operatoren).
@@ -159,11 +160,11 @@ class PreferFixedCastConstraint(ConstraintBase):
         
         event_group_id = cast_group.event.event_group_id
         
-        penalty_var = self.model.NewIntVar(0, 1, 
-            f'Prefer: {cast_group.event.date:%d.%m.%y} '
-            f'({cast_group.event.time_of_day.name}), '
-            f'{cast_group.event.location_plan_period.location_of_work.name_an_city}'
-        )
+        penalty_var = self.model.NewIntVar(0, 1, self.var_name(
+            lambda: f'Prefer: {cast_group.event.date:%d.%m.%y} '
+                    f'({cast_group.event.time_of_day.name}), '
+                    f'{cast_group.event.location_plan_period.location_of_work.name_an_city}'
+        ))
         
         # penalty_var = 1 wenn Event NICHT ausgewählt (entities.event_group_vars[...] == 0)
         # penalty_var = 0 wenn Event ausgewählt (entities.event_group_vars[...] == 1)
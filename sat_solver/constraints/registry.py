@@ -12,6 +12,7 @@ from ortools.sat.python import cp_model
 from ortools.sat.python.cp_model import IntVar
 
 from configuration.solver import SolverConfig, curr_config_handler
+from sat_solver.solve_context import SolveContext, current_context
 
 if TYPE_CHECKING:
     from sat_solver.constraints.base import ConstraintBase, ValidationError, ValidationInfo, Validatable
@@ -53,6 +54,7 @@ class ConstraintRegistry:
         model: Das OR-Tools CP-SAT Model
         entities: Container mit allen Solver-Entitäten
         config: Solver-Konfiguration (Weights, Multipliers)
+        context: Per-Solve-Zustand (siehe sat_solver.solve_context)
         constraints: Liste aller registrierten Constraints
     
     Example:
@@ -75,7 +77,8 @@ class ConstraintRegistry:
         self,
         entities: Entities,
         model: cp_model.CpModel | None = None,
-        config: SolverConfig | None = None
+        config: SolverConfig | None = None,
+        context: SolveContext | None = None
     ):
         """
         Initialisiert die Registry.
@@ -84,10 +87,12 @@ class ConstraintRegistry:
             model: Das CP-SAT Model für Constraint-Erstellung
             entities: Container mit allen Solver-Entitäten
             config: Solver-Konfiguration (optional, nutzt sonst curr_config_handler)
+            context: Per-Solve-Zustand (optional, nutzt sonst den aktiven Kontext)
         """
         self.model = model
         self.entities = entities
         self.config = config or curr_config_handler.get_solver_config()
+        self.context = context or current_context()
         self._constraints: list[ConstraintBase] = []
     
     @property
@@ -44,7 +44,7 @@ class UnsignedShiftsConstraint(ConstraintBase):
         # Erstelle Variablen für jedes Event
         self.unassigned_shifts_per_event = {
             event_group_id: self.model.NewIntVar(
-                0, max_nr_actors, f'unassigned {event_group.event.date}'
+                0, max_nr_actors, self.var_name(lambda: f'unassigned {event_group.event.date}')
             )
             for event_group_id, event_group in self.entities.event_groups_with_event.items()
         }
@@ -136,11 +136,11 @@ class WeightsInAvailDayGroupsConstraint(ConstraintBase):
         )
         
         # Erstelle Variable
-        name = (
+        name = self.var_name(lambda: (
             f'Depth {parent_group.depth}, AvailDay: {c.avail_day.date:%d.%m.%y}, '
             f'{c.avail_day.time_of_day.name}, '
             f'{c.avail_day.actor_plan_period.person.f_name}'
-        )
+        ))
         weight_var = self.model.NewIntVar(-100, 100000, name)
         
         # Stelle fest, ob ein zugehöriges Event stattfindet
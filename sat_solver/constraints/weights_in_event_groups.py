@@ -84,15 +84,13 @@ class WeightsInEventGroupsConstraint(ConstraintBase):
         min_val = min(self._multiplier_weights.values()) * max(self._multiplier_level.values())
         max_val = max(self._multiplier_weights.values()) * max(self._multiplier_level.values())
         
-        # Erstelle Variablen-Name
-        if child.event is None:
-            name = f'Depth {depth}, no Event'
-        else:
-            name = (
-                f'Depth {depth}, Event: {child.event.date:%d.%m.%y}, '
-                f'{child.event.time_of_day.name}, '
-                f'{child.event.location_plan_period.location_of_work.name}'
-            )
+        # Erstelle Variablen-Name (nur im Debug-Modus)
+        name = self.var_name(lambda: (
+            f'Depth {depth}, no Event' if child.event is None else
+            f'Depth {depth}, Event: {child.event.date:%d.%m.%y}, '
+            f'{child.event.time_of_day.name}, '
+            f'{child.event.location_plan_period.location_of_work.name}'
+        ))
         
         # Erstelle Variable
         weight_var = self.model.NewIntVar(min_val, max_val, name)
@@ -4,6 +4,7 @@ from uuid import UUID
 from anytree import NodeMixin, RenderTree, ContRoundStyle
 
 from database import schemas, db_services
+from sat_solver.tree_snapshot import TreeSnapshot, current_revision, tree_snapshot_cache
 
 
 class EventGroup(NodeMixin):
@@ -83,6 +84,21 @@ class EventGroupTree:
         nodes.update({node.event_group_id: node for node in root.descendants})
         return nodes
 
+    @classmethod
+    def from_snapshot(cls, snapshot: TreeSnapshot, location_plan_period_ids: list[UUID]) -> 'EventGroupTree':
+        """Frische anytree-Sicht aus einem Snapshot — ohne DB-Zugriff."""
+        nodes = snapshot.materialize(lambda payload, parent: EventGroup(payload, None, parent))
+        tree = cls.__new__(cls)
+        tree.location_plan_period_ids = list(location_plan_period_ids)
+        tree.root = nodes[0]
+        tree.root.root_is_location_plan_period_master_group = snapshot.root_is_master_group
+        tree.nodes = {0: tree.root} | {node.event_group_id: node for node in nodes[1:]}
+        return tree
+
+    def to_snapshot(self) -> TreeSnapshot:
+        return TreeSnapshot.from_root(self.root, 'event_group_id', 'event_group_db',
+                                      'root_is_location_plan_period_master_group')
+
     def construct_root_node(self) -> EventGroup:
         # Alle Master-Nodes in einem Batch laden (single oder multiple LPPs)
         masters_by_lpp = db_services.EventGroup.get_batch_masters_for_tree(
@@ -142,7 +158,14 @@ def get_event_group_tree(plan_period_id: UUID, lpp_ids: list[UUID] | None = None
     if lpp_ids is None:
         from database.db_services import plan_period as pp_svc
         lpp_ids, _ = pp_svc.get_lpp_and_app_ids(plan_period_id)
-    return EventGroupTree(lpp_ids)
+    key = ('event_group', tuple(lpp_ids))
+    snapshot = tree_snapshot_cache.get(key)
+    if snapshot is not None:
+        return EventGroupTree.from_snapshot(snapshot, lpp_ids)
+    revision = current_revision()
+    tree = EventGroupTree(lpp_ids)
+    tree_snapshot_cache.put(key, tree.to_snapshot(), revision)
+    return tree
 
 
 def get_combined_event_group_tree(plan_period_ids: list[UUID]) -> EventGroupTree:
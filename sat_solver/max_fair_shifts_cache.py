@@ -0,0 +1,71 @@
+"""
+Cache für max./faire Einsätze pro ActorPlanPeriod zwischen Berechnungen.
+
+`solve()` berechnet vor den eigentlichen Plänen die maximal möglichen und
+die fairen Einsätze pro Mitarbeiter — eine ungewichtete Berechnung plus eine
+Maximierung pro ActorPlanPeriod, zusammen oft mehrere Minuten. Solange sich
+an den Eingaben nichts ändert, ist das Ergebnis dasselbe.
+
+Der Fingerprint ist ein SHA-256 über
+- das Proto des Basis-Models (Variablen, Constraints, Zielfunktion) — deckt
+  Verfügbarkeiten, Events, Besetzungsstärken, gewünschte Einsätze,
+  Präferenzen, Cast-Regeln und Solver-Gewichte ab,
+- die Zuordnung Shift-Variable → ActorPlanPeriod und die Pflicht-Flags
+  (`required_assignments`) der ActorPlanPeriods,
+- die Zeitbudgets und StoppingPolicies der Berechnung.
+
+Die Maxima der Mitarbeiter hängen über die fixierten Ergebnisse der
+ungewichteten Berechnung voneinander ab; jede Änderung in der Planperiode
+invalidiert daher alle Einträge der Periode (kein Teil-Neuberechnen).
+
+Die Werte liegen als `MaxFairShiftsOfApp`-Zeilen mit `inputs_fingerprint`
+in der DB und überleben so Programmneustarts und Solver-Job-Prozesse.
+
+WICHTIG: Keine OR-Tools-Imports zur Laufzeit (siehe data_loading.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from database import db_services, schemas
+
+if TYPE_CHECKING:
+    from ortools.sat.python.cp_model import CpModel
+
+    from sat_solver.data_loading import Entities
+
+logger = logging.getLogger(__name__)
+
+
+def inputs_fingerprint(model: CpModel, entities: Entities, *params: object) -> str:
+    """Fingerprint eines fertig aufgebauten Basis-Models samt APP-Zuordnung und `params`."""
+    digest = hashlib.sha256(str(model.Proto()).encode())
+    for adg_id, _ in entities.shift_vars:
+        digest.update(entities.avail_day_groups_with_avail_day[adg_id].avail_day.actor_plan_period.id.bytes)
+    for app_id, app in entities.actor_plan_periods.items():
+        digest.update(app_id.bytes)
+        digest.update(b'\x01' if app.required_assignments else b'\x00')
+    digest.update(repr(params).encode())
+    return digest.hexdigest()
+
+
+def load(app_ids: list[UUID], fingerprint: str) -> tuple[dict[UUID, int], dict[UUID, float]] | None:
+    """Gespeicherte (max_shifts, fair_shifts) — nur wenn für alle `app_ids` vorhanden."""
+    cached = db_services.MaxFairShiftsOfApp.get_by_fingerprint(app_ids, fingerprint)
+    if len(cached) != len(app_ids):
+        return None
+    logger.info('Max./faire Einsätze aus Cache (%d ActorPlanPeriods)', len(cached))
+    return ({app_id: max_shifts for app_id, (max_shifts, _) in cached.items()},
+            {app_id: fair_shifts for app_id, (_, fair_shifts) in cached.items()})
+
+
+def store(fingerprint: str, max_shifts_per_app: dict[UUID, int], fair_shifts_per_app: dict[UUID, float]) -> None:
+    db_services.MaxFairShiftsOfApp.replace_fingerprinted([
+        schemas.MaxFairShiftsOfAppCreate(max_shifts=max_shifts, fair_shifts=fair_shifts_per_app[app_id],
+                                         actor_plan_period_id=app_id, inputs_fingerprint=fingerprint)
+        for app_id, max_shifts in max_shifts_per_app.items()
+    ])
@@ -0,0 +1,125 @@
+"""Fortschritts-Meldungen des Solvers — entkoppelt von Qt.
+
+`solver_main` meldet Phasen-Wechsel über `report(...)`. Wohin die Meldung
+geht, entscheidet der Aufrufer:
+
+- Desktop (Default): Weiterleitung an `signal_handling.handler_solver`,
+  an dem `DlgProgressSteps` hängt.
+- Server (Solver-Job-Worker, ohne PySide6): eigener Callback via
+  `progress_callback(...)`, der den Fortschritt in die Job-Tabelle schreibt.
+
+Der aktive Empfänger hängt an einer `ContextVar` — parallele Berechnungen in
+verschiedenen Threads melden also jeweils an ihren eigenen Empfänger. Neue
+Threads starten ohne Empfänger (→ Default). Soll ein Empfänger von mehreren
+Threads geteilt werden, `ThreadSafeProgressSink` verwenden.
+
+Zusätzlich zu den Text-Schritten meldet `solve_model_to_optimum` während der
+Suche gedrosselt den Stand der Optimierung (`SolveProgress`: Zielfunktion,
+Schranke, unbesetzte Schichten) über `report_solution(...)`; Umleitung analog
+mit `solution_progress_callback(...)`, Default ist
+`signal_handling.handler_solver.solution_progress`.
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressSink(Protocol):
+    """Empfänger für Fortschritts-Meldungen."""
+
+    def __call__(self, comment: str) -> None: ...
+
+
+class ThreadSafeProgressSink:
+    """Serialisiert Aufrufe eines Callbacks, der von mehreren Berechnungen
+    gleichzeitig genutzt wird (z. B. gemeinsames Log für einen Worker-Pool)."""
+
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def __call__(self, comment: str) -> None:
+        with self._lock:
+            self._callback(comment)
+
+
+@dataclass(frozen=True, slots=True)
+class SolveProgress:
+    """Zwischenstand einer laufenden Suche; Zeiten in Sekunden seit Start der Suche."""
+    phase: str
+    elapsed: float
+    objective: float | None
+    bound: float | None
+    unassigned_shifts: int | None = None
+
+
+_sink: ContextVar[ProgressSink | None] = ContextVar('solver_progress_sink', default=None)
+_solution_sink: ContextVar[Callable[[SolveProgress], None] | None] = ContextVar(
+    'solver_solution_progress_sink', default=None)
+
+
+def _qt_progress(comment: str) -> None:
+    try:
+        from gui.observer import signal_handling
+    except ImportError:
+        logger.debug('Solver-Fortschritt (ohne Qt): %s', comment)
+        return
+    signal_handling.handler_solver.progress(comment)
+
+
+def report(comment: str) -> None:
+    """Meldet einen Fortschritts-Schritt an den aktiven Empfänger."""
+    (_sink.get() or _qt_progress)(comment)
+
+
+@contextmanager
+def progress_callback(callback: ProgressSink) -> Iterator[None]:
+    """Leitet Fortschritts-Meldungen für die Dauer des Blocks an `callback` um.
+
+    Gilt nur für den aktuellen Thread bzw. asyncio-Task.
+    """
+    token = _sink.set(callback)
+    try:
+        yield
+    finally:
+        _sink.reset(token)
+
+
+def _qt_solution_progress(solve_progress: SolveProgress) -> None:
+    try:
+        from gui.observer import signal_handling
+    except ImportError:
+        logger.debug('Solver-Zwischenstand (ohne Qt): %s', solve_progress)
+        return
+    signal_handling.handler_solver.solution_progress(solve_progress)
+
+
+def solution_reporter() -> Callable[[SolveProgress], None]:
+    """Aktiver Empfänger für Zwischenstände.
+
+    Die Solver-Callbacks laufen in CP-SAT-eigenen Threads ohne den Kontext des
+    Aufrufers — der Empfänger wird daher vor der Suche hierüber festgehalten.
+    """
+    return _solution_sink.get() or _qt_solution_progress
+
+
+def report_solution(solve_progress: SolveProgress) -> None:
+    """Meldet einen Zwischenstand der Suche an den aktiven Empfänger."""
+    solution_reporter()(solve_progress)
+
+
+@contextmanager
+def solution_progress_callback(callback: Callable[[SolveProgress], None]) -> Iterator[None]:
+    """Leitet Zwischenstände der Suche für die Dauer des Blocks an `callback` um."""
+    token = _solution_sink.set(callback)
+    try:
+        yield
+    finally:
+        _solution_sink.reset(token)
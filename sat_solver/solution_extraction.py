@@ -0,0 +1,106 @@
+"""
+Appointments aus Solver-Lösungen — ohne DB-Zugriff pro Lösung.
+
+Bisher lief nach jeder Lösung (bei Enumeration: in jedem Callback) dieselbe
+Arbeit: pro Event-Gruppe ein Scan über alle `entities.shift_vars`
+(O(Events × Shift-Variablen)), danach `AvailDay.get_batch` für vollständige
+`AvailDayShow`-Graphen.
+
+Jetzt in zwei Stufen:
+
+1. Extraktion (`SolutionIndex.extract`): Der Index hält einmal pro Model die
+   Proto-Indizes der Event-Gruppen- und Shift-Variablen, gruppiert nach
+   Event-Gruppe. Eine Lösung wird in einem Durchgang über die Variablenwerte
+   gelesen (`itemgetter` über alle Indizes auf einmal). Ergebnis sind
+   `schemas.AppointmentIdsCreate` — nur Event- und AvailDay-IDs.
+2. Hydrierung (`hydrate`): erst dort, wo vollständige Schemas gebraucht
+   werden (Anzeige), mit einer einzigen Batch-Abfrage über alle Versionen.
+   Das Speichern (`Appointment.create_bulk`) kommt mit den IDs aus.
+
+WICHTIG: Keine OR-Tools-Imports zur Laufzeit (siehe data_loading.py).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from database import db_services, schemas
+
+if TYPE_CHECKING:
+    from sat_solver.data_loading import Entities
+
+
+def _getter(indices: list[int]):
+    """`itemgetter` mit Tupel-Ergebnis auch für 0 oder 1 Index."""
+    if len(indices) > 1:
+        return itemgetter(*indices)
+    if indices:
+        single = indices[0]
+        return lambda values: (values[single],)
+    return lambda values: ()
+
+
+class SolutionIndex:
+    """Proto-Indizes der Variablen, die ein Appointment ausmachen — einmal pro Model aufbauen."""
+
+    def __init__(self, entities: Entities):
+        self._event_ids: list[UUID] = []
+        self._bounds: list[tuple[int, int]] = []
+        self._avail_day_ids: list[UUID] = []
+        event_group_indices: list[int] = []
+        shift_indices: list[int] = []
+
+        shift_vars_by_event_group: dict[UUID, list[tuple[UUID, int]]] = {}
+        for (adg_id, eg_id), var in entities.shift_vars.items():
+            avail_day_id = entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
+            if avail_day_id:
+                shift_vars_by_event_group.setdefault(eg_id, []).append((avail_day_id, var.index))
+
+        for eg_id, event_group in entities.event_groups_with_event.items():
+            start = len(shift_indices)
+            for avail_day_id, index in shift_vars_by_event_group.get(eg_id, ()):
+                self._avail_day_ids.append(avail_day_id)
+                shift_indices.append(index)
+            self._event_ids.append(event_group.event.id)
+            self._bounds.append((start, len(shift_indices)))
+            event_group_indices.append(entities.event_group_vars[eg_id].index)
+
+        self._event_group_values = _getter(event_group_indices)
+        self._shift_values = _getter(shift_indices)
+
+    def extract(self, values: Sequence[int]) -> list[schemas.AppointmentIdsCreate]:
+        """Appointments einer Lösung; `values` sind die Variablenwerte nach Proto-Index
+        (`solver.response_proto.solution` bzw. `callback.response_proto.solution`)."""
+        event_groups_on = self._event_group_values(values)
+        shifts_on = self._shift_values(values)
+        avail_day_ids = self._avail_day_ids
+        return [
+            schemas.AppointmentIdsCreate.model_construct(
+                event_id=event_id,
+                avail_day_ids=[avail_day_ids[i] for i in range(start, end) if shifts_on[i]],
+            )
+            for event_id, (start, end), on in zip(self._event_ids, self._bounds, event_groups_on)
+            if on
+        ]
+
+
+def hydrate(versions: list[list[schemas.AppointmentIdsCreate]],
+            entities: Entities) -> list[list[schemas.AppointmentCreate]]:
+    """Vollständige Appointments für die Anzeige — eine Batch-Abfrage über alle Versionen.
+
+    Events stammen aus `entities` (schon geladen), AvailDays als `AvailDayShow`.
+    """
+    events = {event_group.event.id: event_group.event for event_group in entities.event_groups_with_event.values()}
+    avail_days = db_services.AvailDay.get_batch(
+        list({avail_day_id for version in versions for appointment in version
+              for avail_day_id in appointment.avail_day_ids}))
+    return [
+        [schemas.AppointmentCreate(notes=appointment.notes, event=events[appointment.event_id],
+                                   avail_days=[avail_days[avail_day_id] for avail_day_id in appointment.avail_day_ids
+                                               if avail_day_id in avail_days])
+         for appointment in version]
+        for version in versions
+    ]
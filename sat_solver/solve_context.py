@@ -0,0 +1,205 @@
+"""
+Zustand einer einzelnen Solver-Berechnung.
+
+Früher lag dieser Zustand modulglobal (`solver_variables.cast_rules`,
+`solver_main.solver` für den Abbruch) — zwei Berechnungen im selben Prozess
+(z. B. mehrere Jobs im Worker-Thread-Pool oder Tests parallel zu einer
+Desktop-Berechnung) hätten sich gegenseitig überschrieben.
+
+Jetzt gilt:
+- Jede Berechnung läuft in einem eigenen `SolveContext` (`solve_context()`).
+  Der aktive Kontext hängt an einer `ContextVar` und ist damit pro Thread
+  bzw. asyncio-Task getrennt.
+- `ConstraintRegistry` übernimmt den Kontext beim Erzeugen; Constraints
+  erreichen ihn über `self.context`.
+- `CpSolver`-Instanzen melden sich für die Dauer von `solve()` am Kontext an
+  (`running()`), `stop()` bricht genau diese Suchen ab.
+- Fortschritts-Meldungen laufen über `sat_solver.progress` (ebenfalls
+  kontextlokal).
+- Jeder Lauf von `solve_model_to_optimum` hängt einen `SolveTrace`
+  (Zielfunktion/Schranke über der Zeit) an `traces` an.
+- Während der Plan-Suche hinterlegt `solver_main` einen Schnappschuss-Lieferanten
+  (`snapshots()`): `snapshot()` baut aus der bisher besten Lösung Appointments,
+  ohne die Suche anzuhalten. `accept_current()` beendet die laufenden Suchen
+  mit ihrer besten Lösung, die folgenden Phasen laufen normal weiter.
+- Variablen-Namen werden nur im Debug-Modus formatiert (`var_name()`):
+  bei `log_search_process` oder `SolverConfig.debug_var_names`. Sonst bleiben
+  sie leer — das spart Formatierung und Proto-Größe bei großen Modellen.
+
+WICHTIG: Keine OR-Tools-Imports zur Laufzeit (siehe data_loading.py).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+from configuration.solver import curr_config_handler
+from sat_solver.solver_variables import CastRules
+
+if TYPE_CHECKING:
+    from ortools.sat.python.cp_model import CpSolver
+
+    from database.schemas import AppointmentCreate
+
+    from sat_solver.stopping import SolveTrace
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+@dataclass(eq=False)
+class SolveContext:
+    """Per-Solve-Zustand: Debug-Variablen und laufende Solver-Suchen."""
+    cast_rules: CastRules = field(default_factory=CastRules)
+    debug_names: bool = False
+    traces: list[SolveTrace] = field(default_factory=list, repr=False)
+    _solvers: set[CpSolver] = field(default_factory=set, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _stopped: bool = False
+    _snapshot: Callable[[], list[AppointmentCreate] | None] | None = field(default=None, repr=False)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    def reset_model_state(self, log_search_process: bool = False) -> None:
+        """Vor jedem neuen Model-Aufbau: modellbezogene Debug-Variablen leeren
+        und den Namens-Modus für dieses Model festlegen."""
+        self.cast_rules.reset_fields()
+        self.debug_names = log_search_process or curr_config_handler.get_solver_config().debug_var_names
+
+    def var_name(self, factory: Callable[[], str]) -> str:
+        """Name für eine neue Solver-Variable — `factory` läuft nur im Debug-Modus.
+
+        Namen, die fachlich ausgewertet werden (Assumptions in `test_plan`,
+        Skill-Konflikte, feste Besetzungen), laufen nicht hierüber.
+        """
+        return factory() if self.debug_names else ''
+
+    @contextmanager
+    def running(self, solver: CpSolver) -> Iterator[CpSolver]:
+        """Meldet `solver` für die Dauer des Blocks als laufende Suche an.
+
+        Nach `stop()` startende Suchen bekommen kein Zeitbudget mehr und kehren
+        sofort zurück — die restlichen Phasen der Berechnung entfallen damit.
+        """
+        with self._lock:
+            if self._stopped:
+                solver.parameters.max_time_in_seconds = 0.0
+            self._solvers.add(solver)
+        try:
+            yield solver
+        finally:
+            with self._lock:
+                self._solvers.discard(solver)
+
+    def stop(self) -> None:
+        """Bricht alle laufenden Suchen dieses Kontexts ab (thread-sicher)."""
+        with self._lock:
+            self._stopped = True
+            solvers = list(self._solvers)
+        for solver in solvers:
+            solver.stop_search()
+
+    def accept_current(self) -> None:
+        """Beendet die laufenden Suchen mit ihrer bisher besten Lösung (thread-sicher).
+
+        Anders als `stop()` laufen folgende Phasen normal weiter.
+        """
+        with self._lock:
+            solvers = list(self._solvers)
+        for solver in solvers:
+            solver.stop_search()
+
+    @contextmanager
+    def snapshots(self, provider: Callable[[], list[AppointmentCreate] | None]) -> Iterator[None]:
+        """Hinterlegt für die Dauer des Blocks den Lieferanten für `snapshot()`."""
+        with self._lock:
+            self._snapshot = provider
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._snapshot = None
+
+    def snapshot(self) -> list[AppointmentCreate] | None:
+        """Appointments der bisher besten Lösung der laufenden Plan-Suche, sonst None."""
+        with self._lock:
+            provider = self._snapshot
+        return provider() if provider else None
+
+
+_current: ContextVar[SolveContext | None] = ContextVar('solve_context', default=None)
+_active: weakref.WeakSet[SolveContext] = weakref.WeakSet()
+_active_lock = threading.Lock()
+
+
+def current_context() -> SolveContext:
+    """Aktiver Kontext; außerhalb von `solve_context()` wird einer für den
+    aktuellen Thread/Task angelegt (Aufrufe einzelner `call_solver_*`-Funktionen).
+
+    Solche impliziten Kontexte erreicht `stop_all()` nicht — sonst bliebe ein
+    einmal abgebrochener Pool-Thread dauerhaft im Zustand `stopped`.
+    """
+    context = _current.get()
+    if context is None:
+        context = SolveContext()
+        _current.set(context)
+    return context
+
+
+@contextmanager
+def solve_context() -> Iterator[SolveContext]:
+    """Führt den Block in einem frischen `SolveContext` aus."""
+    context = SolveContext()
+    token = _current.set(context)
+    with _active_lock:
+        _active.add(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+        with _active_lock:
+            _active.discard(context)
+
+
+def with_solve_context(func: Callable[P, R]) -> Callable[P, R]:
+    """Decorator für Einstiegspunkte (`solve`, `solve_multi_period`, …)."""
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with solve_context():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def stop_all() -> None:
+    """Bricht alle laufenden Berechnungen des Prozesses ab (Desktop: Abbrechen-Button)."""
+    with _active_lock:
+        contexts = list(_active)
+    for context in contexts:
+        context.stop()
+
+
+def accept_all() -> None:
+    """Übernimmt in allen laufenden Berechnungen die bisher beste Lösung der aktuellen Suche."""
+    with _active_lock:
+        contexts = list(_active)
+    for context in contexts:
+        context.accept_current()
+
+
+def snapshot_best() -> list[AppointmentCreate] | None:
+    """Schnappschuss der ersten laufenden Plan-Suche im Prozess (Desktop: Vorschau)."""
+    with _active_lock:
+        contexts = list(_active)
+    for context in contexts:
+        if (appointments := context.snapshot()) is not None:
+            return appointments
+    return None
@@ -1,12 +1,15 @@
+import contextlib
+import contextvars
 import dataclasses
 import logging
 import os
 import sys
 import time
 from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import datetime
 from datetime import date
-from typing import Generator
+from typing import Callable, Generator
 from uuid import UUID
 
 
@@ -41,10 +44,12 @@ from ortools.sat.python.cp_model import IntVar
 from configuration.project_paths import curr_user_path_handler
 from database import db_services, schemas
 from database.db_services import plan_period as pp_svc
-from configuration.solver import curr_config_handler
-from database.schemas import AppointmentCreate
-from gui.observer import signal_handling
-from sat_solver import solver_variables
+from configuration.solver import StoppingPolicy, curr_config_handler
+from database.schemas import AppointmentCreate, AppointmentIdsCreate
+from sat_solver import max_fair_shifts_cache, progress
+from sat_solver.solution_extraction import SolutionIndex, hydrate
+from sat_solver.solve_context import accept_all, current_context, snapshot_best, stop_all, with_solve_context
+from sat_solver.stopping import SolveTrace, StoppingCallback, apply_policy, finish_trace
 from sat_solver.avail_day_group_tree import (AvailDayGroup, get_avail_day_group_tree, AvailDayGroupTree,
                                                 get_combined_avail_day_group_tree)
 from sat_solver.cast_group_tree import get_cast_group_tree, CastGroupTree, CastGroup, get_combined_cast_group_tree
@@ -72,6 +77,8 @@ from sat_solver.constraints import (
 )
 
 cp_sat_logger = logging.getLogger(__name__)
+# Log-Verzeichnis existiert auf dem Server (Solver-Job-Worker) nicht zwingend
+os.makedirs(curr_user_path_handler.get_config().log_file_path, exist_ok=True)
 handler = logging.FileHandler(os.path.join(curr_user_path_handler.get_config().log_file_path, 'cp-sat-solver.log'))
 custom_format = logging.Formatter('')
 handler.setFormatter(custom_format)
@@ -306,7 +313,8 @@ class PartialSolutionCallback(cp_model.CpSolverSolutionCallback):
         self._curr_objective_value = float('inf')
         self._num_equal_objective_values = 0
 
-        self._schedule_versions: list[list[schemas.AppointmentCreate]] = []
+        self._solution_index = SolutionIndex(entities) if collect_schedule_versions else None
+        self._schedule_versions: list[list[schemas.AppointmentIdsCreate]] = []
 
     def on_solution_callback(self):
         # print(f'{self.ObjectiveValue()=}')
@@ -341,39 +349,8 @@ class PartialSolutionCallback(cp_model.CpSolverSolutionCallback):
             self._count_same_max_assigned += 1
 
     def collect_schedule_versions(self):
-        self._schedule_versions.append([])
-
-        # Sammle alle zugewiesenen adg_ids für diese Lösung
-        all_scheduled_adg_ids = []
-        event_group_adg_mapping = {}
-
-        for event_group in sorted(list(self._entities.event_groups_with_event.values()),
-                                  key=lambda x: (x.event.date, x.event.time_of_day.time_of_day_enum.time_index)):
-            if not self.Value(self._entities.event_group_vars[event_group.event_group_id]):
-                continue
-            scheduled_adg_ids = []
-            for (adg_id, eg_id), var in self._entities.shift_vars.items():
-                if eg_id == event_group.event_group_id and self.Value(var):
-                    scheduled_adg_ids.append(adg_id)
-                    all_scheduled_adg_ids.append(adg_id)
-            event_group_adg_mapping[event_group.event_group_id] = (event_group.event, scheduled_adg_ids)
-
-        # Vollständige AvailDays für alle zugewiesenen Schichten laden
-        avail_day_ids = [
-            self._entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-            for adg_id in all_scheduled_adg_ids
-            if self._entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-        ]
-        full_avail_days = db_services.AvailDay.get_batch(avail_day_ids)
-
-        # Appointments erstellen mit vollständigen AvailDays
-        for eg_id, (event, adg_ids) in event_group_adg_mapping.items():
-            avail_days_for_event = []
-            for adg_id in adg_ids:
-                avail_day_id = self._entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-                if avail_day_id and avail_day_id in full_avail_days:
-                    avail_days_for_event.append(full_avail_days[avail_day_id])
-            self._schedule_versions[-1].append(schemas.AppointmentCreate(avail_days=avail_days_for_event, event=event))
+        # Nur IDs — ohne DB-Zugriff pro Lösung; hydriert wird erst bei Bedarf (solution_extraction.hydrate)
+        self._schedule_versions.append(self._solution_index.extract(self.response_proto.solution))
 
     def print_results(self):
         return
@@ -456,11 +433,13 @@ def create_vars(model: cp_model.CpModel, event_group_tree: EventGroupTree,
 
     populate_shifts_exclusive(entities)
     
-    # Erstelle shift_vars für den Solver
+    # Erstelle shift_vars für den Solver (Namen nur im Debug-Modus)
+    context = current_context()
     for adg_id, adg in entities.avail_day_groups_with_avail_day.items():
         for event_group_id, event_group in entities.event_groups_with_event.items():
-            entities.shift_vars[(adg_id, event_group_id)] = model.NewBoolVar(
-                f'shift ({adg.avail_day.actor_plan_period.person.f_name},{adg.avail_day.date:%d.%m.%y}, {event_group_id})')
+            entities.shift_vars[(adg_id, event_group_id)] = model.NewBoolVar(context.var_name(
+                lambda: f'shift ({adg.avail_day.actor_plan_period.person.f_name},'
+                        f'{adg.avail_day.date:%d.%m.%y}, {event_group_id})'))
     # print(f'{len(entities.shift_vars)=}')
     # print(f'{sum(entities.shifts_exclusive.values())=}')
 
@@ -490,6 +469,23 @@ def constraint_max_shift_of_app(model: cp_model.CpModel, app_id: UUID, entities:
     return max_shifts_of_app
 
 
+def constraints_max_shifts_of_apps(model: cp_model.CpModel, entities: 'Entities') -> dict[UUID, IntVar]:
+    """
+    Wie constraint_max_shift_of_app(), aber für alle Mitarbeiter in einem Durchlauf
+    über die Shift-Variablen (statt einem Durchlauf pro Mitarbeiter).
+    """
+    shift_vars_of_app: dict[UUID, list[IntVar]] = defaultdict(list)
+    for (adg_id, _), shift_var in entities.shift_vars.items():
+        app_id = entities.avail_day_groups_with_avail_day[adg_id].avail_day.actor_plan_period.id
+        shift_vars_of_app[app_id].append(shift_var)
+
+    max_shifts_of_apps = {}
+    for app_id in entities.actor_plan_periods:
+        max_shifts_of_apps[app_id] = model.NewIntVar(0, 1000, 'max_sifts')
+        model.Add(max_shifts_of_apps[app_id] == sum(shift_vars_of_app[app_id]))
+    return max_shifts_of_apps
+
+
 
 def create_constraints(model: cp_model.CpModel, entities: 'Entities', 
                        creating_test_constraints: bool = False) -> ConstraintRegistry:
@@ -582,9 +578,15 @@ def define_objective__max_shift_of_app(model: cp_model.CpModel,
                                        constraints_partner_loc_prefs: list[IntVar],
                                        constraints_fixed_cast_conflicts: dict[tuple[datetime.date, str, UUID], IntVar],
                                        skill_conflict_vars: list[IntVar],
-                                       max_shift_of_app: IntVar,
+                                       max_shift_of_app: IntVar | None,
                                        constraints_prefer_fixed_cast: list[IntVar]
                                        ):
+    """
+    Fixiert die Ergebnisse der ungewichteten Berechnung und maximiert die Einsätze von `max_shift_of_app`.
+
+    Mit `max_shift_of_app=None` wird nur das gemeinsame Basis-Model für alle Mitarbeiter
+    erstellt; die Zielfunktion setzt dann jeder Worker auf seiner Kopie.
+    """
     # Mit den Constraints für location_prefs und partner_loc_prefs werden falsche max_shifts_per_app berechnet.
     model.Add(sum(constraints_location_prefs) == sum_location_prefs)
     # model.Add(sum(constraints_partner_loc_prefs) == sum_partner_loc_prefs)
@@ -593,7 +595,8 @@ def define_objective__max_shift_of_app(model: cp_model.CpModel,
     model.Add(sum(list(unassigned_shifts_per_event.values())) == unassigned_shifts)
     # Preference-Constraints werden NICHT erzwungen bei max_shifts Berechnung
     # (nur die Obergrenze finden, Preferences sind für finale Plan-Erstellung relevant)
-    model.Maximize(max_shift_of_app * 100)
+    if max_shift_of_app is not None:
+        model.Maximize(max_shift_of_app * 100)
 
 
 def define_objective__fixed_unassigned(model: cp_model.CpModel,
@@ -633,9 +636,6 @@ def define_objective__fixed_constraint_results(
     model.Add(sum(constraints_prefer_fixed_cast) == sum_prefer_fixed_cast_res)
 
 
-solver: cp_model.CpSolver | None = None
-
-
 def solve_model_with_solver_solution_callback(
         model: cp_model.CpModel, unassigned_shifts_per_event: list[IntVar],
         sum_assigned_shifts: dict[UUID, IntVar],
@@ -660,13 +660,36 @@ def solve_model_with_solver_solution_callback(
                                                entities,
                                                collect_schedule_versions)
 
-    status = solver.solve(model, solution_printer)
+    with current_context().running(solver):
+        status = solver.solve(model, solution_printer)
 
     return solver, solution_printer, status
 
 
 def solve_model_to_optimum(model: cp_model.CpModel, max_search_time: int,
-                           log_search_process: bool) -> tuple[cp_model.CpSolver, CpSolverStatus]:
+                           log_search_process: bool,
+                           num_workers: int | None = None,
+                           phase: str | None = None,
+                           policy: StoppingPolicy | None = None,
+                           publish_progress: bool = False,
+                           unassigned: list[IntVar] | None = None,
+                           snapshot_builder: Callable[[list[int]], list[AppointmentCreate]] | None = None
+                           ) -> tuple[cp_model.CpSolver, CpSolverStatus]:
+    """
+    Löst das Model mit Zeitlimit `max_search_time` und der StoppingPolicy von `phase`
+    (Attribut von SolverConfig.stopping_policies, ohne Phase: Defaults). Eine explizit
+    übergebene `policy` hat Vorrang (Tuning-Skript).
+
+    Der Such-Verlauf landet als SolveTrace in `current_context().traces`.
+
+    Mit `publish_progress` gehen gedrosselte Zwischenstände (`progress.SolveProgress`,
+    mit der Summe der `unassigned`-Variablen) an den aktiven Empfänger. Mit
+    `snapshot_builder` hält die Suche ihre beste Lösung vor; `current_context().snapshot()`
+    baut daraus über den Builder (Variablenwerte nach Proto-Index) Appointments.
+    """
+    if policy is None:
+        policy = (getattr(curr_config_handler.get_solver_config().stopping_policies, phase)
+                  if phase else StoppingPolicy())
     # Solve the model.
     solver = cp_model.CpSolver()
     solver.parameters.mip_max_activity_exponent = 62
@@ -677,8 +700,27 @@ def solve_model_to_optimum(model: cp_model.CpModel, max_search_time: int,
     solver.parameters.linearization_level = 0
     solver.parameters.enumerate_all_solutions = False
     solver.parameters.max_time_in_seconds = max_search_time
+    apply_policy(solver, policy, num_workers)
+
+    trace = SolveTrace(phase or '')
+    callback = StoppingCallback(model, policy, trace,
+                                publish=progress.solution_reporter() if publish_progress else None,
+                                unassigned=unassigned or (), keep_best=snapshot_builder is not None)
+    solver.best_bound_callback = callback.on_bound
+
+    def snapshot() -> list[AppointmentCreate] | None:
+        values = callback.best_values()
+        return snapshot_builder(values) if values is not None else None
+
+    context = current_context()
+    with (context.running(solver), callback.watch(solver),
+          context.snapshots(snapshot) if snapshot_builder else contextlib.nullcontext()):
+        status = solver.solve(model, callback)
 
-    status = solver.solve(model)
+    finish_trace(trace, solver, status, callback)
+    context.traces.append(trace)
+    cp_sat_logger.debug('Phase %s: %s nach %.2f s (%s), %d Lösungen',
+                        trace.phase, trace.status, trace.wall_time, trace.stop_reason, len(trace.solutions))
 
     return solver, status
 
@@ -722,7 +764,8 @@ def print_statistics(solver: cp_model.CpSolver, solution_printer: PartialSolutio
     print(f'sum_constraints_cast_rule: {sum(solver.Value(w) for w in constraints_cast_rule)}')
 
 
-def print_solver_status(model: cp_model.CpModel, status: CpSolverStatus) -> tuple[bool, list[str]]:
+def print_solver_status(model: cp_model.CpModel, solver: cp_model.CpSolver,
+                        status: CpSolverStatus) -> tuple[bool, list[str]]:
     if status == cp_model.MODEL_INVALID:
         # print('########################### INVALID MODEL ######################################')
         return False, []
@@ -766,8 +809,8 @@ def call_solver_with_unadjusted_requested_assignments(
 
     # Create the CP-SAT model.
     model = cp_model.CpModel()
+    current_context().reset_model_state(log_search_process)
     create_vars(model, event_group_tree, avail_day_group_tree, entities)
-    solver_variables.cast_rules.reset_fields()
     
     # Registry-basierte Constraints
     registry = create_constraints(model, entities)
@@ -787,9 +830,11 @@ def call_solver_with_unadjusted_requested_assignments(
     
     define_objective_minimize(model, registry)
     # print('\n\n++++++++++++++++++++++++++++++++++++++ New Solution +++++++++++++++++++++++++++++++++++++++++++++++++++')
-    solver, solver_status = solve_model_to_optimum(model, max_search_time, log_search_process)
+    solver, solver_status = solve_model_to_optimum(
+        model, max_search_time, log_search_process, phase='unadjusted', publish_progress=True,
+        unassigned=list(unsigned_shifts.unassigned_shifts_per_event.values()))
 
-    success, problems = print_solver_status(model, solver_status)
+    success, problems = print_solver_status(model, solver, solver_status)
     if not success:
         return 0, 0, 0, 0, {}, {}, 0, False
 
@@ -831,65 +876,122 @@ def extract_assignments_by_period(assigned_shifts: dict[UUID, int], plan_period_
     return plan_period_shifts
 
 
+def _max_shifts_pool_size(num_apps: int) -> int:
+    """Anzahl paralleler Max-Shifts-Berechnungen: höchstens ein Solve pro CPU-Kern."""
+    return max(1, min(num_apps, os.cpu_count() or 1))
+
+
+def _solve_max_shifts_of_app(base_model: cp_model.CpModel, max_shifts_of_app: IntVar, max_search_time: int,
+                             log_search_process: bool, num_workers: int) -> int | None:
+    """
+    Löst eine Kopie des Basis-Models mit dem Ziel "maximale Einsätze von max_shifts_of_app".
+
+    Läuft in einem Worker-Thread; CP-SAT gibt während der Suche den GIL frei.
+    """
+    model = base_model.clone()
+    objective_var = model.get_int_var_from_proto_index(max_shifts_of_app.index)
+    model.Maximize(objective_var * 100)
+    solver, status = solve_model_to_optimum(model, max_search_time, log_search_process, num_workers,
+                                           phase='max_shifts')
+    if not print_solver_status(model, solver, status)[0]:
+        return None
+    return solver.value(objective_var)
+
+
 def call_solver_to_get_max_shifts_per_app(
         event_group_tree: EventGroupTree, avail_day_group_tree: AvailDayGroupTree, 
         entities: 'Entities', unassigned_shifts: int,
         sum_location_prefs: int, sum_partner_loc_prefs: int, sum_fixed_cast_conflicts: int, sum_cast_rules: int,
         assigned_shifts: dict[UUID, int], max_search_time: int,
-        log_search_process: bool) -> Generator[tuple[bool, UUID], None, tuple[bool, dict[UUID, int]]]:
+        log_search_process: bool,
+        max_workers: int | None = None) -> Generator[tuple[bool, UUID], None, tuple[bool, dict[UUID, int]]]:
     """
     Berechnet für jeden Mitarbeiter die maximal mögliche Anzahl von Einsätzen.
-    
+
+    Das Model (Variablen, Constraints, fixierte Ergebnisse der ungewichteten Berechnung)
+    wird nur einmal aufgebaut. Die Maximierungen pro ActorPlanPeriod sind voneinander
+    unabhängig und laufen auf Kopien dieses Basis-Models in einem Thread-Pool
+    (`max_workers`, Default: Anzahl CPU-Kerne). Die CP-SAT-Worker werden auf die
+    parallelen Solves aufgeteilt. Nach jedem fertigen Mitarbeiter wird
+    `(True, app_id)` geliefert.
+
     Die faire Verteilung wird separat durch get_fair_distribution_multi_period() berechnet.
     """
+    model = cp_model.CpModel()
+    current_context().reset_model_state(log_search_process)
+    create_vars(model, event_group_tree, avail_day_group_tree, entities)
 
-    max_shifts_of_apps = {}
-    for app_id in entities.actor_plan_periods.keys():
-        model = cp_model.CpModel()
-        create_vars(model, event_group_tree, avail_day_group_tree, entities)
-        solver_variables.cast_rules.reset_fields()
-        
-        # Registry-basierte Constraints
-        registry = create_constraints(model, entities)
-        
-        # Constraints aus Registry holen
-        unsigned_shifts: UnsignedShiftsConstraint = registry.get_constraint(UnsignedShiftsConstraint)
-        location_prefs: LocationPrefsConstraint = registry.get_constraint(LocationPrefsConstraint)
-        partner_location_prefs: PartnerLocationPrefsConstraint = registry.get_constraint(PartnerLocationPrefsConstraint)
-        fixed_cast_conflicts: FixedCastConflictsConstraint = registry.get_constraint(FixedCastConflictsConstraint)
-        skills: SkillsConstraint = registry.get_constraint(SkillsConstraint)
-        prefer_fixed_cast: PreferFixedCastConstraint = registry.get_constraint(PreferFixedCastConstraint)
-
-        max_shifts_of_app = create_constraint_max_shift_of_app(model, app_id, entities)
-
-        define_objective__max_shift_of_app(
-            model,
-            unassigned_shifts,
-            sum_location_prefs,
-            sum_partner_loc_prefs,
-            sum_fixed_cast_conflicts,
-            sum_cast_rules,
-            unsigned_shifts.unassigned_shifts_per_event,
-            location_prefs.penalty_vars,
-            partner_location_prefs.penalty_vars,
-            fixed_cast_conflicts.fixed_cast_vars,
-            skills.penalty_vars,
-            max_shifts_of_app,
-            prefer_fixed_cast.penalty_vars
-        )
+    # Registry-basierte Constraints
+    registry = create_constraints(model, entities)
 
-        solver, status = solve_model_to_optimum(model, max_search_time, log_search_process)
+    # Constraints aus Registry holen
+    unsigned_shifts: UnsignedShiftsConstraint = registry.get_constraint(UnsignedShiftsConstraint)
+    location_prefs: LocationPrefsConstraint = registry.get_constraint(LocationPrefsConstraint)
+    partner_location_prefs: PartnerLocationPrefsConstraint = registry.get_constraint(PartnerLocationPrefsConstraint)
+    fixed_cast_conflicts: FixedCastConflictsConstraint = registry.get_constraint(FixedCastConflictsConstraint)
+    skills: SkillsConstraint = registry.get_constraint(SkillsConstraint)
+    prefer_fixed_cast: PreferFixedCastConstraint = registry.get_constraint(PreferFixedCastConstraint)
 
-        yield True, app_id
+    max_shifts_vars = constraints_max_shifts_of_apps(model, entities)
+
+    define_objective__max_shift_of_app(
+        model,
+        unassigned_shifts,
+        sum_location_prefs,
+        sum_partner_loc_prefs,
+        sum_fixed_cast_conflicts,
+        sum_cast_rules,
+        unsigned_shifts.unassigned_shifts_per_event,
+        location_prefs.penalty_vars,
+        partner_location_prefs.penalty_vars,
+        fixed_cast_conflicts.fixed_cast_vars,
+        skills.penalty_vars,
+        None,
+        prefer_fixed_cast.penalty_vars
+    )
 
-        if success_problems := print_solver_status(model, status):
-            max_shifts_of_apps[app_id] = solver.value(max_shifts_of_app)
+    pool_size = max_workers or _max_shifts_pool_size(len(max_shifts_vars))
+    num_workers = max(1, (os.cpu_count() or 1) // pool_size)
 
-        else:
-            return False, {}, {}
+    return (yield from _max_shifts_in_pool(model, max_shifts_vars, max_search_time, log_search_process,
+                                           pool_size, num_workers))
 
-    # print(f'{sum(max_shifts_of_apps.values())=}')
 
+def _max_shifts_in_pool(model: cp_model.CpModel, max_shifts_vars: dict[UUID, IntVar], max_search_time: int,
+                        log_search_process: bool, pool_size: int,
+                        num_workers: int) -> Generator[tuple[bool, UUID], None, tuple[bool, dict[UUID, int]]]:
+    """Pool-Teil von `call_solver_to_get_max_shifts_per_app`.
+
+    Findet ein Mitarbeiter keine Lösung, ist das Gesamtergebnis verloren: noch
+    wartende Jobs werden verworfen, laufende Suchen per `accept_current()`
+    beendet, und es wird nicht auf den Pool gewartet — sonst liefe jede
+    laufende Suche erst ihr volles `max_search_time` ab.
+    """
+    context = current_context()
+    max_shifts_of_apps = {}
+    pool = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='max-shifts')
+    # Jeder Job bekommt eine eigene Kopie des Kontexts: SolveContext (Abbruch)
+    # und Fortschritts-Empfänger gelten so auch in den Worker-Threads.
+    futures = {
+        pool.submit(contextvars.copy_context().run, _solve_max_shifts_of_app,
+                    model, max_shifts_var, max_search_time, log_search_process, num_workers): app_id
+        for app_id, max_shifts_var in max_shifts_vars.items()
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                app_id = futures[future]
+                if (max_shifts := future.result()) is None:
+                    return False, {}
+                max_shifts_of_apps[app_id] = max_shifts
+                yield True, app_id
+    finally:
+        # Auch bei Exception oder vorzeitig geschlossenem Generator
+        pool.shutdown(wait=not pending, cancel_futures=True)
+        if pending:
+            context.accept_current()
 
     return True, max_shifts_of_apps
 
@@ -965,12 +1067,12 @@ def call_solver_with_adjusted_requested_assignments(
         max_search_time: int,
         log_search_process: bool) -> tuple[int, list[int], int, int, int, int,
                                            dict[tuple[datetime.date, str, UUID], int], int,
-                                           list[schemas.AppointmentCreate], bool]:
+                                           list[schemas.AppointmentIdsCreate], bool]:
 
     # Create the CP-SAT model.
     model = cp_model.CpModel()
+    current_context().reset_model_state(log_search_process)
     create_vars(model, event_group_tree, avail_day_group_tree, entities)
-    solver_variables.cast_rules.reset_fields()
     
     # Registry-basierte Constraints
     registry = create_constraints(model, entities)
@@ -989,9 +1091,13 @@ def call_solver_with_adjusted_requested_assignments(
     prefer_fixed_cast: PreferFixedCastConstraint = registry.get_constraint(PreferFixedCastConstraint)
     
     define_objective_minimize(model, registry)
-    solver, solver_status = solve_model_to_optimum(model, max_search_time, log_search_process)
+    solution_index = SolutionIndex(entities)
+    solver, solver_status = solve_model_to_optimum(
+        model, max_search_time, log_search_process, phase='adjusted', publish_progress=True,
+        unassigned=list(unsigned_shifts.unassigned_shifts_per_event.values()),
+        snapshot_builder=lambda values: hydrate([solution_index.extract(values)], entities)[0])
     # print('\n\n++++++++++++++++++++++++++++++++++++++ New Solution +++++++++++++++++++++++++++++++++++++++++++++++++++')
-    success, problems = print_solver_status(model, solver_status)
+    success, problems = print_solver_status(model, solver, solver_status)
     if not success:
         return 0, [], 0, 0, 0, 0, {}, 0, [], False
     
@@ -1013,36 +1119,7 @@ def call_solver_with_adjusted_requested_assignments(
                      weights_in_event_groups.penalty_vars,
                      weights_in_avail_day_groups.penalty_vars, cast_rules.penalty_vars)
 
-    event_group_id_avail_day_group_ids: dict[UUID, list[UUID]] = {}
-    for (adg_id, eg_id), var in entities.shift_vars.items():
-        if solver.Value(entities.event_group_vars[eg_id]):
-            if not event_group_id_avail_day_group_ids.get(eg_id):
-                event_group_id_avail_day_group_ids[eg_id] = []
-        if solver.Value(var):
-            event_group_id_avail_day_group_ids[eg_id].append(adg_id)
-
-    # Für Appointments vollständige AvailDays laden (nicht die minimalen Solver-Versionen)
-    all_assigned_adg_ids = [adg_id for adg_ids in event_group_id_avail_day_group_ids.values() for adg_id in adg_ids]
-    avail_day_ids_for_appointments = [
-        entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-        for adg_id in all_assigned_adg_ids
-        if entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-    ]
-    full_avail_days = db_services.AvailDay.get_batch(avail_day_ids_for_appointments)
-
-    appointments = []
-    for eg_id, adg_ids in event_group_id_avail_day_group_ids.items():
-        avail_days_for_event = []
-        for adg_id in adg_ids:
-            avail_day_id = entities.avail_day_groups_with_avail_day[adg_id]._avail_day_id
-            if avail_day_id and avail_day_id in full_avail_days:
-                avail_days_for_event.append(full_avail_days[avail_day_id])
-        appointments.append(
-            schemas.AppointmentCreate(
-                avail_days=avail_days_for_event,
-                event=entities.event_groups_with_event[eg_id].event
-            )
-        )
+    appointments = solution_index.extract(solver.response_proto.solution)
 
     # solver.parameters.log_search_progress = log_search_process
     # solver.parameters.randomize_search = True
@@ -1080,8 +1157,8 @@ def call_solver_with__fixed_constraint_results(
 ) -> tuple[PartialSolutionCallback | None, dict[tuple[datetime.date, str, UUID], int], bool]:
     # Create the CP-SAT model.
     model = cp_model.CpModel()
+    current_context().reset_model_state(log_search_process)
     create_vars(model, event_group_tree, avail_day_group_tree, entities)
-    solver_variables.cast_rules.reset_fields()
     
     # Registry-basierte Constraints
     registry = create_constraints(model, entities)
@@ -1112,7 +1189,7 @@ def call_solver_with__fixed_constraint_results(
         model, list(unsigned_shifts.unassigned_shifts_per_event.values()), rel_shift_deviations.sum_assigned_shifts,
         rel_shift_deviations.sum_squared_deviations, fixed_cast_conflicts.fixed_cast_vars,
         print_solution_printer_results, 100, log_search_process, entities, collect_schedule_versions)
-    success, problems = print_solver_status(model, solver_status)
+    success, problems = print_solver_status(model, solver, solver_status)
     if not success:
         return None, {}, False
     print_statistics(solver, solution_printer, unsigned_shifts.unassigned_shifts_per_event,
@@ -1204,6 +1281,7 @@ def call_solver_to_test_plan(plan: schemas.PlanShow,
     )
     
     model = cp_model.CpModel()
+    current_context().reset_model_state(log_search_process)
     create_vars(model, event_group_tree, avail_day_group_tree, entities)
     
     # Registry-basierte Constraints
@@ -1215,26 +1293,41 @@ def call_solver_to_test_plan(plan: schemas.PlanShow,
     
     set_test_plan_constraints(model, plan,
                               fixed_cast_conflicts.fixed_cast_vars, skills.penalty_vars, entities)
-    solver, solver_status = solve_model_to_optimum(model, max_search_time, log_search_process)
+    solver, solver_status = solve_model_to_optimum(model, max_search_time, log_search_process,
+                                                   phase='test_plan')
 
-    success, problems = print_solver_status(model, solver_status)
+    success, problems = print_solver_status(model, solver, solver_status)
     return success, problems
 
 
+def _max_fair_shifts_fingerprint(event_group_tree: EventGroupTree, avail_day_group_tree: AvailDayGroupTree,
+                                 entities: 'Entities', *params: object) -> str:
+    """Fingerprint der Eingaben von max./fairen Einsätzen (siehe max_fair_shifts_cache)."""
+    model = cp_model.CpModel()
+    current_context().reset_model_state()
+    create_vars(model, event_group_tree, avail_day_group_tree, entities)
+    define_objective_minimize(model, create_constraints(model, entities))
+    return max_fair_shifts_cache.inputs_fingerprint(model, entities, *params)
+
+
 def _get_max_fair_shifts_and_max_shifts_to_assign(
         plan_period_id: UUID, time_calc_max_shifts: int, time_calc_fair_distribution: int,
-        log_search_process=False) -> tuple[EventGroupTree, AvailDayGroupTree, Entities, 
-                                           dict[tuple[date, str, UUID], int],
-                                           dict[str, int], dict[UUID, int], dict[UUID, float]] | None:
+        log_search_process=False, use_cache=True) -> tuple[EventGroupTree, AvailDayGroupTree, Entities,
+                                                           dict[tuple[date, str, UUID], int],
+                                                           dict[str, int], dict[UUID, int], dict[UUID, float]] | None:
     """
     Berechnet maximale und faire Shifts für eine einzelne Planperiode.
+
+    Mit `use_cache` werden gespeicherte Ergebnisse wiederverwendet, solange sich die
+    Eingaben (Fingerprint, siehe max_fair_shifts_cache) nicht geändert haben; neu
+    berechnete Ergebnisse werden für den nächsten Lauf gespeichert.
     
     Returns:
         Tuple mit (event_group_tree, avail_day_group_tree, entities, 
                    fixed_cast_conflicts, skill_conflicts, max_shifts_per_app, fair_shifts_per_app)
         oder None bei Fehler
     """
-    signal_handling.handler_solver.progress('Vorberechnungen...')
+    progress.report('Vorberechnungen...')
 
     lpp_ids, app_ids = pp_svc.get_lpp_and_app_ids(plan_period_id)
     event_group_tree = get_event_group_tree(plan_period_id, lpp_ids)
@@ -1242,6 +1335,20 @@ def _get_max_fair_shifts_and_max_shifts_to_assign(
     cast_group_tree = get_cast_group_tree(plan_period_id)
     entities = create_data_models(event_group_tree, avail_day_group_tree, cast_group_tree, plan_period_id)
 
+    fingerprint = None
+    if use_cache:
+        # Vor get_fair_distribution(): die überschreibt requested_assignments in entities
+        policies = curr_config_handler.get_solver_config().stopping_policies
+        fingerprint = _max_fair_shifts_fingerprint(event_group_tree, avail_day_group_tree, entities,
+                                                   time_calc_max_shifts, time_calc_fair_distribution,
+                                                   policies.unadjusted, policies.max_shifts)
+        if cached := max_fair_shifts_cache.load(list(entities.actor_plan_periods), fingerprint):
+            progress.report('Vorberechnungen unverändert — gespeicherte Werte werden verwendet.')
+            max_shifts_per_app, fair_shifts_per_app = cached
+            for app_id, fair_shifts in fair_shifts_per_app.items():
+                entities.actor_plan_periods[app_id].requested_assignments = fair_shifts
+            return event_group_tree, avail_day_group_tree, entities, {}, {}, max_shifts_per_app, fair_shifts_per_app
+
     (assigned_shifts, unassigned_shifts, sum_location_prefs, sum_partner_loc_prefs, fixed_cast_conflicts,
      skill_conflicts, sum_cast_rules, success) = call_solver_with_unadjusted_requested_assignments(
         event_group_tree,
@@ -1269,7 +1376,7 @@ def _get_max_fair_shifts_and_max_shifts_to_assign(
 
     while True:
         try:
-            signal_handling.handler_solver.progress('Bestimmung maximaler Einsätze...')
+            progress.report('Bestimmung maximaler Einsätze...')
             next(get_max_shifts_per_app)
         except StopIteration as e:
             success, max_shifts_per_app = e.value
@@ -1279,12 +1386,14 @@ def _get_max_fair_shifts_and_max_shifts_to_assign(
         return None
 
     # Fair Distribution separat berechnen
-    signal_handling.handler_solver.progress('Berechnung fairer Verteilung...')
+    progress.report('Berechnung fairer Verteilung...')
     fair_shifts_per_app = get_fair_distribution(
         max_shifts_per_app,
         sum(assigned_shifts.values()),
         entities
     )
+    if fingerprint:
+        max_fair_shifts_cache.store(fingerprint, max_shifts_per_app, fair_shifts_per_app)
 
     time.sleep(0.1)  # notwendig, damit Signal-Handling Zeit für das Senden des neuen Signals hat.
 
@@ -1310,7 +1419,7 @@ def _get_max_fair_shifts_and_max_shifts_to_assign_multi_period(
     Returns:
         Tuple mit Trees, Conflicts und Shifts oder None bei Fehler
     """
-    signal_handling.handler_solver.progress('Vorberechnungen (Multi-Period)...')
+    progress.report('Vorberechnungen (Multi-Period)...')
     
     # ========== PHASE 1: Max Shifts pro Periode berechnen ==========
     max_shifts_per_app_total = {}
@@ -1376,7 +1485,7 @@ def _get_max_fair_shifts_and_max_shifts_to_assign_multi_period(
                 person_name = entities.actor_plan_periods[app_id].person.full_name
                 period_name = (f'{date_to_string(entities.actor_plan_periods[app_id].plan_period.start)} '
                                f'- {date_to_string(entities.actor_plan_periods[app_id].plan_period.end)}')
-                signal_handling.handler_solver.progress(
+                progress.report(
                     f'Max Shifts für {person_name} in {period_name}...'
                 )
             except StopIteration as e:
@@ -1403,7 +1512,7 @@ def _get_max_fair_shifts_and_max_shifts_to_assign_multi_period(
     
     # ========== PHASE 2: Fair Distribution über alle Perioden ==========
     # Combined Trees werden in get_fair_distribution_multi_period() erstellt
-    signal_handling.handler_solver.progress('Berechne faire Verteilung (Multi-Period)...')
+    progress.report('Berechne faire Verteilung (Multi-Period)...')
     event_group_tree, avail_day_group_tree, fair_shifts_per_app = get_fair_distribution_multi_period(
         plan_period_ids,
         max_shifts_per_app_total,
@@ -1418,17 +1527,20 @@ def _get_max_fair_shifts_and_max_shifts_to_assign_multi_period(
             max_shifts_per_app_total, fair_shifts_per_app)
 
 
+@with_solve_context
 def solve(plan_period_id: UUID, num_plans: int, time_calc_max_shifts: int, time_calc_fair_distribution: int,
-          time_calc_plan: int, log_search_process=False) -> tuple[list[list[AppointmentCreate]] | None,
-                                                                  dict[tuple[date, str, UUID], int] | None,
-                                                                  dict[str, int] | None,
-                                                                  dict[UUID, int] | None,
-                                                                  dict[UUID, float] | None]:
+          time_calc_plan: int, log_search_process=False,
+          use_cache=True) -> tuple[list[list[AppointmentIdsCreate]] | None,
+                                   dict[tuple[date, str, UUID], int] | None,
+                                   dict[str, int] | None,
+                                   dict[UUID, int] | None,
+                                   dict[UUID, float] | None]:
 
     result_shifts = _get_max_fair_shifts_and_max_shifts_to_assign(plan_period_id,
                                                                   time_calc_max_shifts,
                                                                   time_calc_fair_distribution,
-                                                                  log_search_process)
+                                                                  log_search_process,
+                                                                  use_cache)
     success = True
     if result_shifts is None:
         success = False
@@ -1444,7 +1556,7 @@ def solve(plan_period_id: UUID, num_plans: int, time_calc_max_shifts: int, time_
 
     plan_datas = []
     for n in range(1, num_plans + 1):
-        signal_handling.handler_solver.progress(f'Pläne werden berechnet. ({n})')
+        progress.report(f'Pläne werden berechnet. ({n})')
         (sum_squared_deviations_res, unassigned_shifts_per_event_res, sum_weights_shifts_in_avail_day_groups,
          sum_weights_in_event_groups, sum_location_prefs_res, sum_partner_loc_prefs_res, fixed_cast_conflicts,
          sum_cast_rules, appointments,
@@ -1457,14 +1569,15 @@ def solve(plan_period_id: UUID, num_plans: int, time_calc_max_shifts: int, time_
             return None, None, None, None, None
         plan_datas.append(appointments)
 
-    signal_handling.handler_solver.progress('Layouts der Pläne werden erstellt.')
+    progress.report('Layouts der Pläne werden erstellt.')
 
     return plan_datas, fixed_cast_conflicts, skill_conflicts, max_shifts_per_app, fair_shifts_per_app
 
 
+@with_solve_context
 def solve_multi_period(plan_period_ids: list[UUID], num_plans: int, time_calc_max_shifts: int, 
                       time_calc_fair_distribution: int, time_calc_plan: int, 
-                      log_search_process=False) -> tuple[list[list[list[AppointmentCreate]]] | None,
+                      log_search_process=False) -> tuple[list[list[list[AppointmentIdsCreate]]] | None,
                                                          dict[tuple[date, str, UUID], int] | None,
                                                          dict[str, int] | None,
                                                          dict[UUID, int] | None,
@@ -1538,7 +1651,7 @@ def solve_multi_period(plan_period_ids: list[UUID], num_plans: int, time_calc_ma
     all_plans = []
     
     for period_idx, plan_period_id in enumerate(plan_period_ids):
-        signal_handling.handler_solver.progress(
+        progress.report(
             f'Erstelle Pläne für Periode {period_idx + 1}/{len(plan_period_ids)}...'
         )
         
@@ -1567,7 +1680,7 @@ def solve_multi_period(plan_period_ids: list[UUID], num_plans: int, time_calc_ma
         # Erstelle num_plans für diese Periode
         period_plans = []
         for n in range(1, num_plans + 1):
-            signal_handling.handler_solver.progress(
+            progress.report(
                 f'Plan {n}/{num_plans} für Periode {period_idx + 1}/{len(plan_period_ids)}...'
             )
             
@@ -1590,7 +1703,7 @@ def solve_multi_period(plan_period_ids: list[UUID], num_plans: int, time_calc_ma
         
         all_plans.append(period_plans)
     
-    signal_handling.handler_solver.progress('Layouts der Multi-Period Pläne werden erstellt.')
+    progress.report('Layouts der Multi-Period Pläne werden erstellt.')
     
     # Returniere Pläne pro Periode
     # Format: all_plans[period_idx][plan_idx] = appointments (nur Events dieser Periode)
@@ -1650,12 +1763,14 @@ def extract_appointments_by_period(
     return period_appointments
 
 
+@with_solve_context
 def get_max_fair_shifts_per_app(plan_period_id: UUID, time_calc_max_shifts: int, time_calc_fair_distribution: int,
-                                log_search_process=False) -> bool | tuple[dict[UUID, int], dict[UUID, float]]:
+                                log_search_process=False, use_cache=True) -> bool | tuple[dict[UUID, int], dict[UUID, float]]:
     result_shifts = _get_max_fair_shifts_and_max_shifts_to_assign(plan_period_id,
                                                                   time_calc_max_shifts,
                                                                   time_calc_fair_distribution,
-                                                                  log_search_process)
+                                                                  log_search_process,
+                                                                  use_cache)
 
     if result_shifts is None:
         return False
@@ -1728,6 +1843,7 @@ def test_plan(plan_id: UUID, cached_entities: 'Entities | None' = None) -> tuple
     return success, problems, infos
 
 
+@with_solve_context
 def test_plan_with_solver(plan_id: UUID) -> tuple[bool, list[str]]:
     """
     DEPRECATED: Testet einen Plan mit vollständigem Solver-Durchlauf.
@@ -1760,8 +1876,18 @@ def test_plan_with_solver(plan_id: UUID) -> tuple[bool, list[str]]:
 
 
 def solver_quit():
-    if solver:
-        solver.stop_search()
+    """Bricht alle laufenden Berechnungen ab (Desktop: Abbrechen im Fortschritts-Dialog)."""
+    stop_all()
+
+
+def solver_accept_current():
+    """Übernimmt für die laufende Plan-Suche die bisher beste Lösung (Desktop: Fortschritts-Dialog)."""
+    accept_all()
+
+
+def snapshot_current_best() -> list[AppointmentCreate] | None:
+    """Appointments der bisher besten Lösung der laufenden Plan-Suche, ohne sie anzuhalten."""
+    return snapshot_best()
 
 
 # todo: Eine Möglichkeit soll implementiert werden, um mehrere zusammenhängende AvailDays eines Mitarbeiters so
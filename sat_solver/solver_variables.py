@@ -20,5 +20,3 @@ class CastRules:
         self.applied_shifts_2 = []
         self.is_unequal = []
 
-
-cast_rules = CastRules()
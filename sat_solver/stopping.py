@@ -0,0 +1,201 @@
+"""
+Abbruch-Regeln und Such-Verläufe für `solve_model_to_optimum`.
+
+Bisher lief jede Phase stur bis `max_time_in_seconds` (oder bis CP-SAT
+Optimalität bewiesen hat). Pro Phase (`StoppingPolicies` in
+`configuration.solver`) lassen sich jetzt zusätzlich einstellen:
+
+- `relative_gap_limit` — direkt als CP-SAT-Parameter
+- `no_improvement_seconds` — Watchdog-Thread, stoppt, wenn seit der letzten
+  Verbesserung so viel Zeit vergangen ist (erst nach der ersten Lösung)
+- `objective_target` — Prüfung bei jeder Lösung
+- `num_workers` / `subsolvers` — Worker-Anzahl und Portfolio
+
+Jeder Lauf hinterlässt einen `SolveTrace` (Zielfunktion und Schranke über
+der Zeit, Abbruchgrund) im aktiven `SolveContext` — Grundlage für
+`scripts/tune_solver_stopping.py`.
+
+Optional meldet der Callback den Stand der Suche gedrosselt (höchstens alle
+`publish_interval` Sekunden, plus eine Schlussmeldung) an einen
+`SolveProgress`-Empfänger und hält die Variablenwerte der besten Lösung für
+Schnappschüsse vor (`keep_best`). Die Suche wartet dabei nie auf den Leser:
+der Callback kopiert die Werte einmal pro Verbesserung und tauscht nur die
+Referenz unter dem Lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from ortools.sat.python import cp_model
+
+from configuration.solver import StoppingPolicy
+from sat_solver.progress import SolveProgress
+
+
+@dataclass(eq=False)
+class SolveTrace:
+    """Verlauf eines Solver-Laufs; Zeiten in Sekunden seit Start der Suche."""
+    phase: str
+    solutions: list[tuple[float, float]] = field(default_factory=list)
+    bounds: list[tuple[float, float]] = field(default_factory=list)
+    status: str = ''
+    wall_time: float = 0.0
+    stop_reason: str = ''
+
+    @property
+    def best_objective(self) -> float | None:
+        return self.solutions[-1][1] if self.solutions else None
+
+    def time_to_within(self, reference: float, relative: float, maximize: bool = False) -> float | None:
+        """Zeit bis zur ersten Lösung, die höchstens `relative` schlechter als `reference` ist."""
+        tolerance = abs(reference) * relative
+        for wall_time, objective in self.solutions:
+            if (objective >= reference - tolerance) if maximize else (objective <= reference + tolerance):
+                return wall_time
+        return None
+
+
+class StoppingCallback(cp_model.CpSolverSolutionCallback):
+    """Zeichnet Lösungen auf und setzt `objective_target` / `no_improvement_seconds` um.
+
+    Mit `publish` werden Zwischenstände gedrosselt gemeldet; `unassigned` sind die
+    Variablen der unbesetzten Schichten, deren Summe dabei mitgeliefert wird.
+    """
+
+    def __init__(self, model: cp_model.CpModel, policy: StoppingPolicy, trace: SolveTrace,
+                 publish: Callable[[SolveProgress], None] | None = None,
+                 unassigned: Sequence[cp_model.IntVar] = (),
+                 keep_best: bool = False,
+                 publish_interval: float = 0.5):
+        cp_model.CpSolverSolutionCallback.__init__(self)
+        self._policy = policy
+        self._trace = trace
+        self._maximize = model.Proto().objective.scaling_factor < 0
+        self._start = time.perf_counter()
+        self._last_improvement: float | None = None
+        self._lock = threading.Lock()
+        self._publish = publish
+        self._unassigned = unassigned
+        self._keep_best = keep_best
+        self._publish_interval = publish_interval
+        self._last_publish: float | None = None
+        self._unassigned_shifts: int | None = None
+        self._best_values: list[int] | None = None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+    def on_bound(self, bound: float) -> None:
+        self._trace.bounds.append((self.elapsed(), bound))
+        self.publish(bound=bound)
+
+    def on_solution_callback(self) -> None:
+        objective = self.ObjectiveValue()
+        improved = self._is_improvement(objective)
+        if improved and self._keep_best:
+            values = list(self.response_proto.solution)
+            with self._lock:
+                self._best_values = values
+        if improved and self._publish and self._unassigned:
+            self._unassigned_shifts = sum(self.Value(var) for var in self._unassigned)
+        target_reached = self.record(objective)
+        # Die erste Lösung immer melden — ab hier gibt es einen Plan, auch wenn gerade eine Schranke gemeldet wurde
+        if improved and self._publish and (self._due() or len(self._trace.solutions) == 1):
+            self.publish(bound=self.BestObjectiveBound(), force=True)
+        if target_reached:
+            self.StopSearch()
+
+    def _is_improvement(self, objective: float) -> bool:
+        best = self._trace.best_objective
+        return best is None or (objective > best if self._maximize else objective < best)
+
+    def record(self, objective: float) -> bool:
+        """Verbucht eine gefundene Lösung; True, wenn `objective_target` erreicht ist."""
+        if self._is_improvement(objective):
+            with self._lock:
+                self._last_improvement = self.elapsed()
+                self._trace.solutions.append((self._last_improvement, objective))
+        target = self._policy.objective_target
+        if target is not None and (objective >= target if self._maximize else objective <= target):
+            self._trace.stop_reason = 'objective_target'
+            return True
+        return False
+
+    def best_values(self) -> list[int] | None:
+        """Variablenwerte der bisher besten Lösung (nur mit `keep_best`), indiziert über `var.index`."""
+        with self._lock:
+            return self._best_values
+
+    def _due(self) -> bool:
+        with self._lock:
+            now = self.elapsed()
+            if self._last_publish is not None and now - self._last_publish < self._publish_interval:
+                return False
+            self._last_publish = now
+            return True
+
+    def publish(self, bound: float | None = None, force: bool = False) -> None:
+        """Meldet den aktuellen Stand — gedrosselt, außer mit `force`."""
+        if not self._publish or not (force or self._due()):
+            return
+        bounds = self._trace.bounds
+        self._publish(SolveProgress(
+            phase=self._trace.phase, elapsed=self.elapsed(), objective=self._trace.best_objective,
+            bound=bound if bound is not None else (bounds[-1][1] if bounds else None),
+            unassigned_shifts=self._unassigned_shifts))
+
+    @contextmanager
+    def watch(self, solver: cp_model.CpSolver) -> Iterator[None]:
+        """Watchdog für `no_improvement_seconds` für die Dauer der Suche."""
+        window = self._policy.no_improvement_seconds
+        if not window:
+            yield
+            return
+        done = threading.Event()
+
+        def watchdog() -> None:
+            while not done.wait(min(window, 0.1)):
+                with self._lock:
+                    idle = self._last_improvement is not None and self.elapsed() - self._last_improvement >= window
+                if idle:
+                    self._trace.stop_reason = 'no_improvement'
+                    solver.stop_search()
+                    return
+
+        thread = threading.Thread(target=watchdog, name='solver-no-improvement', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+
+def apply_policy(solver: cp_model.CpSolver, policy: StoppingPolicy, num_workers: int | None = None) -> None:
+    """Überträgt die CP-SAT-Parameter der Policy; `num_workers` (z. B. Pool-Aufteilung) hat Vorrang."""
+    if policy.relative_gap_limit is not None:
+        solver.parameters.relative_gap_limit = policy.relative_gap_limit
+    if workers := num_workers or policy.num_workers:
+        solver.parameters.num_workers = workers
+    if policy.subsolvers:
+        solver.parameters.subsolvers.extend(policy.subsolvers)
+
+
+def finish_trace(trace: SolveTrace, solver: cp_model.CpSolver, status, callback: StoppingCallback) -> None:
+    trace.status = solver.status_name(status)
+    trace.wall_time = callback.elapsed()
+    callback.publish(bound=solver.best_objective_bound, force=True)
+    if trace.stop_reason:
+        return
+    if status == cp_model.OPTIMAL:
+        # CP-SAT meldet auch bei erreichtem relative_gap_limit OPTIMAL
+        trace.stop_reason = 'optimal' if solver.objective_value == solver.best_objective_bound else 'gap'
+    elif trace.wall_time >= solver.parameters.max_time_in_seconds:
+        trace.stop_reason = 'time_limit'
+    else:
+        trace.stop_reason = 'stopped'
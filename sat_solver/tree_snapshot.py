@@ -0,0 +1,144 @@
+"""
+Unveränderliche Snapshots der Gruppen-Bäume (EventGroup, AvailDayGroup, CastGroup).
+
+`solve`, `test_plan` und `get_max_fair_shifts_per_app` bauen ihre anytree-Bäume
+bei jedem Aufruf neu aus Batch-Queries auf — Multi-Period sogar mehrfach pro
+Berechnung (Phase 1 pro Periode, Combined-Trees, Phase 3 pro Periode).
+
+Ein `TreeSnapshot` hält einen fertig geladenen Baum als flache Arrays:
+Node-IDs, Parent-Indizes (Pre-Order, Parent steht immer vor seinen Kindern)
+und die DB-Payloads (TreeNode-/Show-Schemas). Er wird einmal pro Schlüssel
+(LPP-/APP-IDs bzw. PlanPeriod) und Daten-Revision gebaut und ist zwischen
+Solver-Phasen und Threads teilbar; `materialize()` erzeugt daraus ohne
+DB-Zugriff eine frische anytree-Sicht. Node-Caches (`_event`, `_avail_day`, …)
+leben auf den Nodes — jede Sicht bekommt also eigene.
+
+Invalidierung:
+- Revision in der DB (`database.tree_revision`), gebumpt von Session-Listenern
+  nach jedem Commit, der baumrelevante Tabellen berührt — in jedem Prozess,
+  also auch bei Änderungen, die ein Desktop-Client über die Web-API macht.
+  Jedes `get` liest die Revision (eine Abfrage auf eine Zeile).
+- Schreibvorgänge an der Session vorbei (rohe Core-Statements) sieht die
+  Revision nicht — Einträge verfallen deshalb zusätzlich nach `max_age`.
+
+WICHTIG: Keine OR-Tools-Imports (siehe data_loading.py).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, TypeVar
+from uuid import UUID
+
+from anytree import NodeMixin, PreOrderIter
+
+from database.tree_revision import current_revision, register_tree_revision_listeners
+
+logger = logging.getLogger(__name__)
+
+N = TypeVar('N', bound=NodeMixin)
+
+
+# ── Snapshot ─────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class TreeSnapshot:
+    """Flache, unveränderliche Darstellung eines Gruppen-Baums.
+
+    Index 0 ist die Wurzel (`parent_indices[0] == -1`). Die Payloads werden
+    von allen materialisierten Sichten geteilt und dürfen nicht mutiert werden.
+    """
+    node_ids: tuple[UUID | int, ...]
+    parent_indices: tuple[int, ...]
+    payloads: tuple[Any, ...]
+    root_is_master_group: bool
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    @classmethod
+    def from_root(cls, root: NodeMixin, id_attr: str, payload_attr: str,
+                  master_flag_attr: str | None = None) -> TreeSnapshot:
+        nodes = list(PreOrderIter(root))
+        index_of = {id(node): i for i, node in enumerate(nodes)}
+        return cls(
+            node_ids=tuple(getattr(node, id_attr) for node in nodes),
+            parent_indices=tuple(-1 if node.parent is None else index_of[id(node.parent)] for node in nodes),
+            payloads=tuple(getattr(node, payload_attr) for node in nodes),
+            root_is_master_group=bool(getattr(root, master_flag_attr)) if master_flag_attr else False,
+        )
+
+    def materialize(self, node_factory: Callable[[Any, N | None], N]) -> list[N]:
+        """Baut eine frische anytree-Sicht. Liefert die Nodes in Snapshot-Reihenfolge."""
+        nodes: list[N] = []
+        for payload, parent_index in zip(self.payloads, self.parent_indices):
+            nodes.append(node_factory(payload, nodes[parent_index] if parent_index >= 0 else None))
+        return nodes
+
+
+# ── Cache ────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    snapshot: TreeSnapshot
+    revision: int
+    created: float
+
+
+class TreeSnapshotCache:
+    """Thread-sicherer LRU für TreeSnapshots plus Hit-/Miss-Zähler.
+
+    Schlüssel z. B. `('event_group', (lpp_id, ...))`. Ein Eintrag gilt nur für
+    die Revision, unter der sein Bau begonnen hat — ein Commit während des
+    Baus macht ihn sofort unerreichbar.
+    """
+
+    def __init__(self, max_entries: int = 32, max_age: float = 300.0):
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> TreeSnapshot | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        # Revision (DB-Abfrage) nur lesen, wenn es überhaupt einen Kandidaten gibt.
+        valid = (entry is not None and time.monotonic() - entry.created <= self._max_age
+                 and entry.revision == current_revision())
+        with self._lock:
+            if not valid:
+                self.misses += 1
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.snapshot
+
+    def put(self, key: Hashable, snapshot: TreeSnapshot, revision: int) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(snapshot, revision, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+tree_snapshot_cache = TreeSnapshotCache()
+
+register_tree_revision_listeners()
@@ -0,0 +1,128 @@
+"""
+Benchmark: Modellaufbau von CastRulesConstraint (synthetische Daten, keine DB).
+
+Erzeugt eine Planperiode mit N Mitarbeitern und einer Besetzungsregel-Kette
+über E Events (jeder Mitarbeiter an jedem Event-Tag verfügbar) und misst:
+
+- "Index":     CastRulesConstraint.apply() — Schicht-Variablen über den
+               vorab gebauten Index event_group → Mitarbeiter
+- "Vollsuche": Referenz-Schleife wie vor dem Index (Dict-Comprehension über
+               alle shift_vars pro Regel-Paar und Mitarbeiter), nur Lookup
+
+Ausführen:
+    uv run python scripts/benchmark_cast_rules_build.py
+    uv run python scripts/benchmark_cast_rules_build.py --persons 60 --events 120 --rule="-~"
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+parser = argparse.ArgumentParser(description='Modellaufbau der Besetzungsregeln messen')
+parser.add_argument('--persons', type=int, default=40, help='Anzahl Mitarbeiter (Standard: 40)')
+parser.add_argument('--events', type=int, default=60, help='Anzahl Events in der Regel-Kette (Standard: 60)')
+parser.add_argument('--rule', default='-', help='Regel-Pattern, z. B. "-", "~", "-~" (Standard: "-")')
+parser.add_argument('--strict', type=int, default=2, choices=(1, 2),
+                    help='strict_rule_pref: 1 = weich, 2 = hart (Standard: 2)')
+args = parser.parse_args()
+
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.cast_group_tree import CastGroup
+from sat_solver.constraints.cast_rules import CastRulesConstraint
+from sat_solver.constraints.registry import ConstraintRegistry
+
+
+def build_entities(model: cp_model.CpModel) -> SimpleNamespace:
+    time_of_day = SimpleNamespace(name='abends', time_of_day_enum=SimpleNamespace(time_index=1))
+    location = SimpleNamespace(location_of_work=SimpleNamespace(name='Ort'))
+    events = [SimpleNamespace(id=uuid.uuid4(), event_group_id=uuid.uuid4(),
+                              date=date(2026, 1, 1) + timedelta(days=i),
+                              time_of_day=time_of_day, location_plan_period=location)
+              for i in range(args.events)]
+
+    parent = CastGroup(None)
+    parent.cast_group_id = uuid.uuid4()
+    parent.cast_rule = args.rule
+    parent.strict_rule_pref = args.strict
+    cast_groups = {}
+    for event in events:
+        cast_group = CastGroup(None, parent=parent)
+        cast_group.cast_group_id = uuid.uuid4()
+        cast_group.nr_actors = 2
+        cast_group._event = event
+        cast_groups[cast_group.cast_group_id] = cast_group
+
+    apps = {uuid.uuid4(): SimpleNamespace(person=SimpleNamespace(id=uuid.uuid4(), f_name=f'P{i}'))
+            for i in range(args.persons)}
+    avail_day_groups, shift_vars = {}, {}
+    for app_id in apps:
+        for event in events:
+            adg_id = uuid.uuid4()
+            avail_day_groups[adg_id] = SimpleNamespace(
+                avail_day=SimpleNamespace(actor_plan_period=SimpleNamespace(id=app_id), date=event.date))
+            shift_vars[(adg_id, event.event_group_id)] = model.NewBoolVar('')
+
+    return SimpleNamespace(
+        actor_plan_periods=apps,
+        avail_day_groups=avail_day_groups,
+        avail_day_groups_with_avail_day=avail_day_groups,
+        event_groups_with_event={e.event_group_id: SimpleNamespace(event_group_id=e.event_group_id, event=e)
+                                 for e in events},
+        event_group_vars={e.event_group_id: model.NewBoolVar('') for e in events},
+        cast_groups={parent.cast_group_id: parent} | cast_groups,
+        cast_groups_with_event=cast_groups,
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+        events=events,
+    )
+
+
+def full_scan_lookup(entities: SimpleNamespace) -> int:
+    """Lookup wie vor dem Index: pro Regel-Paar und Mitarbeiter eine Vollsuche."""
+    found = 0
+    for event_1, event_2 in zip(entities.events, entities.events[1:]):
+        for app_id in entities.actor_plan_periods:
+            found += len({
+                (adg_id, eg_id): var
+                for (adg_id, eg_id), var in entities.shift_vars.items()
+                if eg_id in {event_1.event_group_id, event_2.event_group_id}
+                and entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id == app_id
+                and entities.avail_day_groups_with_avail_day[adg_id].avail_day.date in {event_1.date, event_2.date}
+                and entities.shifts_exclusive[(adg_id, eg_id)]
+            })
+    return found
+
+
+model = cp_model.CpModel()
+entities = build_entities(model)
+print(f"\n{args.persons} Mitarbeiter, {args.events} Events, Regel '{args.rule}', "
+      f"strict={args.strict}, {len(entities.shift_vars)} shift_vars")
+print("=" * 70)
+
+registry = ConstraintRegistry(entities, model, SolverConfig())
+constraint = registry.register(CastRulesConstraint)
+num_constraints_before = len(model.Proto().constraints)
+t0 = time.perf_counter()
+constraint.apply()
+t_index = time.perf_counter() - t0
+print(f"  Index (apply komplett):   {t_index * 1000:9.1f} ms   "
+      f"{len(model.Proto().constraints) - num_constraints_before} Constraints, "
+      f"{len(constraint.penalty_vars)} Penalty-Variablen")
+
+t0 = time.perf_counter()
+full_scan_lookup(entities)
+t_scan = time.perf_counter() - t0
+print(f"  Vollsuche (nur Lookup):   {t_scan * 1000:9.1f} ms")
+if t_index:
+    print(f"  Faktor: {t_scan / t_index:.1f}x")
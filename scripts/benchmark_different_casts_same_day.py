@@ -0,0 +1,128 @@
+"""
+Benchmark: Modellaufbau von DifferentCastsSameDayConstraint (synthetische Daten, keine DB).
+
+Erzeugt N Mitarbeiter über D Tage mit je einem AvailDay pro Tageszeit und
+L Locations mit je einem Event pro Tageszeit (jeder Mitarbeiter überall
+verfügbar). Ein Teil der AvailDays erlaubt über CombinationLocationsPossible
+die Kombination der ersten beiden Locations. Verglichen werden:
+
+- "Paare":   Referenz wie vor dem Clique-Encoding (pro unerlaubtem Var-Paar
+             ein `sum <= 1`)
+- "Cliquen": DifferentCastsSameDayConstraint.apply()
+
+Gemessen: Aufbauzeit, Anzahl Constraints, Presolve-Zeit (stop_after_presolve).
+
+Ausführen:
+    uv run python scripts/benchmark_different_casts_same_day.py
+    uv run python scripts/benchmark_different_casts_same_day.py --persons 40 --days 30 --locations 8
+"""
+
+import argparse
+import datetime
+import itertools
+import os
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+parser = argparse.ArgumentParser(description='Modellaufbau von DifferentCastsSameDay messen')
+parser.add_argument('--persons', type=int, default=20, help='Anzahl Mitarbeiter (Standard: 20)')
+parser.add_argument('--days', type=int, default=20, help='Anzahl Tage (Standard: 20)')
+parser.add_argument('--locations', type=int, default=6, help='Anzahl Locations (Standard: 6)')
+parser.add_argument('--clp-share', type=float, default=0.5,
+                    help='Anteil AvailDays mit CombinationLocationsPossible (Standard: 0.5)')
+args = parser.parse_args()
+
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.constraints.different_casts_same_day import DifferentCastsSameDayConstraint
+from sat_solver.constraints.registry import ConstraintRegistry
+
+TIMES_OF_DAY = (
+    SimpleNamespace(name='vormittags', start=datetime.time(8), end=datetime.time(12)),
+    SimpleNamespace(name='abends', start=datetime.time(18), end=datetime.time(22)),
+)
+
+
+def build_entities(model: cp_model.CpModel) -> SimpleNamespace:
+    locations = [SimpleNamespace(id=uuid.uuid4()) for _ in range(args.locations)]
+    clp = SimpleNamespace(prep_delete=None, locations_of_work=locations[:2],
+                          time_span_between=datetime.timedelta(hours=1))
+    event_groups, avail_day_groups, shift_vars = {}, {}, {}
+    days = [datetime.date(2026, 1, 1) + datetime.timedelta(days=i) for i in range(args.days)]
+
+    for day in days:
+        for time_of_day in TIMES_OF_DAY:
+            for location in locations:
+                event_groups[uuid.uuid4()] = SimpleNamespace(event=SimpleNamespace(
+                    date=day, time_of_day=time_of_day,
+                    location_plan_period=SimpleNamespace(location_of_work=location)))
+
+    clp_counter = itertools.count()
+    for _ in range(args.persons):
+        app = SimpleNamespace(id=uuid.uuid4())
+        for day in days:
+            for time_of_day in TIMES_OF_DAY:
+                with_clp = next(clp_counter) % 100 < args.clp_share * 100
+                adg_id = uuid.uuid4()
+                avail_day_groups[adg_id] = SimpleNamespace(avail_day=SimpleNamespace(
+                    id=uuid.uuid4(), actor_plan_period=app,
+                    combination_locations_possibles=[clp] if with_clp else []))
+                for eg_id, event_group in event_groups.items():
+                    if event_group.event.date == day and event_group.event.time_of_day is time_of_day:
+                        shift_vars[(adg_id, eg_id)] = model.NewBoolVar('')
+
+    return SimpleNamespace(
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+        event_groups_with_event=event_groups,
+        avail_day_groups_with_avail_day=avail_day_groups,
+    )
+
+
+def apply_pairwise(constraint: DifferentCastsSameDayConstraint) -> None:
+    """Referenz: Formulierung vor dem Clique-Encoding."""
+    for dict_app in constraint._build_date_shift_var_dict().values():
+        for dict_location_id in dict_app.values():
+            if len(dict_location_id) <= 1:
+                continue
+            for loc_pair in itertools.combinations(list(dict_location_id.values()), 2):
+                for (key_1, var_1), (key_2, var_2) in itertools.product(*loc_pair):
+                    if not constraint._comb_locations_possible(*key_1, *key_2):
+                        constraint.model.Add(var_1 + var_2 <= 1)
+
+
+def measure(label: str, apply) -> None:
+    model = cp_model.CpModel()
+    entities = build_entities(model)
+    constraint = ConstraintRegistry(entities, model, SolverConfig()).register(DifferentCastsSameDayConstraint)
+    num_before = len(model.Proto().constraints)
+
+    t0 = time.perf_counter()
+    apply(constraint)
+    t_build = time.perf_counter() - t0
+
+    solver = cp_model.CpSolver()
+    solver.parameters.stop_after_presolve = True
+    solver.parameters.num_workers = 1
+    t0 = time.perf_counter()
+    solver.Solve(model)
+    t_presolve = time.perf_counter() - t0
+
+    print(f"  {label:<8} Aufbau: {t_build * 1000:8.1f} ms   "
+          f"Constraints: {len(model.Proto().constraints) - num_before:7d}   "
+          f"Presolve: {t_presolve * 1000:8.1f} ms")
+
+
+print(f"\n{args.persons} Mitarbeiter, {args.days} Tage, {args.locations} Locations, "
+      f"CLP-Anteil {args.clp_share:.0%}")
+print("=" * 70)
+measure("Paare", apply_pairwise)
+measure("Cliquen", DifferentCastsSameDayConstraint.apply)
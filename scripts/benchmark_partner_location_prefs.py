@@ -0,0 +1,157 @@
+"""
+Benchmark: Modellgröße und Lösungszeit von PartnerLocationPrefsConstraint
+(synthetische Daten, keine DB).
+
+N Mitarbeiter, E Events (Besetzungsstärke 2–3) an L Locations, jeder
+Mitarbeiter für jedes Event verfügbar. Jeder Mitarbeiter hat P
+Partner-Präferenzen (zufällige Partner/Locations/Scores). Verglichen werden:
+
+- "Alle Duos": Referenz wie vor der Umstellung (pro Duo mit Präferenzen
+               drei Hilfsvariablen und drei AddMultiplicationEquality)
+- "Präferenz": PartnerLocationPrefsConstraint.apply() — Variablen nur für
+               Duos mit Gewicht ≠ 0
+
+Ausführen:
+    uv run python scripts/benchmark_partner_location_prefs.py
+    uv run python scripts/benchmark_partner_location_prefs.py --persons 40 --events 60 --prefs 3
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+parser = argparse.ArgumentParser(description='Modellgröße der Partner-Präferenzen messen')
+parser.add_argument('--persons', type=int, default=30, help='Anzahl Mitarbeiter (Standard: 30)')
+parser.add_argument('--events', type=int, default=40, help='Anzahl Events (Standard: 40)')
+parser.add_argument('--locations', type=int, default=4, help='Anzahl Locations (Standard: 4)')
+parser.add_argument('--prefs', type=int, default=2, help='Präferenzen pro Mitarbeiter (Standard: 2)')
+parser.add_argument('--time-limit', type=float, default=30.0, help='Max. Lösungszeit in s (Standard: 30)')
+parser.add_argument('--seed', type=int, default=1)
+args = parser.parse_args()
+
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.constraints.partner_location_prefs import PartnerLocationPrefsConstraint
+from sat_solver.constraints.registry import ConstraintRegistry
+
+SCORES = (0, 0.5, 1.5, 2)
+
+
+def build_data() -> tuple[dict, dict]:
+    rng = random.Random(args.seed)
+    locations = [SimpleNamespace(id=uuid.uuid4(), name=f'Ort {i}') for i in range(args.locations)]
+    persons = [SimpleNamespace(id=uuid.uuid4(), f_name=f'P{i}') for i in range(args.persons)]
+    prefs = {
+        person.id: [SimpleNamespace(partner=partner, location_of_work=rng.choice(locations), score=rng.choice(SCORES))
+                    for partner in rng.sample([p for p in persons if p is not person], args.prefs)]
+        for person in persons
+    }
+    events = {
+        uuid.uuid4(): SimpleNamespace(event=SimpleNamespace(
+            date=date(2026, 1, 1) + timedelta(days=i), time_of_day=SimpleNamespace(name='abends'),
+            location_plan_period=SimpleNamespace(location_of_work=locations[i % len(locations)]),
+            cast_group=SimpleNamespace(nr_actors=2 + i % 2)))
+        for i in range(args.events)
+    }
+    avail_day_groups = {}
+    for person in persons:
+        app = SimpleNamespace(id=uuid.uuid4(), person=person)
+        for eg_id in events:
+            adg_id = uuid.uuid4()
+            avail_day_groups[adg_id] = SimpleNamespace(avail_day_group_id=adg_id, _eg_id=eg_id, avail_day=SimpleNamespace(
+                actor_plan_period=app, actor_partner_location_prefs_defaults=prefs[person.id]))
+    return events, avail_day_groups
+
+
+def build_entities(model: cp_model.CpModel, events: dict, avail_day_groups: dict) -> SimpleNamespace:
+    shift_vars = {(adg_id, adg._eg_id): model.NewBoolVar('') for adg_id, adg in avail_day_groups.items()}
+    event_group_vars = {eg_id: model.NewConstant(1) for eg_id in events}
+    for eg_id, event_group in events.items():
+        model.Add(sum(var for (_, e), var in shift_vars.items() if e == eg_id)
+                  == event_group.event.cast_group.nr_actors)
+    return SimpleNamespace(
+        event_groups_with_event=events,
+        avail_day_groups_with_avail_day=avail_day_groups,
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+        event_group_vars=event_group_vars,
+    )
+
+
+def apply_all_duos(constraint: PartnerLocationPrefsConstraint) -> None:
+    """Referenz: Formulierung vor der Umstellung (ohne f-String-Namen)."""
+    model, entities = constraint.model, constraint.entities
+    multipliers = constraint.config.constraints_multipliers.sliders_partner_loc_prefs
+    for eg_id, event_group in entities.event_groups_with_event.items():
+        nr_actors = event_group.event.cast_group.nr_actors
+        adgs = [adg for adg_id, adg in entities.avail_day_groups_with_avail_day.items()
+                if entities.shifts_exclusive.get((adg_id, eg_id))]
+        location_id = event_group.event.location_plan_period.location_of_work.id
+        for adg_0, adg_1 in itertools.combinations(adgs, 2):
+            if not (adg_0.avail_day.actor_partner_location_prefs_defaults
+                    or adg_1.avail_day.actor_partner_location_prefs_defaults):
+                continue
+            if adg_0.avail_day.actor_plan_period.id == adg_1.avail_day.actor_plan_period.id:
+                continue
+            scores = [
+                next((plp.score for plp in a.avail_day.actor_partner_location_prefs_defaults
+                      if plp.partner.id == b.avail_day.actor_plan_period.person.id
+                      and plp.location_of_work.id == location_id), 1)
+                for a, b in ((adg_0, adg_1), (adg_1, adg_0))
+            ]
+            penalty_var = model.NewIntVar(multipliers[2] * 2, multipliers[0] * 2, '')
+            constraint.penalty_vars.append(penalty_var)
+            weight_var = model.NewIntVar(multipliers[2] * 2, multipliers[0] * 2, '')
+            model.Add(weight_var == round((multipliers[scores[0]] + multipliers[scores[1]]) / (nr_actors - 1)))
+            shift_active_var = model.NewBoolVar('')
+            model.AddMultiplicationEquality(shift_active_var, [entities.shift_vars[(adg_0.avail_day_group_id, eg_id)],
+                                                               entities.shift_vars[(adg_1.avail_day_group_id, eg_id)]])
+            all_active_var = model.NewBoolVar('')
+            model.AddMultiplicationEquality(all_active_var, [shift_active_var, entities.event_group_vars[eg_id]])
+            model.AddMultiplicationEquality(penalty_var, [weight_var, all_active_var])
+            if not (scores[0] and scores[1]) and nr_actors < 3:
+                model.Add(entities.shift_vars[(adg_0.avail_day_group_id, eg_id)]
+                          + entities.shift_vars[(adg_1.avail_day_group_id, eg_id)] < 2)
+
+
+def measure(label: str, apply, events: dict, avail_day_groups: dict) -> None:
+    model = cp_model.CpModel()
+    entities = build_entities(model, events, avail_day_groups)
+    constraint = ConstraintRegistry(entities, model, SolverConfig()).register(PartnerLocationPrefsConstraint)
+    num_vars, num_constraints = len(model.Proto().variables), len(model.Proto().constraints)
+
+    t0 = time.perf_counter()
+    apply(constraint)
+    t_build = time.perf_counter() - t0
+    model.Minimize(sum(constraint.penalty_vars))
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = args.time_limit
+    t0 = time.perf_counter()
+    status = solver.Solve(model)
+    t_solve = time.perf_counter() - t0
+
+    print(f"  {label:<10} Aufbau: {t_build * 1000:7.1f} ms   "
+          f"Vars: {len(model.Proto().variables) - num_vars:6d}   "
+          f"Constraints: {len(model.Proto().constraints) - num_constraints:6d}   "
+          f"Lösung: {t_solve:6.2f} s ({solver.StatusName(status)}, Objective {solver.ObjectiveValue():.0f})")
+
+
+events, avail_day_groups = build_data()
+print(f"\n{args.persons} Mitarbeiter, {args.events} Events, {args.locations} Locations, "
+      f"{args.prefs} Präferenzen pro Mitarbeiter")
+print("=" * 70)
+measure("Alle Duos", apply_all_duos, events, avail_day_groups)
+measure("Präferenz", PartnerLocationPrefsConstraint.apply, events, avail_day_groups)
@@ -0,0 +1,96 @@
+"""
+Benchmark: PlanShow als normales vs. normalisiertes JSON (database.wire_format).
+
+Lädt einen Plan (Standard: der Plan mit den meisten Appointments im Team)
+und misst für beide Formate
+- Payload-Größe (JSON-Bytes, wie sie über die Desktop-API gehen),
+- Kodieren auf dem Server (Schema → JSON-Text),
+- Dekodieren im Client (JSON-Text → PlanShow),
+- Speicher der dekodierten Objekte (tracemalloc) und Anzahl verschiedener
+  Person-Objekte als Maß für das Teilen.
+
+Ausführen:
+    uv run python scripts/benchmark_plan_wire_format.py --team "Baden-Württemberg"
+    uv run python scripts/benchmark_plan_wire_format.py --plan-name "01.06.26-30.06.26 (01)" --repeats 10
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='PlanShow: normales vs. normalisiertes JSON')
+parser.add_argument('--team', default='Baden-Württemberg', help='Team-Name (Standard: Baden-Württemberg)')
+parser.add_argument('--plan-name', help='Plan-Name (Standard: größter Plan des Teams)')
+parser.add_argument('--repeats', type=int, default=5, help='Wiederholungen pro Messung (Standard: 5)')
+args = parser.parse_args()
+
+# ── Projekt-Imports ────────────────────────────────────────────────────────────
+from database import db_services, schemas, wire_format
+
+# ── Plan suchen ────────────────────────────────────────────────────────────────
+if args.plan_name:
+    plan = db_services.Plan.get_from__name(args.plan_name)
+else:
+    team = next((t for project in db_services.Project.get_all()
+                 for t in db_services.Team.get_all_from__project(project.id)
+                 if args.team.lower() in t.name.lower()), None)
+    plans = db_services.Plan.get_all_from__team(team.id) if team else []
+    plan = max(plans, key=lambda p: len(p.appointments), default=None)
+if plan is None:
+    print("FEHLER: Kein Plan gefunden (--team / --plan-name prüfen).")
+    sys.exit(1)
+
+print(f"\nPlan: {plan.name}   Appointments: {len(plan.appointments)}   "
+      f"AvailDays: {sum(len(a.avail_days) for a in plan.appointments)}")
+print("=" * 70)
+
+
+def _median_ms(func) -> float:
+    times = []
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _decoded_size(decode) -> tuple[int, schemas.PlanShow]:
+    gc.collect()
+    tracemalloc.start()
+    decoded = decode()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, decoded
+
+
+formats = {
+    'normal': (lambda: plan.model_dump_json(),
+               lambda text: schemas.PlanShow.model_validate_json(text)),
+    'normalisiert': (lambda: json.dumps(wire_format.encode(plan)),
+                     lambda text: wire_format.decode(json.loads(text), schemas.PlanShow)),
+}
+
+print(f"  {'Format':<13} {'Payload':>10} {'Kodieren':>10} {'Dekodieren':>11} {'Speicher':>10} {'Personen':>9}")
+for label, (encode, decode) in formats.items():
+    text = encode()
+    encode_ms = _median_ms(encode)
+    decode_ms = _median_ms(lambda: decode(text))
+    memory, decoded = _decoded_size(lambda: decode(text))
+    persons = len({id(ad.actor_plan_period.person) for a in decoded.appointments for ad in a.avail_days})
+    print(f"  {label:<13} {len(text.encode()) / 1024:>7.1f} KiB {encode_ms:>7.1f} ms {decode_ms:>8.1f} ms "
+          f"{memory / 1024:>6.0f} KiB {persons:>9d}")
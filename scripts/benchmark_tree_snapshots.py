@@ -0,0 +1,114 @@
+"""
+Benchmark: Aufbau der Solver-Bäume mit und ohne Snapshot-Cache.
+
+Simuliert wiederholte Berechnungen derselben Planperiode (solve → test_plan →
+solve …) und vergleicht pro Durchlauf die Baukosten von EventGroupTree,
+AvailDayGroupTree und CastGroupTree:
+
+- "neu":      Konstruktor direkt (Batch-Queries bei jedem Aufruf — alter Pfad)
+- "snapshot": get_*_tree() über `sat_solver.tree_snapshot` (erster Aufruf baut,
+              danach nur noch anytree-Sicht aus dem Snapshot)
+
+Ausführen:
+    uv run python scripts/benchmark_tree_snapshots.py
+    uv run python scripts/benchmark_tree_snapshots.py --plan-period-start 2026-06-01 --team "Baden-Württemberg"
+    uv run python scripts/benchmark_tree_snapshots.py --repeats 20
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import time
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Baukosten der Solver-Bäume messen')
+parser.add_argument('--plan-period-start', default='2026-06-01',
+                    help='Start-Datum der Planperiode (Standard: 2026-06-01)')
+parser.add_argument('--team', default='Baden-Württemberg',
+                    help='Team-Name (Standard: Baden-Württemberg)')
+parser.add_argument('--repeats', type=int, default=10,
+                    help='Anzahl simulierter Berechnungen (Standard: 10)')
+args = parser.parse_args()
+
+# ── Projekt-Imports ────────────────────────────────────────────────────────────
+from database import db_services
+from database.db_services import plan_period as pp_svc
+from sat_solver.avail_day_group_tree import AvailDayGroupTree, get_avail_day_group_tree
+from sat_solver.cast_group_tree import CastGroupTree, get_cast_group_tree
+from sat_solver.event_group_tree import EventGroupTree, get_event_group_tree
+from sat_solver.tree_snapshot import tree_snapshot_cache
+
+# ── Planperiode suchen ─────────────────────────────────────────────────────────
+try:
+    target_start = datetime.date.fromisoformat(args.plan_period_start)
+except ValueError:
+    print(f"FEHLER: Ungültiges Datum '{args.plan_period_start}'. Format: YYYY-MM-DD")
+    sys.exit(1)
+
+plan_period = next(
+    (pp for project in db_services.Project.get_all()
+     for pp in db_services.PlanPeriod.get_all_from__project(project.id)
+     if not pp.prep_delete and pp.start == target_start and args.team.lower() in pp.team.name.lower()),
+    None,
+)
+if plan_period is None:
+    print(f"FEHLER: Keine Planperiode mit Start {target_start} für Team '{args.team}' gefunden.")
+    sys.exit(1)
+
+lpp_ids, app_ids = pp_svc.get_lpp_and_app_ids(plan_period.id)
+print(f"\nPlanperiode: {plan_period.start} – {plan_period.end}  [Team: {plan_period.team.name}]")
+print(f"  LocationPlanPeriods: {len(lpp_ids)}, ActorPlanPeriods: {len(app_ids)}")
+print("=" * 70)
+
+
+def _build_fresh() -> tuple[float, float, float]:
+    t0 = time.perf_counter()
+    EventGroupTree(lpp_ids)
+    t1 = time.perf_counter()
+    AvailDayGroupTree(app_ids)
+    t2 = time.perf_counter()
+    CastGroupTree(plan_period.id)
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2
+
+
+def _build_snapshot() -> tuple[float, float, float]:
+    t0 = time.perf_counter()
+    get_event_group_tree(plan_period.id, lpp_ids)
+    t1 = time.perf_counter()
+    get_avail_day_group_tree(plan_period.id, app_ids)
+    t2 = time.perf_counter()
+    get_cast_group_tree(plan_period.id)
+    t3 = time.perf_counter()
+    return t1 - t0, t2 - t1, t3 - t2
+
+
+def _report(label: str, timings: list[tuple[float, float, float]]) -> float:
+    print(f"\n{label}")
+    for name, col in zip(('EventGroupTree', 'AvailDayGroupTree', 'CastGroupTree'), zip(*timings)):
+        ms = [t * 1000 for t in col]
+        print(f"  {name:<18} erster: {ms[0]:8.1f} ms   Median danach: "
+              f"{statistics.median(ms[1:]) if len(ms) > 1 else ms[0]:8.1f} ms   Summe: {sum(ms):9.1f} ms")
+    total = sum(sum(t) for t in timings) * 1000
+    print(f"  {'GESAMT':<18} {total:.1f} ms über {len(timings)} Berechnungen")
+    return total
+
+
+tree_snapshot_cache.clear()
+total_fresh = _report("Ohne Snapshot (Neubau pro Berechnung):", [_build_fresh() for _ in range(args.repeats)])
+total_snapshot = _report("Mit Snapshot-Cache:", [_build_snapshot() for _ in range(args.repeats)])
+
+print(f"\nCache: {tree_snapshot_cache.stats()}")
+if total_snapshot:
+    print(f"Faktor: {total_fresh / total_snapshot:.1f}x")
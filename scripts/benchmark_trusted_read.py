@@ -0,0 +1,113 @@
+"""
+Benchmark: model_validate vs. db_services._trusted_read für die schwersten Lesewege.
+
+Lädt die ORM-Graphen einmal (Eager-Loading wie in db_services) und misst nur
+die Konvertierung ORM → Schema, getrennt vom SQL:
+- Plan → PlanShow (größter Plan des Teams bzw. --plan-name)
+- PlanPeriod → PlanPeriodShow (Planperiode dieses Plans)
+- AvailDays der Planperiode → AvailDayShow
+
+Mit --profile wird jede Variante zusätzlich unter cProfile ausgeführt und die
+teuersten Funktionen (kumulierte Zeit) ausgegeben.
+
+Ausführen:
+    uv run python scripts/benchmark_trusted_read.py --team "Baden-Württemberg"
+    uv run python scripts/benchmark_trusted_read.py --plan-name "01.06.26-30.06.26 (01)" --repeats 20 --profile
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import statistics
+import sys
+import time
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='ORM → Schema: model_validate vs. _trusted_read')
+parser.add_argument('--team', default='Baden-Württemberg', help='Team-Name (Standard: Baden-Württemberg)')
+parser.add_argument('--plan-name', help='Plan-Name (Standard: größter Plan des Teams)')
+parser.add_argument('--repeats', type=int, default=10, help='Wiederholungen pro Messung (Standard: 10)')
+parser.add_argument('--profile', action='store_true', help='cProfile-Auszug pro Variante ausgeben')
+parser.add_argument('--top', type=int, default=12, help='Zeilen im cProfile-Auszug (Standard: 12)')
+args = parser.parse_args()
+
+# ── Projekt-Imports ────────────────────────────────────────────────────────────
+from sqlmodel import select
+
+from database import db_services, models, schemas
+from database.database import get_session
+from database.db_services._eager_loading import avail_day_show_options, plan_period_show_options, plan_show_options
+from database.db_services._trusted_read import to_schema, to_schemas
+
+# ── Plan suchen ────────────────────────────────────────────────────────────────
+if args.plan_name:
+    plan_id = getattr(db_services.Plan.get_from__name(args.plan_name, minimal=True), 'id', None)
+else:
+    team = next((t for project in db_services.Project.get_all()
+                 for t in db_services.Team.get_all_from__project(project.id)
+                 if args.team.lower() in t.name.lower()), None)
+    plans = db_services.Plan.get_all_from__team(team.id) if team else []
+    plan_id = max(plans, key=lambda p: len(p.appointments)).id if plans else None
+if plan_id is None:
+    print("FEHLER: Kein Plan gefunden (--team / --plan-name prüfen).")
+    sys.exit(1)
+
+
+def _median_ms(func) -> float:
+    times = []
+    for _ in range(args.repeats):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def _profile(label: str, func) -> None:
+    profiler = cProfile.Profile()
+    profiler.runcall(func)
+    print(f"\n── cProfile: {label} " + "─" * max(0, 56 - len(label)))
+    pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(args.top)
+
+
+with get_session() as session:
+    plan = session.exec(select(models.Plan).where(models.Plan.id == plan_id)
+                        .options(*plan_show_options())).unique().one()
+    plan_period = session.exec(select(models.PlanPeriod).where(models.PlanPeriod.id == plan.plan_period_id)
+                               .options(*plan_period_show_options())).unique().one()
+    avail_days = session.exec(select(models.AvailDay).join(models.ActorPlanPeriod)
+                              .where(models.ActorPlanPeriod.plan_period_id == plan.plan_period_id)
+                              .options(*avail_day_show_options())).unique().all()
+    # Lazy-Loads außerhalb der Messung auslösen
+    schemas.PlanPeriodShow.model_validate(plan_period)
+
+    cases = {
+        'PlanShow': (lambda: schemas.PlanShow.model_validate(plan),
+                     lambda: to_schema(schemas.PlanShow, plan)),
+        'PlanPeriodShow': (lambda: schemas.PlanPeriodShow.model_validate(plan_period),
+                           lambda: to_schema(schemas.PlanPeriodShow, plan_period)),
+        f'AvailDayShow ×{len(avail_days)}': (
+            lambda: [schemas.AvailDayShow.model_validate(ad) for ad in avail_days],
+            lambda: to_schemas(schemas.AvailDayShow, avail_days)),
+    }
+
+    print(f"\nPlan: {plan.name}   Appointments: {len(plan.appointments)}   Wiederholungen: {args.repeats}")
+    print("=" * 70)
+    print(f"  {'Schema':<24} {'model_validate':>15} {'_trusted_read':>14} {'Faktor':>8}")
+    for label, (validate, trusted) in cases.items():
+        validate_ms, trusted_ms = _median_ms(validate), _median_ms(trusted)
+        print(f"  {label:<24} {validate_ms:>12.1f} ms {trusted_ms:>11.1f} ms {validate_ms / trusted_ms:>7.1f}×")
+
+    if args.profile:
+        for label, (validate, trusted) in cases.items():
+            _profile(f'{label} / model_validate', validate)
+            _profile(f'{label} / _trusted_read', trusted)
@@ -0,0 +1,94 @@
+"""
+Benchmark: Model-Aufbau mit und ohne Debug-Variablen-Namen.
+
+Baut für eine Planperiode das komplette Solver-Model (create_vars +
+create_constraints) mehrfach auf — einmal im Produktions-Modus (leere Namen),
+einmal im Debug-Modus (wie bei log_search_process / debug_var_names) — und
+vergleicht Aufbauzeit und Gesamtlänge der Variablen-Namen im Proto.
+
+Ausführen:
+    uv run python scripts/benchmark_var_naming.py
+    uv run python scripts/benchmark_var_naming.py --plan-period-start 2026-06-01 --team "Baden-Württemberg"
+    uv run python scripts/benchmark_var_naming.py --repeats 5
+"""
+
+import argparse
+import datetime
+import os
+import statistics
+import sys
+import time
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Model-Aufbau mit/ohne Debug-Namen messen')
+parser.add_argument('--plan-period-start', default='2026-06-01',
+                    help='Start-Datum der Planperiode (Standard: 2026-06-01)')
+parser.add_argument('--team', default='Baden-Württemberg',
+                    help='Team-Name (Standard: Baden-Württemberg)')
+parser.add_argument('--repeats', type=int, default=3,
+                    help='Anzahl Aufbauten pro Modus (Standard: 3)')
+args = parser.parse_args()
+
+# ── Projekt-Imports ────────────────────────────────────────────────────────────
+from ortools.sat.python import cp_model
+
+from database import db_services
+from database.db_services import plan_period as pp_svc
+from sat_solver.avail_day_group_tree import get_avail_day_group_tree
+from sat_solver.cast_group_tree import get_cast_group_tree
+from sat_solver.data_loading import create_data_models
+from sat_solver.event_group_tree import get_event_group_tree
+from sat_solver.solve_context import solve_context
+from sat_solver.solver_main import create_constraints, create_vars
+
+# ── Planperiode suchen ─────────────────────────────────────────────────────────
+try:
+    target_start = datetime.date.fromisoformat(args.plan_period_start)
+except ValueError:
+    print(f"FEHLER: Ungültiges Datum '{args.plan_period_start}'. Format: YYYY-MM-DD")
+    sys.exit(1)
+
+plan_period = next(
+    (pp for project in db_services.Project.get_all()
+     for pp in db_services.PlanPeriod.get_all_from__project(project.id)
+     if not pp.prep_delete and pp.start == target_start and args.team.lower() in pp.team.name.lower()),
+    None,
+)
+if plan_period is None:
+    print(f"FEHLER: Keine Planperiode mit Start {target_start} für Team '{args.team}' gefunden.")
+    sys.exit(1)
+
+lpp_ids, app_ids = pp_svc.get_lpp_and_app_ids(plan_period.id)
+event_group_tree = get_event_group_tree(plan_period.id, lpp_ids)
+avail_day_group_tree = get_avail_day_group_tree(plan_period.id, app_ids)
+cast_group_tree = get_cast_group_tree(plan_period.id)
+print(f"\nPlanperiode: {plan_period.start} – {plan_period.end}  [Team: {plan_period.team.name}]")
+print("=" * 70)
+
+
+def _build(debug_names: bool) -> tuple[float, int, int]:
+    with solve_context() as context:
+        entities = create_data_models(event_group_tree, avail_day_group_tree, cast_group_tree, plan_period.id)
+        model = cp_model.CpModel()
+        t0 = time.perf_counter()
+        context.reset_model_state(debug_names)
+        create_vars(model, event_group_tree, avail_day_group_tree, entities)
+        create_constraints(model, entities)
+        elapsed = time.perf_counter() - t0
+    proto = model.Proto()
+    return elapsed, len(proto.variables), sum(len(var.name) for var in proto.variables)
+
+
+for label, debug_names in (("Produktion (ohne Namen)", False), ("Debug (mit Namen)", True)):
+    runs = [_build(debug_names) for _ in range(args.repeats)]
+    print(f"  {label:<24} Aufbau Median: {statistics.median(r[0] for r in runs) * 1000:8.1f} ms   "
+          f"Variablen: {runs[0][1]:7d}   Namen: {runs[0][2] / 1024:8.1f} KiB")
@@ -0,0 +1,183 @@
+"""
+Lasttest der Verfügbarkeitsmaske: Deadline-Tag einer Planperiode.
+
+Kurz vor einer Deadline öffnen alle Mitarbeiter der Planperiode gleichzeitig
+`/availability` und tragen nebenbei Verfügbarkeiten ein. Simuliert wird das
+direkt gegen die Datenbank (ohne HTTP/Login): --threads Worker rufen für
+zufällige Personen der Planperiode den Datenpfad der Seite auf, parallel
+invalidieren simulierte Eintragungen (--mutations pro Sekunde) die
+Zusammenfassung einzelner Personen — die fachlichen Daten bleiben unverändert.
+
+Gemessen werden pro Pfad Seitenaufrufe/s, p50/p95/p99-Latenz und SQL-Abfragen
+pro Seitenaufruf:
+- legacy:  get_teams_for_person + get_open_plan_periods_for_person +
+           build_availability_view (zählt Sidebar-Stats selbst)
+- summary: web_api.availability.summary (eine Abfrage für Teams, Perioden
+           und Stats; Neuberechnung nur nach Invalidierung)
+
+Ausführen:
+    uv run python scripts/load_test_availability.py --plan-period-id <UUID>
+    uv run python scripts/load_test_availability.py --plan-period-id <UUID> --threads 50 --duration 30
+    uv run python scripts/load_test_availability.py --plan-period-id <UUID> --mode summary --mutations 20
+
+Setzt die Tabelle `availability_summary` voraus (alembic upgrade head).
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Verfügbarkeitsmaske am Deadline-Tag unter Last setzen')
+parser.add_argument('--plan-period-id', required=True, type=uuid.UUID,
+                    help='Planperiode, deren Mitarbeiter die Seite aufrufen')
+parser.add_argument('--mode', choices=('legacy', 'summary', 'both'), default='both',
+                    help='Zu messender Datenpfad (Standard: both)')
+parser.add_argument('--threads', type=int, default=20,
+                    help='Gleichzeitige Seitenaufrufe (Standard: 20, max. Pool-Größe beachten)')
+parser.add_argument('--duration', type=float, default=20.0,
+                    help='Testdauer pro Pfad in Sekunden (Standard: 20)')
+parser.add_argument('--mutations', type=float, default=5.0,
+                    help='Simulierte Eintragungen pro Sekunde (Standard: 5)')
+args = parser.parse_args()
+
+from sqlalchemy import event, select as sa_select
+from sqlmodel import Session
+
+from database.database import engine
+from database.models import ActorPlanPeriod
+from web_api.availability import service, summary
+
+_local = threading.local()
+
+
+@event.listens_for(engine, 'before_cursor_execute')
+def _count_query(*_args) -> None:
+    _local.queries = getattr(_local, 'queries', 0) + 1
+
+
+def _legacy_page_view(session: Session, person_id: uuid.UUID) -> None:
+    teams = service.get_teams_for_person(session, person_id)
+    team_id = teams[0].team_id if teams else None
+    open_periods = service.get_open_plan_periods_for_person(session, person_id, team_id=team_id)
+    if open_periods:
+        service.build_availability_view(session, person_id, open_periods[0], teams=teams,
+                                        selected_team_id=team_id, open_periods=open_periods)
+
+
+def _summary_page_view(session: Session, person_id: uuid.UUID) -> None:
+    summaries = summary.load_summaries(session, person_id)
+    teams = summary.teams_from_summaries(summaries)
+    team_id = teams[0].team_id if teams else None
+    open_periods = summary.open_periods_from_summaries(summaries, team_id)
+    if open_periods:
+        active = open_periods[0]
+        service.build_availability_view(
+            session, person_id, active, teams=teams, selected_team_id=team_id, open_periods=open_periods,
+            sidebar_stats=summary.stats_from_summaries(summaries, active.actor_plan_period_id))
+
+
+def _viewer(page_view, person_ids: list[uuid.UUID], deadline: float,
+            latencies: list[float], queries: list[int], errors: list[str]) -> None:
+    while time.perf_counter() < deadline:
+        person_id = random.choice(person_ids)
+        _local.queries = 0
+        t0 = time.perf_counter()
+        try:
+            with Session(engine) as session:
+                page_view(session, person_id)
+                session.commit()
+        except Exception as exc:  # noqa: BLE001 — Lasttest zählt Fehler, bricht nicht ab
+            errors.append(type(exc).__name__)
+            continue
+        latencies.append(time.perf_counter() - t0)
+        queries.append(_local.queries)
+
+
+def _mutator(person_ids: list[uuid.UUID], deadline: float, counter: list[int]) -> None:
+    """Simuliert Eintragungen: invalidiert die Zusammenfassung einer Person
+    genau so, wie es der Commit-Listener nach einer AvailDay-Änderung tut."""
+    if args.mutations <= 0:
+        return
+    while time.perf_counter() < deadline:
+        time.sleep(random.expovariate(args.mutations))
+        with engine.begin() as connection:
+            summary.invalidate_persons(connection, [random.choice(person_ids)])
+        counter[0] += 1
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run(label: str, page_view, person_ids: list[uuid.UUID]) -> None:
+    with engine.begin() as connection:
+        summary.invalidate_persons(connection, person_ids)  # kalter Start für beide Pfade
+
+    latencies: list[float] = []
+    queries: list[int] = []
+    errors: list[str] = []
+    mutations = [0]
+    start = time.perf_counter()
+    deadline = start + args.duration
+    threads = [threading.Thread(target=_viewer, args=(page_view, person_ids, deadline, latencies, queries, errors))
+               for _ in range(args.threads)]
+    threads.append(threading.Thread(target=_mutator, args=(person_ids, deadline, mutations)))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    if not latencies:
+        print(f'{label:<9} keine erfolgreichen Seitenaufrufe ({len(errors)} Fehler)')
+        return
+    print(f'{label:<9}{len(latencies):>8}{len(latencies) / elapsed:>9.1f}{len(errors):>8}{mutations[0]:>10}'
+          f'{statistics.mean(queries):>9.1f}{max(queries):>7}'
+          f'{statistics.median(latencies) * 1000:>9.1f}'
+          f'{_percentile(latencies, 95) * 1000:>9.1f}'
+          f'{_percentile(latencies, 99) * 1000:>9.1f}')
+    if errors:
+        print(f'          Fehler: {dict(Counter(errors))}')
+
+
+def main() -> None:
+    with Session(engine) as session:
+        person_ids = list(session.execute(
+            sa_select(ActorPlanPeriod.person_id)
+            .where(ActorPlanPeriod.plan_period_id == args.plan_period_id)
+            .distinct()
+        ).scalars())
+    if not person_ids:
+        print('FEHLER: keine Mitarbeiter in dieser Planperiode.')
+        sys.exit(1)
+
+    print(f'\n{len(person_ids)} Mitarbeiter, {args.threads} Threads, {args.duration:.0f} s je Pfad, '
+          f'{args.mutations:g} Eintragungen/s\n')
+    print(f'{"Pfad":<9}{"Aufrufe":>8}{"pro s":>9}{"Fehler":>8}{"Invalid.":>10}'
+          f'{"SQL Ø":>9}{"max":>7}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}')
+    if args.mode in ('legacy', 'both'):
+        _run('legacy', _legacy_page_view, person_ids)
+    if args.mode in ('summary', 'both'):
+        _run('summary', _summary_page_view, person_ids)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Lasttest der Connection-Pool-Profile (`database.pool`).
+
+Pro Profil wird eine eigene Engine erzeugt; --threads Worker leihen in einer
+Schleife eine Verbindung aus, führen eine kurze Abfrage aus und halten die
+Verbindung --hold-ms lang (simulierte Request-Arbeit), dazwischen
+--think-ms Pause. Zum Vergleich läuft das bisherige Setup als Profil
+``legacy`` mit (5 + 10 Verbindungen, ``pool_pre_ping=True``).
+
+Ausgegeben werden pro Profil: Checkouts/s, p50/p95/p99 der Checkout-
+Wartezeit, Timeouts, Idle-Pings und das Maximum gleichzeitig ausgeliehener
+Verbindungen. So lässt sich abschätzen, ab welcher Parallelität ein Profil
+sättigt und was der Ping bei jedem Checkout kostet.
+
+Ausführen:
+    uv run python scripts/load_test_db_pool.py
+    uv run python scripts/load_test_db_pool.py --threads 40 --duration 20 --hold-ms 30
+    uv run python scripts/load_test_db_pool.py --profiles legacy,web --database-url postgresql://...
+
+Ohne --database-url wird DATABASE_URL verwendet, sonst eine temporäre
+SQLite-Datei (dort gibt es keine Netzwerk-Round-Trips — aussagekräftig sind
+die Zahlen nur gegen Postgres).
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Connection-Pool-Profile unter Last vergleichen')
+parser.add_argument('--database-url', default=os.environ.get('DATABASE_URL'),
+                    help='Ziel-DB (Standard: DATABASE_URL, sonst temporäre SQLite-Datei)')
+parser.add_argument('--profiles', default='legacy,web,scheduler,desktop',
+                    help='Kommagetrennte Profile (Standard: legacy,web,scheduler,desktop)')
+parser.add_argument('--threads', type=int, default=30,
+                    help='Gleichzeitige Worker (Standard: 30)')
+parser.add_argument('--duration', type=float, default=10.0,
+                    help='Testdauer pro Profil in Sekunden (Standard: 10)')
+parser.add_argument('--hold-ms', type=float, default=20.0,
+                    help='Haltedauer einer Verbindung in ms (Standard: 20)')
+parser.add_argument('--think-ms', type=float, default=5.0,
+                    help='Pause zwischen zwei Checkouts eines Workers in ms (Standard: 5)')
+args = parser.parse_args()
+
+from sqlalchemy import create_engine, text
+from sqlalchemy import exc as sa_exc
+
+from database.pool import POOL_PROFILES, create_pooled_engine, pool_metrics_snapshot
+
+
+def _engine(profile_name: str, url: str):
+    connect_args = {'check_same_thread': False} if url.startswith('sqlite') else {}
+    if profile_name == 'legacy':
+        return create_engine(url, pool_size=5, max_overflow=10, pool_pre_ping=True, pool_timeout=30,
+                             pool_recycle=1800, connect_args=connect_args)
+    return create_pooled_engine(url, f'lt-{profile_name}', profile_name, POOL_PROFILES[profile_name],
+                                connect_args=connect_args)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run(profile_name: str, url: str) -> None:
+    engine = _engine(profile_name, url)
+    waits: list[float] = []
+    timeouts = [0]
+    in_use = [0, 0]                      # aktuell, Maximum
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker() -> None:
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            try:
+                connection = engine.connect()
+            except sa_exc.TimeoutError:
+                with lock:
+                    timeouts[0] += 1
+                continue
+            with lock:
+                waits.append(time.perf_counter() - t0)
+                in_use[0] += 1
+                in_use[1] = max(in_use)
+            try:
+                connection.execute(text('SELECT 1'))
+                time.sleep(args.hold_ms / 1000)
+            finally:
+                connection.close()
+                with lock:
+                    in_use[0] -= 1
+            time.sleep(args.think_ms / 1000)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+
+    pings = pool_metrics_snapshot().get(f'lt-{profile_name}', {}).get('pings', '–')
+    if not waits:
+        print(f'{profile_name:<10} keine erfolgreichen Checkouts ({timeouts[0]} Timeouts)')
+        return
+    print(f'{profile_name:<10}{len(waits) / elapsed:>10.1f}'
+          f'{statistics.median(waits) * 1000:>9.2f}'
+          f'{_percentile(waits, 95) * 1000:>9.2f}'
+          f'{_percentile(waits, 99) * 1000:>9.2f}'
+          f'{timeouts[0]:>10}{pings:>7}{in_use[1]:>11}')
+
+
+def main() -> None:
+    url = args.database_url
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'pool_load_test.sqlite')}"
+    profiles = [p.strip() for p in args.profiles.split(',') if p.strip()]
+    unknown = [p for p in profiles if p != 'legacy' and p not in POOL_PROFILES]
+    if unknown:
+        print(f'FEHLER: unbekannte Profile {unknown} (erlaubt: legacy, {", ".join(POOL_PROFILES)})')
+        sys.exit(1)
+
+    print(f'\n{args.threads} Worker, {args.duration:.0f} s je Profil, '
+          f'Haltedauer {args.hold_ms:g} ms, Pause {args.think_ms:g} ms\n')
+    print(f'{"Profil":<10}{"Checkout/s":>10}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}'
+          f'{"Timeouts":>10}{"Pings":>7}{"max Verb.":>11}')
+    for profile_name in profiles:
+        _run(profile_name, url)
+
+
+if __name__ == '__main__':
+    main()
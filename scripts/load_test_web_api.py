@@ -0,0 +1,160 @@
+"""
+Lasttest für die Web-API: viele gleichzeitige, simulierte Mitarbeiter.
+
+Jeder simulierte Mitarbeiter loggt sich einmal ein (JSON-Login → Bearer-Token)
+und ruft danach in einer Schleife eine Mischung aus Endpoints auf — so wie
+ein Browser-Tab mit Inbox-Badge-Polling, Kalender-Navigation und gelegentlich
+einer schweren Seite (Dashboard). Gemessen werden Durchsatz (Requests/s)
+sowie p50/p95/p99-Latenzen pro Endpoint.
+
+Damit lässt sich der Effekt des Async-Datenpfads (`web_api.async_database`)
+vergleichen: einmal gegen einen Stand mit sync Endpoints laufen lassen,
+einmal gegen den aktuellen — die p99 des Badge-Pollings sollte unter Last
+durch langsame Requests nicht mehr mitwachsen.
+
+Ausführen:
+    uv run python scripts/load_test_web_api.py --users users.csv
+    uv run python scripts/load_test_web_api.py --users users.csv --concurrency 200 --duration 60
+    uv run python scripts/load_test_web_api.py --users users.csv --base-url https://staging.example.org
+
+`users.csv`: eine Zeile pro Konto, `email,password` (ohne Header). Gibt es
+weniger Konten als `--concurrency`, teilen sich mehrere simulierte
+Mitarbeiter ein Konto (eigene Verbindung, gleiches Token).
+"""
+
+import argparse
+import asyncio
+import csv
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import date, timedelta
+
+import httpx
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Web-API unter Last setzen')
+parser.add_argument('--base-url', default='http://localhost:8000',
+                    help='Basis-URL der Web-API (Standard: http://localhost:8000)')
+parser.add_argument('--users', required=True,
+                    help='CSV-Datei mit email,password pro Zeile')
+parser.add_argument('--concurrency', type=int, default=100,
+                    help='Anzahl gleichzeitiger simulierter Mitarbeiter (Standard: 100)')
+parser.add_argument('--duration', type=float, default=30.0,
+                    help='Testdauer in Sekunden (Standard: 30)')
+parser.add_argument('--think-time', type=float, default=0.5,
+                    help='Mittlere Pause zwischen zwei Requests eines Users in s (Standard: 0.5)')
+args = parser.parse_args()
+
+# Endpoint-Mix: (Label, Pfad-Funktion, Gewicht). Die Kalender-Feeds bekommen
+# ein zufälliges Monatsfenster — wie beim Blättern im FullCalendar.
+
+
+def _month_window() -> str:
+    first = date.today().replace(day=1) + timedelta(days=31 * random.randint(-2, 2))
+    first = first.replace(day=1)
+    return f'start={first.isoformat()}&end={(first + timedelta(days=42)).isoformat()}'
+
+
+ENDPOINTS: list[tuple[str, Callable[[], str], int]] = [
+    ('inbox/badge', lambda: '/inbox/badge', 6),
+    ('inbox', lambda: '/inbox', 1),
+    ('viewer/plan/events', lambda: f'/viewer/plan/events?{_month_window()}', 3),
+    ('dashboard', lambda: '/dashboard', 1),
+]
+
+
+def _read_users(path: str) -> list[tuple[str, str]]:
+    with open(path, newline='', encoding='utf-8') as f:
+        return [(row[0].strip(), row[1].strip()) for row in csv.reader(f) if len(row) >= 2]
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> str | None:
+    response = await client.post(
+        '/auth/login',
+        data={'username': email, 'password': password},
+        headers={'Accept': 'application/json'},
+    )
+    if response.status_code != 200:
+        print(f'Login fehlgeschlagen für {email}: {response.status_code}')
+        return None
+    return response.json().get('access_token')
+
+
+async def _simulated_employee(
+    base_url: str,
+    token: str,
+    deadline: float,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+) -> None:
+    labels = [e[0] for e in ENDPOINTS]
+    weights = [e[2] for e in ENDPOINTS]
+    paths = {e[0]: e[1] for e in ENDPOINTS}
+    headers = {'Authorization': f'Bearer {token}', 'HX-Request': 'true'}
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60.0) as client:
+        while time.perf_counter() < deadline:
+            label = random.choices(labels, weights)[0]
+            t0 = time.perf_counter()
+            try:
+                response = await client.get(paths[label]())
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            latencies[label].append(time.perf_counter() - t0)
+            if not ok:
+                errors[label] += 1
+            await asyncio.sleep(random.expovariate(1 / args.think_time))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def main() -> None:
+    users = _read_users(args.users)
+    if not users:
+        print('FEHLER: keine Konten in --users gefunden.')
+        sys.exit(1)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30.0) as client:
+        tokens = [t for t in [await _login(client, e, p) for e, p in users] if t]
+    if not tokens:
+        print('FEHLER: kein Login erfolgreich.')
+        sys.exit(1)
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*[
+        _simulated_employee(args.base_url, tokens[i % len(tokens)], deadline, latencies, errors)
+        for i in range(args.concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(v) for v in latencies.values())
+    print(f'\n{args.concurrency} simulierte Mitarbeiter, {elapsed:.1f} s, '
+          f'{total} Requests, {total / elapsed:.1f} req/s\n')
+    print(f'{"Endpoint":<22}{"n":>7}{"Fehler":>8}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+    for label, values in sorted(latencies.items()):
+        print(f'{label:<22}{len(values):>7}{errors[label]:>8}'
+              f'{statistics.median(values) * 1000:>10.1f}'
+              f'{_percentile(values, 95) * 1000:>10.1f}'
+              f'{_percentile(values, 99) * 1000:>10.1f}'
+              f'{max(values) * 1000:>10.1f}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
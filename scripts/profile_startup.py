@@ -0,0 +1,89 @@
+"""
+Startzeit-Profil des Desktop-Clients.
+
+1. Importzeit: `python -X importtime -c "import gui.main_window"` in einem
+   frischen Prozess; ausgegeben werden Gesamtzeit sowie die teuersten Module
+   nach kumulierter und nach eigener Zeit.
+2. Zeit bis zum ersten Fenster (mit --window): startet `main.py` --runs-mal mit
+   HCC_STARTUP_PROFILE=1 (gui.startup_profile) und gibt den Median jedes
+   Messpunkts aus. Setzt gespeicherte Anmeldedaten voraus (Silent-Login),
+   sonst wartet der Login-Dialog.
+
+Ausführen:
+    uv run python scripts/profile_startup.py
+    uv run python scripts/profile_startup.py --top 30 --module gui.frm_plan
+    uv run python scripts/profile_startup.py --window --runs 5
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Projektverzeichnis (Arbeitsverzeichnis der Unterprozesse) ─────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='Startzeit-Profil: Importzeit und Zeit bis zum ersten Fenster')
+parser.add_argument('--module', default='gui.main_window', help='Zu importierendes Modul (Standard: gui.main_window)')
+parser.add_argument('--top', type=int, default=20, help='Zeilen pro Rangliste (Standard: 20)')
+parser.add_argument('--window', action='store_true', help='Zusätzlich Zeit bis zum ersten Fenster messen')
+parser.add_argument('--runs', type=int, default=3, help='App-Starts für --window (Standard: 3)')
+args = parser.parse_args()
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)')
+
+
+def _profile_imports() -> list[tuple[str, int, int, int]]:
+    """(Modul, eigene µs, kumulierte µs, Tiefe) je Zeile der -X importtime-Ausgabe."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {args.module}'],
+                            cwd=project_root, capture_output=True, text=True,
+                            env={**os.environ, 'QT_QPA_PLATFORM': os.environ.get('QT_QPA_PLATFORM', 'offscreen')})
+    if result.returncode != 0:
+        print(f"FEHLER beim Import von {args.module}:\n{result.stderr[-2000:]}")
+        sys.exit(1)
+    return [(m.group(4), int(m.group(1)), int(m.group(2)), len(m.group(3)) // 2)
+            for m in map(_IMPORTTIME_LINE.match, result.stderr.splitlines()) if m]
+
+
+def _print_ranking(title: str, rows: list[tuple[str, int]]) -> None:
+    print(f"\n{title}")
+    print("-" * 70)
+    for name, us in rows[:args.top]:
+        print(f"  {us / 1000:>8.1f} ms  {name}")
+
+
+imports = _profile_imports()
+top_level = [(name, cumulative) for name, _, cumulative, depth in imports if depth == 0]
+print(f"\nImport von {args.module}: {sum(us for _, us in top_level) / 1000:.0f} ms, {len(imports)} Module")
+print("=" * 70)
+_print_ranking("Teuerste Module (kumuliert)",
+               sorted(((name, cumulative) for name, _, cumulative, _ in imports), key=lambda r: -r[1]))
+_print_ranking("Teuerste Module (eigene Zeit)",
+               sorted(((name, own) for name, own, _, _ in imports), key=lambda r: -r[1]))
+
+if args.window:
+    runs: list[dict[str, float]] = []
+    for run in range(1, args.runs + 1):
+        env = {**os.environ, 'HCC_STARTUP_PROFILE': '1', 'HCC_STARTUP_T0': repr(time.time())}
+        result = subprocess.run([sys.executable, 'main.py'], cwd=project_root, env=env,
+                                capture_output=True, text=True, timeout=300)
+        line = next((line for line in result.stdout.splitlines() if line.startswith('STARTUP-PROFILE ')), None)
+        if line is None:
+            print(f"FEHLER in Lauf {run}: keine STARTUP-PROFILE-Zeile (Exit {result.returncode}).\n"
+                  f"{result.stderr[-2000:]}")
+            sys.exit(1)
+        runs.append(json.loads(line.removeprefix('STARTUP-PROFILE ')))
+
+    print(f"\nZeit seit Prozessstart, Median aus {len(runs)} Starts")
+    print("-" * 70)
+    for label in runs[0]:
+        print(f"  {label:<28} {statistics.median(r[label] for r in runs if label in r):>8.0f} ms")
@@ -0,0 +1,172 @@
+"""
+Tuning: StoppingPolicy-Empfehlung für typische Plangrößen.
+
+Spielt einen Korpus von Solver-Modellen mit verschiedenen Abbruch- und
+Worker-Einstellungen ab und misst pro Kandidat
+- Laufzeit bis zum Abbruch (das, worauf der Planer wartet),
+- Zeit bis zur ersten "guten" Lösung (höchstens --quality schlechter als die
+  Referenz aus einem langen Lauf),
+- Abstand der Endlösung zur Referenz.
+
+Empfohlen wird der Kandidat mit der kleinsten Median-Laufzeit, der auf allen
+Modellen die Qualitätsschwelle erreicht; dazu wird der passende Abschnitt
+für solver_config.toml ausgegeben.
+
+Korpus:
+- aus der DB: die ungewichteten Modelle (Phase "unadjusted") der letzten
+  --last Planperioden eines Teams; mit --export werden sie als .pbtxt
+  gespeichert
+- aus einem Verzeichnis: --corpus DIR spielt zuvor exportierte Modelle ohne
+  DB-Zugriff ab
+
+Ausführen:
+    uv run python scripts/tune_solver_stopping.py --team "Baden-Württemberg" --last 3
+    uv run python scripts/tune_solver_stopping.py --team "Baden-Württemberg" --export corpus/
+    uv run python scripts/tune_solver_stopping.py --corpus corpus/ --time-limit 30 --quality 0.005
+"""
+
+import argparse
+import itertools
+import os
+import statistics
+import sys
+from pathlib import Path
+
+# Windows-Terminal: UTF-8 für Umlaute
+if hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# ── Sys-Path für Projekt-Imports ──────────────────────────────────────────────
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# ── Argumente ──────────────────────────────────────────────────────────────────
+parser = argparse.ArgumentParser(description='StoppingPolicy-Empfehlung per Korpus-Replay')
+parser.add_argument('--team', help='Team-Name für den DB-Korpus')
+parser.add_argument('--last', type=int, default=3, help='Anzahl der letzten Planperioden (Standard: 3)')
+parser.add_argument('--corpus', type=Path, help='Verzeichnis mit exportierten Modellen (*.pbtxt)')
+parser.add_argument('--export', type=Path, help='DB-Korpus zusätzlich als .pbtxt hierhin schreiben')
+parser.add_argument('--phase', default='unadjusted', help='Phase für den TOML-Abschnitt (Standard: unadjusted)')
+parser.add_argument('--reference-time', type=float, default=120.0,
+                    help='Zeitlimit für den Referenz-Lauf in s (Standard: 120)')
+parser.add_argument('--time-limit', type=float, default=30.0, help='Zeitlimit pro Kandidat in s (Standard: 30)')
+parser.add_argument('--quality', type=float, default=0.01,
+                    help='Erlaubter relativer Abstand zur Referenz (Standard: 0.01 = 1 %%)')
+parser.add_argument('--workers', default=f'4,{os.cpu_count() or 1}', help='Worker-Anzahlen, kommagetrennt')
+parser.add_argument('--gaps', default='0,0.01,0.05', help='relative_gap_limit-Werte, kommagetrennt (0 = aus)')
+parser.add_argument('--no-improvement', default='0,5,10', help='no_improvement_seconds-Werte (0 = aus)')
+args = parser.parse_args()
+if not (args.team or args.corpus):
+    parser.error('--team oder --corpus angeben')
+
+# ── Projekt-Imports ────────────────────────────────────────────────────────────
+from ortools.sat.python import cp_model
+
+from configuration.solver import StoppingPolicy
+from sat_solver.solve_context import solve_context
+from sat_solver.solver_main import solve_model_to_optimum
+
+
+def load_corpus_from_db() -> dict[str, cp_model.CpModel]:
+    from database import db_services
+    from database.db_services import plan_period as pp_svc
+    from sat_solver.avail_day_group_tree import get_avail_day_group_tree
+    from sat_solver.cast_group_tree import get_cast_group_tree
+    from sat_solver.data_loading import create_data_models
+    from sat_solver.event_group_tree import get_event_group_tree
+    from sat_solver.solver_main import create_constraints, create_vars, define_objective_minimize
+
+    plan_periods = sorted(
+        (pp for project in db_services.Project.get_all()
+         for pp in db_services.PlanPeriod.get_all_from__project(project.id)
+         if not pp.prep_delete and args.team.lower() in pp.team.name.lower()),
+        key=lambda pp: pp.start,
+    )[-args.last:]
+    if not plan_periods:
+        print(f"FEHLER: Keine Planperioden für Team '{args.team}' gefunden.")
+        sys.exit(1)
+
+    corpus = {}
+    for plan_period in plan_periods:
+        lpp_ids, app_ids = pp_svc.get_lpp_and_app_ids(plan_period.id)
+        event_group_tree = get_event_group_tree(plan_period.id, lpp_ids)
+        avail_day_group_tree = get_avail_day_group_tree(plan_period.id, app_ids)
+        entities = create_data_models(event_group_tree, avail_day_group_tree,
+                                      get_cast_group_tree(plan_period.id), plan_period.id)
+        with solve_context() as context:
+            model = cp_model.CpModel()
+            context.reset_model_state()
+            create_vars(model, event_group_tree, avail_day_group_tree, entities)
+            define_objective_minimize(model, create_constraints(model, entities))
+        corpus[f'{plan_period.team.name} {plan_period.start:%Y-%m-%d}'] = model
+    return corpus
+
+
+def load_corpus_from_dir(directory: Path) -> dict[str, cp_model.CpModel]:
+    corpus = {}
+    for path in sorted(directory.glob('*.pbtxt')):
+        model = cp_model.CpModel()
+        model.Proto().parse_text_format(path.read_text(encoding='utf-8'))
+        corpus[path.stem] = model
+    return corpus
+
+
+def run(model: cp_model.CpModel, policy: StoppingPolicy, time_limit: float):
+    with solve_context() as context:
+        solve_model_to_optimum(model, time_limit, False, policy=policy)
+    return context.traces[-1]
+
+
+corpus = load_corpus_from_dir(args.corpus) if args.corpus else load_corpus_from_db()
+if args.export:
+    args.export.mkdir(parents=True, exist_ok=True)
+    for name, model in corpus.items():
+        model.ExportToFile(str(args.export / f"{name.replace(' ', '_')}.pbtxt"))
+
+print(f"\nKorpus: {len(corpus)} Modelle   Referenz: {args.reference_time:.0f} s   "
+      f"Kandidaten: {args.time_limit:.0f} s   Qualität: {args.quality:.1%}")
+print("=" * 70)
+references = {}
+for name, model in corpus.items():
+    trace = run(model, StoppingPolicy(), args.reference_time)
+    references[name] = trace.best_objective
+    print(f"  {name:<36} Variablen: {len(model.Proto().variables):7d}   "
+          f"Referenz: {trace.best_objective}  ({trace.stop_reason}, {trace.wall_time:.1f} s)")
+
+candidates = [
+    StoppingPolicy(num_workers=workers, relative_gap_limit=gap or None, no_improvement_seconds=window or None)
+    for workers, gap, window in itertools.product(
+        (int(w) for w in args.workers.split(',')),
+        (float(g) for g in args.gaps.split(',')),
+        (float(n) for n in args.no_improvement.split(',')),
+    )
+]
+
+print(f"\n  {'Worker':>6} {'Gap':>6} {'Stall':>6}   {'Laufzeit':>9} {'gut nach':>9} {'max. Abstand':>13}")
+results = []
+for policy in candidates:
+    wall_times, good_times, deviations = [], [], []
+    for name, model in corpus.items():
+        trace = run(model, policy, args.time_limit)
+        reference = references[name]
+        wall_times.append(trace.wall_time)
+        maximize = model.Proto().objective.scaling_factor < 0
+        good_times.append(trace.time_to_within(reference, args.quality, maximize))
+        deviations.append(abs((trace.best_objective or 0) - reference) / abs(reference) if reference else 0.0)
+    reached = all(t is not None for t in good_times) and max(deviations) <= args.quality
+    median_wall = statistics.median(wall_times)
+    reached_times = [t for t in good_times if t is not None]
+    median_good = statistics.median(reached_times) if reached_times else float('nan')
+    results.append((reached, median_wall, policy))
+    print(f"  {policy.num_workers:>6} {policy.relative_gap_limit or 0:>6.3f} {policy.no_improvement_seconds or 0:>6.0f}"
+          f"   {median_wall:>8.1f}s {median_good:>8.1f}s {max(deviations):>12.2%}{'' if reached else '  ✗'}")
+
+qualifying = [(median_wall, policy) for reached, median_wall, policy in results if reached]
+if not qualifying:
+    print("\nKein Kandidat erreicht die Qualitätsschwelle — --time-limit erhöhen oder --quality lockern.")
+    sys.exit(0)
+_, best = min(qualifying, key=lambda item: item[0])
+print(f"\nEmpfehlung (solver_config.toml):\n\n[stopping_policies.{args.phase}]")
+for key, value in best.model_dump(exclude_none=True, exclude_defaults=True).items():
+    print(f"{key} = {value}")
@@ -4,8 +4,11 @@ Stellt Test-Infrastruktur bereit:
 - Eigene SQLite-File-Test-DB im OS-temp-Verzeichnis
 - Schema-Reset (`drop_all` + `create_all`) vor jedem Test fuer saubere Isolation
 - FastAPI TestClient mit ``get_db_session``-Override
+- Async-Engine (aiosqlite) auf dieselbe Test-DB fuer ``get_async_db_session``
 - Vorgefertigte WebUser-Fixtures (admin, dispatcher) inkl. Person-Verknuepfung
 - ``as_admin`` / ``as_dispatcher``: Auth-Override fuer geschuetzte Routen
+- ``assert_max_queries``: Obergrenze fuer SQL-Abfragen eines Blocks (N+1-Schutz)
+- ``smtp_config`` / ``smtp_connections``: Mail-Versand gegen Fake-SMTP-Verbindungen
 
 DATABASE_URL wird VOR allen Imports auf die Test-DB gesetzt — Schutz gegen
 versehentliche Production-Treffer (vgl. Memory
@@ -25,7 +28,9 @@ import os
 import pathlib
 import secrets
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
+from datetime import date, time
 from typing import Any
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -46,25 +51,45 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import event as _sa_event
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
 
 # Modul-Imports AB JETZT — DATABASE_URL ist gesetzt, also greift der Server-Pfad
 # (PG-/SQLite-Engine) in database.database. Wir patchen unten die Engine, weil
 # der dortige `create_engine`-Call SQLite-untypische Pool-Settings nutzt.
 import database.database as _database_module
+import web_api.async_database as _async_database_module
 import database.models  # noqa: F401 — Side-Effect: registriert Tabellen in SQLModel.metadata
 import web_api.dependencies as _web_dependencies
 import web_api.models.web_models  # noqa: F401 — Web-spezifische Tabellen ebenfalls registrieren
 from database.event_listeners import register_listeners
 
 from database.models import (
+    ActorPlanPeriod,
+    Appointment,
+    AvailDay,
+    AvailDayGroup,
+    CastGroup,
+    Event,
+    EventGroup,
     Gender,
+    LocationOfWork,
+    LocationPlanPeriod,
     Person,
+    Plan,
+    PlanPeriod,
     Project,
+    Team,
+    TimeOfDay,
+    TimeOfDayEnum,
 )
-from web_api.auth.dependencies import require_login
+from web_api.auth.dependencies import require_login, require_login_async
+from web_api.desktop_api.auth import DesktopAuthContext, _require_desktop_user
 from web_api.auth.service import hash_password
 from web_api.dependencies import get_db_session
+from web_api.email import service as _smtp_service
+from web_api.email.config_loader import SmtpConfig
+from web_api.instrumentation import capture_queries
 from web_api.main import app
 from web_api.models.web_models import WebUser, WebUserRole, WebUserRoleLink
 
@@ -99,6 +124,22 @@ _test_engine = _make_test_engine()
 _database_module.engine = _test_engine
 _web_dependencies.engine = _test_engine
 
+
+def _make_async_test_engine():
+    engine = create_async_engine(f"sqlite+aiosqlite:///{_TEST_DB_PATH.as_posix()}")
+
+    @_sa_event.listens_for(engine.sync_engine, "connect")
+    def _enable_fk(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+# Async-Endpoints (`get_async_db_session`) auf dieselbe Test-Datei lenken.
+_async_database_module.set_async_engine(_make_async_test_engine())
+
 # `register_listeners()` registriert auf `sqlalchemy.orm.Session` global —
 # gilt fuer alle Engines. Dennoch einmal aufrufen, falls es noch nicht passiert
 # ist (Modul-Import-Reihenfolge ist hier idempotent).
@@ -244,23 +285,124 @@ def dispatcher_user(session: Session, project: Project) -> WebUser:
 
 @pytest.fixture
 def as_admin(client: TestClient, admin_user: WebUser) -> Generator[TestClient, None, None]:
-    """Auth-Override: ``require_login`` und ``get_current_user`` liefern den admin_user
+    """Auth-Override: ``require_login`` und ``require_login_async`` liefern den admin_user
     direkt zurueck — JWT-Token-Flow wird umgangen."""
-    app.dependency_overrides[require_login] = lambda: admin_user
-    try:
-        yield client
-    finally:
-        app.dependency_overrides.pop(require_login, None)
+    yield from _logged_in_as(client, admin_user)
 
 
 @pytest.fixture
 def as_dispatcher(
     client: TestClient, dispatcher_user: WebUser
 ) -> Generator[TestClient, None, None]:
-    app.dependency_overrides[require_login] = lambda: dispatcher_user
+    yield from _logged_in_as(client, dispatcher_user)
+
+
+def _logged_in_as(client: TestClient, user: WebUser) -> Generator[TestClient, None, None]:
+    """Sync- und Async-Login-Dependency auf ``user`` umbiegen."""
+    app.dependency_overrides[require_login] = lambda: user
+    app.dependency_overrides[require_login_async] = lambda: user
     try:
         yield client
     finally:
         app.dependency_overrides.pop(require_login, None)
+        app.dependency_overrides.pop(require_login_async, None)
+
+
+@pytest.fixture
+def as_desktop(client: TestClient, dispatcher_user: WebUser) -> Generator[TestClient, None, None]:
+    """Auth-Override fuer die Desktop-API (/api/v1): JWT-Pruefung umgangen, Dispatcher-Rolle."""
+    app.dependency_overrides[_require_desktop_user] = lambda: DesktopAuthContext(
+        id=dispatcher_user.id, email=dispatcher_user.email, roles=frozenset({WebUserRole.dispatcher}))
+    try:
+        yield client
+    finally:
+        app.dependency_overrides.pop(_require_desktop_user, None)
+
 
+@pytest.fixture
+def plan_id(session: Session, project: Project, admin_user: WebUser, dispatcher_user: WebUser):
+    """Plan mit 10 Appointments à 2 AvailDays (admin + dispatcher) — für tiefe PlanShow-Lesewege."""
+    with session.no_autoflush:
+        plan_period = PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30),
+                                 team=Team(name="Wire-Team", project=project))
+        time_of_day = TimeOfDay(name="Tag", start=time(9), end=time(17), project=project,
+                                time_of_day_enum=TimeOfDayEnum(name="Tag", abbreviation="T", time_index=1,
+                                                               project=project))
+        lpp = LocationPlanPeriod(plan_period=plan_period,
+                                 location_of_work=LocationOfWork(name="Ort", project=project))
+        apps = [ActorPlanPeriod(plan_period=plan_period, person_id=user.person_id)
+                for user in (admin_user, dispatcher_user)]
+        plan = Plan(name="Plan", notes="", plan_period=plan_period)
+        session.add_all([lpp, plan, time_of_day, *apps])
+    session.commit()
+    with session.no_autoflush:
+        for day in range(1, 11):
+            event = Event(date=date(2026, 9, day), time_of_day=time_of_day, location_plan_period=lpp,
+                          event_group=EventGroup(event_group_id=lpp.event_group.id),
+                          cast_group=CastGroup(nr_actors=2, plan_period=plan_period))
+            avail_days = [AvailDay(date=event.date, time_of_day=time_of_day, actor_plan_period=app,
+                                   avail_day_group=AvailDayGroup(avail_day_group_id=app.avail_day_group.id))
+                          for app in apps]
+            session.add(Appointment(event=event, plan=plan, avail_days=avail_days))
+    session.commit()
+    return plan.id
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], AbstractContextManager[list[str]]]:
+    """``with assert_max_queries(5): client.get(...)`` — schlaegt fehl, wenn der
+    Block mehr als N SQL-Abfragen absetzt (auch im Thread des TestClients)."""
+
+    @contextmanager
+    def _assert_max_queries(limit: int) -> Generator[list[str], None, None]:
+        with capture_queries() as statements:
+            yield statements
+        if len(statements) > limit:
+            listing = "\n".join(f"  {i}. {sql.strip()[:200]}" for i, sql in enumerate(statements, 1))
+            pytest.fail(f"{len(statements)} SQL-Abfragen, erlaubt sind hoechstens {limit}:\n{listing}")
+
+    return _assert_max_queries
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Mail-Versand: SMTP-Verbindungen durch Fakes ersetzen
+# ═══════════════════════════════════════════════════════════════════════════════
 
+
+class FakeSmtp:
+    """Protokolliert die Empfaenger jeder gesendeten Mail in ``sent``."""
+
+    def __init__(self):
+        self.sent: list[list[str]] = []
+
+    def sendmail(self, sender, recipients, message):
+        self.sent.append(recipients)
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def smtp_config() -> SmtpConfig:
+    return SmtpConfig(
+        host="smtp.example.de",
+        port=587,
+        username="",
+        password="",
+        use_tls=False,
+        use_ssl=False,
+        email_from="plan@example.de",
+        email_from_name=None,
+    )
+
+
+@pytest.fixture
+def smtp_connections(monkeypatch: pytest.MonkeyPatch) -> list[FakeSmtp]:
+    """Versand scharf schalten; jede aufgebaute SMTP-Verbindung landet als ``FakeSmtp`` in der Liste."""
+    monkeypatch.setenv("SUPPRESS_NOTIFICATIONS", "false")
+    connections: list[FakeSmtp] = []
+    monkeypatch.setattr(_smtp_service, "_connect", lambda config: connections.append(FakeSmtp()) or connections[-1])
+    return connections
@@ -0,0 +1,114 @@
+"""Async-Datenpfad (``web_api.async_database`` + ``get_async_db_session``).
+
+Verifiziert:
+- URL-Übersetzung sync → async (render.com-Formate, sslmode → ssl)
+- Async-Endpoints sehen dieselbe Test-DB wie der sync Pfad
+  (Inbox-Badge, Viewer-Kalender-Feed)
+- Async-Endpoints authentifizieren über die AsyncSession (kein sync
+  ``get_db_session``), inkl. Silent-Refresh und Login-Redirect
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from web_api.async_database import to_async_url
+from web_api.auth.dependencies import require_login_async
+from web_api.auth.service import create_access_token, create_refresh_token
+from web_api.config import get_settings
+from web_api.dependencies import get_db_session
+from web_api.inbox.service import create_inbox_message
+from web_api.main import app
+from web_api.models.web_models import InboxMessageType, WebUser, WebUserRole, WebUserRoleLink
+
+
+@pytest.mark.parametrize(
+    ("sync_url", "expected"),
+    [
+        ("postgres://u:p@host:5432/db", "postgresql+asyncpg://u:p@host:5432/db"),
+        ("postgresql://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql+psycopg2://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+        ("postgresql://u:p@host/db?sslmode=require", "postgresql+asyncpg://u:p@host/db?ssl=require"),
+        ("sqlite:///tmp/x.sqlite", "sqlite+aiosqlite:///tmp/x.sqlite"),
+        ("postgresql+asyncpg://u:p@host/db", "postgresql+asyncpg://u:p@host/db"),
+    ],
+)
+def test_to_async_url(sync_url: str, expected: str) -> None:
+    assert to_async_url(sync_url) == expected
+
+
+def test_inbox_badge_reads_via_async_session(
+    session: Session, as_admin: TestClient, admin_user: WebUser,
+) -> None:
+    """Sync geschriebene Inbox-Message muss im async Badge-Endpoint zählen."""
+    create_inbox_message(
+        session,
+        recipient_id=admin_user.id,
+        msg_type=InboxMessageType.cancellation_new,
+        reference_id=admin_user.id,
+        reference_type="cancellation_request",
+        snapshot_data={},
+    )
+    session.commit()
+
+    response = as_admin.get("/inbox/badge")
+    assert response.status_code == 200
+    assert ">1<" in response.text.replace(" ", "").replace("\n", "")
+
+
+def test_viewer_plan_events_async_returns_json(
+    session: Session, client: TestClient, admin_user: WebUser,
+) -> None:
+    """Viewer-Feed läuft über ``run_sync`` — ohne Appointments leere Liste."""
+    session.add(WebUserRoleLink(web_user_id=admin_user.id, role=WebUserRole.viewer))
+    session.commit()
+    session.refresh(admin_user, attribute_names=["role_links"])
+
+    app.dependency_overrides[require_login_async] = lambda: admin_user
+    try:
+        response = client.get("/viewer/plan/events")
+    finally:
+        app.dependency_overrides.pop(require_login_async, None)
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.fixture
+def sync_session_forbidden() -> Generator[None, None, None]:
+    def _forbidden():
+        raise AssertionError("Async-Endpoint hat die sync DB-Session angefordert")
+
+    app.dependency_overrides[get_db_session] = _forbidden
+    try:
+        yield
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
+
+
+def test_async_routes_authenticate_on_async_session(
+    client: TestClient, admin_user: WebUser, sync_session_forbidden: None,
+) -> None:
+    """Echter Token-Flow ohne Override — Auth darf keinen Threadpool-Thread belegen."""
+    settings = get_settings()
+    client.cookies.set("access_token", create_access_token(
+        str(admin_user.id), admin_user.email, [WebUserRole.admin.value], settings))
+
+    assert client.get("/inbox/badge").status_code == 200
+    assert client.get("/viewer/plan/events").status_code == 200
+
+
+def test_async_login_refreshes_or_redirects(
+    client: TestClient, admin_user: WebUser, sync_session_forbidden: None,
+) -> None:
+    response = client.get("/inbox/badge", follow_redirects=False)
+    assert response.status_code == 303
+    assert response.headers["location"] == "/auth/login?next=/inbox/badge"
+
+    client.cookies.set("refresh_token", create_refresh_token(str(admin_user.id), get_settings()))
+    response = client.get("/viewer/plan/events", follow_redirects=False)
+    assert response.status_code == 200
+    assert "access_token" in response.cookies
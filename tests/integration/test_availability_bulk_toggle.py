@@ -0,0 +1,128 @@
+"""Bulk-Toggles der Verfügbarkeits-Eingabe (``POST /availability/avail-day/bulk``).
+
+Verifiziert:
+- mehrere Zellen in einem Request anlegen, Antwort enthält nur neue Events
+- gemischter Stapel: Löschen + Anlegen + No-Op, letzter Toggle pro Zelle gewinnt
+- Tage außerhalb der Planperiode werden übersprungen und gemeldet
+- nicht gelinkte Tageszeit → 403 ohne Teil-Mutation
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select as sa_select
+from sqlmodel import Session
+
+from database.models import (
+    ActorPlanPeriod,
+    AvailDay,
+    PersonTimeOfDayLink,
+    PlanPeriod,
+    Project,
+    Team,
+    TimeOfDay,
+    TimeOfDayEnum,
+)
+from web_api.models.web_models import WebUser
+
+
+@pytest.fixture
+def setup(session: Session, project: Project, admin_user: WebUser) -> dict:
+    plan_period = PlanPeriod(
+        start=date(2026, 9, 1), end=date(2026, 9, 30), team=Team(name="Bulk-Team", project=project),
+    )
+    session.add(plan_period)
+    session.commit()
+    app = ActorPlanPeriod(person_id=admin_user.person_id, plan_period=plan_period)
+    enum = TimeOfDayEnum(name="Vormittag", abbreviation="VM", time_index=0, project=project)
+    tod = TimeOfDay(start=time(9), end=time(12), project=project, time_of_day_enum=enum)
+    session.add_all([app, tod])
+    session.commit()
+    session.add(PersonTimeOfDayLink(person_id=admin_user.person_id, time_of_day_id=tod.id))
+    session.commit()
+    return {"app_id": app.id, "tod_id": tod.id}
+
+
+def _post(client: TestClient, setup: dict, toggles: list[tuple[date, bool]]):
+    return client.post("/availability/avail-day/bulk", json={
+        "actor_plan_period_id": str(setup["app_id"]),
+        "toggles": [
+            {"day": d.isoformat(), "time_of_day_id": str(setup["tod_id"]), "active": a}
+            for d, a in toggles
+        ],
+    })
+
+
+def _active_days(session: Session, app_id: uuid.UUID) -> set[date]:
+    session.expire_all()
+    return set(session.execute(
+        sa_select(AvailDay.date)
+        .where(AvailDay.actor_plan_period_id == app_id)
+        .where(AvailDay.prep_delete.is_(None))
+    ).scalars().all())
+
+
+def test_bulk_creates_cells_and_returns_only_changes(
+    session: Session, as_admin: TestClient, setup: dict,
+) -> None:
+    days = [date(2026, 9, d) for d in (1, 2, 3)]
+    response = _post(as_admin, setup, [(d, True) for d in days])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert sorted(e["start"] for e in body["created"]) == [d.isoformat() for d in days]
+    assert body["deleted"] == [] and body["skipped"] == []
+    assert response.headers["HX-Trigger"] == "availability-changed"
+    assert _active_days(session, setup["app_id"]) == set(days)
+
+
+def test_bulk_mixed_batch_last_toggle_wins(
+    session: Session, as_admin: TestClient, setup: dict,
+) -> None:
+    _post(as_admin, setup, [(date(2026, 9, 1), True), (date(2026, 9, 2), True)])
+
+    response = _post(as_admin, setup, [
+        (date(2026, 9, 1), False),                              # löschen
+        (date(2026, 9, 2), True),                               # existiert → No-Op
+        (date(2026, 9, 5), True), (date(2026, 9, 5), False),    # hin und her → No-Op
+        (date(2026, 9, 6), False), (date(2026, 9, 6), True),    # her und hin → anlegen
+    ])
+
+    body = response.json()
+    assert len(body["deleted"]) == 1
+    assert [e["start"] for e in body["created"]] == ["2026-09-06"]
+    assert _active_days(session, setup["app_id"]) == {date(2026, 9, 2), date(2026, 9, 6)}
+
+
+def test_bulk_skips_days_outside_plan_period(as_admin: TestClient, setup: dict) -> None:
+    response = _post(as_admin, setup, [(date(2026, 10, 1), True), (date(2026, 9, 1), True)])
+
+    body = response.json()
+    assert [s["reason"] for s in body["skipped"]] == ["outside_period"]
+    assert len(body["created"]) == 1
+
+
+def test_bulk_rejects_unlinked_time_of_day_without_partial_writes(
+    session: Session, as_admin: TestClient, setup: dict, project: Project,
+) -> None:
+    foreign = TimeOfDay(
+        start=time(14), end=time(18), project=project,
+        time_of_day_enum=TimeOfDayEnum(name="NM", abbreviation="NM", time_index=1, project=project),
+    )
+    session.add(foreign)
+    session.commit()
+
+    response = as_admin.post("/availability/avail-day/bulk", json={
+        "actor_plan_period_id": str(setup["app_id"]),
+        "toggles": [
+            {"day": "2026-09-01", "time_of_day_id": str(setup["tod_id"]), "active": True},
+            {"day": "2026-09-01", "time_of_day_id": str(foreign.id), "active": True},
+        ],
+    })
+
+    assert response.status_code == 403
+    assert _active_days(session, setup["app_id"]) == set()
@@ -0,0 +1,84 @@
+"""Verfügbarkeits-Zusammenfassung (``web_api.availability.summary``).
+
+Verifiziert:
+- Teams, sichtbare Perioden und Sidebar-Stats aus der Zusammenfassung
+  entsprechen den direkten Abfragen des Service
+- eine AvailDay-Änderung invalidiert nur die Zeilen der betroffenen Person
+- die Anzahl SQL-Abfragen pro Seitenaufruf wächst nicht mit der Zahl der Teams
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from database.models import ActorPlanPeriod, AvailDay, PlanPeriod, Project, Team
+from web_api.availability import service, summary
+from web_api.models.web_models import AvailabilitySummary, WebUser
+
+
+def _summary_persons(session: Session) -> set:
+    session.expire_all()
+    return {row.person_id for row in session.exec(select(AvailabilitySummary)).all()}
+
+
+def test_summary_matches_live_queries(session: Session, plan_id, admin_user: WebUser) -> None:
+    person_id = admin_user.person_id
+
+    summaries = summary.load_summaries(session, person_id)
+
+    assert summary.teams_from_summaries(summaries) == service.get_teams_for_person(session, person_id)
+    assert summary.open_periods_from_summaries(summaries) == service.get_open_plan_periods_for_person(
+        session, person_id)
+    for period in summary.open_periods_from_summaries(summaries):
+        assert summary.stats_from_summaries(summaries, period.actor_plan_period_id) == service.get_sidebar_stats(
+            session, period.actor_plan_period_id, period.requested_assignments)
+
+
+def test_avail_day_change_invalidates_only_affected_person(
+    session: Session, plan_id, admin_user: WebUser, dispatcher_user: WebUser,
+) -> None:
+    for user in (admin_user, dispatcher_user):
+        summary.load_summaries(session, user.person_id)
+    session.commit()
+    assert _summary_persons(session) == {admin_user.person_id, dispatcher_user.person_id}
+
+    avail_day = session.exec(
+        select(AvailDay).join(ActorPlanPeriod).where(ActorPlanPeriod.person_id == dispatcher_user.person_id)
+    ).first()
+    avail_day.prep_delete = datetime(2026, 8, 1)
+    session.commit()
+
+    assert _summary_persons(session) == {admin_user.person_id}
+    [reloaded] = summary.load_summaries(session, dispatcher_user.person_id)
+    assert reloaded.stats.total_entered == 9
+
+
+def test_page_view_query_count_independent_of_team_count(
+    session: Session, as_admin: TestClient, plan_id, project: Project, admin_user: WebUser,
+) -> None:
+    bind = session.get_bind()
+
+    def page_view_queries() -> int:
+        assert as_admin.get("/availability").status_code == 200  # füllt die Zusammenfassung
+        statements: list[str] = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(bind, "before_cursor_execute", listener)
+        try:
+            assert as_admin.get("/availability").status_code == 200
+        finally:
+            event.remove(bind, "before_cursor_execute", listener)
+        return len(statements)
+
+    baseline = page_view_queries()
+
+    for nr in range(3):
+        plan_period = PlanPeriod(start=date(2027, 1 + nr, 1), end=date(2027, 1 + nr, 28),
+                                 team=Team(name=f"Team {nr}", project=project))
+        session.add(ActorPlanPeriod(plan_period=plan_period, person_id=admin_user.person_id))
+    session.commit()
+
+    assert page_view_queries() == baseline
@@ -0,0 +1,103 @@
+"""Kalender-Feed-Cache (``web_api.calendar_cache``).
+
+Verifiziert:
+- Revision wird nach Commits auf Plan-relevanten Entities erhöht, nicht
+  bei fremden Tabellen
+- ``get_plan_feed`` liefert beim zweiten Aufruf aus dem Cache und rechnet
+  nach einem Revision-Bump neu
+- Farb-Overrides verändern die gecachte Basis-Payload nicht
+- LRU-Verdrängung
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from database.models import PlanPeriod, Project, Team
+from web_api.calendar_cache import (
+    CalendarFeedCache,
+    FeedKey,
+    apply_color_overrides,
+    feed_cache,
+    get_feed_revision,
+    get_plan_feed,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_feed_cache():
+    feed_cache.clear()
+    yield
+    feed_cache.clear()
+
+
+def _make_team(session: Session, project: Project) -> Team:
+    team = Team(name="Feed-Team", project=project)
+    session.add(team)
+    session.commit()
+    session.refresh(team)
+    return team
+
+
+def test_revision_bumped_after_plan_commit(session: Session, project: Project) -> None:
+    team = _make_team(session, project)
+    before = get_feed_revision(session)
+
+    session.add(PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30), team=team))
+    session.commit()
+
+    assert get_feed_revision(session) == before + 1
+
+
+def test_revision_untouched_by_unrelated_commit(session: Session, project: Project) -> None:
+    before = get_feed_revision(session)
+    _make_team(session, project)
+    assert get_feed_revision(session) == before
+
+
+def test_get_plan_feed_hits_cache_until_revision_bump(session: Session, project: Project) -> None:
+    team = _make_team(session, project)
+    kwargs = dict(
+        project_id=project.id, team_ids=[team.id], start=None, end=None,
+        only_understaffed=False, user_overrides=None,
+    )
+
+    assert get_plan_feed(session, **kwargs) == []
+    assert get_plan_feed(session, **kwargs) == []
+    stats = feed_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    session.add(PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30), team=team))
+    session.commit()
+    get_plan_feed(session, **kwargs)
+    assert feed_cache.stats()["misses"] == 2
+
+
+def test_apply_color_overrides_leaves_cached_payload_untouched() -> None:
+    loc_id = uuid.uuid4()
+    payload = [{"color": "#F97316", "extendedProps": {"location_id": str(loc_id)}}]
+
+    result = apply_color_overrides(payload, {loc_id: "#3B82F6"})
+
+    assert result[0]["color"] == "#3B82F6"
+    assert payload[0]["color"] == "#F97316"
+    assert apply_color_overrides(payload, None) is payload
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache = CalendarFeedCache(max_entries=2)
+    keys = [
+        FeedKey(None, (), date(2026, 1, i), None, False, 0) for i in (1, 2, 3)
+    ]
+    cache.put(keys[0], [])
+    cache.put(keys[1], [])
+    cache.get(keys[0])  # keys[0] frisch → keys[1] ist ältester
+    cache.put(keys[2], [])
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == []
+    assert cache.get(keys[2]) == []
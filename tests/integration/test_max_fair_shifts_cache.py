@@ -0,0 +1,90 @@
+"""Cache für max./faire Einsätze (``sat_solver.max_fair_shifts_cache``).
+
+Verifiziert:
+- ``store`` → ``load`` mit gleichem Fingerprint liefert die Werte zurück,
+  anderer Fingerprint oder fehlende ActorPlanPeriod → kein Treffer
+- erneutes ``store`` ersetzt nur Cache-Einträge, beim Plan-Speichern
+  angelegte Zeilen (ohne Fingerprint) bleiben erhalten
+- die bestehenden Leser sehen keine Cache-Einträge
+- Fingerprint reagiert auf Model-Änderungen und Zeitbudgets
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from ortools.sat.python import cp_model
+from sqlmodel import Session, select
+
+from database import db_services, schemas
+from database.models import ActorPlanPeriod, MaxFairShiftsOfApp, PlanPeriod, Project, Team
+from sat_solver import max_fair_shifts_cache
+from web_api.models.web_models import WebUser
+
+
+@pytest.fixture
+def app_ids(session: Session, project: Project, admin_user: WebUser, dispatcher_user: WebUser) -> list[uuid.UUID]:
+    plan_period = PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30),
+                             team=Team(name="Cache-Team", project=project))
+    apps = [ActorPlanPeriod(plan_period=plan_period, person_id=user.person_id)
+            for user in (admin_user, dispatcher_user)]
+    session.add_all(apps)
+    session.commit()
+    return [app.id for app in apps]
+
+
+def test_store_and_load(app_ids: list[uuid.UUID]) -> None:
+    max_fair_shifts_cache.store("a" * 64, dict(zip(app_ids, (4, 6))), dict(zip(app_ids, (3.5, 5.0))))
+
+    assert max_fair_shifts_cache.load(app_ids, "a" * 64) == (dict(zip(app_ids, (4, 6))),
+                                                            dict(zip(app_ids, (3.5, 5.0))))
+    assert max_fair_shifts_cache.load(app_ids, "b" * 64) is None
+    assert max_fair_shifts_cache.load(app_ids + [uuid.uuid4()], "a" * 64) is None
+
+
+def test_store_replaces_only_cache_rows(session: Session, app_ids: list[uuid.UUID]) -> None:
+    db_services.MaxFairShiftsOfApp.create_bulk([
+        schemas.MaxFairShiftsOfAppCreate(max_shifts=1, fair_shifts=1.0, actor_plan_period_id=app_id)
+        for app_id in app_ids
+    ])
+    max_fair_shifts_cache.store("a" * 64, dict.fromkeys(app_ids, 2), dict.fromkeys(app_ids, 2.0))
+    max_fair_shifts_cache.store("b" * 64, dict.fromkeys(app_ids, 3), dict.fromkeys(app_ids, 3.0))
+
+    rows = session.exec(select(MaxFairShiftsOfApp)).all()
+    assert sorted((r.inputs_fingerprint or "", r.max_shifts) for r in rows) == [
+        ("", 1), ("", 1), ("b" * 64, 3), ("b" * 64, 3)]
+
+
+def test_readers_ignore_cache_rows(app_ids: list[uuid.UUID]) -> None:
+    plan_period_id = db_services.ActorPlanPeriod.get(app_ids[0]).plan_period.id
+    db_services.MaxFairShiftsOfApp.create_bulk([
+        schemas.MaxFairShiftsOfAppCreate(max_shifts=1, fair_shifts=1.0, actor_plan_period_id=app_ids[0])])
+    max_fair_shifts_cache.store("a" * 64, dict.fromkeys(app_ids, 2), dict.fromkeys(app_ids, 2.0))
+
+    assert db_services.MaxFairShiftsOfApp.get_by_actor_plan_period_ids(app_ids) == {app_ids[0]: (1, 1.0)}
+    assert db_services.MaxFairShiftsOfApp.get_all_from__plan_period_minimal(plan_period_id) == {
+        app_ids[0]: (1, 1.0)}
+    assert [m.max_shifts for m in db_services.MaxFairShiftsOfApp.get_all_from__plan_period(plan_period_id)] == [1]
+
+
+def test_fingerprint_tracks_model_and_budgets() -> None:
+    def fingerprint(upper_bound: int, *params: object) -> str:
+        model = cp_model.CpModel()
+        shift_var = model.NewBoolVar("")
+        model.Add(shift_var <= upper_bound)
+        app = SimpleNamespace(required_assignments=False)
+        app_id = uuid.UUID(int=1)
+        entities = SimpleNamespace(
+            shift_vars={(uuid.UUID(int=2), uuid.UUID(int=3)): shift_var},
+            avail_day_groups_with_avail_day={uuid.UUID(int=2): SimpleNamespace(
+                avail_day=SimpleNamespace(actor_plan_period=SimpleNamespace(id=app_id)))},
+            actor_plan_periods={app_id: app},
+        )
+        return max_fair_shifts_cache.inputs_fingerprint(model, entities, *params)
+
+    assert fingerprint(1, 20, 80) == fingerprint(1, 20, 80)
+    assert fingerprint(0, 20, 80) != fingerprint(1, 20, 80)
+    assert fingerprint(1, 20, 60) != fingerprint(1, 20, 80)
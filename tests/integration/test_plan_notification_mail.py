@@ -0,0 +1,50 @@
+"""Plan-Benachrichtigungen (``EmailService.send_plan_notification``).
+
+Verifiziert:
+- ``_assignments_by_person`` liefert dieselben Einsatzlisten wie der Lauf
+  über ``plan.appointments``, sortiert nach Datum
+- ``dry_run`` rendert alle Mails, versendet nichts und meldet Zeiten je Stufe
+- der Versand nutzt eine SMTP-Verbindung für alle Empfänger
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from database import models
+from database.database import get_session
+from email_to_users.service import EmailService
+from web_api.email.config_loader import SmtpConfig
+
+def test_assignments_by_person_matches_plan_walk(plan_id) -> None:
+    with get_session() as session:
+        plan = session.get(models.Plan, plan_id)
+        expected: dict = {}
+        for appointment in sorted(plan.appointments, key=lambda a: a.event.date):
+            for avail_day in appointment.avail_days:
+                expected.setdefault(avail_day.actor_plan_period.person_id, []).append({
+                    "date": appointment.event.date.strftime("%d.%m.%Y"),
+                    "time": appointment.event.time_of_day.name,
+                    "location": appointment.event.location_plan_period.location_of_work.name,
+                })
+
+        assert EmailService._assignments_by_person(session, plan_id) == expected
+
+
+def test_dry_run_renders_without_sending(plan_id, smtp_config: SmtpConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    service = EmailService(smtp_config)
+    monkeypatch.setattr(service, "_send_many", lambda payloads: pytest.fail("dry_run darf nicht senden"))
+
+    stats = service.send_plan_notification(str(plan_id), dry_run=True)
+
+    assert stats["rendered"] == 2
+    assert (stats["success"], stats["failed"]) == (0, 0)
+    assert set(stats["timings_ms"]) == {"query", "render", "deliver"}
+
+
+def test_delivery_reuses_one_connection(plan_id, smtp_config: SmtpConfig, smtp_connections) -> None:
+    stats = EmailService(smtp_config).send_plan_notification(str(plan_id))
+
+    assert (stats["success"], stats["failed"]) == (2, 0)
+    assert len(smtp_connections) == 1
+    assert len(smtp_connections[0].sent) == 2
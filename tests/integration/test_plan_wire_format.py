@@ -0,0 +1,49 @@
+"""Normalisiertes JSON für tiefe Lese-Schemas (``database.wire_format``).
+
+Verifiziert:
+- ``decode(encode(plan))`` ergibt denselben ``PlanShow`` wie der normale Weg,
+  gemeinsame Objekte (Person, Planperiode, Event) sind nach dem Dekodieren
+  dieselbe Instanz
+- normalisiertes JSON ist kleiner, jede Entity steht genau einmal darin
+- der Desktop-Endpunkt liefert das Format nur mit passendem Accept-Header
+"""
+
+from __future__ import annotations
+
+import json
+
+from fastapi.testclient import TestClient
+
+from database import db_services, schemas, wire_format
+
+
+def test_round_trip_shares_objects(plan_id) -> None:
+    plan = db_services.Plan.get(plan_id)
+
+    encoded = wire_format.encode(plan)
+    decoded = wire_format.decode(json.loads(json.dumps(encoded)), schemas.PlanShow)
+
+    assert decoded == plan
+    persons = {id(ad.actor_plan_period.person) for a in decoded.appointments for ad in a.avail_days}
+    assert len(persons) == 2
+    assert len({id(a.event.location_plan_period) for a in decoded.appointments}) == 1
+    assert len(json.dumps(encoded)) < len(plan.model_dump_json())
+    assert len(encoded["entities"]["Appointment"]) == 10
+
+
+def test_plain_json_still_decodes(plan_id) -> None:
+    plan = db_services.Plan.get(plan_id)
+
+    assert wire_format.decode(plan.model_dump(mode="json"), schemas.PlanShow) == plan
+
+
+def test_endpoint_negotiates_format(as_desktop: TestClient, plan_id) -> None:
+    plain = as_desktop.get(f"/api/v1/plans/{plan_id}")
+    normalized = as_desktop.get(f"/api/v1/plans/{plan_id}",
+                                   headers={"Accept": wire_format.NORMALIZED_MEDIA_TYPE})
+
+    assert plain.status_code == normalized.status_code == 200
+    assert not wire_format.is_normalized(plain.json())
+    assert normalized.headers["content-type"].startswith(wire_format.NORMALIZED_MEDIA_TYPE)
+    assert (wire_format.decode(normalized.json(), schemas.PlanShow)
+            == schemas.PlanShow.model_validate(plain.json()))
@@ -0,0 +1,93 @@
+"""Reminder-Versand (``EmailService.send_availability_reminder``, ``scheduler.jobs``).
+
+Verifiziert:
+- t7 erreicht alle Team-Members über eine SMTP-Verbindung, schreibt
+  NotificationLog + Inbox-Messages und zählt die berührten Zeilen
+- ein zweiter Lauf desselben kinds versendet nichts (Idempotenz)
+- t3 erreicht nur Personen mit offener Planperiode (keine aktiven AvailDays)
+- gleichzeitig feuernde Reminder-Jobs werden zu einem Lauf gebündelt
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+
+import pytest
+from sqlmodel import Session, select
+
+from database.models import (
+    AvailDay,
+    NotificationGroup,
+    NotificationLog,
+    Plan,
+    TeamActorAssign,
+)
+from email_to_users.service import EmailService
+from web_api.email.config_loader import SmtpConfig
+from web_api.models.web_models import InboxMessage, WebUser
+from web_api.scheduler import jobs
+
+@pytest.fixture
+def group_id(session: Session, plan_id, admin_user: WebUser, dispatcher_user: WebUser):
+    """NotificationGroup über der Planperiode des ``plan_id``-Fixtures, beide Personen im Team."""
+    plan_period = session.get(Plan, plan_id).plan_period
+    group = NotificationGroup(deadline=date(2026, 8, 25), team_id=plan_period.team_id)
+    plan_period.notification_group = group
+    session.add_all([
+        group,
+        *(TeamActorAssign(person_id=user.person_id, team_id=plan_period.team_id, start=date(2026, 1, 1))
+          for user in (admin_user, dispatcher_user)),
+    ])
+    session.commit()
+    return group.id
+
+
+def test_t7_reaches_all_members_once(
+    session: Session, group_id, smtp_config: SmtpConfig, smtp_connections,
+) -> None:
+    service = EmailService(smtp_config)
+
+    stats = service.send_availability_reminder(group_id, "t7")
+
+    assert (stats["success"], stats["failed"], stats["skipped"]) == (2, 0, 0)
+    assert stats["rows_written"] == 4  # 2 NotificationLog + 2 InboxMessage
+    assert stats["rows_read"] > 0
+    assert len(smtp_connections) == 1 and len(smtp_connections[0].sent) == 2
+    assert len(session.exec(select(NotificationLog)).all()) == 2
+    assert len(session.exec(select(InboxMessage)).all()) == 2
+
+    again = service.send_availability_reminder(group_id, "t7")
+
+    assert (again["success"], again["skipped"], again["rows_written"]) == (0, 2, 0)
+
+
+def test_t3_only_reaches_members_with_open_period(
+    session: Session, group_id, dispatcher_user: WebUser, smtp_config: SmtpConfig, smtp_connections,
+) -> None:
+    for avail_day in session.exec(select(AvailDay)).all():
+        if avail_day.actor_plan_period.person_id == dispatcher_user.person_id:
+            avail_day.prep_delete = datetime(2026, 8, 1)
+    session.commit()
+
+    stats = EmailService(smtp_config).send_availability_reminder(group_id, "t3")
+
+    assert stats["success"] == 1
+    logs = session.exec(select(NotificationLog)).all()
+    assert [log.person_id for log in logs] == [dispatcher_user.person_id]
+
+
+def test_simultaneous_jobs_are_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    runs: list[list] = []
+    monkeypatch.setattr(jobs, "_run_reminders", runs.append)
+    monkeypatch.setattr(jobs, "_COALESCE_WINDOW_SECONDS", 0.2)
+    threads = [threading.Thread(target=jobs.reminder_job, args=(f"00000000-0000-0000-0000-00000000000{i}", "t7"))
+               for i in range(3)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(runs) == 1
+    assert len(runs[0]) == 3
@@ -0,0 +1,86 @@
+"""Request-Instrumentierung (``web_api.instrumentation``).
+
+Verifiziert:
+- Metriken sind nach Route-Template gelabelt und zählen die Abfragen des Requests
+- ``GET /metrics`` nur mit METRICS_TOKEN, Prometheus-Textformat
+- fehlgeschlagene Statements hinterlassen keine Startzeit auf der Verbindung
+- Slow-Logs enthalten keine Literale oder Parameterwerte
+- ``assert_max_queries`` schlägt bei Überschreitung fehl
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, text
+
+from web_api import instrumentation
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    instrumentation.reset_metrics()
+    monkeypatch.setattr(instrumentation, "_config", instrumentation.InstrumentationConfig())
+
+
+def test_metrics_labelled_by_route_template(client: TestClient) -> None:
+    client.get("/health")
+    client.get("/help/gibt/es/nicht")
+    client.get("/kein-endpunkt")
+
+    rendered = instrumentation.render_prometheus()
+
+    assert 'hcc_http_requests_total{method="GET",route="/health",status="200"} 1' in rendered
+    assert 'hcc_http_request_db_queries_total{method="GET",route="/health",status="200"} 1' in rendered
+    assert 'route="/help/{slug:path}"' in rendered
+    assert "/help/gibt/es/nicht" not in rendered
+    assert 'hcc_http_requests_total{method="GET",route="<unmatched>",status="404"} 1' in rendered
+    assert ('hcc_http_request_duration_seconds_bucket{method="GET",route="/health",status="200",le="+Inf"} 1'
+            in rendered)
+
+
+def test_metrics_endpoint_requires_token(client: TestClient) -> None:
+    assert client.get("/metrics").status_code == 404
+
+    instrumentation.configure(metrics_token="s3cret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer falsch"}).status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE hcc_http_request_duration_seconds histogram" in response.text
+
+
+def test_failed_statement_clears_start_time(session: Session) -> None:
+    with pytest.raises(Exception):
+        session.exec(text("SELECT * FROM gibt_es_nicht"))
+    session.rollback()
+
+    assert not session.connection().info.get("query_start")
+
+
+def test_slow_logs_are_redacted(client: TestClient, session: Session, caplog: pytest.LogCaptureFixture) -> None:
+    instrumentation.configure(slow_query_ms=0, slow_request_ms=0)
+
+    with caplog.at_level(logging.WARNING, logger=instrumentation.__name__):
+        session.exec(text("SELECT 'geheim' AS x WHERE 1 = :n").bindparams(n=4711))
+        client.get("/health")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("Langsame Abfrage" in m and "SELECT '?' AS x WHERE 1 = ?" in m and "1 Parameter" in m
+               for m in messages)
+    assert any(m.startswith("Langsamer Request: GET /health 200") and "1 Queries" in m for m in messages)
+    assert not any("geheim" in m or "4711" in m for m in messages)
+
+
+def test_assert_max_queries(client: TestClient, assert_max_queries) -> None:
+    with assert_max_queries(1) as statements:
+        client.get("/health")
+    assert len(statements) == 1
+
+    with pytest.raises(pytest.fail.Exception, match="1 SQL-Abfragen, erlaubt sind hoechstens 0"):
+        with assert_max_queries(0):
+            client.get("/health")
@@ -0,0 +1,199 @@
+"""Solver-Job-Warteschlange (``web_api.solver_jobs`` + ``/api/v1/solver-jobs``).
+
+Verifiziert:
+- Submit liefert 503, solange ``SOLVER_JOB_WORKERS`` 0 ist
+- Submit/Get/Cancel über die Desktop-API
+- ``claim_next_job`` übernimmt einen Job genau einmal
+- ``fail_stale_jobs`` markiert Jobs ohne Heartbeat als fehlgeschlagen
+- Worker-Helfer ``record_progress``/``finish_job``
+- ``run_solver_job``: Erfolg speichert höchstens ``num_plans`` Versionen,
+  eine Exception im Solver markiert den Job als fehlgeschlagen
+- Runner ersetzt den Prozess-Pool nach ``BrokenProcessPool``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta, timezone
+from typing import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from database import db_services
+from database.models import PlanPeriod, Project, Team
+from sat_solver import solver_main
+from web_api.config import Settings, get_settings
+from web_api.main import app
+from web_api.models.web_models import SolverJob, SolverJobStatus
+from web_api.solver_jobs import service, worker
+
+
+@pytest.fixture
+def plan_period(session: Session, project: Project) -> PlanPeriod:
+    plan_period = PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30),
+                             team=Team(name="Solver-Team", project=project))
+    session.add(plan_period)
+    session.commit()
+    session.refresh(plan_period)
+    return plan_period
+
+
+@pytest.fixture
+def workers_enabled() -> Generator[None, None, None]:
+    app.dependency_overrides[get_settings] = lambda: Settings(SOLVER_JOB_WORKERS=1)
+    try:
+        yield
+    finally:
+        app.dependency_overrides.pop(get_settings, None)
+
+
+def _body(plan_period_ids: list[uuid.UUID]) -> dict:
+    return {
+        "plan_period_ids": [str(pp_id) for pp_id in plan_period_ids],
+        "num_plans": 2,
+        "time_calc_max_shifts": 5,
+        "time_calc_fair_distribution": 5,
+        "time_calc_plan": 10,
+    }
+
+
+def _submit(session: Session, plan_period: PlanPeriod, num_plans: int = 2) -> SolverJob:
+    job = service.submit_solver_job(
+        session,
+        plan_period_ids=[plan_period.id],
+        params=service.SolverJobParams(num_plans, 5, 5, 10),
+        created_by_id=None,
+    )
+    session.commit()
+    return job
+
+
+def test_submit_disabled_returns_503(as_desktop: TestClient, plan_period: PlanPeriod) -> None:
+    resp = as_desktop.post("/api/v1/solver-jobs", json=_body([plan_period.id]))
+    assert resp.status_code == 503
+
+
+def test_submit_get_cancel(
+    as_desktop: TestClient, workers_enabled: None, plan_period: PlanPeriod
+) -> None:
+    resp = as_desktop.post("/api/v1/solver-jobs", json=_body([plan_period.id]))
+    assert resp.status_code == 202
+    job = resp.json()
+    assert (job["status"], job["kind"]) == ("queued", "single_period")
+    assert job["team_id"] == str(plan_period.team_id)
+
+    listed = as_desktop.get("/api/v1/solver-jobs", params={"team_id": str(plan_period.team_id)}).json()
+    assert [j["id"] for j in listed] == [job["id"]]
+
+    resp = as_desktop.post(f"/api/v1/solver-jobs/{job['id']}/cancel")
+    assert resp.json()["status"] == "cancelled"
+    assert as_desktop.get(f"/api/v1/solver-jobs/{job['id']}").json()["status"] == "cancelled"
+
+
+def test_submit_unknown_period_404(as_desktop: TestClient, workers_enabled: None) -> None:
+    resp = as_desktop.post("/api/v1/solver-jobs", json=_body([uuid.uuid4()]))
+    assert resp.status_code == 404
+
+
+def test_claim_next_job_only_once(session: Session, plan_period: PlanPeriod) -> None:
+    job = _submit(session, plan_period)
+
+    assert service.claim_next_job(session) == job.id
+    assert service.claim_next_job(session) is None
+    session.refresh(job)
+    assert job.status == SolverJobStatus.running
+
+
+def test_cancel_running_job_sets_flag(session: Session, plan_period: PlanPeriod) -> None:
+    job = _submit(session, plan_period)
+    service.claim_next_job(session)
+    session.refresh(job)
+
+    service.request_cancel(session, job)
+    session.commit()
+
+    assert job.status == SolverJobStatus.running
+    assert service.record_progress(job.id, "Schritt 1") is True
+    service.finish_job(job.id, SolverJobStatus.cancelled)
+    session.refresh(job)
+    assert (job.status, job.progress_step) == (SolverJobStatus.cancelled, 1)
+
+
+def test_fail_stale_jobs(session: Session, plan_period: PlanPeriod) -> None:
+    job = _submit(session, plan_period)
+    service.claim_next_job(session)
+    session.refresh(job)
+    job.heartbeat_at = datetime.now(timezone.utc) - timedelta(minutes=10)
+    session.commit()
+
+    assert service.fail_stale_jobs(session, timedelta(minutes=5)) == 1
+    session.refresh(job)
+    assert job.status == SolverJobStatus.failed
+
+
+def _claimed_job(session: Session, plan_period: PlanPeriod, num_plans: int = 2) -> SolverJob:
+    job = _submit(session, plan_period, num_plans)
+    service.claim_next_job(session)
+    return job
+
+
+def test_run_solver_job_saves_requested_number_of_versions(
+    session: Session, plan_period: PlanPeriod, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # SQLite kennt den partiellen Unique-Index auf plan.plan_period_id nur
+    # vollständig — hier daher eine von drei Versionen.
+    job = _claimed_job(session, plan_period, num_plans=1)
+    monkeypatch.setattr(solver_main, "solve", lambda *args, **kwargs: ([[], [], []], {}, {}, {}, {}))
+
+    worker.run_solver_job(job.id)
+
+    session.refresh(job)
+    assert job.status == SolverJobStatus.succeeded
+    assert [db_services.Plan.get(uuid.UUID(plan_id)).name for plan_id in job.result["plan_ids"]] == [
+        "01.09.26-30.09.26 (01)"]
+
+
+def test_run_solver_job_marks_failure(
+    session: Session, plan_period: PlanPeriod, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job = _claimed_job(session, plan_period)
+
+    def _raise(*args, **kwargs):
+        raise RuntimeError("Modell kaputt")
+
+    monkeypatch.setattr(solver_main, "solve", _raise)
+
+    worker.run_solver_job(job.id)
+
+    session.refresh(job)
+    assert (job.status, job.error) == (SolverJobStatus.failed, "RuntimeError: Modell kaputt")
+    assert db_services.Plan.get_all_from__team(plan_period.team_id, True, True) == {}
+
+
+def test_runner_replaces_broken_pool(session: Session, plan_period: PlanPeriod) -> None:
+    job = _claimed_job(session, plan_period)
+    runner = worker.SolverJobRunner(1, 1.0, timedelta(minutes=5))
+    runner._pool = broken_pool = runner._new_pool()
+
+    async def _crash() -> None:
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(BrokenProcessPool("Kind-Prozess beendet"))
+        runner._on_done(job.id)(future)
+        for _ in range(200):
+            session.expire_all()
+            if session.get(SolverJob, job.id).status != SolverJobStatus.running:
+                return
+            await asyncio.sleep(0.01)
+
+    asyncio.run(_crash())
+
+    session.refresh(job)
+    assert (job.status, job.error) == (SolverJobStatus.failed, "Kind-Prozess beendet")
+    assert runner._pool_broken
+    runner._replace_pool()
+    assert runner._pool is not broken_pool and not runner._pool_broken
+    runner._pool.shutdown()
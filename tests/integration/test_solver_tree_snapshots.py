@@ -0,0 +1,89 @@
+"""Tree-Snapshots der Solver-Bäume (``sat_solver.tree_snapshot``).
+
+Verifiziert:
+- Zweiter ``get_event_group_tree``-Aufruf kommt aus dem Snapshot-Cache und
+  liefert dieselbe Struktur als frische, unabhängige anytree-Sicht
+- Commit auf eine Baum-Tabelle bumpt die Revision → Neubau
+- ein Bump aus einem anderen Prozess (nur die DB-Zeile) invalidiert ebenso
+- ``TreeSnapshot`` ist Pre-Order (Parent vor Kindern)
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from sqlmodel import Session
+
+from database.models import EventGroup, LocationOfWork, LocationPlanPeriod, PlanPeriod, Project, Team
+from sat_solver.event_group_tree import get_event_group_tree
+import database.database as db_module
+from database.tree_revision import bump_revision
+from sat_solver.tree_snapshot import current_revision, tree_snapshot_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_snapshot_cache():
+    tree_snapshot_cache.clear()
+    yield
+    tree_snapshot_cache.clear()
+
+
+@pytest.fixture
+def lpp(session: Session, project: Project) -> LocationPlanPeriod:
+    plan_period = PlanPeriod(start=date(2026, 9, 1), end=date(2026, 9, 30),
+                             team=Team(name="Tree-Team", project=project))
+    lpp = LocationPlanPeriod(plan_period=plan_period,
+                             location_of_work=LocationOfWork(name="Ort", project=project))
+    session.add(lpp)
+    session.commit()
+    master = lpp.event_group
+    child_a = EventGroup(event_group=master)
+    session.add_all([child_a, EventGroup(event_group=master), EventGroup(event_group=child_a)])
+    session.commit()
+    session.refresh(lpp)
+    return lpp
+
+
+def test_second_build_comes_from_snapshot(lpp: LocationPlanPeriod) -> None:
+    first = get_event_group_tree(lpp.plan_period_id, [lpp.id])
+    second = get_event_group_tree(lpp.plan_period_id, [lpp.id])
+
+    assert tree_snapshot_cache.stats()["hits"] == 1
+    assert second.to_snapshot() == first.to_snapshot()
+    assert second.root is not first.root
+    assert second.root.root_is_location_plan_period_master_group
+    assert len(second.root.descendants) == 3
+    assert set(second.nodes) == set(first.nodes)
+
+
+def test_commit_on_tree_table_invalidates(session: Session, lpp: LocationPlanPeriod) -> None:
+    get_event_group_tree(lpp.plan_period_id, [lpp.id])
+    revision = current_revision()
+
+    session.add(EventGroup(event_group_id=lpp.event_group.id))
+    session.commit()
+
+    assert current_revision() != revision
+    tree = get_event_group_tree(lpp.plan_period_id, [lpp.id])
+    assert tree_snapshot_cache.stats()["hits"] == 0
+    assert len(tree.root.descendants) == 4
+
+
+def test_revision_bump_from_other_process_invalidates(lpp: LocationPlanPeriod) -> None:
+    get_event_group_tree(lpp.plan_period_id, [lpp.id])
+
+    # Anderer Prozess: kein Listener hier feuert, nur die Revisionszeile ändert sich.
+    with db_module.engine.begin() as connection:
+        bump_revision(connection)
+
+    get_event_group_tree(lpp.plan_period_id, [lpp.id])
+    assert tree_snapshot_cache.stats() == {"entries": 1, "hits": 0, "misses": 2}
+
+
+def test_snapshot_is_pre_order(lpp: LocationPlanPeriod) -> None:
+    snapshot = get_event_group_tree(lpp.plan_period_id, [lpp.id]).to_snapshot()
+
+    assert snapshot.parent_indices[0] == -1
+    assert all(0 <= parent < i for i, parent in enumerate(snapshot.parent_indices) if i)
+    assert snapshot.node_ids[0] == lpp.event_group.id
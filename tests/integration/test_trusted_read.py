@@ -0,0 +1,54 @@
+"""Schnelle ORM → Schema-Konvertierung (``db_services._trusted_read``).
+
+Verifiziert:
+- ``to_schema`` / ``to_schemas`` liefern dieselben Schemas wie
+  ``model_validate`` (PlanShow, PlanPeriodShow, AvailDayShow, PersonShow)
+- Field-Validatoren laufen weiterhin (``parse_guests`` auf JSON-Text)
+- gemeinsame Unterobjekte sind innerhalb eines Aufrufs dieselbe Instanz
+"""
+
+from __future__ import annotations
+
+from sqlmodel import select
+
+from database import models, schemas
+from database.database import get_session
+from database.db_services._eager_loading import avail_day_show_options, plan_show_options
+from database.db_services._trusted_read import to_schema, to_schemas
+
+
+def _plan(session, plan_id):
+    stmt = select(models.Plan).where(models.Plan.id == plan_id).options(*plan_show_options())
+    return session.exec(stmt).unique().one()
+
+
+def test_matches_model_validate(plan_id) -> None:
+    with get_session() as session:
+        plan = _plan(session, plan_id)
+        plan_period = plan.plan_period
+        avail_days = session.exec(select(models.AvailDay).options(*avail_day_show_options())).unique().all()
+        persons = session.exec(select(models.Person)).all()
+
+        assert to_schema(schemas.PlanShow, plan) == schemas.PlanShow.model_validate(plan)
+        assert to_schema(schemas.PlanPeriodShow, plan_period) == schemas.PlanPeriodShow.model_validate(plan_period)
+        assert (to_schemas(schemas.AvailDayShow, avail_days)
+                == [schemas.AvailDayShow.model_validate(ad) for ad in avail_days])
+        assert ([p.model_dump() for p in to_schemas(schemas.PersonShow, persons)]
+                == [schemas.PersonShow.model_validate(p).model_dump() for p in persons])
+
+
+def test_runs_field_validators(plan_id) -> None:
+    with get_session() as session:
+        plan = _plan(session, plan_id)
+        plan.appointments[0].guests = '["Gast"]'
+
+        assert to_schema(schemas.PlanShow, plan).appointments[0].guests == ["Gast"]
+
+
+def test_shares_nested_instances(plan_id) -> None:
+    with get_session() as session:
+        plan = to_schema(schemas.PlanShow, _plan(session, plan_id))
+
+    persons = {id(ad.actor_plan_period.person) for a in plan.appointments for ad in a.avail_days}
+    assert len(persons) == 2
+    assert len({id(a.event.location_plan_period) for a in plan.appointments}) == 1
@@ -0,0 +1,67 @@
+"""Sammel-Endpunkt /api/v1/batch und Nachreichen der Offline-Queue.
+
+Verifiziert:
+- Operationen laufen in Reihenfolge, beim ersten Fehler ist Schluss
+  (``completed`` = Zahl der erfolgreichen)
+- nur Routen des Desktop-Routers sind Ziel; /batch selbst, Punkt-Segmente
+  und Query-Strings werden abgelehnt
+- eine gefüllte Offline-Queue wird über den Endpunkt nachgereicht, gleiche
+  Setzer kommen zusammengefasst genau einmal an
+"""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from database import db_services
+from gui.api_client.offline_queue import OfflineWriteQueue
+
+
+def test_batch_runs_in_order_and_stops_at_first_error(as_desktop: TestClient, plan_id) -> None:
+    response = as_desktop.post("/api/v1/batch", json={"operations": [
+        {"method": "PATCH", "path": f"/api/v1/plans/{plan_id}/notes", "body": {"notes": "eins"}},
+        {"method": "PATCH", "path": f"/api/v1/plans/{plan_id}/location-columns", "body": {"location_columns": "{}"}},
+        {"method": "PATCH", "path": f"/api/v1/plans/{plan_id}/notes", "body": {"falsch": 1}},
+        {"method": "PATCH", "path": f"/api/v1/plans/{plan_id}/notes", "body": {"notes": "nie"}},
+    ]})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["completed"] == 2
+    assert [r["status"] for r in data["results"]] == [200, 204, 422]
+    assert db_services.Plan.get(plan_id).notes == "eins"
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/batch",
+    "/api/v1/plans/../batch",
+    "/api/v1/../../admin/project-settings/deadline",
+    "/api/v1/%2e%2e/%2E%2E/admin/project-settings/deadline",
+    "/api/v1/plans/{plan_id}/notes?x=1",
+    "/api/v1/plans//{plan_id}/notes",
+    "/api/v1/gibt-es-nicht",
+])
+def test_batch_rejects_foreign_paths(as_desktop: TestClient, plan_id, path: str) -> None:
+    response = as_desktop.post("/api/v1/batch", json={"operations": [
+        {"method": "PATCH", "path": f"/api/v1/plans/{plan_id}/notes", "body": {"notes": "nie"}},
+        {"method": "POST", "path": path.format(plan_id=plan_id), "body": None}]})
+
+    assert response.status_code == 422
+    assert db_services.Plan.get(plan_id).notes != "nie"
+
+
+def test_offline_queue_replays_through_batch(as_desktop: TestClient, plan_id, tmp_path) -> None:
+    class _Client:
+        def post(self, path, json=None, timeout=None):
+            return as_desktop.post(path, json=json).json()
+
+    queue = OfflineWriteQueue(str(tmp_path / "queue.sqlite3"))
+    path = f"/api/v1/plans/{plan_id}/notes"
+    for notes in ("a", "b", "c"):
+        queue.enqueue("PATCH", path, {"notes": notes}, coalesce_key=f"PATCH {path}")
+
+    assert queue.replay(_Client()) == 1
+    assert queue.depth == 0
+    assert db_services.Plan.get(plan_id).notes == "c"
+    queue.close()
@@ -0,0 +1,132 @@
+"""CastRulesConstraint: Solver-Encoding vs. ``validate_plan``.
+
+Für ein kleines synthetisches Szenario (3 Mitarbeiter, 3 Events, Regel "-~")
+werden alle 2^9 Besetzungen durchprobiert: Das Modell muss genau die
+Besetzungen zulassen, die ``validate_plan`` als fehlerfrei meldet. Für die
+weiche Variante muss die Penalty der Zahl doppelt besetzter Mitarbeiter
+entsprechen.
+"""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.cast_group_tree import CastGroup
+from sat_solver.constraints.cast_rules import CastRulesConstraint
+from sat_solver.constraints.registry import ConstraintRegistry
+
+PERSONS = ("Anna", "Ben", "Cleo")
+NR_ACTORS = (2, 2, 3)
+
+
+def _event(day: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), event_group_id=uuid.uuid4(), date=date(2026, 9, day),
+        time_of_day=SimpleNamespace(name="abends", time_of_day_enum=SimpleNamespace(time_index=1)),
+        location_plan_period=SimpleNamespace(location_of_work=SimpleNamespace(name="Ort")),
+    )
+
+
+def _scenario(rule: str, strict_rule_pref: int):
+    model = cp_model.CpModel()
+    events = [_event(day) for day in (1, 2, 3)]
+
+    parent = CastGroup(None)
+    parent.cast_group_id = uuid.uuid4()
+    parent.cast_rule = rule
+    parent.strict_rule_pref = strict_rule_pref
+    cast_groups = {}
+    for event, nr_actors in zip(events, NR_ACTORS):
+        cast_group = CastGroup(None, parent=parent)
+        cast_group.cast_group_id = uuid.uuid4()
+        cast_group.nr_actors = nr_actors
+        cast_group._event = event
+        cast_groups[cast_group.cast_group_id] = cast_group
+
+    apps = {uuid.uuid4(): SimpleNamespace(person=SimpleNamespace(id=uuid.uuid4(), f_name=name, full_name=name))
+            for name in PERSONS}
+    avail_day_groups, shift_vars = {}, {}
+    for app_id, app in apps.items():
+        for event in events:
+            adg_id = uuid.uuid4()
+            avail_day_groups[adg_id] = SimpleNamespace(
+                avail_day=SimpleNamespace(actor_plan_period=SimpleNamespace(id=app_id), date=event.date))
+            shift_vars[(adg_id, event.event_group_id)] = model.NewBoolVar(f"{app.person.f_name} {event.date}")
+
+    event_group_vars = {event.event_group_id: model.NewConstant(1) for event in events}
+    entities = SimpleNamespace(
+        actor_plan_periods=apps,
+        avail_day_groups=avail_day_groups,
+        avail_day_groups_with_avail_day=avail_day_groups,
+        event_groups_with_event={e.event_group_id: SimpleNamespace(event_group_id=e.event_group_id, event=e)
+                                 for e in events},
+        event_group_vars=event_group_vars,
+        cast_groups={parent.cast_group_id: parent} | cast_groups,
+        cast_groups_with_event=cast_groups,
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+    )
+    registry = ConstraintRegistry(entities, model, SolverConfig())
+    constraint = registry.register(CastRulesConstraint)
+    constraint.apply()
+    return model, entities, constraint, events
+
+
+def _plan(entities, events, assignment: dict) -> SimpleNamespace:
+    """Plan mit einem Appointment pro Event; assignment: (adg_id, eg_id) -> 0/1."""
+    appointments = []
+    for event in events:
+        avail_days = [
+            SimpleNamespace(actor_plan_period=entities.actor_plan_periods[
+                entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id])
+            for (adg_id, eg_id), value in assignment.items() if value and eg_id == event.event_group_id
+        ]
+        appointments.append(SimpleNamespace(event=event, avail_days=avail_days))
+    return SimpleNamespace(appointments=appointments)
+
+
+def _is_feasible(model: cp_model.CpModel, entities, assignment: dict) -> tuple[bool, cp_model.CpSolver]:
+    model.ClearAssumptions()
+    model.AddAssumptions([entities.shift_vars[key] if value else entities.shift_vars[key].Not()
+                          for key, value in assignment.items()])
+    solver = cp_model.CpSolver()
+    solver.parameters.num_workers = 1
+    status = solver.Solve(model)
+    return status in (cp_model.OPTIMAL, cp_model.FEASIBLE), solver
+
+
+@pytest.mark.parametrize("rule", ["-~", "~-", "--"])
+def test_hard_encoding_matches_validate_plan(rule: str) -> None:
+    model, entities, constraint, events = _scenario(rule, strict_rule_pref=2)
+    keys = list(entities.shift_vars)
+
+    for values in itertools.product((0, 1), repeat=len(keys)):
+        assignment = dict(zip(keys, values))
+        feasible, _ = _is_feasible(model, entities, assignment)
+        valid = not constraint.validate_plan(_plan(entities, events, assignment))
+        assert feasible == valid, assignment
+
+
+def test_soft_different_cast_penalty_counts_double_assignments() -> None:
+    model, entities, constraint, events = _scenario("-*", strict_rule_pref=1)
+    keys = list(entities.shift_vars)
+    eg_1, eg_2 = events[0].event_group_id, events[1].event_group_id
+
+    for values in itertools.product((0, 1), repeat=len(keys)):
+        assignment = dict(zip(keys, values))
+        feasible, solver = _is_feasible(model, entities, assignment)
+        assert feasible
+        double = sum(
+            1 for app_id in entities.actor_plan_periods
+            if all(any(v for (adg_id, eg_id), v in assignment.items()
+                       if eg_id == eg and entities.avail_day_groups[adg_id].avail_day.actor_plan_period.id == app_id)
+                   for eg in (eg_1, eg_2))
+        )
+        assert sum(solver.Value(var) for var in constraint.penalty_vars) == double
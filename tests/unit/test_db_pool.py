@@ -0,0 +1,75 @@
+"""Connection-Pool-Profile und Pool-Telemetrie (``database.pool``).
+
+Verifiziert:
+- Profilwahl per ``DB_POOL_PROFILE`` und Env-Overrides einzelner Werte
+- Idle-Ping nur für Verbindungen, die länger als ``ping_after_idle`` lagen
+- Timeouts und Checkouts landen in den Metriken, auch nach ``dispose()``
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import exc as sa_exc
+from sqlalchemy import text
+
+from database import pool
+from database.pool import PoolProfile, create_pooled_engine, pool_metrics_snapshot, resolve_profile
+
+
+def test_resolve_profile_env_overrides(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert resolve_profile("web") == ("web", pool.POOL_PROFILES["web"])
+
+    monkeypatch.setenv("DB_POOL_PROFILE", "desktop")
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    monkeypatch.setenv("DB_POOL_PING_AFTER_IDLE", "-1")
+    name, profile = resolve_profile("web")
+
+    assert name == "desktop"
+    assert (profile.pool_size, profile.ping_after_idle) == (7, None)
+    assert profile.max_overflow == pool.POOL_PROFILES["desktop"].max_overflow
+
+    monkeypatch.setenv("DB_POOL_PROFILE", "unbekannt")
+    with pytest.raises(ValueError):
+        resolve_profile("web")
+
+
+def _engine(tmp_path, name: str, profile: PoolProfile):
+    return create_pooled_engine(f"sqlite:///{tmp_path / 'pool.sqlite'}", name, "web", profile,
+                                connect_args={"check_same_thread": False})
+
+
+def test_idle_ping_only_after_idle_threshold(tmp_path) -> None:
+    engine = _engine(tmp_path, "t-ping", PoolProfile(1, 0, 1, 1800, ping_after_idle=0.05))
+
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    assert pool_metrics_snapshot()["t-ping"]["pings"] == 0
+
+    time.sleep(0.1)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert pool_metrics_snapshot()["t-ping"]["pings"] == 1
+
+
+def test_timeouts_and_wait_histogram(tmp_path) -> None:
+    engine = _engine(tmp_path, "t-wait", PoolProfile(1, 0, 0.1, 1800, ping_after_idle=None))
+    held = engine.connect()
+    try:
+        with pytest.raises(sa_exc.TimeoutError):
+            engine.connect()
+    finally:
+        held.close()
+
+    engine.dispose()
+    worker = threading.Thread(target=lambda: engine.connect().close())
+    worker.start()
+    worker.join()
+
+    snapshot = pool_metrics_snapshot()["t-wait"]
+    assert (snapshot["checkouts"], snapshot["timeouts"]) == (2, 1)
+    assert snapshot["wait_seconds_buckets"][-1] == {"le": "+Inf", "count": 2}
+    assert snapshot["checked_out"] == 0
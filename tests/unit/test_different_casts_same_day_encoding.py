@@ -0,0 +1,120 @@
+"""DifferentCastsSameDayConstraint: Clique-Encoding vs. paarweise Referenz.
+
+Ein Mitarbeiter, ein Tag, drei Locations mit Vormittags- und Abend-Events.
+Für alle Besetzungen muss das Modell genau dann zulässig sein, wenn kein
+Var-Paar an verschiedenen Locations laut ``_comb_locations_possible``
+unerlaubt ist (die frühere ``sum <= 1``-Formulierung).
+"""
+
+from __future__ import annotations
+
+import datetime
+import itertools
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.constraints.different_casts_same_day import (
+    DifferentCastsSameDayConstraint,
+    _greedy_clique_cover,
+)
+from sat_solver.constraints.registry import ConstraintRegistry
+
+DAY = datetime.date(2026, 9, 1)
+MORNING = SimpleNamespace(name="vormittags", start=datetime.time(8), end=datetime.time(12))
+EVENING = SimpleNamespace(name="abends", start=datetime.time(18), end=datetime.time(22))
+
+
+def _scenario(with_clps: bool):
+    model = cp_model.CpModel()
+    locations = [SimpleNamespace(id=uuid.uuid4()) for _ in range(3)]
+    app = SimpleNamespace(id=uuid.uuid4())
+
+    def clps(time_span_hours: int) -> list:
+        if not with_clps:
+            return []
+        return [SimpleNamespace(prep_delete=None, locations_of_work=locations[:2],
+                                time_span_between=datetime.timedelta(hours=time_span_hours))]
+
+    # Vormittags braucht 1 h Abstand, abends keinen.
+    adgs = {
+        MORNING.name: (uuid.uuid4(), SimpleNamespace(id=uuid.uuid4(), actor_plan_period=app,
+                                                     combination_locations_possibles=clps(1))),
+        EVENING.name: (uuid.uuid4(), SimpleNamespace(id=uuid.uuid4(), actor_plan_period=app,
+                                                     combination_locations_possibles=clps(0))),
+    }
+    events = {}
+    # Location 0 vormittags doppelt → gleiche Signatur
+    for location, time_of_day in [(loc, tod) for loc in locations for tod in (MORNING, EVENING)] + [
+            (locations[0], MORNING)]:
+        eg_id = uuid.uuid4()
+        events[eg_id] = SimpleNamespace(event=SimpleNamespace(
+            date=DAY, time_of_day=time_of_day,
+            location_plan_period=SimpleNamespace(location_of_work=location)))
+
+    shift_vars = {}
+    for eg_id, event_group in events.items():
+        adg_id, _ = adgs[event_group.event.time_of_day.name]
+        shift_vars[(adg_id, eg_id)] = model.NewBoolVar("")
+
+    entities = SimpleNamespace(
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+        event_groups_with_event=events,
+        avail_day_groups_with_avail_day={adg_id: SimpleNamespace(avail_day=avail_day)
+                                         for adg_id, avail_day in adgs.values()},
+    )
+    registry = ConstraintRegistry(entities, model, SolverConfig())
+    constraint = registry.register(DifferentCastsSameDayConstraint)
+    constraint.apply()
+    return model, entities, constraint
+
+
+@pytest.mark.parametrize("with_clps", [True, False])
+def test_clique_encoding_matches_pairwise_reference(with_clps: bool) -> None:
+    model, entities, constraint = _scenario(with_clps)
+    keys = list(entities.shift_vars)
+
+    def location(key):
+        return entities.event_groups_with_event[key[1]].event.location_plan_period.location_of_work.id
+
+    forbidden = {
+        (k1, k2) for k1, k2 in itertools.combinations(keys, 2)
+        if location(k1) != location(k2) and not constraint._comb_locations_possible(*k1, *k2)
+    }
+    assert forbidden
+
+    for values in itertools.product((0, 1), repeat=len(keys)):
+        assignment = dict(zip(keys, values))
+        model.ClearAssumptions()
+        model.AddAssumptions([entities.shift_vars[k] if v else entities.shift_vars[k].Not()
+                              for k, v in assignment.items()])
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = 1
+        feasible = solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        valid = not any(assignment[k1] and assignment[k2] for k1, k2 in forbidden)
+        assert feasible == valid, assignment
+
+
+def test_without_clps_one_clique_per_day() -> None:
+    model, _, _ = _scenario(with_clps=False)
+    at_most_ones = [c for c in model.Proto().constraints if c.has_at_most_one()]
+
+    # Drei Location-Literale, eine Clique statt 16 Paar-Constraints
+    assert len(at_most_ones) == 1
+    assert len(at_most_ones[0].at_most_one.literals) == 3
+
+
+def test_greedy_clique_cover_covers_all_edges() -> None:
+    # Oktaeder (K_{2,2,2}): maximale Cliquen sind Dreiecke
+    adjacency = [{j for j in range(6) if j // 2 != i // 2} for i in range(6)]
+    cliques = _greedy_clique_cover(adjacency)
+
+    covered = {frozenset(p) for clique in cliques for p in itertools.combinations(clique, 2)}
+    assert covered == {frozenset((i, j)) for i in range(6) for j in adjacency[i]}
+    for clique in cliques:
+        assert len(clique) == 3
+        assert all(b in adjacency[a] for a, b in itertools.combinations(clique, 2))
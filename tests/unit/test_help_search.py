@@ -0,0 +1,66 @@
+"""Volltextsuche der Hilfe (``web_api.help.search``).
+
+Verifiziert:
+- Umlaute und ausgeschriebene Umlaute landen auf demselben Term
+- Praefix-Suche, UND-Verknuepfung und Titel-Gewichtung
+- Rollenfilter: Topics ohne Rollen sind fuer alle sichtbar
+- die Disk-Ablage wird beim zweiten Laden statt eines Neuaufbaus genutzt
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from web_api.help import search
+from web_api.help.models import HelpTopic
+
+
+def _topic(slug: str, title: str, body: str, roles: tuple[str, ...] = ()) -> HelpTopic:
+    return HelpTopic(slug=slug, title=title, roles=roles, category="Mitarbeiter",
+                     body_html="", body_text=body)
+
+
+_TOPICS = {
+    "employee/availability": _topic("employee/availability", "Verfügbarkeit eintragen",
+                                    "Trage ein, wann du arbeiten kannst.", ("employee",)),
+    "employee/calendar": _topic("employee/calendar", "Kalender",
+                                "Deine Einsätze und deine Verfügbarkeit im Überblick.", ("employee",)),
+    "dispatcher/circles": _topic("dispatcher/circles", "Notfall-Kreise",
+                                 "Wer wird bei Ausfall benachrichtigt?", ("dispatcher",)),
+    "general/login": _topic("general/login", "Anmelden", "Passwort vergessen? Größe egal."),
+}
+
+
+@pytest.fixture
+def index() -> search.HelpSearchIndex:
+    return search.HelpSearchIndex.build(_TOPICS, search.content_hash(_TOPICS))
+
+
+def test_tokenize_normalizes_umlauts() -> None:
+    assert search.tokenize("Verfügbarkeit") == search.tokenize("VERFUEGBARKEIT") == ["verfuegbarkeit"]
+    assert search.tokenize("Größe und café") == ["groesse", "cafe"]
+
+
+def test_prefix_search_ranks_title_hits_first(index: search.HelpSearchIndex) -> None:
+    hits = index.search("verfü", {"employee"})
+
+    assert [h.slug for h in hits] == ["employee/availability", "employee/calendar"]
+    assert [h.slug for h in index.search("verfügbarkeit überblick", {"employee"})] == ["employee/calendar"]
+
+
+def test_role_filter(index: search.HelpSearchIndex) -> None:
+    assert index.search("notfall", {"employee"}) == []
+    assert [h.slug for h in index.search("notfall", {"dispatcher"})] == ["dispatcher/circles"]
+    assert [h.slug for h in index.search("passw", {"employee"})] == ["general/login"]
+
+
+def test_disk_cache_is_reused(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("HCC_HELP_INDEX_DIR", str(tmp_path))
+    built = search.load_or_build(_TOPICS)
+    assert len(list(tmp_path.glob("help-index-*.json"))) == 1
+
+    monkeypatch.setattr(search.HelpSearchIndex, "build", classmethod(lambda *a: pytest.fail("kein Neuaufbau")))
+    loaded = search.load_or_build(_TOPICS)
+
+    assert loaded.terms == built.terms
+    assert loaded.search("kalender", {"employee"}) == built.search("kalender", {"employee"})
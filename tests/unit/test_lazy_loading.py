@@ -0,0 +1,59 @@
+"""Lazy geladene Subsysteme des Desktop-Clients (``gui.lazy_loading``).
+
+Verifiziert:
+- ``lazy_import`` führt das Modul erst beim ersten Attributzugriff aus
+- ``gui.main_window`` lädt beim Import weder Solver (OR-Tools) noch
+  Google-API-Stack, sympy oder xlsxwriter
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from gui.lazy_loading import lazy_import
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_lazy_import_defers_execution_until_attribute_access(tmp_path, monkeypatch):
+    (tmp_path / 'lazy_probe_module.py').write_text("import builtins\nbuiltins.lazy_probe_loaded = True\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, 'lazy_probe_module', raising=False)
+
+    import builtins
+    module = lazy_import('lazy_probe_module')
+    try:
+        assert not hasattr(builtins, 'lazy_probe_loaded')
+        assert module.VALUE == 42
+        assert builtins.lazy_probe_loaded is True
+        assert lazy_import('lazy_probe_module') is module
+    finally:
+        sys.modules.pop('lazy_probe_module', None)
+        builtins.__dict__.pop('lazy_probe_loaded', None)
+
+
+def test_lazy_import_unknown_module_raises():
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import('no_such_module_for_lazy_import')
+
+
+def test_main_window_import_skips_heavy_subsystems(tmp_path):
+    code = textwrap.dedent("""
+        import sys
+        import gui.main_window
+        heavy = ('ortools', 'sat_solver.solver_main', 'googleapiclient', 'sympy', 'xlsxwriter', 'pandas')
+        loaded = [name for name in heavy
+                  if name in sys.modules and type(sys.modules[name]).__name__ != '_LazyModule']
+        print(','.join(loaded))
+    """)
+    env = {**os.environ, 'QT_QPA_PLATFORM': 'offscreen',
+           'DATABASE_URL': f"sqlite:///{tmp_path / 'startup.sqlite'}"}
+    result = subprocess.run([sys.executable, '-c', code], cwd=_PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip() == ''
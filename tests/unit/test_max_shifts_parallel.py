@@ -0,0 +1,112 @@
+"""Parallele Max-Shifts-Berechnung (``solver_main._solve_max_shifts_of_app``).
+
+Synthetisches Basis-Model: vier Mitarbeiter, sechs Events mit je einem Platz,
+Mitarbeiter an 2–5 zufälligen Events verfügbar, alle Events besetzt. Die
+Maximierung auf Kopien des Basis-Models im Thread-Pool muss pro Mitarbeiter
+dasselbe Ergebnis liefern wie ein eigenes Model pro Mitarbeiter, und das
+Basis-Model bleibt ohne Zielfunktion.
+
+Findet ein Mitarbeiter keine Lösung, kehrt der Pool sofort zurück und beendet
+die laufenden Suchen der anderen, statt deren Zeitlimit abzuwarten.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from ortools.sat.python import cp_model
+
+from sat_solver import solver_main
+from sat_solver.solve_context import current_context, solve_context
+from sat_solver.solver_main import (_max_shifts_in_pool, _solve_max_shifts_of_app, constraint_max_shift_of_app,
+                                    constraints_max_shifts_of_apps, solve_model_to_optimum)
+
+NUM_APPS = 4
+NUM_EVENTS = 6
+
+
+def _scenario(model: cp_model.CpModel, seed: int = 3) -> SimpleNamespace:
+    rng = random.Random(seed)
+    apps = {uuid.uuid4(): SimpleNamespace() for _ in range(NUM_APPS)}
+    events = [uuid.uuid4() for _ in range(NUM_EVENTS)]
+    avail_day_groups, shift_vars = {}, {}
+    for nr_avail, app_id in enumerate(apps, start=2):
+        for eg_id in rng.sample(events, nr_avail):
+            adg_id = uuid.uuid4()
+            avail_day_groups[adg_id] = SimpleNamespace(
+                avail_day=SimpleNamespace(actor_plan_period=SimpleNamespace(id=app_id)))
+            shift_vars[(adg_id, eg_id)] = model.NewBoolVar("")
+    # Wie die fixierten unassigned_shifts: jedes Event mit Kandidaten wird besetzt
+    for eg_id in events:
+        if candidates := [var for (_, e), var in shift_vars.items() if e == eg_id]:
+            model.AddExactlyOne(candidates)
+    return SimpleNamespace(actor_plan_periods=apps, avail_day_groups_with_avail_day=avail_day_groups,
+                           shift_vars=shift_vars)
+
+
+def _sequential_reference(app_index: int) -> int:
+    """Alter Weg: eigenes Model pro Mitarbeiter (gleicher Seed → gleiches Szenario)."""
+    model = cp_model.CpModel()
+    entities = _scenario(model)
+    max_shifts = constraint_max_shift_of_app(model, list(entities.actor_plan_periods)[app_index], entities)
+    model.Maximize(max_shifts)
+    solver, _ = solve_model_to_optimum(model, 10, False)
+    return solver.value(max_shifts)
+
+
+def test_parallel_matches_sequential() -> None:
+    base_model = cp_model.CpModel()
+    entities = _scenario(base_model)
+    max_shifts_vars = constraints_max_shifts_of_apps(base_model, entities)
+
+    with ThreadPoolExecutor(max_workers=NUM_APPS) as pool:
+        parallel = list(pool.map(lambda var: _solve_max_shifts_of_app(base_model, var, 10, False, 1),
+                                 max_shifts_vars.values()))
+
+    assert parallel == [_sequential_reference(i) for i in range(NUM_APPS)]
+    assert len(set(parallel)) > 1
+    assert not base_model.has_objective()
+
+
+class _SlowSolver:
+    """Steht für eine laufende CP-SAT-Suche, die erst `stop_search()` beendet."""
+
+    def __init__(self):
+        self.stopped = threading.Event()
+
+    def stop_search(self) -> None:
+        self.stopped.set()
+
+
+def test_failed_app_stops_running_searches(monkeypatch) -> None:
+    app_ids = [uuid.uuid4() for _ in range(NUM_APPS)]
+    solvers = {app_id: _SlowSolver() for app_id in app_ids[1:]}
+    started = threading.Barrier(NUM_APPS)
+
+    def fake_solve(_model, app_id, *_args):
+        if app_id == app_ids[0]:
+            started.wait()
+            return None
+        solver = solvers[app_id]
+        with current_context().running(solver):
+            started.wait()
+            solver.stopped.wait(timeout=30)
+        return 1
+
+    monkeypatch.setattr(solver_main, "_solve_max_shifts_of_app", fake_solve)
+    begin = time.perf_counter()
+    with solve_context():
+        generator = _max_shifts_in_pool(None, {app_id: app_id for app_id in app_ids}, 30, False, NUM_APPS, 1)
+        try:
+            next(generator)
+        except StopIteration as finished:
+            result = finished.value
+
+    assert result == (False, {})
+    assert time.perf_counter() - begin < 5
+    assert all(solver.stopped.is_set() for solver in solvers.values())
@@ -0,0 +1,235 @@
+"""Offline-Queue des Desktop-Clients (``gui.api_client.offline_queue``).
+
+Verifiziert:
+- Reihenfolge bleibt erhalten, auch nach erneutem Öffnen der Journal-Datei
+- Setzer mit gleichem ``coalesce_key`` ersetzen den ausstehenden Vorgang
+- ``replay`` bestätigt nur den vom Server gemeldeten Präfix, verwirft
+  endgültig abgelehnte Vorgänge (z. B. 422) und lässt bei vorübergehenden
+  Fehlern (401, 409, 429, 5xx) oder fehlender Verbindung den Rest liegen
+- wiederholt abgelehnte Vorgänge (409, 500) werden nach ``MAX_ATTEMPTS``
+  beiseitegelegt, statt die Queue dauerhaft zu blockieren; Login-/Lastfehler
+  zählen nicht als Fehlversuch
+- ``DesktopApiClient``: direkte Schreibvorgänge warten hinter der Queue
+  (ohne auf einen laufenden Replay zu warten), ``write()`` reicht im
+  Hintergrund-Thread nach, das Journal gehört zu Server + User
+"""
+
+from __future__ import annotations
+
+import base64
+import json as jsonlib
+import threading
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from gui.api_client.client import ApiServerError, DesktopApiClient
+from gui.api_client.offline_queue import BATCH_PATH, MAX_ATTEMPTS, OfflineWriteQueue
+
+
+class _FakeClient:
+    """Beantwortet /batch wie der Server: Abbruch beim ersten Status in ``reject``."""
+
+    def __init__(self, reject: dict[str, int] | None = None, offline: bool = False):
+        self.reject = reject or {}
+        self.offline = offline
+        self.received: list[str] = []
+
+    def post(self, path, json=None, timeout=None):
+        assert path == BATCH_PATH
+        assert timeout is not None
+        if self.offline:
+            raise requests.ConnectionError("offline")
+        results = []
+        for op in json["operations"]:
+            status = self.reject.pop(op["path"], 204)
+            results.append({"status": status, "body": None})
+            if status >= 400:
+                return {"completed": len(results) - 1, "results": results}
+            self.received.append(op["path"])
+        return {"completed": len(results), "results": results}
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = OfflineWriteQueue(str(tmp_path / "queue.sqlite3"), batch_size=2)
+    yield queue
+    queue.close()
+
+
+def test_keeps_order_across_reopen(queue) -> None:
+    for i in range(3):
+        queue.enqueue("PATCH", f"/api/v1/x/{i}", {"i": i})
+    queue.close()
+
+    reopened = OfflineWriteQueue(queue.path)
+    assert [(op.path, op.body) for op in reopened.pending()] == [(f"/api/v1/x/{i}", {"i": i}) for i in range(3)]
+    reopened.close()
+
+
+def test_coalesces_setters(queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/a/notes", {"notes": "1"}, coalesce_key="PATCH /api/v1/a/notes")
+    queue.enqueue("DELETE", "/api/v1/b")
+    queue.enqueue("PATCH", "/api/v1/a/notes", {"notes": "2"}, coalesce_key="PATCH /api/v1/a/notes")
+
+    assert [(op.path, op.body) for op in queue.pending()] == [("/api/v1/b", None),
+                                                             ("/api/v1/a/notes", {"notes": "2"})]
+
+
+def test_replay_acknowledges_prefix_and_drops_rejected(queue) -> None:
+    for i in range(5):
+        queue.enqueue("PATCH", f"/api/v1/x/{i}")
+    client = _FakeClient(reject={"/api/v1/x/1": 422})
+
+    assert queue.replay(client) == 4
+
+    assert client.received == ["/api/v1/x/0", "/api/v1/x/2", "/api/v1/x/3", "/api/v1/x/4"]
+    stats = queue.stats()
+    assert (stats.depth, stats.replayed, stats.dropped) == (0, 4, 1)
+
+
+@pytest.mark.parametrize("status", [401, 403, 408, 409, 429, 503])
+def test_replay_keeps_queue_on_transient_error_or_offline(queue, status: int) -> None:
+    for i in range(3):
+        queue.enqueue("PATCH", f"/api/v1/x/{i}")
+
+    assert queue.replay(_FakeClient(offline=True)) == 0
+    assert queue.depth == 3
+
+    assert queue.replay(_FakeClient(reject={"/api/v1/x/1": status})) == 1
+    assert [op.path for op in queue.pending()] == ["/api/v1/x/1", "/api/v1/x/2"]
+    assert queue.stats().dropped == 0
+
+
+@pytest.mark.parametrize("status", [409, 500])
+def test_replay_sets_aside_repeatedly_rejected_write(queue, status: int) -> None:
+    for i in range(3):
+        queue.enqueue("PATCH", f"/api/v1/x/{i}")
+
+    for _ in range(MAX_ATTEMPTS - 1):
+        queue.replay(_FakeClient(reject={"/api/v1/x/1": status}))
+        assert queue.depth == 2
+    client = _FakeClient(reject={"/api/v1/x/1": status})
+    assert queue.replay(client) == 1
+
+    assert client.received == ["/api/v1/x/2"]
+    assert (queue.depth, queue.stats().set_aside) == (0, 1)
+    (set_aside,) = queue.set_aside_writes()
+    assert (set_aside.path, set_aside.status) == ("/api/v1/x/1", status)
+
+    queue.discard([set_aside.seq])
+    assert queue.set_aside_writes() == []
+
+
+def test_replay_does_not_count_auth_or_load_errors(queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/x/0")
+
+    for _ in range(MAX_ATTEMPTS + 1):
+        queue.replay(_FakeClient(reject={"/api/v1/x/0": 503}))
+
+    assert queue.depth == 1
+    assert queue.set_aside_writes() == []
+
+
+class _FakeSession:
+    """Ersetzt ``requests.Session`` des Clients; protokolliert (Thread, Methode, Pfad)."""
+
+    def __init__(self, offline: bool = False):
+        self.offline = offline
+        self.calls: list[tuple[str, str, str]] = []
+
+    def request(self, method, url, headers=None, json=None, **kwargs):
+        path = url.removeprefix("http://server")
+        self.calls.append((threading.current_thread().name, method, path))
+        if self.offline:
+            raise requests.ConnectionError("offline")
+        payload = None
+        if path == BATCH_PATH:
+            payload = {"completed": len(json["operations"]),
+                       "results": [{"status": 204, "body": None}] * len(json["operations"])}
+        response = requests.Response()
+        response.status_code = 200 if payload is not None else 204
+        response._content = jsonlib.dumps(payload).encode() if payload is not None else b""
+        return response
+
+
+def _token(user_id: str) -> str:
+    payload = base64.urlsafe_b64encode(jsonlib.dumps({"sub": user_id}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@pytest.fixture
+def api_client(queue):
+    client = DesktopApiClient("http://server")
+    client._access_token = _token("user-a")
+    client._offline_queue_path = lambda: queue.path
+    client._offline_queue = queue
+    client._session = _FakeSession()
+    yield client
+    if client._replay_executor is not None:
+        client._replay_executor.shutdown(wait=True)
+
+
+def test_direct_write_waits_behind_queue(api_client, queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/x/notes", {"notes": "a"})
+
+    api_client.post("/api/v1/x", json={})
+    api_client.get("/api/v1/x")
+
+    assert [call[1:] for call in api_client._session.calls] == [
+        ("POST", BATCH_PATH), ("POST", "/api/v1/x"), ("GET", "/api/v1/x")]
+    assert queue.depth == 0
+
+
+def test_direct_write_refused_while_queue_cannot_drain(api_client, queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/x/notes", {"notes": "a"})
+    api_client._session.offline = True
+
+    with pytest.raises(ApiServerError):
+        api_client.delete("/api/v1/x")
+
+    assert [call[1:] for call in api_client._session.calls] == [("POST", BATCH_PATH)]
+    assert queue.depth == 1
+
+
+def test_write_replays_in_background_thread(api_client, queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/x/notes", {"notes": "a"})
+
+    api_client.write("PATCH", "/api/v1/y/notes", {"notes": "b"})
+    api_client._replay_executor.shutdown(wait=True)
+
+    (thread_name, method, path), = api_client._session.calls
+    assert (method, path) == ("POST", BATCH_PATH)
+    assert thread_name != threading.current_thread().name
+    assert queue.depth == 0
+
+
+def test_direct_write_does_not_wait_for_running_replay(api_client, queue) -> None:
+    queue.enqueue("PATCH", "/api/v1/x/notes", {"notes": "a"})
+
+    with api_client._replay_lock:
+        with pytest.raises(ApiServerError):
+            api_client.post("/api/v1/x", json={})
+
+    assert api_client._session.calls == []
+
+
+def test_journal_is_scoped_to_server_and_user(monkeypatch, tmp_path) -> None:
+    from configuration import project_paths
+    monkeypatch.setattr(project_paths.curr_user_path_handler, "get_config",
+                        lambda: SimpleNamespace(config_file_path=str(tmp_path)))
+    client = DesktopApiClient("http://server-a")
+    assert client._offline_queue_path() is None
+
+    client._access_token = _token("user-a")
+    client.offline_queue.enqueue("PATCH", "/api/v1/x/notes", {"notes": "a"})
+    assert client._has_queued_writes()
+
+    client._access_token = _token("user-b")
+    assert not client._has_queued_writes()
+    client._access_token = _token("user-a")
+    client._base_url = "http://server-b"
+    assert not client._has_queued_writes()
+    client._base_url = "http://server-a"
+    assert client.offline_queue.depth == 1
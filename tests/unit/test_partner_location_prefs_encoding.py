@@ -0,0 +1,120 @@
+"""PartnerLocationPrefsConstraint: Encoding vs. Duo-Referenz.
+
+Zwei Events (Besetzungsstärke 2 und 3), vier Mitarbeiter mit gemischten
+Partner-Präferenzen. Für alle Besetzungen muss die Penalty-Summe der
+Duo-Formel entsprechen (Gewicht ``round((m[s0] + m[s1]) / (nr_actors - 1))``
+für jedes gemeinsam besetzte Duo, bei dem mindestens einer Präferenzen hat)
+und Score 0 bei Besetzungsstärke 2 unzulässig sein.
+"""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from ortools.sat.python import cp_model
+
+from configuration.solver import SolverConfig
+from sat_solver.constraints.partner_location_prefs import PartnerLocationPrefsConstraint
+from sat_solver.constraints.registry import ConstraintRegistry
+
+LOCATION = SimpleNamespace(id=uuid.uuid4(), name="Ort")
+OTHER_LOCATION = SimpleNamespace(id=uuid.uuid4(), name="Anderswo")
+
+
+def _scenario(default_multiplier: int):
+    model = cp_model.CpModel()
+    config = SolverConfig()
+    multipliers = dict(config.constraints_multipliers.sliders_partner_loc_prefs)
+    multipliers[1] = default_multiplier
+    config.constraints_multipliers.sliders_partner_loc_prefs = multipliers
+
+    persons = {name: SimpleNamespace(id=uuid.uuid4(), f_name=name) for name in ("Anna", "Ben", "Cleo", "Dana")}
+
+    def pref(partner: str, score: float, location=LOCATION):
+        return SimpleNamespace(partner=persons[partner], location_of_work=location, score=score)
+
+    prefs = {
+        "Anna": [pref("Ben", 0)],
+        "Ben": [pref("Anna", 2, OTHER_LOCATION)],
+        "Cleo": [pref("Anna", 2), pref("Dana", 0.5)],
+        "Dana": [],
+    }
+    events = {}
+    for nr_actors, day in ((2, 1), (3, 2)):
+        events[uuid.uuid4()] = SimpleNamespace(event=SimpleNamespace(
+            date=date(2026, 9, day), time_of_day=SimpleNamespace(name="abends"),
+            location_plan_period=SimpleNamespace(location_of_work=LOCATION),
+            cast_group=SimpleNamespace(nr_actors=nr_actors)))
+
+    avail_day_groups, shift_vars = {}, {}
+    for name, person in persons.items():
+        app = SimpleNamespace(id=uuid.uuid4(), person=person)
+        for eg_id in events:
+            adg_id = uuid.uuid4()
+            avail_day_groups[adg_id] = SimpleNamespace(avail_day_group_id=adg_id, avail_day=SimpleNamespace(
+                actor_plan_period=app, actor_partner_location_prefs_defaults=prefs[name]))
+            shift_vars[(adg_id, eg_id)] = model.NewBoolVar("")
+
+    entities = SimpleNamespace(
+        event_groups_with_event=events,
+        avail_day_groups_with_avail_day=avail_day_groups,
+        shift_vars=shift_vars,
+        shifts_exclusive={key: 1 for key in shift_vars},
+        event_group_vars={eg_id: model.NewBoolVar("") for eg_id in events},
+    )
+    constraint = ConstraintRegistry(entities, model, config).register(PartnerLocationPrefsConstraint)
+    constraint.apply()
+    return model, entities, constraint, multipliers
+
+
+def _expected(entities, multipliers, assignment) -> tuple[bool, int]:
+    feasible, penalty = True, 0
+    for eg_id, event_group in entities.event_groups_with_event.items():
+        nr_actors = event_group.event.cast_group.nr_actors
+        adgs = [adg for adg_id, adg in entities.avail_day_groups_with_avail_day.items()
+                if assignment.get((adg_id, eg_id))]
+        for adg_0, adg_1 in itertools.combinations(adgs, 2):
+            prefs_0 = adg_0.avail_day.actor_partner_location_prefs_defaults
+            prefs_1 = adg_1.avail_day.actor_partner_location_prefs_defaults
+            if not (prefs_0 or prefs_1):
+                continue
+            score_0 = next((p.score for p in prefs_0 if p.partner is adg_1.avail_day.actor_plan_period.person
+                            and p.location_of_work is LOCATION), 1)
+            score_1 = next((p.score for p in prefs_1 if p.partner is adg_0.avail_day.actor_plan_period.person
+                            and p.location_of_work is LOCATION), 1)
+            if not (score_0 and score_1) and nr_actors < 3:
+                feasible = False
+            if assignment[eg_id]:
+                penalty += round((multipliers[score_0] + multipliers[score_1]) / (nr_actors - 1))
+    return feasible, penalty
+
+
+@pytest.mark.parametrize("default_multiplier", [0, 30])
+def test_encoding_matches_duo_reference(default_multiplier: int) -> None:
+    model, entities, constraint, multipliers = _scenario(default_multiplier)
+    keys = list(entities.shift_vars) + list(entities.event_group_vars)
+    variables = {**entities.shift_vars, **entities.event_group_vars}
+
+    for values in itertools.product((0, 1), repeat=len(keys)):
+        assignment = dict(zip(keys, values))
+        model.ClearAssumptions()
+        model.AddAssumptions([variables[k] if v else variables[k].Not() for k, v in assignment.items()])
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = 1
+        feasible = solver.Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        expected_feasible, expected_penalty = _expected(entities, multipliers, assignment)
+        assert feasible == expected_feasible, assignment
+        if feasible:
+            assert sum(solver.Value(v) for v in constraint.penalty_vars) == expected_penalty, assignment
+
+
+def test_default_duos_get_no_variables() -> None:
+    _, _, constraint, _ = _scenario(default_multiplier=0)
+
+    # Nur Anna+Ben (0), Cleo+Anna (2), Cleo+Dana (0.5) pro Event — Ben hat zwar
+    # Präferenzen, aber nicht für diese Location; Ben+Dana etc. bleiben ohne Variable.
+    assert len(constraint.penalty_vars) == 3 * 2
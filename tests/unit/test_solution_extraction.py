@@ -0,0 +1,57 @@
+"""Appointments aus Solver-Lösungen (``sat_solver.solution_extraction``).
+
+Verifiziert:
+- ``SolutionIndex.extract`` liefert pro besetzter Event-Gruppe ein
+  Appointment mit den IDs der zugewiesenen AvailDays — ohne DB-Zugriff
+- Shift-Variablen von Gruppen ohne AvailDay werden ignoriert, nicht besetzte
+  Event-Gruppen fehlen im Ergebnis
+"""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+
+from ortools.sat.python import cp_model
+
+from database import schemas
+from sat_solver.solution_extraction import SolutionIndex
+
+
+def _entities(model: cp_model.CpModel):
+    adg_ids = [uuid.uuid4() for _ in range(3)]
+    avail_day_ids = [uuid.uuid4(), uuid.uuid4(), None]
+    eg_ids = [uuid.uuid4(), uuid.uuid4(), uuid.uuid4()]
+    event_ids = [uuid.uuid4() for _ in eg_ids]
+    shift_keys = [(adg_ids[0], eg_ids[0]), (adg_ids[1], eg_ids[0]), (adg_ids[2], eg_ids[0]),
+                  (adg_ids[1], eg_ids[1])]
+    entities = SimpleNamespace(
+        shift_vars={key: model.NewBoolVar("") for key in shift_keys},
+        event_group_vars={eg_id: model.NewBoolVar("") for eg_id in eg_ids},
+        avail_day_groups_with_avail_day={
+            adg_id: SimpleNamespace(_avail_day_id=ad_id) for adg_id, ad_id in zip(adg_ids, avail_day_ids)},
+        event_groups_with_event={
+            eg_id: SimpleNamespace(event=SimpleNamespace(id=event_id)) for eg_id, event_id in zip(eg_ids, event_ids)},
+    )
+    return entities, avail_day_ids, event_ids
+
+
+def test_extract_reads_ids_from_values() -> None:
+    model = cp_model.CpModel()
+    entities, avail_day_ids, event_ids = _entities(model)
+    index = SolutionIndex(entities)
+
+    values = [0] * len(model.Proto().variables)
+    for key, value in zip(entities.shift_vars, (1, 0, 1, 1)):
+        values[entities.shift_vars[key].index] = value
+    for eg_id, value in zip(entities.event_group_vars, (1, 1, 0)):
+        values[entities.event_group_vars[eg_id].index] = value
+
+    appointments = index.extract(values)
+
+    assert all(isinstance(a, schemas.AppointmentIdsCreate) for a in appointments)
+    assert [(a.event_id, a.avail_day_ids) for a in appointments] == [
+        (event_ids[0], [avail_day_ids[0]]),
+        (event_ids[1], [avail_day_ids[1]]),
+    ]
+    assert appointments[0].notes == ""
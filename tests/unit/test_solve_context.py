@@ -0,0 +1,136 @@
+"""Re-entrante Solver-Läufe (``sat_solver.solve_context`` / ``sat_solver.progress``).
+
+Verifiziert:
+- Parallele Berechnungen in Threads halten Debug-Zustand und
+  Fortschritts-Meldungen getrennt (Stress-Test)
+- Abbruch eines Kontexts trifft nur dessen eigene Suchen
+- ``ThreadSafeProgressSink`` verliert bei geteiltem Empfänger keine Meldungen
+- Variablen-Namen werden nur im Debug-Modus formatiert
+- ``print_solver_status`` liest die Infeasibility-Annahmen vom übergebenen Solver
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ortools.sat.python import cp_model
+
+from sat_solver import progress
+from sat_solver.solve_context import current_context, solve_context, stop_all
+from sat_solver.solver_main import print_solver_status, solve_model_to_optimum
+from tests.unit.test_cast_rules_encoding import _scenario
+
+NUM_SOLVES = 16
+STEPS = 20
+
+
+def _one_solve(job: int, barrier: threading.Barrier):
+    messages: list[str] = []
+    with solve_context() as context, progress.progress_callback(messages.append):
+        barrier.wait()
+        for step in range(STEPS):
+            progress.report(f"{job}:{step}")
+        model, _, constraint, _ = _scenario("-~", strict_rule_pref=1)
+        model.Minimize(sum(constraint.penalty_vars))
+        _, status = solve_model_to_optimum(model, 10, False)
+    return context, messages, status
+
+
+def test_concurrent_solves_keep_state_separate() -> None:
+    with solve_context() as reference:
+        _scenario("-~", strict_rule_pref=1)
+    expected_unequal = len(reference.cast_rules.is_unequal)
+    assert expected_unequal
+
+    barrier = threading.Barrier(NUM_SOLVES)
+    with ThreadPoolExecutor(max_workers=NUM_SOLVES) as pool:
+        results = list(pool.map(_one_solve, range(NUM_SOLVES), [barrier] * NUM_SOLVES))
+
+    seen_vars: set[int] = set()
+    for job, (context, messages, status) in enumerate(results):
+        assert status == cp_model.OPTIMAL
+        assert messages == [f"{job}:{step}" for step in range(STEPS)]
+        assert len(context.cast_rules.is_unequal) == expected_unequal
+        own_vars = {id(var) for var in context.cast_rules.is_unequal}
+        assert not own_vars & seen_vars
+        seen_vars |= own_vars
+    assert len({id(context) for context, _, _ in results}) == NUM_SOLVES
+
+
+def test_stop_only_affects_own_context() -> None:
+    stopped_ready, other_done = threading.Event(), threading.Event()
+    statuses = {}
+
+    def stopped_job():
+        with solve_context():
+            stopped_ready.set()
+            other_done.wait(10)
+            model, _, constraint, _ = _scenario("-~", strict_rule_pref=1)
+            model.Minimize(sum(constraint.penalty_vars))
+            statuses["stopped"] = solve_model_to_optimum(model, 10, False)[1]
+
+    def implicit_job():
+        # Ohne solve_context(): impliziter Kontext, von stop_all() nicht erfasst
+        current_context()
+        stopped_ready.wait(10)
+        stop_all()
+        model, _, constraint, _ = _scenario("-~", strict_rule_pref=1)
+        model.Minimize(sum(constraint.penalty_vars))
+        statuses["other"] = solve_model_to_optimum(model, 10, False)[1]
+        other_done.set()
+
+    threads = [threading.Thread(target=stopped_job), threading.Thread(target=implicit_job)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert statuses == {"stopped": cp_model.UNKNOWN, "other": cp_model.OPTIMAL}
+
+
+def test_thread_safe_sink_shared_by_workers() -> None:
+    received: list[str] = []
+    sink = progress.ThreadSafeProgressSink(received.append)
+
+    def worker(job: int) -> None:
+        with progress.progress_callback(sink):
+            for step in range(200):
+                progress.report(f"{job}:{step}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+
+    assert sorted(received) == sorted(f"{job}:{step}" for job in range(8) for step in range(200))
+
+
+def test_var_names_only_in_debug_mode() -> None:
+    calls: list[str] = []
+
+    def factory() -> str:
+        calls.append("x")
+        return "shift x"
+
+    with solve_context() as context:
+        context.reset_model_state()
+        _, _, constraint, _ = _scenario("-~", strict_rule_pref=1)
+        assert context.var_name(factory) == "" and not calls
+        assert constraint.penalty_vars and not any(var.Name() for var in constraint.penalty_vars)
+
+        context.reset_model_state(log_search_process=True)
+        assert context.var_name(factory) == "shift x" and calls == ["x"]
+
+
+def test_print_solver_status_infeasible_uses_given_solver() -> None:
+    model = cp_model.CpModel()
+    x = model.NewBoolVar("x")
+    assumption = model.NewBoolVar("x_muss_1_sein")
+    model.Add(x == 0)
+    model.Add(x == 1).OnlyEnforceIf(assumption)
+    model.AddAssumption(assumption)
+
+    solver = cp_model.CpSolver()
+    status = solver.Solve(model)
+
+    assert status == cp_model.INFEASIBLE
+    assert print_solver_status(model, solver, status) == (False, ["x_muss_1_sein"])
@@ -0,0 +1,107 @@
+"""Abbruch-Regeln und Such-Verläufe (``sat_solver.stopping``).
+
+Verifiziert:
+- ``objective_target`` beendet die Suche bei der ersten ausreichend guten
+  Lösung, der Trace landet im aktiven SolveContext
+- ohne Policy läuft die Suche bis zur Optimalität, Lösungen im Trace sind
+  streng monoton
+- ``no_improvement_seconds`` greift erst nach der ersten Lösung
+- Zwischenstände gehen an den aktiven Empfänger (Schlussmeldung mit bestem
+  Wert), Schnappschüsse der besten Lösung sind während der Suche abrufbar
+- ``accept_current`` beendet laufende Suchen, ohne den Kontext zu stoppen
+"""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from ortools.sat.python import cp_model
+
+from configuration.solver import StoppingPolicy
+from sat_solver import solver_main
+from sat_solver.progress import SolveProgress, solution_progress_callback
+from sat_solver.solve_context import solve_context
+from sat_solver.stopping import SolveTrace, StoppingCallback
+
+
+def _knapsack() -> cp_model.CpModel:
+    model = cp_model.CpModel()
+    items = [model.NewBoolVar("") for _ in range(30)]
+    weights = [(7 * i) % 23 + 3 for i in range(30)]
+    values = [(11 * i) % 29 + 1 for i in range(30)]
+    model.Add(sum(w * x for w, x in zip(weights, items)) <= 120)
+    model.Maximize(sum(v * x for v, x in zip(values, items)))
+    return model
+
+
+def _solve(policy: StoppingPolicy, monkeypatch) -> SolveTrace:
+    config = SimpleNamespace(stopping_policies=SimpleNamespace(adjusted=policy))
+    monkeypatch.setattr(solver_main.curr_config_handler, "get_solver_config", lambda: config)
+    with solve_context() as context:
+        solver_main.solve_model_to_optimum(_knapsack(), 10, False, num_workers=1, phase="adjusted")
+    assert len(context.traces) == 1
+    return context.traces[0]
+
+
+def test_objective_target_stops_early(monkeypatch) -> None:
+    trace = _solve(StoppingPolicy(objective_target=1), monkeypatch)
+
+    assert trace.stop_reason == "objective_target"
+    assert trace.phase == "adjusted"
+    assert len(trace.solutions) == 1 and trace.best_objective >= 1
+
+
+def test_trace_without_policy_runs_to_optimum(monkeypatch) -> None:
+    trace = _solve(StoppingPolicy(), monkeypatch)
+
+    assert trace.stop_reason == "optimal"
+    objectives = [objective for _, objective in trace.solutions]
+    assert objectives == sorted(set(objectives))
+    assert trace.time_to_within(objectives[-1], 0.0, maximize=True) == trace.solutions[-1][0]
+
+
+def test_no_improvement_window_starts_with_first_solution() -> None:
+    callback = StoppingCallback(_knapsack(), StoppingPolicy(no_improvement_seconds=0.05), SolveTrace("adjusted"))
+    stopped = threading.Event()
+
+    with callback.watch(SimpleNamespace(stop_search=stopped.set)):
+        assert not stopped.wait(0.3)
+        callback.record(10)
+        assert stopped.wait(2)
+
+
+def test_progress_and_snapshots_during_search(monkeypatch) -> None:
+    config = SimpleNamespace(stopping_policies=SimpleNamespace(adjusted=StoppingPolicy()))
+    monkeypatch.setattr(solver_main.curr_config_handler, "get_solver_config", lambda: config)
+    model = _knapsack()
+    items = [model.GetBoolVarFromProtoIndex(i) for i in range(30)]
+    received: list[SolveProgress] = []
+    snapshots: list[list[int] | None] = []
+
+    with solve_context() as context:
+        def on_progress(solve_progress: SolveProgress) -> None:
+            received.append(solve_progress)
+            snapshots.append(context.snapshot())
+
+        with solution_progress_callback(on_progress):
+            solver, _ = solver_main.solve_model_to_optimum(
+                model, 10, False, num_workers=1, phase="adjusted", publish_progress=True, unassigned=items[:3],
+                snapshot_builder=lambda values: [values[item.index] for item in items])
+
+    assert received[-1].objective == solver.objective_value and received[-1].phase == "adjusted"
+    assert received[-1].unassigned_shifts == sum(solver.Value(item) for item in items[:3])
+    in_search = [snapshot for snapshot in snapshots if snapshot is not None]
+    assert in_search and all(len(snapshot) == 30 for snapshot in in_search)
+    assert snapshots[-1] is None and context.snapshot() is None
+
+
+def test_accept_current_stops_searches_but_not_context() -> None:
+    stopped = threading.Event()
+    solver = cp_model.CpSolver()
+    solver.stop_search = stopped.set
+
+    with solve_context() as context, context.running(solver):
+        context.accept_current()
+
+    assert stopped.is_set() and not context.stopped
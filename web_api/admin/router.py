@@ -4,12 +4,14 @@ from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
 from fastapi.responses import HTMLResponse
 from sqlmodel import Session
 
+from database.pool import pool_metrics_snapshot
 from web_api.admin.email_settings_service import (
     get_settings_or_none,
     upsert_settings,
 )
 from web_api.admin.service import get_admin_project
 from web_api.auth.dependencies import WebUserRole, require_role
+from web_api.calendar_cache import feed_cache
 from web_api.dependencies import get_db_session
 from web_api.email.config_loader import (
     EmailNotConfiguredError,
@@ -235,4 +237,35 @@ def admin_test_email_settings(
             "ok": True,
             "message": f"Test-Mail wurde an {user.email} versendet.",
         },
-    )
\ No newline at end of file
+    )
+
+# ── Cache-Statistik ──────────────────────────────────────────────────────────
+
+
+@router.get("/cache-stats")
+def admin_cache_stats(
+    user: WebUser = require_role(WebUserRole.admin),
+):
+    """Hit-Ratio des Kalender-Feed-Caches dieses Workers (JSON).
+
+    Werte sind prozess-lokal — bei mehreren Uvicorn-Workern liefert jeder
+    Aufruf die Zahlen des Workers, der den Request bedient.
+    """
+    return {"calendar_feed": feed_cache.stats()}
+
+
+# ── DB-Pool-Metriken ─────────────────────────────────────────────────────────
+
+
+@router.get("/metrics/db-pool")
+def admin_db_pool_metrics(
+    user: WebUser = require_role(WebUserRole.admin),
+):
+    """Auslastung und Checkout-Wartezeiten der DB-Pools dieses Workers (JSON).
+
+    Pro Engine (``sync``, ``async``, ggf. ``scheduler``): Profil, aktuell
+    ausgeliehene Verbindungen, Overflow, Timeouts, Idle-Pings und ein
+    kumulatives Wartezeit-Histogramm (siehe `database.pool`). Prozess-lokal
+    wie ``/admin/cache-stats``.
+    """
+    return {"pools": pool_metrics_snapshot()}
@@ -0,0 +1,144 @@
+"""Async-Engine und Session-Factory für die Web-API (SQLAlchemy AsyncEngine).
+
+Ergänzt die synchrone Engine aus `database.database` um einen asynchronen
+Datenpfad für lese-intensive Endpoints (Viewer-Kalender, Inbox-Badge,
+Verfügbarkeits-Feeds). Hintergrund: sync `def`-Endpoints laufen im
+AnyIO-Threadpool (Default 40 Threads) und halten während der DB-Wartezeit
+einen Thread. Ein paar langsame Calls (Dashboard, Statistiken, Absage mit
+SMTP-Fan-out) blockieren so das HTMX-Badge-Polling aller anderen User.
+
+Async-Endpoints warten stattdessen auf dem Event-Loop. Die bestehenden
+Service-Funktionen bleiben synchron typisiert und werden per
+`AsyncSession.run_sync(...)` aufgerufen — SQLAlchemy führt sie dabei in einem
+Greenlet aus, dessen I/O asynchron über asyncpg läuft. Dadurch lassen sich
+Endpoints schrittweise umstellen, ohne die Service-Schicht zu duplizieren.
+
+Die Engine wird lazy beim ersten Zugriff erzeugt — Desktop-Client und
+Alembic importieren dieses Modul nie und brauchen kein asyncpg.
+
+Verwendung in Routern:
+    from web_api.dependencies import get_async_db_session
+
+    @router.get("/x")
+    async def x(session: AsyncSession = Depends(get_async_db_session)):
+        rows = await session.run_sync(service.load_rows, arg)
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event as _sa_event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database.pool import create_pooled_engine, resolve_profile
+from web_api.config import get_settings
+
+# Sync-Treiber → Async-Treiber. Unbekannte Treiber werden unverändert
+# durchgereicht (z. B. bereits `postgresql+asyncpg://`).
+_ASYNC_DRIVERS: dict[str, str] = {
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql+psycopg": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def to_async_url(database_url: str) -> str:
+    """Übersetzt eine sync DATABASE_URL in die Async-Variante.
+
+    render.com liefert `postgres://…` bzw. `postgresql://…` — beides wird zu
+    `postgresql+asyncpg://…`. `sslmode` versteht asyncpg nicht als
+    Query-Parameter; es wird auf das asyncpg-Äquivalent `ssl` umgeschrieben.
+    """
+    url = make_url(database_url)
+    drivername = _ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    url = url.set(drivername=drivername)
+    if drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        query = dict(url.query)
+        query["ssl"] = query.pop("sslmode")
+        url = url.set(query=query)
+    return url.render_as_string(hide_password=False)
+
+
+def _create_engine(database_url: str) -> AsyncEngine:
+    async_url = to_async_url(database_url)
+    if async_url.startswith("sqlite"):
+        engine = create_async_engine(async_url, echo=False)
+
+        # Wie in database.database: FK-Constraints für SQLite aktivieren
+        @_sa_event.listens_for(engine.sync_engine, "connect")
+        def _set_sqlite_fk_pragma(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+
+        return engine
+
+    # Eigener Pool, getrennt vom sync Pool: Async-Checkouts blockieren keinen
+    # Threadpool-Thread, brauchen aber eigene Verbindungen. Profil wie die
+    # sync Engine des Web-Workers (database.pool).
+    profile_name, profile = resolve_profile("web")
+    return create_pooled_engine(
+        _with_statement_cache(async_url, get_settings().DB_PREPARED_STATEMENT_CACHE_SIZE),
+        "async",
+        profile_name,
+        profile,
+        is_async=True,
+        echo=False,
+    )
+
+
+def _with_statement_cache(async_url: str, size: int) -> str:
+    """Setzt asyncpgs Prepared-Statement-Cache pro Verbindung.
+
+    Heiße Abfragen (Badge-Polling, Kalender-Feeds) werden serverseitig einmal
+    vorbereitet und danach nur noch ausgeführt. 0 schaltet den Cache ab — nötig
+    hinter PgBouncer im Transaction-Pooling-Modus.
+    """
+    url = make_url(async_url)
+    if url.drivername != "postgresql+asyncpg" or "prepared_statement_cache_size" in url.query:
+        return async_url
+    url = url.update_query_dict({"prepared_statement_cache_size": str(size)})
+    return url.render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Liefert die prozessweite AsyncEngine (lazy erzeugt)."""
+    global _engine
+    if _engine is None:
+        _engine = _create_engine(get_settings().DATABASE_URL)
+    return _engine
+
+
+def set_async_engine(engine: AsyncEngine | None) -> None:
+    """Ersetzt die AsyncEngine — für Tests (SQLite-Test-DB) und Shutdown."""
+    global _engine, _session_factory
+    _engine = engine
+    _session_factory = None
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session-Factory auf der aktuellen AsyncEngine.
+
+    `expire_on_commit=False`: nach dem Commit dürfen Templates noch auf
+    Attribute zugreifen, ohne einen (im Async-Kontext verbotenen) Lazy-Load
+    auszulösen.
+    """
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_async_engine(), class_=AsyncSession, expire_on_commit=False,
+        )
+    return _session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Schließt alle Pool-Verbindungen — aus dem FastAPI-Lifespan aufgerufen."""
+    if _engine is not None:
+        await _engine.dispose()
@@ -1,5 +1,11 @@
-"""FastAPI-Dependencies für Auth: get_current_user, require_login, require_role."""
+"""FastAPI-Dependencies für Auth: get_current_user, require_login, require_role.
 
+Für `async def`-Endpoints gibt es `require_login_async` / `AsyncLoggedInUser` /
+`require_role_async`: gleiche Logik, aber auf der request-scoped `AsyncSession`
+— sonst belegt allein die Authentifizierung wieder einen Threadpool-Thread.
+"""
+
+import uuid
 from typing import Annotated
 from urllib.parse import urlparse
 
@@ -8,11 +14,12 @@ from fastapi import Cookie, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from web_api.auth.cookies import set_auth_cookies
 from web_api.auth.service import decode_token, silent_refresh
 from web_api.config import Settings, get_settings
-from web_api.dependencies import get_db_session
+from web_api.dependencies import get_async_db_session, get_db_session
 from web_api.exceptions import LoginRequired
 from web_api.models.web_models import WebUser, WebUserRole, WebUserRoleLink
 
@@ -38,10 +45,15 @@ def _load_user_from_token(
 
     if payload.get("type") != "access":
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Falscher Token-Typ")
+    try:
+        # UUID statt str binden — aiosqlite/SQLite akzeptiert für Uuid-Spalten keine Strings.
+        user_id = uuid.UUID(payload.get("sub") or "")
+    except ValueError:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Ungültiges Token")
 
     user = session.exec(
         select(WebUser)
-        .where(WebUser.id == payload["sub"])
+        .where(WebUser.id == user_id)
         .options(selectinload(WebUser.role_links))  # type: ignore[arg-type]
     ).first()
 
@@ -120,6 +132,40 @@ def require_login(
     Bearer-Tokens werden NICHT silent gerefresht: API-Caller (Desktop) managen
     Tokens explizit über `/auth/refresh` und einen Refresh-Interceptor.
     """
+    return _resolve_login(
+        session, request, response, settings, bearer_token, access_token, refresh_token,
+    )
+
+
+async def require_login_async(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db_session),
+    settings: Settings = Depends(get_settings),
+    bearer_token: str | None = Depends(_oauth2_scheme),
+    access_token: str | None = Cookie(default=None),
+    refresh_token: str | None = Cookie(default=None),
+) -> WebUser:
+    """Wie `require_login`, aber für `async def`-Endpoints.
+
+    Nutzt dieselbe request-scoped `AsyncSession` wie der Endpoint (FastAPI
+    cached `get_async_db_session` pro Request) — eine Verbindung, kein Thread.
+    """
+    return await session.run_sync(
+        _resolve_login, request, response, settings, bearer_token, access_token, refresh_token,
+    )
+
+
+def _resolve_login(
+    session: Session,
+    request: Request,
+    response: Response,
+    settings: Settings,
+    bearer_token: str | None,
+    access_token: str | None,
+    refresh_token: str | None,
+) -> WebUser:
+    """Gemeinsamer Kern von `require_login` und `require_login_async`."""
     token = bearer_token or access_token
     if token:
         try:
@@ -141,6 +187,7 @@ def require_login(
 
 CurrentUser = Annotated[WebUser, Depends(get_current_user)]
 LoggedInUser = Annotated[WebUser, Depends(require_login)]
+AsyncLoggedInUser = Annotated[WebUser, Depends(require_login_async)]
 
 
 def require_role(*roles: WebUserRole):
@@ -153,8 +200,21 @@ def require_role(*roles: WebUserRole):
     """
 
     def _check(current_user: LoggedInUser) -> WebUser:
-        if not current_user.has_any_role(*roles):
-            raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Keine Berechtigung")
-        return current_user
+        return _ensure_role(current_user, roles)
+
+    return Depends(_check)
+
+
+def require_role_async(*roles: WebUserRole):
+    """Wie `require_role`, aber auf `AsyncLoggedInUser` — für `async def`-Endpoints."""
+
+    async def _check(current_user: AsyncLoggedInUser) -> WebUser:
+        return _ensure_role(current_user, roles)
+
+    return Depends(_check)
+
 
-    return Depends(_check)
\ No newline at end of file
+def _ensure_role(user: WebUser, roles: tuple[WebUserRole, ...]) -> WebUser:
+    if not user.has_any_role(*roles):
+        raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Keine Berechtigung")
+    return user
\ No newline at end of file
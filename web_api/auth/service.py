@@ -1,5 +1,6 @@
 """Auth-Service: Passwort-Hashing, JWT-Token-Verwaltung und User-Lookup."""
 
+import uuid
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
@@ -136,8 +137,9 @@ def silent_refresh(
     if payload.get("type") != "refresh":
         return None
 
-    user_id = payload.get("sub")
-    if not user_id:
+    try:
+        user_id = uuid.UUID(payload.get("sub") or "")
+    except ValueError:
         return None
 
     user = session.exec(
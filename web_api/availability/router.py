@@ -5,14 +5,16 @@ from datetime import date, time, timedelta
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Query, status
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
+from pydantic import BaseModel, Field
 from sqlalchemy import select as sa_select
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from database.models import ActorPlanPeriod, AvailDay, Person, TimeOfDay, TimeOfDayEnum
-from web_api.auth.dependencies import LoggedInUser
-from web_api.dependencies import get_db_session
-from web_api.availability import service
+from web_api.auth.dependencies import AsyncLoggedInUser, LoggedInUser
+from web_api.dependencies import get_async_db_session, get_db_session
+from web_api.availability import service, summary
 from web_api.templating import templates
 
 router = APIRouter(prefix="/availability", tags=["availability"])
@@ -54,16 +56,17 @@ def availability_page(
     at: str | None = Query(default=None),
 ):
     person_id = _require_person(user)
-    teams = service.get_teams_for_person(session, person_id)
+    # Teams, Perioden und Sidebar-Stats aus der vorberechneten Zusammenfassung
+    # (eine Abfrage statt 1 + N Team-Abfragen und zwei Zählungen).
+    summaries = summary.load_summaries(session, person_id)
+    teams = summary.teams_from_summaries(summaries)
 
     # Team ableiten: aus Query-Param oder erstes Team
     selected_team_id = team_id
     if selected_team_id is None and teams:
         selected_team_id = teams[0].team_id
 
-    open_periods = service.get_open_plan_periods_for_person(
-        session, person_id, team_id=selected_team_id
-    )
+    open_periods = summary.open_periods_from_summaries(summaries, selected_team_id)
 
     if not open_periods:
         return templates.TemplateResponse(
@@ -84,6 +87,7 @@ def availability_page(
         selected_team_id=selected_team_id,
         open_periods=open_periods,
         position=at,
+        sidebar_stats=summary.stats_from_summaries(summaries, active.actor_plan_period_id),
     )
 
     nav = view_model.period_nav
@@ -113,35 +117,45 @@ def availability_page(
 
 
 @router.get("/events")
-def availability_events(
-    user: LoggedInUser,
-    session: Session = Depends(get_db_session),
+async def availability_events(
+    user: AsyncLoggedInUser,
+    session: AsyncSession = Depends(get_async_db_session),
     actor_plan_period_id: uuid.UUID = Query(...),
     start: date = Query(...),
     end: date = Query(...),
 ):
-    """FullCalendar ruft diesen Endpoint für den sichtbaren Datumsbereich auf."""
+    """FullCalendar ruft diesen Endpoint für den sichtbaren Datumsbereich auf.
+
+    Async-Pfad (siehe `web_api.async_database`) — hochfrequent bei jeder
+    Kalender-Navigation, soll den Threadpool nicht belegen.
+    """
     person_id = _require_person(user)
-    service.authorize_actor_plan_period(session, person_id, actor_plan_period_id)
-    markers = service.get_markers_for_range(session, actor_plan_period_id, start, end)
 
-    return [
-        {
-            "id": str(m.avail_day_id),
-            "title": m.time_of_day_enum_abbreviation,
-            "start": m.day.isoformat(),
-            "allDay": True,
-            "color": _enum_color(m.time_of_day_enum_time_index),
-            "extendedProps": {
-                "time_of_day_id": str(m.time_of_day_id),
-                "has_appointment": m.has_appointment,
-                "enum_name": m.time_of_day_enum_name,
-                "tod_start": m.time_of_day_start.strftime("%H:%M"),
-                "tod_end": m.time_of_day_end.strftime("%H:%M"),
-            },
-        }
-        for m in markers
-    ]
+    def _load(sync_session: Session) -> list[service.AvailDayMarker]:
+        service.authorize_actor_plan_period(sync_session, person_id, actor_plan_period_id)
+        return service.get_markers_for_range(sync_session, actor_plan_period_id, start, end)
+
+    markers = await session.run_sync(_load)
+
+    return [_marker_to_fc_event(m) for m in markers]
+
+
+def _marker_to_fc_event(m: service.AvailDayMarker) -> dict:
+    """FullCalendar-Event-Shape eines Markers (Feed + Bulk-Antwort)."""
+    return {
+        "id": str(m.avail_day_id),
+        "title": m.time_of_day_enum_abbreviation,
+        "start": m.day.isoformat(),
+        "allDay": True,
+        "color": _enum_color(m.time_of_day_enum_time_index),
+        "extendedProps": {
+            "time_of_day_id": str(m.time_of_day_id),
+            "has_appointment": m.has_appointment,
+            "enum_name": m.time_of_day_enum_name,
+            "tod_start": m.time_of_day_start.strftime("%H:%M"),
+            "tod_end": m.time_of_day_end.strftime("%H:%M"),
+        },
+    }
 
 
 def _enum_color(time_index: int) -> str:
@@ -264,6 +278,53 @@ def create_avail_day(
     )
 
 
+class AvailDayToggleBody(BaseModel):
+    day: date
+    time_of_day_id: uuid.UUID
+    active: bool
+
+
+class AvailDayBulkBody(BaseModel):
+    actor_plan_period_id: uuid.UUID
+    toggles: list[AvailDayToggleBody] = Field(min_length=1, max_length=500)
+
+
+@router.post("/avail-day/bulk")
+def bulk_toggle_avail_days(
+    body: AvailDayBulkBody,
+    user: LoggedInUser,
+    session: Session = Depends(get_db_session),
+):
+    """Stapel von Zellen-Toggles (Intervall-Modus) in einer Transaktion.
+
+    Der Client sammelt schnelle Klicks und schickt sie gebündelt. Autorisierung
+    einmal pro Stapel; die Antwort enthält nur die geänderten Zellen
+    (neue Events im FullCalendar-Format + IDs gelöschter AvailDays) statt
+    einer neu gerenderten Ansicht.
+    """
+    person_id = _require_person(user)
+    _require_intervall_mode(session, person_id)
+    app = service.authorize_actor_plan_period(session, person_id, body.actor_plan_period_id)
+    service.check_closed_or_403(app.plan_period)
+
+    result = service.apply_avail_day_toggles(
+        session, app, person_id,
+        [service.AvailDayToggle(t.day, t.time_of_day_id, t.active) for t in body.toggles],
+    )
+    changed = bool(result.created or result.deleted_ids)
+    return JSONResponse(
+        {
+            "created": [_marker_to_fc_event(m) for m in result.created],
+            "deleted": [str(ad_id) for ad_id in result.deleted_ids],
+            "skipped": [
+                {"day": s.day.isoformat(), "time_of_day_id": str(s.time_of_day_id), "reason": s.reason}
+                for s in result.skipped
+            ],
+        },
+        headers={"HX-Trigger": "availability-changed"} if changed else None,
+    )
+
+
 @router.delete("/avail-day/by-enum", response_class=HTMLResponse)
 def delete_avail_day_by_enum(
     request: Request,
@@ -519,17 +580,25 @@ def delete_time_of_day(
 
 
 @router.get("/sidebar-stats", response_class=HTMLResponse)
-def sidebar_stats(
+async def sidebar_stats(
     request: Request,
-    user: LoggedInUser,
-    session: Session = Depends(get_db_session),
+    user: AsyncLoggedInUser,
+    session: AsyncSession = Depends(get_async_db_session),
     actor_plan_period_id: uuid.UUID = Query(...),
 ):
     """Liefert nur das Sidebar-Stats-Fragment — wird via HX-Trigger
     `availability-changed` aus den Mutation-Endpoints angestoßen."""
     person_id = _require_person(user)
-    app = service.authorize_actor_plan_period(session, person_id, actor_plan_period_id)
-    stats = service.get_sidebar_stats(session, actor_plan_period_id, app.requested_assignments)
+
+    def _load(sync_session: Session) -> service.SidebarStats:
+        # Treffer in der Zusammenfassung der Person ist zugleich die Autorisierung.
+        stats = summary.stats_from_summaries(summary.load_summaries(sync_session, person_id), actor_plan_period_id)
+        if stats is not None:
+            return stats
+        app = service.authorize_actor_plan_period(sync_session, person_id, actor_plan_period_id)
+        return service.get_sidebar_stats(sync_session, actor_plan_period_id, app.requested_assignments)
+
+    stats = await session.run_sync(_load)
     return templates.TemplateResponse(
         "availability/partials/sidebar_period_stats.html",
         {"request": request, "stats": stats},
@@ -358,11 +358,8 @@ def get_open_plan_periods_for_person(
     stmt = stmt.order_by(PlanPeriod.start.desc())
     rows = session.execute(stmt).mappings().all()
 
-    today = date.today()
-    current_or_future: list[OpenPlanPeriodInfo] = []
-    past: list[OpenPlanPeriodInfo] = []
-    for r in rows:
-        info = OpenPlanPeriodInfo(
+    return visible_plan_periods([
+        OpenPlanPeriodInfo(
             actor_plan_period_id=r["app_id"],
             plan_period_id=r["pp_id"],
             start=r["pp_start"],
@@ -375,10 +372,16 @@ def get_open_plan_periods_for_person(
             team_id=r["team_id"],
             team_name=r["team_name"],
         )
-        if info.end >= today:
-            current_or_future.append(info)
-        else:
-            past.append(info)
+        for r in rows
+    ])
+
+
+def visible_plan_periods(periods: list[OpenPlanPeriodInfo]) -> list[OpenPlanPeriodInfo]:
+    """Lookback-Regel auf `start.desc()` sortierte Perioden anwenden
+    (geteilt mit `web_api.availability.summary`)."""
+    today = date.today()
+    current_or_future = [p for p in periods if p.end >= today]
+    past = [p for p in periods if p.end < today]
 
     # Reihenfolge: laufend/zukuenftig zuerst (neueste oben), dann genau eine
     # vergangene Periode zur Einsicht — explizit die mit dem groessten `end`.
@@ -1029,9 +1032,13 @@ def build_availability_view(
     selected_team_id: uuid.UUID | None,
     open_periods: list[OpenPlanPeriodInfo],
     position: str | None = None,
+    sidebar_stats: SidebarStats | None = None,
 ) -> AvailabilityViewModel:
     """Zentrale Aggregation für die index.html-Seite.
 
+    `sidebar_stats` kann vorberechnet übergeben werden
+    (`web_api.availability.summary`); sonst wird gezählt.
+
     `position` steuert das initial_date nach Cross-PP-Sprung:
     - "end"   → initial_date = active_period.end (Sprung zur vorigen PP via "<")
     - "start" → initial_date = active_period.start (explizit Anfang)
@@ -1053,7 +1060,7 @@ def build_availability_view(
             active_period.end,
         )
     person_tods = get_person_time_of_days(session, person_id)
-    stats = get_sidebar_stats(
+    stats = sidebar_stats or get_sidebar_stats(
         session,
         active_period.actor_plan_period_id,
         active_period.requested_assignments,
@@ -1241,6 +1248,141 @@ def delete_avail_day(session: Session, avail_day_id: uuid.UUID) -> None:
         session.flush()
 
 
+# ── Bulk-Toggles (Monats-Eingabe) ────────────────────────────────────────────
+
+
+@dataclass
+class AvailDayToggle:
+    """Ein Zellen-Toggle: Ziel-Zustand für (Tag, TOD) — `active` = soll existieren."""
+    day: date
+    time_of_day_id: uuid.UUID
+    active: bool
+
+
+@dataclass
+class SkippedToggle:
+    day: date
+    time_of_day_id: uuid.UUID
+    reason: Literal["appointed", "outside_period"]
+
+
+@dataclass
+class BulkToggleResult:
+    """Nur die tatsächlich geänderten Zellen — No-Op-Toggles tauchen nicht auf."""
+    created: list[AvailDayMarker] = field(default_factory=list)
+    deleted_ids: list[uuid.UUID] = field(default_factory=list)
+    skipped: list[SkippedToggle] = field(default_factory=list)
+
+
+def _appointed_avail_day_ids(session: Session, avail_day_ids: list[uuid.UUID]) -> set[uuid.UUID]:
+    """Mengen-Variante von `has_appointment` — ein Query statt einem pro AvailDay."""
+    if not avail_day_ids:
+        return set()
+    return set(session.execute(
+        sa_select(AvailDayAppointmentLink.avail_day_id)
+        .join(Appointment, Appointment.id == AvailDayAppointmentLink.appointment_id)
+        .join(Plan, Plan.id == Appointment.plan_id)
+        .where(AvailDayAppointmentLink.avail_day_id.in_(avail_day_ids))
+        .where(Plan.is_binding.is_(True))
+        .where(Plan.prep_delete.is_(None))
+    ).scalars().all())
+
+
+def apply_avail_day_toggles(
+    session: Session,
+    app: ActorPlanPeriod,
+    person_id: uuid.UUID,
+    toggles: list[AvailDayToggle],
+) -> BulkToggleResult:
+    """Wendet einen Stapel Zellen-Toggles in einer Transaktion an.
+
+    Autorisierung (`authorize_actor_plan_period`, `check_closed_or_403`) macht
+    der Aufrufer einmal für den ganzen Stapel. Hier:
+      - mehrere Toggles derselben Zelle → der letzte gewinnt (Hin-und-Her-Klicks)
+      - Tage außerhalb der Planperiode und eingeplante AvailDays werden
+        übersprungen und im Ergebnis gemeldet, der Rest wird trotzdem angewendet
+      - TODs für neue AvailDays müssen zur Person gelinkt sein, sonst 403 für
+        den ganzen Stapel (vor jeder Mutation)
+
+    Bestand und Appointment-Flags werden mit je einem Query geladen, alle
+    Inserts/Deletes landen in einem einzigen Flush.
+    """
+    result = BulkToggleResult()
+    targets: dict[tuple[date, uuid.UUID], bool] = {}
+    for toggle in toggles:
+        targets[(toggle.day, toggle.time_of_day_id)] = toggle.active
+
+    plan_period = app.plan_period
+    for day, tod_id in list(targets):
+        if not plan_period.start <= day <= plan_period.end:
+            result.skipped.append(SkippedToggle(day, tod_id, "outside_period"))
+            del targets[(day, tod_id)]
+    if not targets:
+        return result
+
+    wanted_tod_ids = {tod_id for (_, tod_id), active in targets.items() if active}
+    if wanted_tod_ids:
+        linked = set(session.execute(
+            sa_select(PersonTimeOfDayLink.time_of_day_id)
+            .where(PersonTimeOfDayLink.person_id == person_id)
+            .where(PersonTimeOfDayLink.time_of_day_id.in_(wanted_tod_ids))
+        ).scalars().all())
+        if wanted_tod_ids - linked:
+            raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Kein Zugriff auf diese Tageszeit")
+
+    existing = {
+        (ad.date, ad.time_of_day_id): ad
+        for ad in session.execute(
+            sa_select(AvailDay)
+            .where(AvailDay.actor_plan_period_id == app.id)
+            .where(AvailDay.date.in_({day for day, _ in targets}))
+            .where(AvailDay.time_of_day_id.in_({tod_id for _, tod_id in targets}))
+            .where(AvailDay.prep_delete.is_(None))
+        ).scalars().all()
+    }
+    appointed = _appointed_avail_day_ids(session, [
+        existing[key].id for key, active in targets.items() if not active and key in existing
+    ])
+
+    master = app.avail_day_group
+    if master is None:
+        raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR,
+                            detail="Root-AvailDayGroup fehlt (Datenbestand-Anomalie)")
+
+    # Objekte statt FKs übergeben — siehe `create_avail_day` (before_flush-Listener).
+    new_avail_days: list[AvailDay] = []
+    for (day, tod_id), active in targets.items():
+        ad = existing.get((day, tod_id))
+        if active and ad is None:
+            ad = AvailDay(
+                date=day,
+                time_of_day_id=tod_id,
+                avail_day_group=AvailDayGroup(avail_day_group=master),
+                actor_plan_period=app,
+            )
+            session.add(ad)
+            new_avail_days.append(ad)
+        elif not active and ad is not None:
+            if ad.id in appointed:
+                result.skipped.append(SkippedToggle(day, tod_id, "appointed"))
+                continue
+            session.delete(ad)
+            session.delete(ad.avail_day_group)
+            result.deleted_ids.append(ad.id)
+    session.flush()
+
+    if new_avail_days:
+        new_ids = {ad.id for ad in new_avail_days}
+        result.created = [
+            m for m in get_markers_for_range(
+                session, app.id,
+                min(ad.date for ad in new_avail_days), max(ad.date for ad in new_avail_days),
+            )
+            if m.avail_day_id in new_ids
+        ]
+    return result
+
+
 def update_notes(session: Session, app: ActorPlanPeriod, notes: str) -> None:
     """Spiegelt db_services/actor_plan_period.py:172-177."""
     app.notes = notes or None
@@ -0,0 +1,301 @@
+"""Vorberechnete Verfügbarkeits-Zusammenfassung pro (Person, Planperiode).
+
+Die Verfügbarkeitsmaske brauchte pro Seitenaufruf `get_teams_for_person`
+(1 + eine Abfrage pro Team), `get_open_plan_periods_for_person` und zwei
+Zähl-Abfragen für die Sidebar-Stats — kurz vor einer Deadline öffnet die
+ganze Belegschaft die Seite gleichzeitig.
+
+Tabelle `availability_summary`: eine Zeile pro ActorPlanPeriod einer Person
+(nur nicht gelöschte PlanPeriods/Teams) mit Perioden-Stammdaten, Deadline,
+APP-Notizen/Wunscheinsätzen und den Zählern der Sidebar-Stats. Team-Liste,
+sichtbare Perioden, Navigation und Stats kommen damit aus EINER Abfrage
+(`load_summaries`); fehlt die Person in der Tabelle, wird sie mit einer
+mengenbasierten Abfrage neu gebaut und geschrieben.
+
+Invalidierung pro Person, analog zu `web_api.calendar_cache`:
+Session-Listener merken sich nach jedem Flush die berührten AvailDays,
+ActorPlanPeriods, Appointment-Links, Appointments, Pläne, PlanPeriods,
+Teams und NotificationGroups; NACH dem Commit löscht eine eigene
+Mini-Transaktion alle Zusammenfassungs-Zeilen der betroffenen Personen.
+Bulk-UPDATE/DELETE auf diesen Tabellen (ohne bekannte Objekte) leeren die
+ganze Tabelle. Unvollständig invalidierte Zeilen (Leser, der vor dem Commit
+gelesen und nach dem Löschen geschrieben hat) verfallen spätestens nach
+`AVAILABILITY_SUMMARY_MAX_AGE_SECONDS`.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import event, func, or_
+from sqlalchemy import select as sa_select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session
+
+from database.models import (
+    ActorPlanPeriod,
+    Appointment,
+    AvailDay,
+    AvailDayAppointmentLink,
+    NotificationGroup,
+    Plan,
+    PlanPeriod,
+    Team,
+)
+from web_api.availability.service import OpenPlanPeriodInfo, SidebarStats, TeamInfo, visible_plan_periods
+from web_api.config import get_settings
+from web_api.models.web_models import AvailabilitySummary
+
+logger = logging.getLogger(__name__)
+
+_SESSION_KEY = "availability_summary_dirty"
+_TRACKED_MODELS = (
+    ActorPlanPeriod, Appointment, AvailDay, AvailDayAppointmentLink, NotificationGroup, Plan, PlanPeriod, Team,
+)
+_TRACKED_TABLES: frozenset[str] = frozenset(m.__tablename__ for m in _TRACKED_MODELS)
+_ALL = "all"
+
+
+def _utcnow_naive() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class PeriodSummary:
+    period: OpenPlanPeriodInfo
+    stats: SidebarStats
+
+
+# ── Lesen ────────────────────────────────────────────────────────────────────
+
+
+def _compute_rows(session: Session, person_id: uuid.UUID) -> list[AvailabilitySummary]:
+    entered = (
+        sa_select(func.count(AvailDay.id))
+        .where(AvailDay.actor_plan_period_id == ActorPlanPeriod.id)
+        .where(AvailDay.prep_delete.is_(None))
+        .correlate(ActorPlanPeriod)
+        .scalar_subquery()
+    )
+    appointed = (
+        sa_select(func.count(AvailDay.id.distinct()))
+        .join(AvailDayAppointmentLink, AvailDayAppointmentLink.avail_day_id == AvailDay.id)
+        .where(AvailDay.actor_plan_period_id == ActorPlanPeriod.id)
+        .where(AvailDay.prep_delete.is_(None))
+        .correlate(ActorPlanPeriod)
+        .scalar_subquery()
+    )
+    rows = session.execute(
+        sa_select(
+            ActorPlanPeriod.id, ActorPlanPeriod.notes, ActorPlanPeriod.requested_assignments,
+            PlanPeriod.id, PlanPeriod.start, PlanPeriod.end, NotificationGroup.deadline,
+            PlanPeriod.notes_for_employees, PlanPeriod.closed, Team.id, Team.name,
+            entered, appointed,
+        )
+        .select_from(ActorPlanPeriod)
+        .join(PlanPeriod, PlanPeriod.id == ActorPlanPeriod.plan_period_id)
+        .join(NotificationGroup, NotificationGroup.id == PlanPeriod.notification_group_id, isouter=True)
+        .join(Team, Team.id == PlanPeriod.team_id)
+        .where(ActorPlanPeriod.person_id == person_id)
+        .where(PlanPeriod.prep_delete.is_(None))
+        .where(Team.prep_delete.is_(None))
+    ).all()
+    now = _utcnow_naive()
+    return [
+        AvailabilitySummary(
+            person_id=person_id, plan_period_id=pp_id, actor_plan_period_id=app_id,
+            team_id=team_id, team_name=team_name, start=start, end=end, deadline=deadline,
+            notes_for_employees=notes_for_employees, notes=notes,
+            requested_assignments=requested, closed=closed,
+            total_entered=total_entered, total_appointed=total_appointed, computed_at=now,
+        )
+        for (app_id, notes, requested, pp_id, start, end, deadline, notes_for_employees, closed,
+             team_id, team_name, total_entered, total_appointed) in rows
+    ]
+
+
+def _store_rows(session: Session, person_id: uuid.UUID, rows: list[AvailabilitySummary]) -> None:
+    """Schreibt die Zeilen in einem Savepoint — parallele Requests derselben
+    Person dürfen kollidieren, ohne die Request-Transaktion zu zerschießen."""
+    try:
+        with session.begin_nested():
+            session.execute(sa_delete(AvailabilitySummary).where(AvailabilitySummary.person_id == person_id))
+            session.add_all(rows)
+    except IntegrityError:
+        logger.debug("Verfügbarkeits-Zusammenfassung für %s parallel geschrieben — ignoriert", person_id)
+    # Nicht im Identity-Map halten: spätere Flushes der Request-Session sollen
+    # die Zeilen nicht erneut anfassen.
+    for row in rows:
+        if row in session:
+            session.expunge(row)
+
+
+def _to_summary(row: AvailabilitySummary) -> PeriodSummary:
+    return PeriodSummary(
+        period=OpenPlanPeriodInfo(
+            actor_plan_period_id=row.actor_plan_period_id,
+            plan_period_id=row.plan_period_id,
+            start=row.start,
+            end=row.end,
+            deadline=row.deadline,
+            notes_for_employees=row.notes_for_employees,
+            notes=row.notes,
+            requested_assignments=row.requested_assignments,
+            closed=row.closed,
+            team_id=row.team_id,
+            team_name=row.team_name,
+        ),
+        stats=SidebarStats(
+            total_entered=row.total_entered,
+            total_appointed=row.total_appointed,
+            requested_assignments=row.requested_assignments,
+        ),
+    )
+
+
+def load_summaries(session: Session, person_id: uuid.UUID) -> list[PeriodSummary]:
+    """Alle Zusammenfassungen der Person (`start` absteigend) — eine Abfrage im Normalfall."""
+    rows = session.execute(
+        sa_select(AvailabilitySummary).where(AvailabilitySummary.person_id == person_id)
+    ).scalars().all()
+    cutoff = _utcnow_naive() - timedelta(seconds=get_settings().AVAILABILITY_SUMMARY_MAX_AGE_SECONDS)
+    if not rows or any(row.computed_at < cutoff for row in rows):
+        for row in rows:
+            session.expunge(row)
+        rows = _compute_rows(session, person_id)
+        _store_rows(session, person_id, rows)
+    return [_to_summary(row) for row in sorted(rows, key=lambda r: r.start, reverse=True)]
+
+
+def teams_from_summaries(summaries: list[PeriodSummary]) -> list[TeamInfo]:
+    """Teams mit mindestens einer sichtbaren PlanPeriod (wie `get_teams_for_person`)."""
+    teams = {s.period.team_id: s.period.team_name for s in summaries}
+    return sorted(
+        (TeamInfo(team_id=team_id, team_name=name) for team_id, name in teams.items()
+         if open_periods_from_summaries(summaries, team_id)),
+        key=lambda t: t.team_name,
+    )
+
+
+def open_periods_from_summaries(
+    summaries: list[PeriodSummary],
+    team_id: uuid.UUID | None = None,
+) -> list[OpenPlanPeriodInfo]:
+    """Sichtbare Perioden (wie `get_open_plan_periods_for_person`)."""
+    return visible_plan_periods([
+        s.period for s in summaries if team_id is None or s.period.team_id == team_id
+    ])
+
+
+def stats_from_summaries(summaries: list[PeriodSummary], actor_plan_period_id: uuid.UUID) -> SidebarStats | None:
+    return next((s.stats for s in summaries if s.period.actor_plan_period_id == actor_plan_period_id), None)
+
+
+# ── Invalidierung ────────────────────────────────────────────────────────────
+
+
+def invalidate_persons(connection, person_ids) -> None:
+    """Löscht die Zusammenfassungen der Personen (`_ALL` = alle)."""
+    stmt = sa_delete(AvailabilitySummary)
+    if person_ids != _ALL:
+        stmt = stmt.where(AvailabilitySummary.person_id.in_(list(person_ids)))
+    connection.execute(stmt)
+
+
+def _dirty(session: SASession) -> dict:
+    return session.info.setdefault(_SESSION_KEY, {
+        "persons": set(), "apps": set(), "avail_days": set(), "plans": set(),
+        "plan_periods": set(), "teams": set(), "groups": set(), "all": False,
+    })
+
+
+def _collect(dirty: dict, obj) -> None:
+    if isinstance(obj, AvailDay):
+        dirty["apps"].add(obj.actor_plan_period_id)
+    elif isinstance(obj, ActorPlanPeriod):
+        dirty["persons"].add(obj.person_id)
+    elif isinstance(obj, AvailDayAppointmentLink):
+        dirty["avail_days"].add(obj.avail_day_id)
+    elif isinstance(obj, Appointment):
+        dirty["plans"].add(obj.plan_id)
+    elif isinstance(obj, Plan):
+        dirty["plan_periods"].add(obj.plan_period_id)
+    elif isinstance(obj, PlanPeriod):
+        dirty["plan_periods"].add(obj.id)
+    elif isinstance(obj, Team):
+        dirty["teams"].add(obj.id)
+    elif isinstance(obj, NotificationGroup):
+        dirty["groups"].add(obj.id)
+
+
+def _after_flush(session: SASession, _flush_context) -> None:
+    objects = [obj for obj in (*session.new, *session.dirty, *session.deleted) if isinstance(obj, _TRACKED_MODELS)]
+    if not objects:
+        return
+    dirty = _dirty(session)
+    for obj in objects:
+        _collect(dirty, obj)
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        _dirty(orm_execute_state.session)["all"] = True
+
+
+def _affected_persons(connection, dirty: dict):
+    if dirty["all"]:
+        return _ALL
+    plan_periods = sa_select(PlanPeriod.id).where(or_(
+        PlanPeriod.id.in_(list(dirty["plan_periods"])),
+        PlanPeriod.team_id.in_(list(dirty["teams"])),
+        PlanPeriod.notification_group_id.in_(list(dirty["groups"])),
+        PlanPeriod.id.in_(sa_select(Plan.plan_period_id).where(Plan.id.in_(list(dirty["plans"])))),
+    ))
+    apps = or_(
+        ActorPlanPeriod.id.in_(list(dirty["apps"])),
+        ActorPlanPeriod.id.in_(
+            sa_select(AvailDay.actor_plan_period_id).where(AvailDay.id.in_(list(dirty["avail_days"])))
+        ),
+        ActorPlanPeriod.plan_period_id.in_(plan_periods),
+    )
+    persons = set(dirty["persons"])
+    persons.update(connection.execute(sa_select(ActorPlanPeriod.person_id).where(apps).distinct()).scalars())
+    return persons
+
+
+def _after_commit(session: SASession) -> None:
+    dirty = session.info.pop(_SESSION_KEY, None)
+    if dirty is None:
+        return
+    bind = session.get_bind()
+    try:
+        with bind.begin() as connection:
+            persons = _affected_persons(connection, dirty)
+            if persons:
+                invalidate_persons(connection, persons)
+    except Exception:
+        # Wie beim Kalender-Cache: der Request ist bereits committet;
+        # schlimmstenfalls veralten die Zeilen bis zum Max-Age.
+        logger.exception("Verfügbarkeits-Zusammenfassung konnte nicht invalidiert werden")
+
+
+def _after_soft_rollback(session: SASession, _previous_transaction) -> None:
+    session.info.pop(_SESSION_KEY, None)
+
+
+def register_availability_summary_listeners() -> None:
+    """Registriert die Invalidierungs-Listener global auf `Session` (idempotent)."""
+    if event.contains(SASession, "after_flush", _after_flush):
+        return
+    event.listen(SASession, "after_flush", _after_flush)
+    event.listen(SASession, "do_orm_execute", _do_orm_execute)
+    event.listen(SASession, "after_commit", _after_commit)
+    event.listen(SASession, "after_soft_rollback", _after_soft_rollback)
@@ -0,0 +1,381 @@
+"""Serverseitiger Response-Cache für die FullCalendar-JSON-Feeds.
+
+`/viewer/plan/events` und `/dispatcher/plan/events` feuern bei jeder
+Kalender-Navigation und jedem View-Wechsel. Viele User fragen dieselben
+(Projekt, Team-Set, Datumsfenster)-Kombinationen mit identischen Daten ab —
+der teure Teil (`get_appointments_for_teams`) wird daher einmal berechnet
+und als JSON-fertige Basis-Payload gecacht.
+
+Zweistufig:
+1. Prozess-lokaler LRU (`CalendarFeedCache`) — immer aktiv.
+2. Optional (`CALENDAR_FEED_CACHE_SHARED=true`) eine Postgres-Tabelle
+   `calendar_feed_cache`, die sich alle Uvicorn-Worker teilen.
+
+Invalidierung über eine Daten-Revision (`calendar_feed_revision`, eine
+Zeile): Session-Listener bumpen sie nach jedem Commit, der Pläne,
+Appointments, Events oder deren Stammdaten berührt. Die Revision ist Teil
+des Cache-Keys — ein Bump macht alle alten Einträge in allen Workern
+unerreichbar, ohne sie aktiv löschen zu müssen.
+
+Der Bump läuft bewusst NACH dem Commit in einer eigenen Mini-Transaktion:
+Ein Leser, der die neue Revision sieht, sieht garantiert auch die neuen
+Daten. Ein Leser, der die alte Revision gelesen hat, cacht höchstens unter
+einem Key, der bereits überholt ist. Zusätzlich entsteht im fachlichen
+Transaktionspfad kein Row-Lock auf die Revisionszeile.
+
+Per-User-Farb-Overrides werden erst NACH dem Cache auf eine Kopie der
+Basis-Payload angewendet — sonst wäre der Cache pro User fragmentiert.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import event
+from sqlalchemy import select as sa_select
+from sqlalchemy import update as sa_update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as SASession
+from sqlmodel import Session
+
+from database.models import (
+    Address,
+    Appointment,
+    AvailDayAppointmentLink,
+    CastGroup,
+    Event,
+    LocationOfWork,
+    LocationPlanPeriod,
+    Plan,
+    PlanPeriod,
+    TimeOfDay,
+)
+from web_api.common import fc_event_end_iso, fc_event_start_iso
+from web_api.config import get_settings
+from web_api.dispatcher.service import get_appointments_for_teams
+from web_api.employees.service import CalendarEvent
+from web_api.models.web_models import CalendarFeedCacheEntry, CalendarFeedRevision
+
+logger = logging.getLogger(__name__)
+
+# Alles, was in die Feed-Payload einfließt (Join-Tabellen von
+# `get_appointments_for_teams`). Änderungen an diesen Entities → Bump.
+_TRACKED_MODELS: tuple[type, ...] = (
+    Address,
+    Appointment,
+    AvailDayAppointmentLink,
+    CastGroup,
+    Event,
+    LocationOfWork,
+    LocationPlanPeriod,
+    Plan,
+    PlanPeriod,
+    TimeOfDay,
+)
+_TRACKED_TABLES: frozenset[str] = frozenset(m.__tablename__ for m in _TRACKED_MODELS)
+
+_SESSION_FLAG = "calendar_feed_dirty"
+_REVISION_ROW_ID = 1
+
+
+# ── Cache-Key ────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class FeedKey:
+    project_id: uuid.UUID | None
+    team_ids: tuple[uuid.UUID, ...]  # sortiert — Reihenfolge der Query-Params egal
+    start: date | None
+    end: date | None
+    only_understaffed: bool
+    revision: int
+
+    def digest(self) -> str:
+        """Stabiler Key für die Shared-Stufe (prozessübergreifend)."""
+        raw = "|".join([
+            str(self.project_id),
+            ",".join(str(t) for t in self.team_ids),
+            self.start.isoformat() if self.start else "",
+            self.end.isoformat() if self.end else "",
+            "1" if self.only_understaffed else "0",
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# ── Prozess-lokaler LRU ──────────────────────────────────────────────────────
+
+
+class CalendarFeedCache:
+    """Thread-sicherer LRU für Basis-Payloads plus Hit-/Miss-Zähler.
+
+    Gecachte Listen werden von mehreren Requests geteilt — Aufrufer dürfen
+    sie nicht mutieren (`apply_color_overrides` arbeitet auf Kopien).
+    """
+
+    def __init__(self, max_entries: int):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[FeedKey, list[dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def get(self, key: FeedKey) -> list[dict] | None:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return payload
+
+    def put(self, key: FeedKey, payload: list[dict]) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def record_shared_hit(self) -> None:
+        with self._lock:
+            self.shared_hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.shared_hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+            }
+
+
+feed_cache = CalendarFeedCache(max_entries=get_settings().CALENDAR_FEED_CACHE_SIZE)
+
+
+# ── Revision ─────────────────────────────────────────────────────────────────
+
+
+def get_feed_revision(session: Session) -> int:
+    """Aktuelle Daten-Revision (0, solange noch nie gebumpt wurde)."""
+    revision = session.execute(
+        sa_select(CalendarFeedRevision.revision)
+        .where(CalendarFeedRevision.id == _REVISION_ROW_ID)
+    ).scalar_one_or_none()
+    return revision or 0
+
+
+def bump_feed_revision(connection) -> None:
+    """Erhöht die Revision atomar (`revision = revision + 1`), legt die Zeile
+    beim allerersten Bump an."""
+    result = connection.execute(
+        sa_update(CalendarFeedRevision)
+        .where(CalendarFeedRevision.id == _REVISION_ROW_ID)
+        .values(revision=CalendarFeedRevision.revision + 1)
+    )
+    if result.rowcount == 0:
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    CalendarFeedRevision.__table__.insert().values(
+                        id=_REVISION_ROW_ID, revision=1,
+                    )
+                )
+        except IntegrityError:
+            # Paralleler Erst-Bump hat die Zeile angelegt — dann nur erhöhen.
+            connection.execute(
+                sa_update(CalendarFeedRevision)
+                .where(CalendarFeedRevision.id == _REVISION_ROW_ID)
+                .values(revision=CalendarFeedRevision.revision + 1)
+            )
+
+
+def _touches_feed(objects) -> bool:
+    return any(isinstance(obj, _TRACKED_MODELS) for obj in objects)
+
+
+def _after_flush(session: SASession, _flush_context) -> None:
+    if _touches_feed(session.new) or _touches_feed(session.dirty) or _touches_feed(session.deleted):
+        session.info[_SESSION_FLAG] = True
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    """Bulk-UPDATE/DELETE (z. B. `sql_delete(Appointment)`) laufen am Flush
+    vorbei — hier separat erkennen."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if table is not None and getattr(table, "name", None) in _TRACKED_TABLES:
+        orm_execute_state.session.info[_SESSION_FLAG] = True
+
+
+def _after_commit(session: SASession) -> None:
+    if not session.info.pop(_SESSION_FLAG, False):
+        return
+    bind = session.get_bind()
+    try:
+        with bind.begin() as connection:
+            bump_feed_revision(connection)
+    except Exception:
+        # Ein fehlgeschlagener Bump darf den (bereits committeten) Request
+        # nicht scheitern lassen — schlimmstenfalls veraltet der Cache bis
+        # zum nächsten erfolgreichen Bump.
+        logger.exception("Kalender-Feed-Revision konnte nicht erhöht werden")
+
+
+def _after_soft_rollback(session: SASession, _previous_transaction) -> None:
+    session.info.pop(_SESSION_FLAG, None)
+
+
+def register_calendar_feed_listeners() -> None:
+    """Registriert die Invalidierungs-Listener global auf `Session`.
+
+    Idempotent — mehrfacher Aufruf (Tests, Reload) registriert nicht doppelt.
+    """
+    if event.contains(SASession, "after_flush", _after_flush):
+        return
+    event.listen(SASession, "after_flush", _after_flush)
+    event.listen(SASession, "do_orm_execute", _do_orm_execute)
+    event.listen(SASession, "after_commit", _after_commit)
+    event.listen(SASession, "after_soft_rollback", _after_soft_rollback)
+
+
+# ── Payload ──────────────────────────────────────────────────────────────────
+
+
+def calendar_event_to_fc(ev: CalendarEvent) -> dict:
+    """CalendarEvent → FullCalendar-Event-Dict (gemeinsame Form für Viewer
+    und Dispatcher)."""
+    return {
+        "id": str(ev.appointment_id),
+        "title": ev.location_name,
+        "start": fc_event_start_iso(ev.event_date, ev.time_start),
+        "end": fc_event_end_iso(ev.event_date, ev.time_start, ev.time_end),
+        "allDay": ev.time_start is None,
+        "color": ev.color,
+        "extendedProps": {
+            "time_of_day": ev.time_of_day_name or "",
+            "time_start": ev.time_start.strftime("%H:%M") if ev.time_start else "",
+            "time_end": ev.time_end.strftime("%H:%M") if ev.time_end else "",
+            "notes": ev.appointment_notes or "",
+            "plan_period_id": str(ev.plan_period_id),
+            "team_id": str(ev.team_id) if ev.team_id else "",
+            "location_id": str(ev.location_id),
+            "location_name": ev.location_name,
+            "location_name_only": ev.location_name_only,
+            "cast_count": ev.cast_count,
+            "cast_required": ev.cast_required,
+            "is_understaffed": ev.is_understaffed,
+        },
+    }
+
+
+def apply_color_overrides(
+    payload: list[dict],
+    user_overrides: dict[uuid.UUID, str] | None,
+) -> list[dict]:
+    """Legt die User-Farben über die (Default-farbige) Basis-Payload.
+
+    Nur betroffene Events werden flach kopiert — der Cache-Inhalt bleibt
+    unverändert.
+    """
+    if not user_overrides:
+        return payload
+    by_str = {str(loc_id): color for loc_id, color in user_overrides.items()}
+    result: list[dict] = []
+    for ev in payload:
+        color = by_str.get(ev["extendedProps"]["location_id"])
+        result.append({**ev, "color": color} if color else ev)
+    return result
+
+
+# ── Shared-Stufe (Postgres) ──────────────────────────────────────────────────
+
+
+def _shared_get(session: Session, key: FeedKey) -> list[dict] | None:
+    return session.execute(
+        sa_select(CalendarFeedCacheEntry.payload)
+        .where(CalendarFeedCacheEntry.cache_key == key.digest())
+        .where(CalendarFeedCacheEntry.revision == key.revision)
+    ).scalar_one_or_none()
+
+
+def _shared_put(session: Session, key: FeedKey, payload: list[dict]) -> None:
+    """Upsert in einem Savepoint — parallele Worker mit demselben Key dürfen
+    kollidieren, ohne die Request-Transaktion zu zerschießen."""
+    try:
+        with session.begin_nested():
+            session.execute(
+                sa_delete(CalendarFeedCacheEntry)
+                .where(CalendarFeedCacheEntry.revision < key.revision)
+            )
+            session.merge(CalendarFeedCacheEntry(
+                cache_key=key.digest(), revision=key.revision, payload=payload,
+            ))
+    except IntegrityError:
+        logger.debug("Shared-Cache-Kollision für %s — ignoriert", key.digest())
+
+
+# ── Öffentliche API ──────────────────────────────────────────────────────────
+
+
+def get_plan_feed(
+    session: Session,
+    *,
+    project_id: uuid.UUID | None,
+    team_ids: list[uuid.UUID],
+    start: date | None,
+    end: date | None,
+    only_understaffed: bool,
+    user_overrides: dict[uuid.UUID, str] | None,
+) -> list[dict]:
+    """FullCalendar-Payload für die Team-Plan-Kalender (gecacht).
+
+    `team_ids` müssen bereits auf die erlaubten Teams verschnitten sein —
+    der Cache macht keinen Berechtigungs-Check, er ist nur nach Inhalt
+    gekeyt.
+    """
+    key = FeedKey(
+        project_id=project_id,
+        team_ids=tuple(sorted(set(team_ids), key=str)),
+        start=start,
+        end=end,
+        only_understaffed=only_understaffed,
+        revision=get_feed_revision(session),
+    )
+    payload = feed_cache.get(key)
+    if payload is None:
+        shared = get_settings().CALENDAR_FEED_CACHE_SHARED
+        payload = _shared_get(session, key) if shared else None
+        if payload is not None:
+            feed_cache.record_shared_hit()
+        else:
+            feed_cache.record_miss()
+            events = get_appointments_for_teams(
+                session, list(key.team_ids), start, end,
+                only_understaffed=only_understaffed,
+            )
+            payload = [calendar_event_to_fc(ev) for ev in events]
+            if shared:
+                _shared_put(session, key, payload)
+        feed_cache.put(key, payload)
+
+    return apply_color_overrides(payload, user_overrides)
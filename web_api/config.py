@@ -34,6 +34,37 @@ class Settings(BaseSettings):
     # Aktionen wieder auf False (oder Variable loeschen) plus Redeploy.
     SUPPRESS_NOTIFICATIONS: bool = False
 
+    # Kalender-Feed-Cache (web_api.calendar_cache): Anzahl Einträge im
+    # prozess-lokalen LRU und optionale Postgres-Stufe, die sich alle
+    # Uvicorn-Worker teilen.
+    CALENDAR_FEED_CACHE_SIZE: int = 512
+    CALENDAR_FEED_CACHE_SHARED: bool = False
+
+    # asyncpg-Prepared-Statement-Cache pro Verbindung (web_api.async_database);
+    # 0 hinter PgBouncer (Transaction-Pooling). Pool-Größen je Prozess-Rolle:
+    # database.pool (DB_POOL_PROFILE, DB_POOL_SIZE, ...).
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+
+    # Verfügbarkeits-Zusammenfassung (web_api.availability.summary): maximales
+    # Alter einer Zeile, falls eine Invalidierung verloren ging.
+    AVAILABILITY_SUMMARY_MAX_AGE_SECONDS: int = 900
+
+    # Request-Instrumentierung (web_api.instrumentation): Schwellen für das
+    # Slow-Log in Millisekunden. GET /metrics (Prometheus) ist nur aktiv, wenn
+    # METRICS_TOKEN gesetzt ist (Abruf mit "Authorization: Bearer <token>").
+    SLOW_REQUEST_MS: int = 1000
+    SLOW_QUERY_MS: int = 250
+    METRICS_TOKEN: str = ""
+
+    # Solver-Jobs (web_api.solver_jobs): Anzahl Prozesse im Solver-Pool.
+    # 0 = serverseitige Berechnung aus (Default — OR-Tools ist keine
+    # Pflicht-Abhängigkeit der Web-API). Der Runner läuft nur im Worker mit
+    # dem Scheduler-Lock; Jobs ohne Heartbeat seit STALE_SECONDS gelten als
+    # abgestürzt.
+    SOLVER_JOB_WORKERS: int = 0
+    SOLVER_JOB_POLL_SECONDS: float = 2.0
+    SOLVER_JOB_STALE_SECONDS: int = 300
+
 
 def get_settings() -> Settings:
     """Factory — kann in Tests via dependency_overrides ersetzt werden."""
@@ -1,8 +1,10 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from database.database import engine
+from web_api.async_database import get_async_session_factory
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -14,3 +16,19 @@ def get_db_session() -> Generator[Session, None, None]:
         except Exception:
             session.rollback()
             raise
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped Async-Session für `async def`-Endpoints.
+
+    Gleiche Semantik wie `get_db_session`: Commit bei Erfolg, Rollback bei
+    Exception. Sync-Service-Funktionen via `await session.run_sync(fn, ...)`
+    aufrufen (siehe `web_api.async_database`).
+    """
+    async with get_async_session_factory()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
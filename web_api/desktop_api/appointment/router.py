@@ -25,7 +25,7 @@ class AppointmentCreateBody(BaseModel):
 
 class AppointmentBulkCreateBody(BaseModel):
     plan_id: uuid.UUID
-    appointments: list[schemas.AppointmentCreate]
+    appointments: list[schemas.AppointmentIdsCreate | schemas.AppointmentCreate]
 
 
 class AppointmentBulkIdsBody(BaseModel):
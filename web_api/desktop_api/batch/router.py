@@ -0,0 +1,99 @@
+"""Desktop-API: Sammel-Endpunkt für nachgereichte Schreibvorgänge (/api/v1/batch).
+
+Der Desktop-Client puffert Schreibvorgänge ohne Verbindung in seiner
+Offline-Queue (gui/api_client/offline_queue.py) und reicht sie danach in
+Blöcken hier ein, statt pro Vorgang einen eigenen HTTP-Roundtrip zu zahlen.
+
+Jede Operation läuft in Reihenfolge als interner Request gegen dieselbe App
+(gleiche Router, Auth, Validierung — Authorization/Cookie werden
+durchgereicht) und damit in ihrer eigenen DB-Session. Beim ersten Fehler
+(Status >= 400) ist Schluss: `completed` nennt die Zahl der erfolgreichen
+Operationen, `results` enthält deren Ergebnisse plus das der fehlerhaften.
+Der Client bestätigt genau diesen Präfix — Wiederholungen nach Abbrüchen sind
+möglich (at-least-once), die gepufferten Operationen sind idempotent gewählt.
+
+Ziel einer Operation kann nur eine Route des Desktop-Routers sein (ohne
+/batch selbst — keine Verschachtelung). Pfade mit Punkt-Segmenten (auch
+kodiert), Query-String oder Fragment werden abgelehnt, bevor irgendeine
+Operation läuft.
+"""
+
+from functools import cache
+from posixpath import normpath
+from typing import Any, Literal
+from urllib.parse import unquote
+
+import httpx
+from fastapi import APIRouter, Request
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field, model_validator
+from starlette.routing import Match
+
+from web_api.desktop_api.auth import DesktopUser
+
+router = APIRouter(prefix="/batch", tags=["desktop-batch"])
+
+_API_PREFIX = "/api/v1/"
+_FORWARDED_HEADERS = ("authorization", "cookie")
+
+
+class BatchOperation(BaseModel):
+    method: Literal["POST", "PUT", "PATCH", "DELETE"]
+    path: str
+    body: Any = None
+
+    @model_validator(mode="after")
+    def _desktop_api_route(self) -> "BatchOperation":
+        decoded = unquote(self.path)
+        if (not decoded.startswith(_API_PREFIX) or any(c in decoded for c in "?#\\")
+                or normpath(decoded) != decoded.rstrip("/")):
+            raise ValueError(f"ungültiger Pfad {self.path!r}: nur normalisierte Pfade unter {_API_PREFIX}")
+        if not _matches_desktop_route(self.method, decoded):
+            raise ValueError(f"{self.method} {self.path} ist keine Route der Desktop-API (ohne /batch)")
+        return self
+
+
+@cache
+def _desktop_routes() -> tuple[APIRoute, ...]:
+    # Import erst zur Laufzeit: der Desktop-Router bindet diesen Router ein.
+    from web_api.desktop_api.router import router as desktop_router
+
+    return tuple(route for route in desktop_router.routes
+                 if isinstance(route, APIRoute) and route.endpoint is not run_batch)
+
+
+def _matches_desktop_route(method: str, path: str) -> bool:
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    return any(route.matches(scope)[0] == Match.FULL for route in _desktop_routes())
+
+
+class BatchBody(BaseModel):
+    operations: list[BatchOperation] = Field(min_length=1, max_length=500)
+
+
+class BatchItemResult(BaseModel):
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    completed: int
+    results: list[BatchItemResult]
+
+
+@router.post("", response_model=BatchResponse)
+async def run_batch(body: BatchBody, request: Request, _: DesktopUser) -> BatchResponse:
+    headers = {name: value for name, value in request.headers.items() if name in _FORWARDED_HEADERS}
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    results: list[BatchItemResult] = []
+    async with httpx.AsyncClient(transport=transport, base_url=str(request.base_url)) as client:
+        for operation in body.operations:
+            response = await client.request(operation.method, operation.path, json=operation.body, headers=headers)
+            try:
+                payload = response.json() if response.content else None
+            except ValueError:
+                payload = response.text
+            results.append(BatchItemResult(status=response.status_code, body=payload))
+            if response.status_code >= 400:
+                return BatchResponse(completed=len(results) - 1, results=results)
+    return BatchResponse(completed=len(results), results=results)
@@ -26,6 +26,7 @@ class PlanNotificationBody(BaseModel):
     plan_id: uuid.UUID
     recipient_ids: list[uuid.UUID] | None = None
     include_attachments: bool = True
+    dry_run: bool = False
 
 
 class AvailabilityRequestBody(BaseModel):
@@ -55,6 +56,9 @@ class SendStats(BaseModel):
     success: int = 0
     failed: int = 0
     error: str | None = None
+    # Nur Plan-Benachrichtigung: gerenderte Mails und Zeiten je Stufe (query/render/deliver)
+    rendered: int | None = None
+    timings_ms: dict[str, float] | None = None
 
 
 def _fetch_persons(ids: list[uuid.UUID] | None):
@@ -84,6 +88,7 @@ def send_plan_notification(
         str(body.plan_id),
         recipient_ids=recipient_id_strs,
         include_attachments=body.include_attachments,
+        dry_run=body.dry_run,
     )
     return SendStats(**stats)
 
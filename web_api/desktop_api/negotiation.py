@@ -0,0 +1,33 @@
+"""Content-Negotiation für tiefe Lese-Schemas der Desktop-API.
+
+Endpunkte, die `PlanShow` & Co. liefern, nehmen `WireFormat` als Dependency
+und geben ihr Ergebnis über `respond(...)` zurück: Mit
+`Accept: application/vnd.hcc-plan.normalized+json` geht die normalisierte
+Darstellung aus `database.wire_format` raus, sonst wie bisher das Schema
+(FastAPI serialisiert über `response_model`).
+"""
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from database import wire_format
+
+
+class _WireFormat:
+    def __init__(self, normalized: bool) -> None:
+        self.normalized = normalized
+
+    def respond(self, model: BaseModel) -> BaseModel | JSONResponse:
+        if not self.normalized:
+            return model
+        return JSONResponse(wire_format.encode(model), media_type=wire_format.NORMALIZED_MEDIA_TYPE)
+
+
+def _wire_format(request: Request) -> _WireFormat:
+    return _WireFormat(wire_format.NORMALIZED_MEDIA_TYPE in request.headers.get("accept", ""))
+
+
+WireFormat = Annotated[_WireFormat, Depends(_wire_format)]
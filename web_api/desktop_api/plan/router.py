@@ -9,6 +9,7 @@ from sqlmodel import Session
 from database import db_services, schemas
 from web_api.dependencies import get_db_session
 from web_api.desktop_api.auth import DesktopUser
+from web_api.desktop_api.negotiation import WireFormat
 from web_api.email.service import schedule_emails
 from web_api.plan_adjustment.service import set_plan_is_binding
 
@@ -53,18 +54,23 @@ class PlanIsBindingResponse(BaseModel):
 
 
 @router.post("", response_model=schemas.PlanShow, status_code=status.HTTP_201_CREATED)
-def create_plan(body: PlanCreateBody, _: DesktopUser):
-    return db_services.Plan.create(body.plan_period_id, body.name, body.notes)
+def create_plan(body: PlanCreateBody, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.Plan.create(body.plan_period_id, body.name, body.notes))
+
+
+@router.get("/{plan_id}", response_model=schemas.PlanShow)
+def get_plan(plan_id: uuid.UUID, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.Plan.get(plan_id))
 
 
 @router.patch("/{plan_id}/name", response_model=schemas.PlanShow)
-def update_plan_name(plan_id: uuid.UUID, body: PlanNameBody, _: DesktopUser):
-    return db_services.Plan.update_name(plan_id, body.name)
+def update_plan_name(plan_id: uuid.UUID, body: PlanNameBody, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.Plan.update_name(plan_id, body.name))
 
 
 @router.patch("/{plan_id}/notes", response_model=schemas.PlanShow)
-def update_plan_notes(plan_id: uuid.UUID, body: PlanNotesBody, _: DesktopUser):
-    return db_services.Plan.update_notes(plan_id, body.notes)
+def update_plan_notes(plan_id: uuid.UUID, body: PlanNotesBody, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.Plan.update_notes(plan_id, body.notes))
 
 
 @router.patch("/{plan_id}/location-columns", status_code=status.HTTP_204_NO_CONTENT)
@@ -101,8 +107,8 @@ def delete_prep_deleted(plan_id: uuid.UUID, _: DesktopUser):
 
 
 @router.put("/{plan_id}/excel-settings", response_model=schemas.PlanShow)
-def put_in_excel_settings(plan_id: uuid.UUID, body: PlanExcelSettingsBody, _: DesktopUser):
-    return db_services.Plan.put_in_excel_settings(plan_id, body.excel_settings_id)
+def put_in_excel_settings(plan_id: uuid.UUID, body: PlanExcelSettingsBody, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.Plan.put_in_excel_settings(plan_id, body.excel_settings_id))
 
 
 @teams_router.delete("/{team_id}/plans/prep-deleted", status_code=status.HTTP_204_NO_CONTENT)
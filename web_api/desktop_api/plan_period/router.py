@@ -28,6 +28,7 @@ from database.db_services.plan_period import (
     PlanPeriodPermissionError,
 )
 from web_api.desktop_api.auth import DesktopUser
+from web_api.desktop_api.negotiation import WireFormat
 from web_api.models.web_models import WebUserRole
 
 router = APIRouter(prefix="/plan-periods", tags=["desktop-plan-periods"])
@@ -56,8 +57,8 @@ def _to_create_schema(body: PlanPeriodCreateBody) -> schemas.PlanPeriodCreate:
 
 
 @router.get("/{plan_period_id}", response_model=schemas.PlanPeriodShow)
-def get_plan_period(plan_period_id: uuid.UUID, _: DesktopUser):
-    return db_services.PlanPeriod.get(plan_period_id)
+def get_plan_period(plan_period_id: uuid.UUID, _: DesktopUser, wire: WireFormat):
+    return wire.respond(db_services.PlanPeriod.get(plan_period_id))
 
 
 @router.get("/{plan_period_id}/notification-group",
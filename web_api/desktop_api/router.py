@@ -9,6 +9,7 @@ from web_api.desktop_api.address.router import router as address_router
 from web_api.desktop_api.appointment.router import router as appointment_router
 from web_api.desktop_api.avail_day.router import router as avail_day_router
 from web_api.desktop_api.avail_day_group.router import router as avail_day_group_router
+from web_api.desktop_api.batch.router import router as batch_router
 from web_api.desktop_api.cast_group.router import router as cast_group_router
 from web_api.desktop_api.cast_rule.router import router as cast_rule_router
 from web_api.desktop_api.combination_locations_possible.router import router as combination_locations_possible_router
@@ -29,6 +30,7 @@ from web_api.desktop_api.plan_period.router import teams_router as plan_period_t
 from web_api.desktop_api.project.router import router as project_router
 from web_api.desktop_api.required_avail_day_groups.router import router as required_avail_day_groups_router
 from web_api.desktop_api.skill.router import router as skill_router
+from web_api.desktop_api.solver_job.router import router as solver_job_router
 from web_api.desktop_api.skill_group.router import router as skill_group_router
 from web_api.desktop_api.team.router import router as team_router
 from web_api.desktop_api.team_actor_assign.router import router as team_actor_assign_router
@@ -71,3 +73,5 @@ router.include_router(combination_locations_possible_router)
 router.include_router(employee_event_router)
 router.include_router(employee_event_category_router)
 router.include_router(email_router)
+router.include_router(solver_job_router)
+router.include_router(batch_router)
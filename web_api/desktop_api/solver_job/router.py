@@ -0,0 +1,93 @@
+"""Desktop-API: Solver-Job-Endpunkte (/api/v1/solver-jobs).
+
+Der Desktop-Client legt eine Planberechnung als Job an und pollt den Status.
+Gerechnet wird im Prozess-Pool des Servers (`web_api.solver_jobs.worker`);
+die fertigen Pläne stehen danach wie gewohnt in der DB.
+"""
+
+import uuid
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel, Field
+from sqlmodel import Session
+
+from web_api.config import Settings, get_settings
+from web_api.dependencies import get_db_session
+from web_api.desktop_api.auth import DesktopUser
+from web_api.models.web_models import SolverJob, SolverJobKind, SolverJobStatus
+from web_api.solver_jobs import service
+
+router = APIRouter(prefix="/solver-jobs", tags=["desktop-solver-jobs"])
+
+
+class SolverJobCreateBody(BaseModel):
+    plan_period_ids: list[uuid.UUID] = Field(min_length=1)
+    num_plans: int = Field(ge=1, le=50)
+    time_calc_max_shifts: int = Field(ge=1)
+    time_calc_fair_distribution: int = Field(ge=1)
+    time_calc_plan: int = Field(ge=1)
+
+
+class SolverJobRead(BaseModel):
+    id: uuid.UUID
+    kind: SolverJobKind
+    status: SolverJobStatus
+    team_id: uuid.UUID
+    plan_period_ids: list[uuid.UUID]
+    cancel_requested: bool
+    progress_step: int
+    progress_message: str | None
+    result: dict | None
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    @classmethod
+    def from_job(cls, job: SolverJob) -> "SolverJobRead":
+        return cls.model_validate(job, from_attributes=True)
+
+
+@router.post("", response_model=SolverJobRead, status_code=status.HTTP_202_ACCEPTED)
+def submit_solver_job(
+    body: SolverJobCreateBody,
+    user: DesktopUser,
+    session: Session = Depends(get_db_session),
+    settings: Settings = Depends(get_settings),
+):
+    if settings.SOLVER_JOB_WORKERS <= 0:
+        raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="Serverseitige Planberechnung ist nicht aktiviert")
+    job = service.submit_solver_job(
+        session,
+        plan_period_ids=body.plan_period_ids,
+        params=service.SolverJobParams(
+            num_plans=body.num_plans,
+            time_calc_max_shifts=body.time_calc_max_shifts,
+            time_calc_fair_distribution=body.time_calc_fair_distribution,
+            time_calc_plan=body.time_calc_plan,
+        ),
+        created_by_id=user.id,
+    )
+    return SolverJobRead.from_job(job)
+
+
+@router.get("", response_model=list[SolverJobRead])
+def list_solver_jobs(
+    _: DesktopUser,
+    team_id: uuid.UUID = Query(...),
+    session: Session = Depends(get_db_session),
+):
+    return [SolverJobRead.from_job(j) for j in service.list_solver_jobs_for_team(session, team_id)]
+
+
+@router.get("/{job_id}", response_model=SolverJobRead)
+def get_solver_job(job_id: uuid.UUID, _: DesktopUser, session: Session = Depends(get_db_session)):
+    return SolverJobRead.from_job(service.get_solver_job(session, job_id))
+
+
+@router.post("/{job_id}/cancel", response_model=SolverJobRead)
+def cancel_solver_job(job_id: uuid.UUID, _: DesktopUser, session: Session = Depends(get_db_session)):
+    job = service.request_cancel(session, service.get_solver_job(session, job_id))
+    return SolverJobRead.from_job(job)
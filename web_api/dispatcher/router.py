@@ -11,7 +11,8 @@ from sqlmodel import Session
 from database.models import Appointment
 from web_api.auth.dependencies import WebUserRole, require_role
 from web_api.cancellations.service import get_cancellations_for_dispatcher
-from web_api.common import fc_event_end_iso, fc_event_start_iso, guest_list
+from web_api.calendar_cache import get_plan_feed
+from web_api.common import guest_list
 from web_api.user_settings.service import get_color_overrides
 from web_api.dependencies import get_db_session
 from web_api.dispatcher.dependencies import require_team_dispatcher_for_appointment
@@ -175,6 +176,9 @@ def dispatcher_plan_events(
     Der Filter wirkt als Intersection: wenn `teams` gesetzt ist, werden
     nur Events der gewählten Teams geladen; wenn zusätzlich
     `only_understaffed=True` ist, davon nur die unterbesetzten.
+
+    Basis-Payload aus dem Feed-Cache (`web_api.calendar_cache`), geteilt mit
+    dem Viewer-Endpoint; Farb-Overrides werden pro User danach angewendet.
     """
     person_id = _require_person_id(user)
     my_teams = get_teams_for_dispatcher(session, person_id)
@@ -182,38 +186,16 @@ def dispatcher_plan_events(
     effective_ids = filter_allowed_team_ids(teams, allowed_ids)
 
     overrides = get_color_overrides(session, user.id)
-    events = get_appointments_for_teams(
-        session, effective_ids, start, end,
+    return get_plan_feed(
+        session,
+        project_id=my_teams[0].project_id if my_teams else None,
+        team_ids=effective_ids,
+        start=start,
+        end=end,
         only_understaffed=only_understaffed,
         user_overrides=overrides,
     )
 
-    return [
-        {
-            "id": str(ev.appointment_id),
-            "title": ev.location_name,
-            "start": fc_event_start_iso(ev.event_date, ev.time_start),
-            "end": fc_event_end_iso(ev.event_date, ev.time_start, ev.time_end),
-            "allDay": ev.time_start is None,
-            "color": ev.color,
-            "extendedProps": {
-                "time_of_day": ev.time_of_day_name or "",
-                "time_start": ev.time_start.strftime("%H:%M") if ev.time_start else "",
-                "time_end": ev.time_end.strftime("%H:%M") if ev.time_end else "",
-                "notes": ev.appointment_notes or "",
-                "plan_period_id": str(ev.plan_period_id),
-                "team_id": str(ev.team_id) if ev.team_id else "",
-                "location_id": str(ev.location_id),
-                "location_name": ev.location_name,
-                "location_name_only": ev.location_name_only,
-                "cast_count": ev.cast_count,
-                "cast_required": ev.cast_required,
-                "is_understaffed": ev.is_understaffed,
-            },
-        }
-        for ev in events
-    ]
-
 
 # ── Appointment-CRUD (D3) ────────────────────────────────────────────────────
 # Diese Endpoints MÜSSEN vor `/plan/appointments/{appointment_id}` registriert
@@ -12,8 +12,9 @@
         Dataclass mit to, subject, html_body, cc.
 
 Privat:
-    _send_emails_with_config / _send_email
+    _send_emails_with_config / _send_one_smtp / _send_many_smtp
         Versand-Mechanik, läuft im BackgroundTask ohne DB-Session.
+        `_send_many_smtp` nutzt für mehrere Mails eine SMTP-Verbindung.
 """
 
 import logging
@@ -58,15 +59,8 @@ def schedule_emails(
 
 
 def _send_emails_with_config(payloads: list[EmailPayload], smtp_config: SmtpConfig) -> None:
-    for payload in payloads:
-        try:
-            _send_one_smtp(payload, smtp_config)
-        except Exception:
-            logger.exception(
-                "E-Mail-Versand fehlgeschlagen (to=%s, subject=%s)",
-                payload.to,
-                payload.subject,
-            )
+    # Fehler loggt _send_many_smtp pro Payload
+    _send_many_smtp(payloads, smtp_config)
 
 
 def send_test_email(smtp_config: SmtpConfig, recipient_email: str) -> None:
@@ -87,24 +81,18 @@ def send_test_email(smtp_config: SmtpConfig, recipient_email: str) -> None:
     _send_one_smtp(payload, smtp_config)
 
 
-def _send_one_smtp(payload: EmailPayload, smtp_config: SmtpConfig) -> None:
-    """Sendet eine einzelne E-Mail. Wirft bei Fehler — Logging im Caller.
-
-    Choke-Point: ALLE Mail-Versendungen laufen am Ende hier durch — sowohl der
-    Web-API-BackgroundTask-Pfad (`schedule_emails` → `_send_emails_with_config`
-    → `_send_one_smtp`) als auch der Scheduler-/Desktop-Pfad
-    (`email_to_users.EmailService._send_one` → `_send_one_smtp`). Der
-    SUPPRESS_NOTIFICATIONS-Check muss daher hier sitzen, sonst rutschen die
-    Scheduler-Reminder durch (vgl. Vorfall 2026-05-16: Catchup-Mails wurden
-    versendet, obwohl Inbox-Hub bereits unterdrueckt war).
-    """
+def _suppressed(payload: EmailPayload) -> bool:
     if get_settings().SUPPRESS_NOTIFICATIONS:
         logger.warning(
             "SUPPRESS_NOTIFICATIONS aktiv — E-Mail NICHT versendet "
             "(to=%s subject=%s)",
             payload.to, payload.subject,
         )
-        return
+        return True
+    return False
+
+
+def _build_message(payload: EmailPayload, smtp_config: SmtpConfig) -> MIMEMultipart:
     msg = MIMEMultipart("alternative")
     msg["Subject"] = payload.subject
     msg["From"] = smtp_config.from_header
@@ -112,14 +100,80 @@ def _send_one_smtp(payload: EmailPayload, smtp_config: SmtpConfig) -> None:
     if payload.cc:
         msg["Cc"] = ", ".join(payload.cc)
     msg.attach(MIMEText(payload.html_body, "html", "utf-8"))
+    return msg
 
-    all_recipients = payload.to + payload.cc + payload.bcc
+
+def _connect(smtp_config: SmtpConfig) -> smtplib.SMTP:
     server_cls = smtplib.SMTP_SSL if smtp_config.use_ssl else smtplib.SMTP
-    with server_cls(smtp_config.host, smtp_config.port, timeout=10) as server:
+    server = server_cls(smtp_config.host, smtp_config.port, timeout=10)
+    try:
         server.ehlo()
         if smtp_config.use_tls and not smtp_config.use_ssl:
             server.starttls()
             server.ehlo()
         if smtp_config.username:
             server.login(smtp_config.username, smtp_config.password)
-        server.sendmail(smtp_config.email_from, all_recipients, msg.as_string())
\ No newline at end of file
+    except BaseException:
+        server.close()
+        raise
+    return server
+
+
+def _sendmail(server: smtplib.SMTP, payload: EmailPayload, smtp_config: SmtpConfig) -> None:
+    all_recipients = payload.to + payload.cc + payload.bcc
+    server.sendmail(smtp_config.email_from, all_recipients, _build_message(payload, smtp_config).as_string())
+
+
+def _send_one_smtp(payload: EmailPayload, smtp_config: SmtpConfig) -> None:
+    """Sendet eine einzelne E-Mail. Wirft bei Fehler — Logging im Caller.
+
+    Choke-Point: ALLE Mail-Versendungen laufen am Ende hier oder über
+    `_send_many_smtp` durch — sowohl der Web-API-BackgroundTask-Pfad
+    (`schedule_emails` → `_send_emails_with_config` → `_send_many_smtp`) als
+    auch der Scheduler-/Desktop-Pfad (`email_to_users.EmailService._send_one`
+    → `_send_one_smtp`, Plan-Benachrichtigungen → `_send_many_smtp`). Der
+    SUPPRESS_NOTIFICATIONS-Check (`_suppressed`) muss daher in beiden
+    sitzen, sonst rutschen die Scheduler-Reminder durch (vgl. Vorfall
+    2026-05-16: Catchup-Mails wurden versendet, obwohl Inbox-Hub bereits
+    unterdrueckt war).
+    """
+    if _suppressed(payload):
+        return
+    with _connect(smtp_config) as server:
+        _sendmail(server, payload, smtp_config)
+
+
+def _send_many_smtp(payloads: list[EmailPayload], smtp_config: SmtpConfig) -> list[str | None]:
+    """Sendet mehrere E-Mails über eine SMTP-Verbindung (ein Handshake/Login statt einem pro Mail).
+
+    Returns: pro Payload `None` bei Erfolg, sonst `"<ExcType>: <message>"`.
+    Ablehnungen einzelner Empfänger lassen die Verbindung stehen; bei
+    Verbindungsfehlern wird für die nächste Mail neu verbunden. Gleicher
+    SUPPRESS_NOTIFICATIONS-Check wie `_send_one_smtp`.
+    """
+    results: list[str | None] = []
+    server: smtplib.SMTP | None = None
+    try:
+        for payload in payloads:
+            if _suppressed(payload):
+                results.append(None)
+                continue
+            try:
+                if server is None:
+                    server = _connect(smtp_config)
+                _sendmail(server, payload, smtp_config)
+                results.append(None)
+            except Exception as exc:
+                logger.exception("E-Mail-Versand fehlgeschlagen (to=%s)", payload.to)
+                results.append(f"{type(exc).__name__}: {exc}")
+                if not isinstance(exc, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                    if server is not None:
+                        server.close()
+                    server = None
+    finally:
+        if server is not None:
+            try:
+                server.quit()
+            except OSError:
+                server.close()
+    return results
@@ -15,6 +15,9 @@ Der Modul-Import ist nebenwirkungsfrei: Topics werden erst beim ersten
 Aufruf von ``get_all_topics()`` von Disk gelesen (PEP 562 Lazy-Pattern).
 Im Dev-Modus (Env-Var ``HCC_HELP_HOT_RELOAD=1``) wird der Cache
 umgangen — Content-Aenderungen werden ohne Server-Neustart sichtbar.
+
+Die Volltextsuche (``search_topics``) nutzt einen invertierten Index, der
+einmal pro Prozess aufgebaut bzw. von Disk geladen wird (``search.py``).
 """
 
 from __future__ import annotations
@@ -22,9 +25,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from web_api.help.models import HelpTopic
+    from web_api.help.models import HelpSearchHit, HelpTopic
 
-__all__ = ["HelpTopic", "get_topic", "get_all_topics", "get_topics_for_role"]
+__all__ = ["HelpSearchHit", "HelpTopic", "get_topic", "get_all_topics", "get_topics_for_role", "search_topics"]
 
 
 def __getattr__(name: str):
@@ -32,7 +35,10 @@ def __getattr__(name: str):
     if name in ("get_topic", "get_all_topics", "get_topics_for_role"):
         from web_api.help import loader
         return getattr(loader, name)
-    if name == "HelpTopic":
-        from web_api.help.models import HelpTopic
-        return HelpTopic
+    if name == "search_topics":
+        from web_api.help.search import search_topics
+        return search_topics
+    if name in ("HelpTopic", "HelpSearchHit"):
+        from web_api.help import models
+        return getattr(models, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -74,13 +74,12 @@ def _apply_heading_anchors(html: str) -> str:
 
 
 def _strip_to_text(html: str) -> str:
-    """Sehr einfache Plaintext-Extraktion fuer FTS in Phase 3.
+    """Sehr einfache Plaintext-Extraktion fuer die Volltextsuche (`web_api.help.search`).
 
     Wir koennten BeautifulSoup nehmen, aber das ist hier zu schwer fuer
     den Use-Case. Solange die Topics keine ``<script>``-Tags enthalten
     (tun sie nicht), reicht ein primitiver Tag-Stripper.
     """
-    import re
     return re.sub(r"<[^>]+>", " ", html)
 
 
@@ -136,6 +135,7 @@ def _load_all(lang: str = DEFAULT_LANG) -> dict[str, HelpTopic]:
 # ── oeffentliche API ─────────────────────────────────────────────────────────
 
 _cache: dict[str, HelpTopic] | None = None
+_role_cache: dict[str, list[HelpTopic]] = {}
 
 
 def get_all_topics() -> dict[str, HelpTopic]:
@@ -153,7 +153,15 @@ def get_topic(slug: str) -> HelpTopic | None:
 
 
 def get_topics_for_role(role: str) -> list[HelpTopic]:
-    """Topics, die fuer eine Rolle sichtbar sind, sortiert nach (category, order, title)."""
+    """Topics, die fuer eine Rolle sichtbar sind, sortiert nach (category, order, title).
+
+    Ausser im Hot-Reload-Modus einmal pro Rolle gefiltert und gecached —
+    Aufrufer bekommen eine Kopie, die sie veraendern duerfen.
+    """
+    if not _is_hot_reload() and role in _role_cache:
+        return list(_role_cache[role])
     topics = [t for t in get_all_topics().values() if not t.roles or role in t.roles]
     topics.sort(key=lambda t: (t.category, t.order, t.title))
-    return topics
\ No newline at end of file
+    if not _is_hot_reload():
+        _role_cache[role] = topics
+    return list(topics)
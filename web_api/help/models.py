@@ -19,8 +19,19 @@ class HelpTopic:
     roles: tuple[str, ...]              # z.B. ("employee",) oder ("employee", "dispatcher")
     category: str                       # Gruppierung im TOC, z.B. "Mitarbeiter"
     body_html: str                      # bereits gerenderter HTML-Body
-    body_text: str                      # Plain-Text fuer spaetere FTS (Phase 3)
+    body_text: str                      # Plain-Text fuer die Volltextsuche
     anchors: tuple[str, ...] = ()       # optionale Section-Anker, z.B. ("absage-frist",)
     order: int = 100                    # Sortier-Hint im TOC; kleinere Werte zuerst
     updated: date | None = None         # zuletzt aktualisiert (optional)
     related: tuple[str, ...] = field(default_factory=tuple)  # weitere Topic-Slugs
+
+
+@dataclass(frozen=True, slots=True)
+class HelpSearchHit:
+    """Ein Treffer der Hilfe-Volltextsuche (siehe `web_api.help.search`)."""
+
+    slug: str
+    title: str
+    category: str
+    excerpt: str                        # Anfang des Plain-Text-Bodys
+    score: float
@@ -10,12 +10,12 @@ from __future__ import annotations
 
 from collections import defaultdict
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.requests import Request
 from fastapi.responses import HTMLResponse
 
 from web_api.auth.dependencies import LoggedInUser
-from web_api.help import get_topic, get_topics_for_role
+from web_api.help import get_topic, get_topics_for_role, search_topics
 from web_api.help.models import HelpTopic
 from web_api.templating import templates
 
@@ -58,6 +58,30 @@ def help_index(request: Request, user: LoggedInUser):
     )
 
 
+@router.get("/search", response_class=HTMLResponse)
+def help_search(
+    request: Request,
+    user: LoggedInUser,
+    q: str = Query(default="", max_length=200),
+    limit: int = Query(default=8, ge=1, le=50),
+):
+    """HTMX-Search-as-you-type: Trefferliste als Fragment.
+
+    Der Index liegt vorberechnet im Speicher (``web_api.help.search``); die
+    Rollenfilterung passiert dort ueber die Rollen des Users. Muss wie der
+    Popover VOR der ``/{slug:path}``-Catch-All-Route stehen.
+    """
+    hits = search_topics(q, {r.value for r in user.roles}, limit=limit)
+    return templates.TemplateResponse(
+        "help/_search_results.html",
+        {
+            "request": request,
+            "hits": hits,
+            "query": q.strip(),
+        },
+    )
+
+
 @router.get("/popover/{slug:path}", response_class=HTMLResponse)
 def help_popover(
     request: Request,
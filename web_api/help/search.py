@@ -0,0 +1,264 @@
+"""Volltextsuche ueber die Hilfe-Topics: invertierter Index im Speicher.
+
+Aufbau einmal pro Prozess (Warm-up im Lifespan von `web_api.main`):
+- Tokenisierung: casefold, Umlaute ausgeschrieben (``ü`` → ``ue``, ``ß`` →
+  ``ss``), restliche Akzente entfernt, Woerter < 2 Zeichen und eine kurze
+  deutsche Stoppwortliste verworfen. ``Verfügbarkeit`` und
+  ``Verfuegbarkeit`` landen so auf demselben Term.
+- Gewichtung: Titel x5, Kategorie x2, Body x1 pro Vorkommen, gedaempft
+  (``1 + log(tf)``) und mit der IDF des Terms multipliziert — bereits beim
+  Aufbau, die Suche summiert nur noch.
+- Vokabular als sortierte Liste: Praefix-Suche per ``bisect`` (Search-as-
+  you-type — das letzte, noch unvollstaendige Wort findet seine Fortsetzungen).
+
+Der Index wird als JSON unter ``HCC_HELP_INDEX_DIR`` (Default: Temp-Verzeichnis)
+abgelegt, Dateiname mit Hash ueber Topic-Inhalt und Index-Version. Weitere
+Worker bzw. der naechste Start laden ihn von dort, statt neu zu zaehlen;
+geaenderter Content ergibt einen neuen Hash und damit einen Neuaufbau.
+Im Hot-Reload-Modus (``HCC_HELP_HOT_RELOAD=1``) wird der Hash bei jeder
+Suche neu gebildet.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import tempfile
+import unicodedata
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from web_api.help.loader import DEFAULT_LANG, _is_hot_reload, get_all_topics
+from web_api.help.models import HelpSearchHit, HelpTopic
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+_FIELD_WEIGHTS = (("title", 5.0), ("category", 2.0), ("body_text", 1.0))
+_PREFIX_FACTOR = 0.5                    # Praefix-Treffer zaehlen halb so viel wie exakte
+_EXCERPT_LENGTH = 160
+_MIN_TOKEN_LENGTH = 2
+
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss"})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({
+    "aber", "als", "am", "an", "auch", "auf", "aus", "bei", "bis", "da", "das", "dass", "dem", "den",
+    "der", "des", "die", "du", "ein", "eine", "einem", "einen", "einer", "es", "fuer", "hat", "ich",
+    "im", "in", "ist", "kann", "mit", "nach", "nicht", "noch", "nur", "oder", "sich", "sie", "so",
+    "um", "und", "vom", "von", "vor", "wenn", "wie", "wird", "zu", "zum", "zur",
+})
+
+
+def normalize(text: str) -> str:
+    """casefold + ausgeschriebene Umlaute + ohne Akzente (``Größe`` → ``groesse``)."""
+    text = text.casefold().translate(_UMLAUTS)
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(normalize(text))
+            if len(t) >= _MIN_TOKEN_LENGTH and t not in _STOPWORDS]
+
+
+def _query_tokens(query: str) -> list[str]:
+    """Wie `tokenize`, aber das letzte Wort bleibt auch als Stoppwort erhalten —
+    beim Tippen ist ``an`` meist der Anfang von ``anmerkungen``."""
+    words = [t for t in _TOKEN_RE.findall(normalize(query)) if len(t) >= _MIN_TOKEN_LENGTH]
+    tokens = [t for t in words[:-1] if t not in _STOPWORDS] + words[-1:]
+    return list(dict.fromkeys(tokens))
+
+
+def _excerpt(body_text: str) -> str:
+    text = " ".join(body_text.split())
+    if len(text) <= _EXCERPT_LENGTH:
+        return text
+    return text[:_EXCERPT_LENGTH].rsplit(" ", 1)[0] + " …"
+
+
+def content_hash(topics: dict[str, HelpTopic]) -> str:
+    """Hash ueber alle indexierten Felder — Schluessel der Disk-Ablage."""
+    digest = hashlib.sha256(f"v{INDEX_VERSION}".encode())
+    for slug in sorted(topics):
+        t = topics[slug]
+        digest.update(json.dumps([slug, t.title, t.category, list(t.roles), t.body_text]).encode())
+    return digest.hexdigest()
+
+
+class HelpSearchIndex:
+    """Invertierter Index: ``terms[i]`` → ``postings[i]`` = ``[(doc, weight), ...]``."""
+
+    __slots__ = ("content_hash", "docs", "terms", "postings")
+
+    def __init__(self, content_hash: str, docs: list[dict], terms: list[str], postings: list[list[tuple[int, float]]]):
+        self.content_hash = content_hash
+        self.docs = docs                # slug, title, category, excerpt, roles (frozenset)
+        self.terms = terms
+        self.postings = postings
+
+    # ── Aufbau ──────────────────────────────────────────────────────────────
+
+    @classmethod
+    def build(cls, topics: dict[str, HelpTopic], content_hash: str) -> HelpSearchIndex:
+        docs: list[dict] = []
+        raw: dict[str, dict[int, float]] = defaultdict(dict)
+        for doc_no, slug in enumerate(sorted(topics)):
+            topic = topics[slug]
+            docs.append({
+                "slug": slug,
+                "title": topic.title,
+                "category": topic.category,
+                "excerpt": _excerpt(topic.body_text),
+                "roles": frozenset(topic.roles),
+            })
+            weights: Counter[str] = Counter()
+            for field_name, boost in _FIELD_WEIGHTS:
+                for term, tf in Counter(tokenize(getattr(topic, field_name))).items():
+                    weights[term] += boost * (1.0 + math.log(tf))
+            for term, weight in weights.items():
+                raw[term][doc_no] = weight
+
+        n_docs = len(docs)
+        terms = sorted(raw)
+        postings = []
+        for term in terms:
+            idf = math.log(1.0 + n_docs / len(raw[term]))
+            postings.append([(doc_no, round(w * idf, 4)) for doc_no, w in sorted(raw[term].items())])
+        return cls(content_hash, docs, terms, postings)
+
+    # ── Serialisierung ──────────────────────────────────────────────────────
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "version": INDEX_VERSION,
+            "content_hash": self.content_hash,
+            "docs": [{**d, "roles": sorted(d["roles"])} for d in self.docs],
+            "terms": self.terms,
+            "postings": self.postings,
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> HelpSearchIndex:
+        payload = json.loads(data)
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"Index-Version {payload.get('version')} != {INDEX_VERSION}")
+        docs = [{**d, "roles": frozenset(d["roles"])} for d in payload["docs"]]
+        postings = [[(doc_no, weight) for doc_no, weight in p] for p in payload["postings"]]
+        return cls(payload["content_hash"], docs, payload["terms"], postings)
+
+    # ── Suche ───────────────────────────────────────────────────────────────
+
+    def _scores_for(self, token: str) -> dict[int, float]:
+        """Exakter Term voll, alle Fortsetzungen des Praefixes mit `_PREFIX_FACTOR`."""
+        scores: dict[int, float] = {}
+        start = bisect.bisect_left(self.terms, token)
+        end = bisect.bisect_left(self.terms, token + "\uffff", lo=start)
+        for term_id in range(start, end):
+            factor = 1.0 if self.terms[term_id] == token else _PREFIX_FACTOR
+            for doc_no, weight in self.postings[term_id]:
+                score = weight * factor
+                if score > scores.get(doc_no, 0.0):
+                    scores[doc_no] = score
+        return scores
+
+    def search(self, query: str, roles: set[str] | frozenset[str], limit: int = 10) -> list[HelpSearchHit]:
+        """UND-Verknuepfung aller Woerter, sortiert nach Score; nur fuer `roles` sichtbare Topics."""
+        tokens = _query_tokens(query)
+        if not tokens:
+            return []
+        totals: dict[int, float] | None = None
+        for token in tokens:
+            scores = self._scores_for(token)
+            if totals is None:
+                totals = {d: s for d, s in scores.items() if self._visible(d, roles)}
+            else:
+                totals = {d: s + scores[d] for d, s in totals.items() if d in scores}
+            if not totals:
+                return []
+        ranked = sorted(totals.items(), key=lambda kv: (-kv[1], self.docs[kv[0]]["title"]))[:limit]
+        return [
+            HelpSearchHit(
+                slug=self.docs[d]["slug"],
+                title=self.docs[d]["title"],
+                category=self.docs[d]["category"],
+                excerpt=self.docs[d]["excerpt"],
+                score=round(score, 3),
+            )
+            for d, score in ranked
+        ]
+
+    def _visible(self, doc_no: int, roles) -> bool:
+        # Leere Rollen-Liste = fuer alle eingeloggten User sichtbar (wie im Router).
+        doc_roles = self.docs[doc_no]["roles"]
+        return not doc_roles or not doc_roles.isdisjoint(roles)
+
+
+# ── Disk-Ablage ──────────────────────────────────────────────────────────────
+
+
+def _index_dir() -> Path:
+    return Path(os.environ.get("HCC_HELP_INDEX_DIR") or Path(tempfile.gettempdir()) / "hcc_help_index")
+
+
+def _index_path(content_hash: str, lang: str) -> Path:
+    return _index_dir() / f"help-index-{lang}-{content_hash[:16]}.json"
+
+
+def load_or_build(topics: dict[str, HelpTopic], lang: str = DEFAULT_LANG) -> HelpSearchIndex:
+    """Index aus der Disk-Ablage laden oder neu aufbauen und ablegen.
+
+    Ablage-Fehler (Read-only-FS, kaputte Datei) werden geloggt — die Suche
+    funktioniert dann mit dem frisch gebauten Index trotzdem.
+    """
+    digest = content_hash(topics)
+    path = _index_path(digest, lang)
+    try:
+        index = HelpSearchIndex.from_json(path.read_text(encoding="utf-8"))
+        if index.content_hash == digest:
+            return index
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Hilfe-Suchindex %s unbrauchbar, wird neu aufgebaut: %s", path, exc)
+
+    index = HelpSearchIndex.build(topics, digest)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Atomar ersetzen — parallel startende Worker lesen nie eine halbe Datei.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(index.to_json())
+            os.replace(tmp_name, path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+    except OSError as exc:
+        logger.warning("Hilfe-Suchindex konnte nicht abgelegt werden (%s): %s", path, exc)
+    return index
+
+
+# ── oeffentliche API ─────────────────────────────────────────────────────────
+
+_index: HelpSearchIndex | None = None
+
+
+def get_search_index() -> HelpSearchIndex:
+    """Prozessweiter Index; im Hot-Reload-Modus bei Content-Aenderung neu."""
+    global _index
+    if _index is None:
+        _index = load_or_build(get_all_topics())
+    elif _is_hot_reload():
+        topics = get_all_topics()
+        if content_hash(topics) != _index.content_hash:
+            _index = load_or_build(topics)
+    return _index
+
+
+def search_topics(query: str, roles: set[str] | frozenset[str], limit: int = 10) -> list[HelpSearchHit]:
+    return get_search_index().search(query, roles, limit)
@@ -5,9 +5,10 @@ import uuid
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from web_api.auth.dependencies import LoggedInUser, WebUserRole
-from web_api.dependencies import get_db_session
+from web_api.auth.dependencies import AsyncLoggedInUser, LoggedInUser, WebUserRole
+from web_api.dependencies import get_async_db_session, get_db_session
 from web_api.inbox.service import get_inbox_grouped, get_unread_count, mark_as_read
 from web_api.templating import templates
 
@@ -15,10 +16,10 @@ router = APIRouter(prefix="/inbox", tags=["inbox"])
 
 
 @router.get("", response_class=HTMLResponse)
-def inbox_page(
+async def inbox_page(
     request: Request,
-    user: LoggedInUser,
-    session: Session = Depends(get_db_session),
+    user: AsyncLoggedInUser,
+    session: AsyncSession = Depends(get_async_db_session),
     type_filter: str | None = Query(default=None),
     unread_only: bool = Query(default=False),
     role_filter: str | None = Query(default=None),
@@ -26,12 +27,14 @@ def inbox_page(
     is_dispatcher = user.has_any_role(WebUserRole.dispatcher, WebUserRole.admin)
     is_employee = user.has_any_role(WebUserRole.employee)
     can_offer_takeover = is_employee
-    groups = get_inbox_grouped(
-        session, user.id,
-        type_filter=type_filter,
-        unread_only=unread_only,
-        role_filter=role_filter,
-        person_id=user.person_id,
+    groups = await session.run_sync(
+        lambda sync_session: get_inbox_grouped(
+            sync_session, user.id,
+            type_filter=type_filter,
+            unread_only=unread_only,
+            role_filter=role_filter,
+            person_id=user.person_id,
+        )
     )
     return templates.TemplateResponse(
         "inbox/index.html",
@@ -50,12 +53,14 @@ def inbox_page(
 
 
 @router.get("/badge", response_class=HTMLResponse)
-def inbox_badge(
+async def inbox_badge(
     request: Request,
-    user: LoggedInUser,
-    session: Session = Depends(get_db_session),
+    user: AsyncLoggedInUser,
+    session: AsyncSession = Depends(get_async_db_session),
 ):
-    count = get_unread_count(session, user.id)
+    """HTMX-Polling-Endpoint — async, damit langsame Requests anderer User
+    (Dashboard, SMTP-Fan-out) das Badge-Polling nicht ausbremsen."""
+    count = await session.run_sync(get_unread_count, user.id)
     return templates.TemplateResponse(
         "inbox/partials/inbox_badge.html",
         {"request": request, "unread_count": count},
@@ -115,6 +115,41 @@ def create_inbox_message(
     return msg
 
 
+def create_inbox_messages(
+    session: Session,
+    *,
+    msg_type: InboxMessageType,
+    reference_id: uuid.UUID,
+    reference_type: str,
+    snapshots: dict[uuid.UUID, dict],
+) -> list[InboxMessage]:
+    """Wie `create_inbox_message` fuer mehrere Empfaenger derselben Referenz.
+
+    `snapshots`: `recipient_web_user_id → snapshot_data`. Die Messages werden
+    per `add_all` angelegt und beim naechsten Flush in einem INSERT geschrieben.
+    """
+    if get_settings().SUPPRESS_NOTIFICATIONS:
+        logger.warning(
+            "SUPPRESS_NOTIFICATIONS aktiv — %d Inbox-Messages NICHT erzeugt "
+            "(type=%s reference=%s/%s)",
+            len(snapshots), msg_type, reference_type, reference_id,
+        )
+        return []
+    messages = [
+        InboxMessage(
+            recipient_web_user_id=recipient_id,
+            type=msg_type,
+            reference_id=reference_id,
+            reference_type=reference_type,
+            is_read=False,
+            snapshot_data=snapshot_data,
+        )
+        for recipient_id, snapshot_data in snapshots.items()
+    ]
+    session.add_all(messages)
+    return messages
+
+
 def get_inbox_for_user(
     session: Session,
     web_user_id: uuid.UUID,
@@ -0,0 +1,361 @@
+"""Request-Instrumentierung: Latenz, Query-Anzahl und DB-Zeit pro Route.
+
+Zwei Bausteine:
+
+1. SQLAlchemy-Listener auf ``Engine`` (global, also auch für die sync Engine
+   der Async-Engine) messen jede Abfrage. Die Werte landen in den
+   `RequestStats` des laufenden Requests — über eine ContextVar, die
+   Threadpool (sync Endpoints) und Greenlet (`AsyncSession.run_sync`) erben.
+2. `RequestMetricsMiddleware` (reines ASGI, ohne BaseHTTPMiddleware-Task)
+   legt pro Request die `RequestStats` an und aggregiert danach pro
+   (Methode, Route-Template, Status): Anzahl, Latenz-Histogramm, Queries,
+   DB-Zeit. Label ist das Template (``/availability/events``), nicht der
+   konkrete Pfad — die Kardinalität bleibt begrenzt.
+
+Langsame Requests (``SLOW_REQUEST_MS``) werden mit Query-Anzahl, DB-Zeit und
+den langsamsten Statements geloggt, langsame Einzel-Abfragen
+(``SLOW_QUERY_MS``) sofort. Geloggt wird nur das Statement mit Platzhaltern;
+Parameterwerte nie (nur deren Anzahl), String-Literale werden durch ``?``
+ersetzt.
+
+`render_prometheus()` liefert alles im Prometheus-Textformat (plus die
+DB-Pool-Metriken aus `database.pool`) für ``GET /metrics``.
+
+`capture_queries()` zählt prozessweit alle Abfragen innerhalb eines Blocks —
+Grundlage der Test-Fixture ``assert_max_queries`` gegen N+1-Regressionen.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from database.pool import pool_metrics_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Obergrenzen der Latenz-Buckets in Sekunden (Prometheus-Konvention `le`).
+LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_TOP_STATEMENTS = 3
+_STATEMENT_LOG_LENGTH = 500
+_UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class InstrumentationConfig:
+    slow_request_ms: float = 1000
+    slow_query_ms: float = 250
+    metrics_token: str = ""
+
+
+_config: InstrumentationConfig | None = None
+
+
+def _get_config() -> InstrumentationConfig:
+    # `get_settings()` liest bei jedem Aufruf .env — einmal pro Prozess reicht.
+    global _config
+    if _config is None:
+        from web_api.config import get_settings
+
+        settings = get_settings()
+        _config = InstrumentationConfig(
+            slow_request_ms=settings.SLOW_REQUEST_MS,
+            slow_query_ms=settings.SLOW_QUERY_MS,
+            metrics_token=settings.METRICS_TOKEN,
+        )
+    return _config
+
+
+def metrics_token() -> str:
+    """Token für ``GET /metrics`` (leer = Endpunkt deaktiviert), einmal pro Prozess gelesen."""
+    return _get_config().metrics_token
+
+
+def configure(**overrides) -> InstrumentationConfig:
+    """Schwellen und Token zur Laufzeit setzen (Tests, Diagnose)."""
+    global _config
+    config = _get_config()
+    _config = InstrumentationConfig(**{**config.__dict__, **overrides})
+    return _config
+
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def redact_statement(statement: str) -> str:
+    """Statement für Logs: String-Literale → ``?``, Whitespace zusammengezogen, gekürzt."""
+    text = _WHITESPACE_RE.sub(" ", _STRING_LITERAL_RE.sub("'?'", statement)).strip()
+    if len(text) > _STATEMENT_LOG_LENGTH:
+        text = text[:_STATEMENT_LOG_LENGTH] + " …"
+    return text
+
+
+def _parameter_count(parameters) -> int:
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (list, tuple, dict)):
+        return sum(len(p) for p in parameters)     # executemany
+    try:
+        return len(parameters)
+    except TypeError:
+        return 0
+
+
+# ── Pro Request ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class RequestStats:
+    route: str = _UNMATCHED_ROUTE
+    query_count: int = 0
+    db_seconds: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)   # (Sekunden, Statement)
+
+    def record(self, seconds: float, statement: str) -> None:
+        self.query_count += 1
+        self.db_seconds += seconds
+        if len(self.slowest) < _TOP_STATEMENTS or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(key=lambda item: -item[0])
+            del self.slowest[_TOP_STATEMENTS:]
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+_collectors: list[list[str]] = []
+_collectors_lock = threading.Lock()
+
+
+@contextmanager
+def capture_queries() -> Iterator[list[str]]:
+    """Sammelt alle SQL-Statements dieses Prozesses innerhalb des Blocks.
+
+    Prozessweit statt per ContextVar: der TestClient führt die App in einem
+    eigenen Thread aus, dorthin erbt sich kein Kontext.
+    """
+    statements: list[str] = []
+    with _collectors_lock:
+        _collectors.append(statements)
+    try:
+        yield statements
+    finally:
+        with _collectors_lock:
+            _collectors.remove(statements)
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, statement, parameters, _context, _executemany) -> None:
+    starts = conn.info.get("query_start")
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(seconds, statement)
+    if _collectors:
+        with _collectors_lock:
+            for statements in _collectors:
+                statements.append(statement)
+    if seconds * 1000 >= _get_config().slow_query_ms:
+        logger.warning(
+            "Langsame Abfrage: %.1f ms, Route %s, %d Parameter (redigiert): %s",
+            seconds * 1000,
+            stats.route if stats is not None else "-",
+            _parameter_count(parameters),
+            redact_statement(statement),
+        )
+
+
+def _handle_error(exception_context) -> None:
+    """Fehlgeschlagenes Statement: `after_cursor_execute` kommt nie — Startzeit
+    wieder abräumen, sonst wächst die Liste auf gepoolten Verbindungen."""
+    connection = exception_context.connection
+    if connection is None:
+        return
+    starts = connection.info.get("query_start")
+    if starts:
+        starts.pop()
+
+
+def register_query_listeners() -> None:
+    """Registriert die Mess-Listener global auf `Engine` (idempotent)."""
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+# ── Aggregation pro Route ────────────────────────────────────────────────────
+
+
+class _RouteMetrics:
+    __slots__ = ("count", "bucket_counts", "seconds_sum", "queries_sum", "db_seconds_sum")
+
+    def __init__(self):
+        self.count = 0
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.seconds_sum = 0.0
+        self.queries_sum = 0
+        self.db_seconds_sum = 0.0
+
+
+_routes: dict[tuple[str, str, int], _RouteMetrics] = {}
+_routes_lock = threading.Lock()
+
+
+def _observe(method: str, status: int, seconds: float, stats: RequestStats) -> None:
+    with _routes_lock:
+        metrics = _routes.get((method, stats.route, status))
+        if metrics is None:
+            metrics = _routes[(method, stats.route, status)] = _RouteMetrics()
+        metrics.count += 1
+        metrics.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        metrics.seconds_sum += seconds
+        metrics.queries_sum += stats.query_count
+        metrics.db_seconds_sum += stats.db_seconds
+
+
+def reset_metrics() -> None:
+    """Leert die Routen-Aggregate (Tests)."""
+    with _routes_lock:
+        _routes.clear()
+
+
+class RequestMetricsMiddleware:
+    """ASGI-Middleware: `RequestStats` pro HTTP-Request, danach Aggregation + Slow-Log."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status_holder = [500]
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            seconds = time.perf_counter() - start
+            _current.reset(token)
+            route = scope.get("route")
+            stats.route = getattr(route, "path", None) or _UNMATCHED_ROUTE
+            _observe(scope["method"], status_holder[0], seconds, stats)
+            if seconds * 1000 >= _get_config().slow_request_ms:
+                logger.warning(
+                    "Langsamer Request: %s %s %d — %.1f ms, %d Queries, DB %.1f ms; langsamste: %s",
+                    scope["method"], stats.route, status_holder[0], seconds * 1000,
+                    stats.query_count, stats.db_seconds * 1000,
+                    " | ".join(f"{s * 1000:.1f} ms {redact_statement(sql)}" for s, sql in stats.slowest) or "-",
+                )
+
+
+# ── Prometheus-Textformat ────────────────────────────────────────────────────
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_le(upper: float) -> str:
+    return "+Inf" if upper == float("inf") else repr(float(upper))
+
+
+def render_prometheus() -> str:
+    """Routen- und DB-Pool-Metriken dieses Workers im Prometheus-Textformat 0.0.4."""
+    lines = [
+        "# HELP hcc_http_requests_total HTTP-Requests pro Route-Template und Status.",
+        "# TYPE hcc_http_requests_total counter",
+    ]
+    with _routes_lock:
+        routes = sorted((key, m.count, list(m.bucket_counts), m.seconds_sum, m.queries_sum, m.db_seconds_sum)
+                        for key, m in _routes.items())
+    for (method, route, status), count, *_ in routes:
+        lines.append(f'hcc_http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}')
+
+    lines += [
+        "# HELP hcc_http_request_duration_seconds Wall-Time pro Request.",
+        "# TYPE hcc_http_request_duration_seconds histogram",
+    ]
+    for (method, route, status), count, bucket_counts, seconds_sum, _, _ in routes:
+        labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+        cumulative = 0
+        for upper, bucket_count in zip((*LATENCY_BUCKETS, float("inf")), bucket_counts):
+            cumulative += bucket_count
+            lines.append(f'hcc_http_request_duration_seconds_bucket{{{labels},le="{_format_le(upper)}"}} {cumulative}')
+        lines.append(f"hcc_http_request_duration_seconds_sum{{{labels}}} {seconds_sum:.6f}")
+        lines.append(f"hcc_http_request_duration_seconds_count{{{labels}}} {count}")
+
+    lines += [
+        "# HELP hcc_http_request_db_queries_total SQL-Abfragen, summiert über alle Requests.",
+        "# TYPE hcc_http_request_db_queries_total counter",
+    ]
+    for (method, route, status), _, _, _, queries_sum, _ in routes:
+        lines.append(f'hcc_http_request_db_queries_total{{method="{method}",route="{_escape(route)}",'
+                     f'status="{status}"}} {queries_sum}')
+    lines += [
+        "# HELP hcc_http_request_db_seconds_total DB-Zeit, summiert über alle Requests.",
+        "# TYPE hcc_http_request_db_seconds_total counter",
+    ]
+    for (method, route, status), _, _, _, _, db_seconds_sum in routes:
+        lines.append(f'hcc_http_request_db_seconds_total{{method="{method}",route="{_escape(route)}",'
+                     f'status="{status}"}} {db_seconds_sum:.6f}')
+
+    lines += _render_pool_metrics()
+    return "\n".join(lines) + "\n"
+
+
+_POOL_GAUGES = (
+    ("checked_out", "gauge", "Aktuell ausgeliehene Verbindungen."),
+    ("overflow", "gauge", "Verbindungen über pool_size hinaus."),
+    ("checkouts", "counter", "Checkouts seit Prozessstart."),
+    ("timeouts", "counter", "Checkouts mit Pool-Timeout."),
+    ("pings", "counter", "Idle-Pings."),
+    ("ping_failures", "counter", "Fehlgeschlagene Idle-Pings."),
+    ("invalidations", "counter", "Verworfene Verbindungen."),
+)
+
+
+def _render_pool_metrics() -> list[str]:
+    pools = pool_metrics_snapshot()
+    lines: list[str] = []
+    for key, kind, help_text in _POOL_GAUGES:
+        name = f"hcc_db_pool_{key}" + ("_total" if kind == "counter" else "")
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for pool_name, snapshot in sorted(pools.items()):
+            lines.append(f'{name}{{pool="{pool_name}",profile="{snapshot["profile"]}"}} {snapshot[key]}')
+
+    lines += [
+        "# HELP hcc_db_pool_wait_seconds Wartezeit auf eine Pool-Verbindung.",
+        "# TYPE hcc_db_pool_wait_seconds histogram",
+    ]
+    for pool_name, snapshot in sorted(pools.items()):
+        labels = f'pool="{pool_name}",profile="{snapshot["profile"]}"'
+        for bucket in snapshot["wait_seconds_buckets"]:
+            le = bucket["le"] if bucket["le"] == "+Inf" else repr(float(bucket["le"]))
+            lines.append(f'hcc_db_pool_wait_seconds_bucket{{{labels},le="{le}"}} {bucket["count"]}')
+        lines.append(f'hcc_db_pool_wait_seconds_sum{{{labels}}} {snapshot["wait_seconds_sum"]}')
+        lines.append(f'hcc_db_pool_wait_seconds_count{{{labels}}} {snapshot["checkouts"]}')
+    return lines
@@ -1,4 +1,5 @@
 import logging
+import secrets
 from contextlib import asynccontextmanager
 from urllib.parse import quote
 
@@ -12,11 +13,14 @@ logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlmodel import Session, text
 
+from web_api.async_database import dispose_async_engine
+from web_api.availability.summary import register_availability_summary_listeners
+from web_api.calendar_cache import register_calendar_feed_listeners
 from web_api.rate_limit import limiter
 
 from web_api.account.router import router as account_router
@@ -36,6 +40,13 @@ from web_api.dispatcher_periods.router import router as dispatcher_periods_route
 from web_api.employees.router import router as employees_router
 from web_api.exceptions import LoginRequired
 from web_api.help.router import router as help_router
+from web_api.help.search import get_search_index
+from web_api.instrumentation import (
+    RequestMetricsMiddleware,
+    metrics_token,
+    register_query_listeners,
+    render_prometheus,
+)
 from web_api.inbox.router import router as inbox_router
 from web_api.dispatcher.notification_circles.router import router as notification_circles_router
 from web_api.dispatcher.emergency_notification_circles.router import router as emergency_notification_circles_router
@@ -48,6 +59,7 @@ from web_api.scheduler.advisory_lock import (
     release_scheduler_lock,
 )
 from web_api.scheduler.setup import create_scheduler
+from web_api.solver_jobs.worker import start_solver_job_runner, stop_solver_job_runner
 from web_api.swap_requests.router import router as swap_requests_router
 from web_api.user_settings.router import router as user_settings_router
 from web_api.viewer.router import router as viewer_router
@@ -68,17 +80,30 @@ async def lifespan(app: FastAPI):
             "SUPPRESS_NOTIFICATIONS=true — E-Mails und Inbox-Messages sind "
             "deaktiviert. Nach administrativer Aktion auf False zuruecksetzen."
         )
+    # Hilfe-Suchindex in jedem Worker vor dem ersten Request bereitstellen
+    # (aus der Disk-Ablage oder neu aufgebaut, siehe `web_api.help.search`).
+    get_search_index()
     lock_handle = acquire_scheduler_lock(settings.DATABASE_URL)
     scheduler = None
     if lock_handle.acquired:
         scheduler = create_scheduler(settings.DATABASE_URL)
         scheduler.start()
+        # Solver-Pool ebenfalls nur im Lock-Holder — sonst startet jeder
+        # Uvicorn-Worker eigene Solver-Prozesse.
+        if settings.SOLVER_JOB_WORKERS > 0:
+            start_solver_job_runner(
+                settings.SOLVER_JOB_WORKERS,
+                settings.SOLVER_JOB_POLL_SECONDS,
+                settings.SOLVER_JOB_STALE_SECONDS,
+            )
     try:
         yield
     finally:
+        await stop_solver_job_runner()
         if scheduler is not None:
             scheduler.shutdown(wait=False)
         release_scheduler_lock(lock_handle)
+        await dispose_async_engine()
 
 
 app = FastAPI(
@@ -89,6 +114,14 @@ app = FastAPI(
 
 app.state.limiter = limiter
 
+# Invalidierung des Kalender-Feed-Caches bei Plan-/Appointment-Änderungen
+register_calendar_feed_listeners()
+# Invalidierung der Verfügbarkeits-Zusammenfassung bei AvailDay-/PlanPeriod-Änderungen
+register_availability_summary_listeners()
+# Latenz, Query-Anzahl und DB-Zeit pro Route-Template (GET /metrics, Slow-Log)
+register_query_listeners()
+app.add_middleware(RequestMetricsMiddleware)
+
 
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
@@ -201,6 +234,18 @@ def health_check(session: Session = Depends(get_db_session)):
     return {"status": "ok", "database": db_status}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request) -> PlainTextResponse:
+    """Prometheus-Metriken dieses Workers; ohne METRICS_TOKEN nicht vorhanden."""
+    token = metrics_token()
+    if not token:
+        return PlainTextResponse("Not Found", status_code=status.HTTP_404_NOT_FOUND)
+    authorization = request.headers.get("Authorization", "")
+    if not secrets.compare_digest(authorization.encode(), f"Bearer {token}".encode()):
+        return PlainTextResponse("Unauthorized", status_code=status.HTTP_401_UNAUTHORIZED)
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
 @app.head("/health", include_in_schema=False)
 def health_check_head() -> Response:
     """Lightweight Health-Probe ohne DB-Touch — fuer Render/Uptime-Monitore,
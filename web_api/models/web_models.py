@@ -2,7 +2,7 @@
 
 import enum
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Optional
 
 from sqlalchemy import Enum as SAEnum
@@ -500,3 +500,124 @@ class EmailSettings(SQLModel, table=True):
     updated_by_id: Optional[uuid.UUID] = Field(
         default=None, foreign_key="web_user.id", nullable=True, ondelete="SET NULL"
     )
+
+
+# ── Kalender-Feed-Cache ──────────────────────────────────────────────────────
+
+
+class CalendarFeedRevision(SQLModel, table=True):
+    """Singleton-Zähler (id=1) für den Kalender-Feed-Cache.
+
+    Wird nach jedem Commit, der Pläne/Appointments/Events berührt, um 1
+    erhöht (siehe `web_api.calendar_cache`). Cache-Einträge sind an die
+    Revision gebunden — ein Bump invalidiert alle Worker gleichzeitig.
+    """
+
+    __tablename__ = "calendar_feed_revision"
+
+    id: int = Field(default=1, primary_key=True)
+    revision: int = Field(default=0)
+
+
+class CalendarFeedCacheEntry(SQLModel, table=True):
+    """Optionale, worker-übergreifende Cache-Stufe für Kalender-Feeds.
+
+    `cache_key` ist der SHA-256 über (Projekt, Team-Set, Datumsfenster,
+    Filter). Einträge mit veralteter Revision werden beim nächsten Schreiben
+    aufgeräumt.
+    """
+
+    __tablename__ = "calendar_feed_cache"
+
+    cache_key: str = Field(primary_key=True, max_length=64)
+    revision: int = Field(index=True)
+    payload: list = Field(sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=_utcnow)
+
+
+# ── Verfügbarkeits-Zusammenfassung ───────────────────────────────────────────
+
+
+class AvailabilitySummary(SQLModel, table=True):
+    """Vorberechnete Zeile pro (Person, Planperiode) für die Verfügbarkeitsmaske.
+
+    Enthält alles, was Team-Dropdown, Perioden-Liste, Perioden-Navigation
+    und Sidebar-Stats brauchen (siehe `web_api.availability.summary`).
+    Invalidierung pro Person: Änderungen an AvailDays, ActorPlanPeriods,
+    PlanPeriods, Teams, Deadlines oder Appointment-Links löschen alle
+    Zeilen der betroffenen Personen; der nächste Seitenaufruf baut sie neu.
+    """
+
+    __tablename__ = "availability_summary"
+
+    person_id: uuid.UUID = Field(primary_key=True, foreign_key="person.id", ondelete="CASCADE")
+    plan_period_id: uuid.UUID = Field(primary_key=True, foreign_key="plan_period.id", ondelete="CASCADE")
+    actor_plan_period_id: uuid.UUID
+    team_id: uuid.UUID
+    team_name: str
+    start: date
+    end: date
+    deadline: Optional[date] = Field(default=None, nullable=True)
+    notes_for_employees: Optional[str] = Field(default=None, nullable=True)
+    notes: Optional[str] = Field(default=None, nullable=True)
+    requested_assignments: int
+    closed: bool
+    total_entered: int
+    total_appointed: int
+    computed_at: datetime
+
+
+# ── Solver-Jobs (serverseitige Planberechnung) ───────────────────────────────
+
+
+class SolverJobKind(str, enum.Enum):
+    single_period = "single_period"
+    multi_period = "multi_period"
+
+
+class SolverJobStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+class SolverJob(SQLModel, table=True):
+    """Warteschlangen-Eintrag für eine Planberechnung auf dem Server.
+
+    Der Desktop-Client legt Jobs über `/api/v1/solver-jobs` an und pollt den
+    Status; der Runner (`web_api.solver_jobs.worker`) übernimmt `queued`-Jobs
+    per atomarem Status-Update und rechnet sie in einem Prozess-Pool.
+    `params` enthält Planzahl und Zeitlimits, `result` nach Abschluss die
+    IDs der gespeicherten Pläne bzw. die Konflikte.
+    """
+
+    __tablename__ = "solver_job"
+
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    kind: SolverJobKind = Field(
+        sa_column=Column(SAEnum(SolverJobKind, name="solverjobkind"), nullable=False)
+    )
+    status: SolverJobStatus = Field(
+        sa_column=Column(
+            SAEnum(SolverJobStatus, name="solverjobstatus"),
+            nullable=False,
+            index=True,
+        )
+    )
+    team_id: uuid.UUID = Field(foreign_key="team.id", ondelete="CASCADE", index=True)
+    plan_period_ids: list = Field(sa_column=Column(JSON, nullable=False))
+    params: dict = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    created_by_id: Optional[uuid.UUID] = Field(
+        default=None, foreign_key="web_user.id", nullable=True, ondelete="SET NULL"
+    )
+    cancel_requested: bool = Field(default=False)
+    progress_step: int = Field(default=0)
+    progress_message: Optional[str] = Field(default=None, max_length=255)
+    result: Optional[dict] = Field(default=None, sa_column=Column(JSON, nullable=True))
+    error: Optional[str] = Field(default=None)
+    created_at: datetime = Field(default_factory=_utcnow)
+    started_at: Optional[datetime] = Field(default=None, nullable=True)
+    heartbeat_at: Optional[datetime] = Field(default=None, nullable=True)
+    finished_at: Optional[datetime] = Field(default=None, nullable=True)
@@ -20,11 +20,20 @@ PG-Advisory-Lock, sodass nur ein Lock-Holder `scheduler.start()` aufruft.
 Zeitzone: Alle Reminder feuern um 08:00 Europe/Berlin am Stichtag, ueber
 `DateTrigger` mit `ZoneInfo`. Sommerzeit unkritisch, weil DateTrigger
 absolute Zeitpunkte verwendet.
+
+**Buendelung:** Gruppen mit gleicher Deadline feuern im selben Moment (der
+Executor startet sie parallel). `reminder_job` legt `(group_id, kind)` daher
+nur in eine Warteschlange; der erste Job wartet `_COALESCE_WINDOW_SECONDS`
+und arbeitet dann alle bis dahin eingetroffenen ab — eine SMTP-Config, ein
+`EmailService`, nacheinander statt konkurrierend auf dieselben Tabellen.
+Die anderen Jobs kehren sofort zurueck.
 """
 
 from __future__ import annotations
 
 import logging
+import threading
+import time as time_module
 import uuid
 from datetime import date, datetime, time, timedelta
 from typing import TYPE_CHECKING
@@ -49,44 +58,89 @@ _REMINDER_KINDS: tuple[tuple[int, str], ...] = (
 _TZ = ZoneInfo("Europe/Berlin")
 _FIRE_TIME = time(8, 0)
 _MISFIRE_GRACE_SECONDS = 3600
+_COALESCE_WINDOW_SECONDS = 2.0
+
+# Wartende (group_id, kind) in Eingangsreihenfolge (dict als geordnete Menge)
+_pending: dict[tuple[uuid.UUID, str], None] = {}
+_pending_lock = threading.Lock()
+_draining = False
 
 
 def reminder_job(group_id: uuid.UUID | str, kind: str) -> None:
     """Top-Level-Job-Funktion — wird von APScheduler aus dem JobStore aufgerufen.
 
-    Laedt die SMTP-Config aus der DB, instantiiert den `EmailService` und
-    delegiert an `send_availability_reminder(group_id, kind, url_base)`. Beim
-    Aufruf aus dem JobStore kommt `group_id` als String zurueck (UUID wird
-    re-serialisiert) — wir konvertieren explizit zu UUID.
+    Beim Aufruf aus dem JobStore kommt `group_id` als String zurueck (UUID
+    wird re-serialisiert) — wir konvertieren explizit zu UUID. Der Versand
+    laeuft gebuendelt ueber `_run_reminders` (siehe Modul-Docstring).
+    """
+    global _draining
+    if isinstance(group_id, str):
+        group_id = uuid.UUID(group_id)
 
-    `url_base` wird *innerhalb* des Jobs aus den Settings gelesen, nicht als
-    Parameter durchgereicht — die persistierte Job-Signatur muss stabil
-    bleiben (siehe Modul-Docstring).
+    with _pending_lock:
+        _pending[(group_id, kind)] = None
+        if _draining:
+            return
+        _draining = True
+    try:
+        time_module.sleep(_COALESCE_WINDOW_SECONDS)
+        while True:
+            with _pending_lock:
+                batch = list(_pending)
+                _pending.clear()
+                if not batch:
+                    _draining = False
+                    return
+            _run_reminders(batch)
+    except BaseException:
+        with _pending_lock:
+            _draining = False
+        raise
+
+
+def _run_reminders(jobs: list[tuple[uuid.UUID, str]]) -> None:
+    """Versendet die Reminder fuer `jobs` mit einer SMTP-Config und einem `EmailService`.
+
+    Laedt die SMTP-Config aus der DB und delegiert pro Job an
+    `send_availability_reminder(group_id, kind, url_base)`. `url_base` wird
+    *innerhalb* des Jobs aus den Settings gelesen, nicht als Parameter
+    durchgereicht — die persistierte Job-Signatur muss stabil bleiben (siehe
+    Modul-Docstring).
     """
     from database.database import get_session
     from email_to_users.service import EmailService
     from web_api.config import get_settings
     from web_api.email.config_loader import load_smtp_config
 
-    if isinstance(group_id, str):
-        group_id = uuid.UUID(group_id)
-
     try:
         with get_session() as session:
             smtp_config = load_smtp_config(session)
     except Exception:
-        logger.exception("Reminder-Job: SMTP-Config konnte nicht geladen werden, skip")
+        logger.exception("Reminder-Job: SMTP-Config konnte nicht geladen werden, skip (%d Jobs)", len(jobs))
         return
 
     url_base = get_settings().BASE_URL or None
-
     service = EmailService(smtp_config)
-    stats = service.send_availability_reminder(group_id, kind, url_base=url_base)
-    logger.info(
-        "Reminder-Job %s/%s versendet: success=%d failed=%d skipped=%d",
-        group_id, kind, stats.get("success", 0), stats.get("failed", 0),
-        stats.get("skipped", 0),
-    )
+    started = time_module.perf_counter()
+    rows_read = rows_written = 0
+    for group_id, kind in jobs:
+        try:
+            stats = service.send_availability_reminder(group_id, kind, url_base=url_base)
+        except Exception:
+            logger.exception("Reminder-Job %s/%s fehlgeschlagen", group_id, kind)
+            continue
+        rows_read += stats.get("rows_read", 0)
+        rows_written += stats.get("rows_written", 0)
+        logger.info(
+            "Reminder-Job %s/%s versendet: success=%d failed=%d skipped=%d rows_read=%d rows_written=%d",
+            group_id, kind, stats.get("success", 0), stats.get("failed", 0),
+            stats.get("skipped", 0), stats.get("rows_read", 0), stats.get("rows_written", 0),
+        )
+    if len(jobs) > 1:
+        logger.info(
+            "Reminder-Lauf: %d Jobs gebuendelt in %.1f s, rows_read=%d rows_written=%d",
+            len(jobs), time_module.perf_counter() - started, rows_read, rows_written,
+        )
 
 
 def register_jobs_for_group(
@@ -137,6 +191,7 @@ def trigger_catchup(group: "NotificationGroup") -> None:
 
     Wird aufgerufen, wenn eine PP nachtraeglich zu einer existierenden
     Gruppe hinzugefuegt wird (siehe Phase 1.5). Nutzt den selben Mailer,
-    aber laeuft ohne Scheduler-Persistenz — direkter Funktionsaufruf.
+    aber laeuft ohne Scheduler-Persistenz und ohne Buendelungs-Wartezeit —
+    direkter Funktionsaufruf.
     """
-    reminder_job(group.id, "catchup")
+    _run_reminders([(group.id, "catchup")])
@@ -1,6 +1,8 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 
+from database.pool import POOL_PROFILES, create_pooled_engine
+
 
 # Modul-globaler Scheduler — wird im FastAPI-`lifespan` ueber create_scheduler()
 # gesetzt und via get_scheduler() von db_services-Hooks erreicht. None solange
@@ -10,7 +12,13 @@ _scheduler: AsyncIOScheduler | None = None
 
 def create_scheduler(db_url: str) -> AsyncIOScheduler:
     global _scheduler
-    jobstores = {"default": SQLAlchemyJobStore(url=db_url)}
+    if db_url.startswith("postgres"):
+        # Eigener kleiner Pool (Profil "scheduler") statt der Default-Engine
+        # des Job-Stores — mit Idle-Ping und in den Pool-Metriken sichtbar.
+        engine = create_pooled_engine(db_url, "scheduler", "scheduler", POOL_PROFILES["scheduler"])
+        jobstores = {"default": SQLAlchemyJobStore(engine=engine)}
+    else:
+        jobstores = {"default": SQLAlchemyJobStore(url=db_url)}
     _scheduler = AsyncIOScheduler(jobstores=jobstores)
     return _scheduler
 
@@ -0,0 +1,198 @@
+"""Solver-Job-Service: Warteschlange für serverseitige Planberechnungen.
+
+Request-Pfad (Desktop-API) legt Jobs an, liest Status und fordert Abbruch an.
+Der Runner (`web_api.solver_jobs.worker`) übernimmt `queued`-Jobs über
+`claim_next_job` — ein bedingtes UPDATE (`WHERE status='queued'`), damit
+mehrere Runner nie denselben Job bekommen, ohne Row-Locks zu halten.
+
+Die Schreib-Helfer für den Worker-Prozess (`record_progress`, `finish_job`)
+öffnen eine eigene Session pro Aufruf — sie laufen außerhalb jedes Requests.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException, status
+from sqlalchemy import select as sa_select, update
+from sqlmodel import Session
+
+from database.database import get_session
+from database.models import PlanPeriod
+from web_api.models.web_models import SolverJob, SolverJobKind, SolverJobStatus
+
+logger = logging.getLogger(__name__)
+
+_FINISHED = (SolverJobStatus.succeeded, SolverJobStatus.failed, SolverJobStatus.cancelled)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class SolverJobParams:
+    num_plans: int
+    time_calc_max_shifts: int
+    time_calc_fair_distribution: int
+    time_calc_plan: int
+
+    def as_dict(self) -> dict:
+        return {
+            "num_plans": self.num_plans,
+            "time_calc_max_shifts": self.time_calc_max_shifts,
+            "time_calc_fair_distribution": self.time_calc_fair_distribution,
+            "time_calc_plan": self.time_calc_plan,
+        }
+
+
+# ── Request-Pfad ──────────────────────────────────────────────────────────────
+
+
+def submit_solver_job(
+    session: Session,
+    *,
+    plan_period_ids: list[uuid.UUID],
+    params: SolverJobParams,
+    created_by_id: uuid.UUID | None,
+) -> SolverJob:
+    """Legt einen `queued`-Job an. Mehrere Perioden → Multi-Period-Berechnung.
+
+    Alle Perioden müssen existieren und zum selben Team gehören (HTTP 404/400).
+    """
+    if not plan_period_ids:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="Keine Planperiode angegeben")
+    rows = session.execute(
+        sa_select(PlanPeriod.id, PlanPeriod.team_id)
+        .where(PlanPeriod.id.in_(plan_period_ids))
+        .where(PlanPeriod.prep_delete.is_(None))
+    ).all()
+    if len(rows) != len(set(plan_period_ids)):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Planperiode nicht gefunden")
+    team_ids = {r.team_id for r in rows}
+    if len(team_ids) != 1:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST,
+                            detail="Alle Planperioden müssen zum selben Team gehören")
+
+    job = SolverJob(
+        kind=SolverJobKind.multi_period if len(plan_period_ids) > 1 else SolverJobKind.single_period,
+        status=SolverJobStatus.queued,
+        team_id=team_ids.pop(),
+        plan_period_ids=[str(pp_id) for pp_id in plan_period_ids],
+        params=params.as_dict(),
+        created_by_id=created_by_id,
+    )
+    session.add(job)
+    session.flush()
+    return job
+
+
+def get_solver_job(session: Session, job_id: uuid.UUID) -> SolverJob:
+    job = session.get(SolverJob, job_id)
+    if job is None:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Solver-Job nicht gefunden")
+    return job
+
+
+def list_solver_jobs_for_team(session: Session, team_id: uuid.UUID, limit: int = 20) -> list[SolverJob]:
+    return list(session.execute(
+        sa_select(SolverJob)
+        .where(SolverJob.team_id == team_id)
+        .order_by(SolverJob.created_at.desc())
+        .limit(limit)
+    ).scalars().all())
+
+
+def request_cancel(session: Session, job: SolverJob) -> SolverJob:
+    """Wartende Jobs werden sofort storniert, laufende bekommen ein Abbruch-Flag.
+
+    Der Worker prüft das Flag an jedem Fortschritts-Schritt (siehe
+    `worker._JobProgress`) — eine bereits laufende CP-SAT-Suche endet
+    spätestens an ihrem Zeitlimit.
+    """
+    if job.status == SolverJobStatus.queued:
+        job.status = SolverJobStatus.cancelled
+        job.finished_at = _utcnow()
+    elif job.status == SolverJobStatus.running:
+        job.cancel_requested = True
+    session.flush()
+    return job
+
+
+# ── Runner / Worker-Prozess ───────────────────────────────────────────────────
+
+
+def claim_next_job(session: Session) -> uuid.UUID | None:
+    """Übernimmt den ältesten `queued`-Job atomar und liefert seine ID.
+
+    Verliert der Runner das Rennen gegen einen anderen (rowcount 0), gibt es
+    im nächsten Poll-Takt einen neuen Versuch.
+    """
+    job_id = session.execute(
+        sa_select(SolverJob.id)
+        .where(SolverJob.status == SolverJobStatus.queued)
+        .order_by(SolverJob.created_at)
+        .limit(1)
+    ).scalar_one_or_none()
+    if job_id is None:
+        return None
+    now = _utcnow()
+    claimed = session.execute(
+        update(SolverJob)
+        .where(SolverJob.id == job_id)
+        .where(SolverJob.status == SolverJobStatus.queued)
+        .values(status=SolverJobStatus.running, started_at=now, heartbeat_at=now)
+    ).rowcount
+    session.commit()
+    return job_id if claimed else None
+
+
+def fail_stale_jobs(session: Session, stale_after: timedelta) -> int:
+    """Markiert laufende Jobs ohne Heartbeat als fehlgeschlagen (Prozess-Absturz, Deploy)."""
+    count = session.execute(
+        update(SolverJob)
+        .where(SolverJob.status == SolverJobStatus.running)
+        .where(SolverJob.heartbeat_at < _utcnow() - stale_after)
+        .values(status=SolverJobStatus.failed, finished_at=_utcnow(),
+                error="Berechnung abgebrochen (kein Lebenszeichen vom Worker)")
+    ).rowcount
+    session.commit()
+    if count:
+        logger.warning("solver_jobs: %d verwaiste Jobs als fehlgeschlagen markiert", count)
+    return count
+
+
+def record_progress(job_id: uuid.UUID, message: str) -> bool:
+    """Schreibt einen Fortschritts-Schritt + Heartbeat. Liefert `cancel_requested`."""
+    with get_session() as session:
+        job = session.get(SolverJob, job_id)
+        job.progress_step += 1
+        job.progress_message = message[:255]
+        job.heartbeat_at = _utcnow()
+        return job.cancel_requested
+
+
+def touch_heartbeat(job_id: uuid.UUID) -> bool:
+    """Heartbeat ohne Fortschritt (lange CP-SAT-Läufe). Liefert `cancel_requested`."""
+    with get_session() as session:
+        job = session.get(SolverJob, job_id)
+        job.heartbeat_at = _utcnow()
+        return job.cancel_requested
+
+
+def finish_job(
+    job_id: uuid.UUID,
+    job_status: SolverJobStatus,
+    *,
+    result: dict | None = None,
+    error: str | None = None,
+) -> None:
+    with get_session() as session:
+        job = session.get(SolverJob, job_id)
+        if job.status in _FINISHED:
+            return
+        job.status = job_status
+        job.result = result
+        job.error = error
+        job.finished_at = _utcnow()
@@ -0,0 +1,295 @@
+"""Solver-Job-Runner: rechnet Planberechnungen in einem Prozess-Pool.
+
+Aufbau:
+- `SolverJobRunner` läuft als asyncio-Task im Lifespan des Uvicorn-Workers,
+  der den Scheduler-Lock hält. Er pollt die `solver_job`-Tabelle, übernimmt
+  `queued`-Jobs (`service.claim_next_job`) und reicht sie an einen
+  `ProcessPoolExecutor` weiter — CP-SAT blockiert damit weder den Event-Loop
+  noch den Threadpool der Request-Handler.
+- `run_solver_job(job_id)` ist die Top-Level-Funktion im Kind-Prozess
+  (pickle-bar, kein Closure). Sie ruft `solve`/`solve_multi_period`, leitet
+  `sat_solver.progress` auf die Job-Zeile um und speichert die Ergebnisse als
+  Pläne — analog `gui.data_processing.save_schedule_versions_to_db`, aber
+  direkt über `db_services` statt über den Desktop-Command-Controller.
+
+Pro Periode werden höchstens `num_plans` Versionen gespeichert — die Zahl,
+die der Desktop angefordert hat (lokal fragt er danach per Dialog nach).
+
+Stürzt ein Kind-Prozess ab, ist der ganze `ProcessPoolExecutor` unbrauchbar
+(`BrokenProcessPool`); der Runner ersetzt ihn vor dem nächsten Job.
+
+Abbruch ist kooperativ: Ein Heartbeat-Thread im Kind-Prozess liest
+`cancel_requested`, stoppt die laufende Suche (`solve_context.stop_all`) und
+der nächste Fortschritts-Schritt bricht dann ab.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+from sqlmodel import Session
+
+from database import database as db_module
+from sat_solver.solve_context import stop_all
+from web_api.models.web_models import SolverJob, SolverJobKind, SolverJobStatus
+from web_api.solver_jobs import service
+
+logger = logging.getLogger(__name__)
+
+_HEARTBEAT_SECONDS = 30
+
+
+class SolverJobCancelled(Exception):
+    """Abbruch auf Anforderung des Dispatchers (`cancel_requested`)."""
+
+
+# ── Kind-Prozess ─────────────────────────────────────────────────────────────
+
+
+class _JobProgress:
+    """Progress-Callback + Heartbeat-Thread für einen laufenden Job."""
+
+    def __init__(self, job_id: uuid.UUID) -> None:
+        self.job_id = job_id
+        self.cancelled = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._heartbeat, daemon=True)
+
+    def __enter__(self) -> _JobProgress:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(_HEARTBEAT_SECONDS):
+            try:
+                if service.touch_heartbeat(self.job_id):
+                    self.cancelled.set()
+                    # Laufende CP-SAT-Suche sofort beenden statt auf den nächsten Schritt zu warten
+                    stop_all()
+            except Exception:
+                logger.exception("solver_jobs: Heartbeat für %s fehlgeschlagen", self.job_id)
+
+    def __call__(self, comment: str) -> None:
+        if service.record_progress(self.job_id, comment) or self.cancelled.is_set():
+            raise SolverJobCancelled()
+
+
+def _serialize_fixed_cast_conflicts(conflicts: dict | None) -> list[dict]:
+    return [
+        {"date": day.isoformat(), "time_of_day": tod_name, "event_id": str(event_id), "count": count}
+        for (day, tod_name, event_id), count in (conflicts or {}).items()
+        if count
+    ]
+
+
+def _save_schedule_versions(
+    plan_period_id: uuid.UUID,
+    team_id: uuid.UUID,
+    schedule_versions: list,
+) -> list[uuid.UUID]:
+    """Speichert Plan-Versionen einer Periode. Namensschema wie im Desktop."""
+    from database import db_services
+
+    plan_period = db_services.PlanPeriod.get(plan_period_id, minimal=True)
+    saved_plan_names = set(db_services.Plan.get_all_from__team(team_id, True, True).keys())
+    plan_base_name = f'{plan_period.start:%d.%m.%y}-{plan_period.end:%d.%m.%y}'
+    index = 1
+    plan_ids = []
+    for version in schedule_versions:
+        while f'{plan_base_name} ({index:0>2})' in saved_plan_names:
+            index += 1
+        plan = db_services.Plan.create(plan_period_id, f'{plan_base_name} ({index:0>2})')
+        saved_plan_names.add(plan.name)
+        db_services.Appointment.create_bulk(version, plan.id)
+        plan_ids.append(plan.id)
+    return plan_ids
+
+
+def _save_max_fair_shifts(
+    max_shifts_per_app: dict[uuid.UUID, int],
+    fair_shifts_per_app: dict[uuid.UUID, float],
+) -> None:
+    """Einmal pro Job — bei Multi-Period decken die Dicts alle Perioden ab."""
+    from database import db_services, schemas
+
+    db_services.MaxFairShiftsOfApp.create_bulk([
+        schemas.MaxFairShiftsOfAppCreate(
+            max_shifts=max_shifts_per_app[app_id],
+            fair_shifts=fair_shifts_per_app[app_id],
+            actor_plan_period_id=app_id,
+        )
+        for app_id in max_shifts_per_app
+        if app_id in fair_shifts_per_app
+    ])
+
+
+def run_solver_job(job_id: uuid.UUID) -> None:
+    """Einstiegspunkt im Kind-Prozess: Job rechnen, Ergebnis zurückschreiben."""
+    from sat_solver import progress, solver_main
+
+    with Session(db_module.engine) as session:
+        job = session.get(SolverJob, job_id)
+        kind, team_id, params = job.kind, job.team_id, dict(job.params)
+        num_plans = params["num_plans"]
+        plan_period_ids = [uuid.UUID(pp_id) for pp_id in job.plan_period_ids]
+
+    try:
+        with _JobProgress(job_id) as job_progress, progress.progress_callback(job_progress):
+            if kind == SolverJobKind.multi_period:
+                versions, fixed_cast, skills, max_shifts, fair_shifts = solver_main.solve_multi_period(
+                    plan_period_ids, **params)
+            else:
+                versions, fixed_cast, skills, max_shifts, fair_shifts = solver_main.solve(
+                    plan_period_ids[0], **params)
+                versions = None if versions is None else [versions]
+
+            if versions is None:
+                service.finish_job(job_id, SolverJobStatus.failed, result={"no_solution": True},
+                                   error="Keine Lösung gefunden")
+                return
+            if sum((fixed_cast or {}).values()) or sum((skills or {}).values()):
+                service.finish_job(
+                    job_id, SolverJobStatus.failed,
+                    result={
+                        "fixed_cast_conflicts": _serialize_fixed_cast_conflicts(fixed_cast),
+                        "skill_conflicts": skills or {},
+                    },
+                    error="Besetzungs- oder Skill-Konflikte",
+                )
+                return
+
+            job_progress('Pläne werden gespeichert.')
+            plan_ids = []
+            for pp_id, period_versions in zip(plan_period_ids, versions):
+                plan_ids.extend(_save_schedule_versions(pp_id, team_id, period_versions[:num_plans]))
+            _save_max_fair_shifts(max_shifts or {}, fair_shifts or {})
+    except SolverJobCancelled:
+        service.finish_job(job_id, SolverJobStatus.cancelled)
+        return
+    except Exception as e:
+        logger.exception("solver_jobs: Job %s fehlgeschlagen", job_id)
+        service.finish_job(job_id, SolverJobStatus.failed, error=f"{type(e).__name__}: {e}")
+        return
+
+    service.finish_job(job_id, SolverJobStatus.succeeded,
+                       result={"plan_ids": [str(plan_id) for plan_id in plan_ids]})
+
+
+# ── Runner im Web-Prozess ────────────────────────────────────────────────────
+
+
+class SolverJobRunner:
+    """Pollt die Job-Tabelle und verteilt Jobs auf `max_workers` Prozesse."""
+
+    def __init__(self, max_workers: int, poll_seconds: float, stale_after: timedelta) -> None:
+        self.max_workers = max_workers
+        self.poll_seconds = poll_seconds
+        self.stale_after = stale_after
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_broken = False
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Future] = set()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn statt fork: Kind-Prozesse erben keine offenen DB-Connections
+        # und keinen Event-Loop-Zustand des Uvicorn-Workers.
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_pool(self) -> None:
+        logger.warning("solver_jobs: Prozess-Pool defekt — wird neu erzeugt")
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+        self._pool_broken = False
+
+    def start(self) -> None:
+        self._pool = self._new_pool()
+        self._task = asyncio.create_task(self._loop())
+        logger.info("solver_jobs: Runner gestartet (%d Prozesse)", self.max_workers)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._pool is not None:
+            # Laufende Jobs werden nicht abgewartet — `fail_stale_jobs` räumt
+            # sie nach dem Neustart auf.
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await asyncio.to_thread(self._housekeeping)
+                if self._pool_broken:
+                    self._replace_pool()
+                while len(self._running) < self.max_workers:
+                    job_id = await asyncio.to_thread(self._claim)
+                    if job_id is None:
+                        break
+                    try:
+                        future = loop.run_in_executor(self._pool, run_solver_job, job_id)
+                    except BrokenProcessPool:
+                        # Absturz seit dem letzten Durchlauf, Callback noch nicht gelaufen
+                        self._replace_pool()
+                        future = loop.run_in_executor(self._pool, run_solver_job, job_id)
+                    self._running.add(future)
+                    future.add_done_callback(self._on_done(job_id))
+            except Exception:
+                logger.exception("solver_jobs: Poll-Durchlauf fehlgeschlagen")
+            await asyncio.sleep(self.poll_seconds)
+
+    def _on_done(self, job_id: uuid.UUID):
+        def _callback(future: asyncio.Future) -> None:
+            self._running.discard(future)
+            if future.cancelled() or future.exception() is None:
+                return
+            # Absturz des Kind-Prozesses selbst (z. B. BrokenProcessPool)
+            error = future.exception()
+            logger.error("solver_jobs: Prozess für Job %s abgestürzt: %s", job_id, error)
+            if isinstance(error, BrokenProcessPool):
+                self._pool_broken = True
+            # Läuft auf dem Event-Loop — DB-Zugriff in den Default-Threadpool.
+            future.get_loop().run_in_executor(None, functools.partial(
+                service.finish_job, job_id, SolverJobStatus.failed, error=str(error) or type(error).__name__))
+        return _callback
+
+    def _claim(self) -> uuid.UUID | None:
+        with Session(db_module.engine) as session:
+            return service.claim_next_job(session)
+
+    def _housekeeping(self) -> None:
+        with Session(db_module.engine) as session:
+            service.fail_stale_jobs(session, self.stale_after)
+
+
+_runner: SolverJobRunner | None = None
+
+
+def start_solver_job_runner(max_workers: int, poll_seconds: float, stale_seconds: int) -> None:
+    global _runner
+    _runner = SolverJobRunner(max_workers, poll_seconds, timedelta(seconds=stale_seconds))
+    _runner.start()
+
+
+async def stop_solver_job_runner() -> None:
+    global _runner
+    if _runner is not None:
+        await _runner.stop()
+        _runner = None
@@ -11,10 +11,11 @@ from datetime import date
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from web_api.auth.dependencies import WebUserRole, require_role
-from web_api.common import fc_event_end_iso, fc_event_start_iso
-from web_api.dependencies import get_db_session
+from web_api.auth.dependencies import WebUserRole, require_role, require_role_async
+from web_api.calendar_cache import get_plan_feed
+from web_api.dependencies import get_async_db_session, get_db_session
 from web_api.dispatcher.service import (
     filter_allowed_team_ids,
     get_appointment_detail_for_dispatcher,
@@ -105,9 +106,9 @@ def viewer_plan(
 
 
 @router.get("/plan/events")
-def viewer_plan_events(
-    user: WebUser = require_role(WebUserRole.viewer, WebUserRole.admin),
-    session: Session = Depends(get_db_session),
+async def viewer_plan_events(
+    user: WebUser = require_role_async(WebUserRole.viewer, WebUserRole.admin),
+    session: AsyncSession = Depends(get_async_db_session),
     teams: list[uuid.UUID] = Query(default_factory=list),
     only_understaffed: bool = Query(default=False),
     start: date | None = Query(default=None),
@@ -118,6 +119,27 @@ def viewer_plan_events(
     Sicherheits-Schnitt: Trotz `teams` aus dem Query wird auf die im Projekt
     erlaubten Team-IDs verschnitten — ein Viewer in Projekt A kann auch durch
     URL-Manipulation keine Teams aus Projekt B sehen.
+
+    Async-Pfad: wird bei jeder Kalender-Navigation gefeuert und soll den
+    Threadpool nicht blockieren (siehe `web_api.async_database`).
+    """
+    return await session.run_sync(
+        _load_viewer_plan_events, user, teams, only_understaffed, start, end,
+    )
+
+
+def _load_viewer_plan_events(
+    session: Session,
+    user: WebUser,
+    teams: list[uuid.UUID],
+    only_understaffed: bool,
+    start: date | None,
+    end: date | None,
+) -> list[dict]:
+    """Sync-Teil von `viewer_plan_events` — läuft via `AsyncSession.run_sync`.
+
+    Die Basis-Payload kommt aus dem geteilten Feed-Cache, die Farb-Overrides
+    des Users werden danach angewendet.
     """
     project_id = get_user_project_id(session, user)
     my_teams = get_all_teams_in_project(session, project_id)
@@ -125,38 +147,16 @@ def viewer_plan_events(
     effective_ids = filter_allowed_team_ids(teams, allowed_ids)
 
     overrides = get_color_overrides(session, user.id)
-    events = get_appointments_for_teams(
-        session, effective_ids, start, end,
+    return get_plan_feed(
+        session,
+        project_id=project_id,
+        team_ids=effective_ids,
+        start=start,
+        end=end,
         only_understaffed=only_understaffed,
         user_overrides=overrides,
     )
 
-    return [
-        {
-            "id": str(ev.appointment_id),
-            "title": ev.location_name,
-            "start": fc_event_start_iso(ev.event_date, ev.time_start),
-            "end": fc_event_end_iso(ev.event_date, ev.time_start, ev.time_end),
-            "allDay": ev.time_start is None,
-            "color": ev.color,
-            "extendedProps": {
-                "time_of_day": ev.time_of_day_name or "",
-                "time_start": ev.time_start.strftime("%H:%M") if ev.time_start else "",
-                "time_end": ev.time_end.strftime("%H:%M") if ev.time_end else "",
-                "notes": ev.appointment_notes or "",
-                "plan_period_id": str(ev.plan_period_id),
-                "team_id": str(ev.team_id) if ev.team_id else "",
-                "location_id": str(ev.location_id),
-                "location_name": ev.location_name,
-                "location_name_only": ev.location_name_only,
-                "cast_count": ev.cast_count,
-                "cast_required": ev.cast_required,
-                "is_understaffed": ev.is_understaffed,
-            },
-        }
-        for ev in events
-    ]
-
 
 # ── Termindetail (Read-Only) ─────────────────────────────────────────────────
 
@@ -426,9 +426,9 @@ def viewer_availability(
 
 
 @router.get("/availability/events")
-def viewer_availability_events(
-    user: WebUser = require_role(WebUserRole.viewer, WebUserRole.admin),
-    session: Session = Depends(get_db_session),
+async def viewer_availability_events(
+    user: WebUser = require_role_async(WebUserRole.viewer, WebUserRole.admin),
+    session: AsyncSession = Depends(get_async_db_session),
     person_id: uuid.UUID = Query(...),
     actor_plan_period_id: uuid.UUID = Query(...),
     start: date = Query(...),
@@ -440,18 +440,11 @@ def viewer_availability_events(
     einem fremden Projekt querfragen kann. Authorize_actor_plan_period
     prueft zusaetzlich, dass die APP zur Person gehoert.
     """
-    from web_api.availability.service import (
-        authorize_actor_plan_period,
-        get_markers_for_range,
+    markers = await session.run_sync(
+        _load_viewer_availability_markers,
+        user, person_id, actor_plan_period_id, start, end,
     )
 
-    project_id = get_user_project_id(session, user)
-    # Person muss zum Projekt gehoeren (sonst Cross-Project-Leak).
-    get_person_detail(session, project_id=project_id, person_id=person_id)
-
-    authorize_actor_plan_period(session, person_id, actor_plan_period_id)
-    markers = get_markers_for_range(session, actor_plan_period_id, start, end)
-
     # Farbpalette identisch zum /availability/events-Endpoint — gleiches
     # Look-and-Feel fuer den Viewer.
     palette = ["#F97316", "#38BDF8", "#2DD4BF", "#818CF8", "#F472B6", "#4ADE80"]
@@ -471,4 +464,26 @@ def viewer_availability_events(
             },
         }
         for m in markers
-    ]
\ No newline at end of file
+    ]
+
+
+def _load_viewer_availability_markers(
+    session: Session,
+    user: WebUser,
+    person_id: uuid.UUID,
+    actor_plan_period_id: uuid.UUID,
+    start: date,
+    end: date,
+) -> list:
+    """Sync-Teil von `viewer_availability_events` — läuft via `run_sync`."""
+    from web_api.availability.service import (
+        authorize_actor_plan_period,
+        get_markers_for_range,
+    )
+
+    project_id = get_user_project_id(session, user)
+    # Person muss zum Projekt gehoeren (sonst Cross-Project-Leak).
+    get_person_detail(session, project_id=project_id, person_id=person_id)
+
+    authorize_actor_plan_period(session, person_id, actor_plan_period_id)
+    return get_markers_for_range(session, actor_plan_period_id, start, end)